@@ -34,6 +34,9 @@ sasview -V
 
     -q, --quiet. *Suppress startup messages on interactive console.*
 
+    --profile-startup. *Print the time taken by the imports of the GUI
+    startup once the main window is shown.*
+
 Note: On Windows any console output is ignored by default. You can either
 open a console to show the output with the *-o* flag or redirect output to
 a file using something like *sasview ... > output.txt*.
@@ -53,6 +56,7 @@ def parse_cli(argv):
     * command: str - string to exec
     * module: str - module to run as main
     * interactive: bool - run interactive
+    * profile_startup: bool - profile the imports of the GUI startup
     * args: list[str] - additional arguments, or script + args
     """
     parser = argparse.ArgumentParser()
@@ -70,6 +74,8 @@ def parse_cli(argv):
         help="Don't print banner when entering interactive mode")
     parser.add_argument("-l", "--loglevel", type=str,
         help="Logging level (production or development for now)")
+    parser.add_argument("--profile-startup", action='store_true',
+        help="Print the import time profile of the GUI startup")
     parser.add_argument("args", nargs="*",
         help="script followed by args")
 
@@ -104,6 +110,12 @@ def parse_cli(argv):
     return opts
 
 def main(logging="production"):
+    # Profile the imports from as early as possible, before parsing the
+    # arguments imports anything
+    if "--profile-startup" in sys.argv[1:]:
+        from sas.system import startup_profile
+        startup_profile.start()
+
     from sas.system import log
     from sas.system import lib
     from sas.system import console
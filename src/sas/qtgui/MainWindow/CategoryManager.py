@@ -7,7 +7,7 @@ from PySide6 import QtWidgets
 
 from collections import defaultdict
 from sas.qtgui.Utilities.CategoryInstaller import CategoryInstaller
-from sasmodels.sasview_model import load_standard_models
+from sas.sascalc.fit.models import ModelManager
 
 from .UI.CategoryManagerUI import Ui_CategoryManagerUI
 from .UI.ChangeCategoryUI import Ui_ChangeCategoryUI
@@ -76,7 +76,8 @@ class Categories(object):
         create a dictionary for model->category mapping
         """
         # Load the model dict
-        models = load_standard_models()
+        # Stand-ins from the model index, the models are only loaded when used
+        models = ModelManager().cat_model_list()
         for model in models:
             # {model name -> model object}
             self.models[model.name] = model
@@ -14,9 +14,12 @@ from twisted.internet import threads
 
 # SASCALC
 from sasdata.dataloader.loader import Loader
+from sas.sascalc.data_util import parallel_loader
+from sas.sascalc.data_util.data_cache import DataCache
 
 # QTGUI
 import sas.qtgui.Utilities.GuiUtils as GuiUtils
+import sas.qtgui.Utilities.ProjectArchive as ProjectArchive
 import sas.qtgui.Plotting.PlotHelper as PlotHelper
 
 from sas.qtgui.Plotting.PlotterData import Data1D
@@ -35,6 +38,13 @@ from sas import config
 
 logger = logging.getLogger(__name__)
 
+# Project file entries holding the analysis state of each perspective
+PERSPECTIVE_PARAMETERS = {
+    'Fitting': 'fit_params',
+    'Inversion': 'pr_params',
+    'Invariant': 'invar_params',
+    'Corfunc': 'corfunc_params',
+}
 
 class DataExplorerWindow(DroppableDataLoadWidget):
     # The controller which is responsible for managing signal slots connections
@@ -69,6 +79,18 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         # Active plots {id:Plotter1D/2D}, required to keep track of currently displayed plots
         self.active_plots = {}
 
+        # Analyses of a lazily loaded project, restored when their data is
+        # sent to the perspective {data id: {parameters key: parameters}}
+        self._pending_analyses = {}
+        # Last use of the datasets, saved in projects {data id: time}
+        self._last_used = {}
+        # Lazily loaded project with arrays still read from the file
+        self._mapped_project = None
+        # Maps of the lazily loaded project file, closed once all is read
+        self._project_maps = []
+        # Background reading of the arrays of a lazily loaded project
+        self._prefetch_thread = ProjectArchive.PrefetchThread()
+
         # Connect the buttons
         self.cmdLoad.clicked.connect(self.loadFile)
         self.cmdDeleteData.clicked.connect(self.deleteFile)
@@ -293,15 +315,15 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         kwargs = {
             'parent'    : self,
             'caption'   : 'Open Project',
-            'filter'    : 'Project Files (*.json);;Old Project Files (*.svs);;All files (*.*)'
+            'filter'    : 'Project Files (*.sasv *.json);;Old Project Files (*.svs);;All files (*.*)'
         }
         filename = QtWidgets.QFileDialog.getOpenFileName(**kwargs)[0]
         if filename:
             self.default_project_location = os.path.dirname(filename)
-            # Delete all data and initialize all perspectives
+            # Delete all data and close all perspectives, which are loaded again when shown
             self.deleteAllItems()
             self.cbFitting.blockSignals(True)
-            self.parent.loadAllPerspectives()
+            self.parent.closeAllPerspectives()
             self.cbFitting.blockSignals(False)
             self.initPerspectives()
             self.readProject(filename)
@@ -318,7 +340,8 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         }
         filename = QtWidgets.QFileDialog.getOpenFileName(**kwargs)[0]
         if filename:
-            self.readProject(filename)
+            # Show the analysis right away
+            self.readProject(filename, lazy=False)
 
     def saveProject(self):
         """
@@ -326,7 +349,7 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         """
         parent = self
         caption = 'Save Project'
-        filter = 'Project (*.json)'
+        filter = 'Project (*.sasv);;Project JSON (*.json)'
         directory = self.default_project_location
         name_tuple = QtWidgets.QFileDialog.getSaveFileName(parent, caption, directory, filter, "")
         filename = name_tuple[0]
@@ -335,7 +358,12 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         self.default_project_location = os.path.dirname(filename)
         _, extension = os.path.splitext(filename)
         if not extension:
-            filename = '.'.join((filename, 'json'))
+            json_filter = 'json' in name_tuple[1]
+            filename += '.json' if json_filter else ProjectArchive.PROJECT_EXTENSION
+        if self._mapped_project is not None:
+            # Saving reads all arrays anyway, and the project file can't be
+            # replaced while it is mapped
+            self.hydrateAll()
         self.communicator.statusBarUpdateSignal.emit("Saving Project... %s\n" % os.path.basename(filename))
 
         return filename
@@ -414,6 +442,8 @@ class DataExplorerWindow(DroppableDataLoadWidget):
             name = data.name
             is_checked_bool = item.checkState() == QtCore.Qt.Checked
             properties['checked'] = is_checked_bool
+            if data.id in self._last_used:
+                properties['last_used'] = self._last_used[data.id]
             # save underlying theories
             other_datas = GuiUtils.plotsFromDisplayName(name, model)
             # skip the main plot
@@ -487,14 +517,19 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         # save datas
         GuiUtils.saveData(outfile, all_data)
 
-    def readProject(self, filename):
+    def readProject(self, filename, lazy=None):
         """
         Read out datasets and perspective information from file
+
+        With lazy, arrays of project archives are read when used and, unless
+        pages depend on several data sets, analyses are restored when their
+        data is sent to a perspective. Defaults to config.LAZY_PROJECT_LOADING.
         """
         # Find out the filetype based on extension
         ext = os.path.splitext(filename)[1]
         all_data = {}
         if 'svs' in ext.lower():
+            lazy = False
             # backward compatibility mode.
             try:
                 datasets = GuiUtils.readProjectFromSVS(filename)
@@ -513,12 +548,19 @@ class DataExplorerWindow(DroppableDataLoadWidget):
                 logging.error(msg)
                 pass
         else:
-            with open(filename, 'r') as infile:
-                try:
-                    all_data = GuiUtils.readDataFromFile(infile)
-                except Exception as ex:
-                    logging.error("Project load failed with " + str(ex))
-                    return
+            if lazy is None:
+                lazy = config.LAZY_PROJECT_LOADING
+            try:
+                all_data = ProjectArchive.readProject(filename, lazy=lazy)
+            except Exception as ex:
+                logging.error("Project load failed with " + str(ex))
+                return
+        if lazy:
+            self._mapped_project = os.path.abspath(filename)
+            self._project_maps = ProjectArchive.fileMappings(all_data)
+        # Analyses are restored when their data is sent to a perspective,
+        # unless pages depend on several data sets
+        defer_analyses = lazy and not self.hasMultiDataPages(all_data)
         cs_keys = []
         visible_perspective = config.DEFAULT_PERSPECTIVE
         for key, value in all_data.items():
@@ -537,6 +579,14 @@ class DataExplorerWindow(DroppableDataLoadWidget):
             # Load last visible perspective as stored in project file
             if 'visible_perspective' in key:
                 visible_perspective = value
+            if defer_analyses and 'fit_data' in value:
+                # Only create the data explorer items for now
+                self.updateModelFromData({key: value['fit_data']})
+                analyses = {name: value[name] for name in PERSPECTIVE_PARAMETERS.values()
+                            if name in value}
+                if analyses:
+                    self._pending_analyses[key] = analyses
+                continue
             # send newly created items to the perspective
             self.updatePerspectiveWithProperties(key, value)
         # Set to fitting perspective and load in Batch and C&S Pages
@@ -555,6 +605,117 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         self.cbFitting.setCurrentIndex(
                 self.cbFitting.findText(visible_perspective))
 
+        if lazy:
+            self.prefetchProject(all_data)
+
+    @staticmethod
+    def hasMultiDataPages(all_data):
+        """
+        Check for constraint and batch pages, which use several data sets
+        """
+        for key, value in all_data.items():
+            if 'cs_tab' in key:
+                return True
+            if not isinstance(value, dict) or 'fit_params' not in value:
+                continue
+            params = value['fit_params']
+            if not isinstance(params, list):
+                params = [params]
+            for page in params:
+                if isinstance(page, dict) and \
+                        page.get('is_batch_fitting', ['False'])[0] == 'True':
+                    return True
+        return False
+
+    def prefetchProject(self, all_data):
+        """
+        Read the arrays of a lazily loaded project in the background,
+        most recently used data sets first
+        """
+        datasets = [value['fit_data'] for value in all_data.values()
+                    if isinstance(value, dict) and 'fit_data' in value]
+        for data, properties, _ in datasets:
+            if 'last_used' in properties:
+                self._last_used[data.id] = properties['last_used']
+        datasets.sort(key=lambda dataset: dataset[1].get('last_used', 0), reverse=True)
+        self._prefetch_thread.queue(datasets)
+
+    def useItems(self, items):
+        """
+        Record the use of the data of the items and read their arrays into
+        memory, if still mapped from a lazily loaded project
+        """
+        now = time.time()
+        for item in items:
+            data = GuiUtils.dataFromItem(item)
+            if data is None:
+                continue
+            self._last_used[data.id] = now
+            ProjectArchive.hydrate(data)
+            # Plots of the data set
+            for row in range(item.rowCount()):
+                child = item.child(row)
+                if child is not None and child.isCheckable():
+                    ProjectArchive.hydrate(GuiUtils.dataFromItem(child))
+
+    def hydrateAll(self):
+        """
+        Read all arrays still mapped from a lazily loaded project into memory
+        and close the project file
+        """
+        self._prefetch_thread.stop()
+        for model in (self.model, self.theory_model):
+            for row in range(model.rowCount()):
+                item = model.item(row)
+                data = GuiUtils.dataFromItem(item)
+                ProjectArchive.hydrate(data)
+                for child_row in range(item.rowCount()):
+                    ProjectArchive.hydrate(GuiUtils.dataFromItem(item.child(child_row)))
+        ProjectArchive.hydrate(self._pending_analyses)
+        self._mapped_project = None
+        self.closeProjectFile()
+
+    def closeProjectFile(self):
+        """
+        Close the maps of a lazily loaded project file, once the prefetch
+        no longer reads from them
+        """
+        if not self._prefetch_thread.stopReading(timeout=1.0):
+            logging.debug("The prefetch of the project file did not stop in time.")
+        self._project_maps = ProjectArchive.closeMappings(self._project_maps)
+        if self._project_maps:
+            logging.debug("The project file is still in use and could not be closed.")
+
+    def pendingAnalyses(self):
+        """
+        Analyses of a lazily loaded project not restored yet, by data id
+        """
+        return self._pending_analyses
+
+    def restorePendingAnalyses(self, items):
+        """
+        Restore the analyses of the current perspective saved for the items.
+        Returns the items without such an analysis.
+        """
+        parameters = PERSPECTIVE_PARAMETERS.get(self.cbFitting.currentText())
+        remaining = []
+        restored = False
+        for item in items:
+            data = GuiUtils.dataFromItem(item)
+            analyses = self._pending_analyses.get(getattr(data, 'id', None), {})
+            if parameters not in analyses:
+                remaining.append(item)
+                continue
+            value = {parameters: analyses.pop(parameters)}
+            if not analyses:
+                del self._pending_analyses[data.id]
+            self.updatePerspectiveWithProperties(data.id, value, items=[item])
+            restored = True
+        if restored and not self._pending_analyses and self._mapped_project is not None:
+            # The project file is no longer needed for the analyses
+            self.hydrateAll()
+        return remaining
+
     def updateWithBatchPages(self, all_data):
         """
         Checks all properties and see if there are any batch pages defined.
@@ -586,10 +747,12 @@ class DataExplorerWindow(DroppableDataLoadWidget):
                 self._perspective().updateFromParameters(page)
         pass
 
-    def updatePerspectiveWithProperties(self, key, value):
+    def updatePerspectiveWithProperties(self, key, value, items=None):
         """
+        Create the model items for the data in value, or use the given items,
+        and restore their analyses
         """
-        if 'fit_data' in value:
+        if 'fit_data' in value and items is None:
             data_dict = {key: value['fit_data']}
             # Create new model items in the data explorer
             items = self.updateModelFromData(data_dict)
@@ -650,7 +813,11 @@ class DataExplorerWindow(DroppableDataLoadWidget):
             from sasdata.dataloader.data_info import Data1D as old_data1d
             from sasdata.dataloader.data_info import Data2D as old_data2d
             if isinstance(new_data, (old_data1d, old_data2d)):
-                new_data = self.manager.create_gui_data(value[0], new_data.name)
+                # Arrays of a lazily loaded project are not copied
+                stub, arrays = ProjectArchive.detachMapped(new_data)
+                new_data = self.manager.create_gui_data(stub, new_data.name)
+                for name, array in arrays.items():
+                    setattr(new_data, name, array)
             if hasattr(value[0], 'id'):
                 new_data.id = value[0].id
                 new_data.group_id = value[0].group_id
@@ -802,6 +969,12 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         Send selected item data to the current perspective and set the relevant notifiers
         """
         selected_items = self.selectedItems()
+        if len(selected_items) < 1:
+            return
+        self.useItems(selected_items)
+        # Data sent for the first time since a lazy project load
+        # get their saved analysis back
+        selected_items = self.restorePendingAnalyses(selected_items)
         if len(selected_items) < 1:
             return
  
@@ -824,6 +997,7 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         """
         # Set the signal handlers
         self.communicator.updateModelFromPerspectiveSignal.connect(self.updateModelFromPerspective)
+        self.useItems([item])
         selected_items = [item]
         # Notify the GuiManager about the send request
         try:
@@ -1199,6 +1373,8 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         # Call show on requested plots
         # All same-type charts in one plot
         for item, plot_set in plots:
+            self.useItems([item])
+            ProjectArchive.hydrate(plot_set)
             if isinstance(plot_set, Data1D):
                 if 'new_plot' not in locals():
                     new_plot = PlotterWidget(manager=self, parent=self)
@@ -1344,9 +1520,12 @@ class DataExplorerWindow(DroppableDataLoadWidget):
 
     def readData(self, path):
         """
-        verbatim copy-paste from
-        ``sasgui.guiframe.local_perspectives.data_loader.data_loader.py``
-        slightly modified for clarity
+        Read the data files and add their content to the model.
+
+        Files are parsed in parallel by config.DATA_LOADING_WORKERS
+        processes, unless already in the cache of parsed files, and the
+        data of each batch of parsed files is added to the model in a
+        single update.
         """
         message = ""
         log_msg = ''
@@ -1357,13 +1536,14 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         number_of_files = len(path)
         self.communicator.progressBarUpdateSignal.emit(0)
 
-        for index, p_file in enumerate(path):
+        extension_list = config.PLUGIN_STATE_EXTENSIONS.copy()
+        if config.APPLICATION_STATE_EXTENSION is not None:
+            extension_list.append(config.APPLICATION_STATE_EXTENSION)
+
+        data_files = []
+        for p_file in path:
             basename = os.path.basename(p_file)
             _, extension = os.path.splitext(basename)
-            extension_list = config.PLUGIN_STATE_EXTENSIONS.copy()
-            if config.APPLICATION_STATE_EXTENSION is not None:
-                extension_list.append(config.APPLICATION_STATE_EXTENSION)
-
             if extension.lower() in extension_list:
                 any_error = True
                 log_msg = "Data Loader cannot "
@@ -1373,14 +1553,30 @@ class DataExplorerWindow(DroppableDataLoadWidget):
                 error_message = log_msg + "\n"
                 logging.info(log_msg)
                 continue
+            data_files.append(p_file)
 
-            try:
-                message = "Loading Data... " + str(basename) + "\n"
-
-                # change this to signal notification in GuiManager
-                self.communicator.statusBarUpdateSignal.emit(message)
-
-                output_objects = self.loader.load(p_file)
+        if data_files:
+            if len(data_files) == 1:
+                message = "Loading Data... " + os.path.basename(data_files[0]) + "\n"
+            else:
+                message = "Loading Data... %d files\n" % len(data_files)
+            # change this to signal notification in GuiManager
+            self.communicator.statusBarUpdateSignal.emit(message)
+
+        cache = DataCache(max_size=config.DATA_CACHE_SIZE * 2**20) if config.DATA_CACHE_SIZE else None
+        files_read = number_of_files - len(data_files)
+        # Workers parse with the readers sasdata registers by default. Readers
+        # associated with self.loader at run time are not known to them, pass
+        # loader=self.loader to parse the files here with those instead.
+        batches = parallel_loader.load_files(data_files, n_workers=config.DATA_LOADING_WORKERS,
+                                             cache=cache)
+        for results in batches:
+            new_data_list = []
+            for p_file, output_objects, exception in results:
+                basename = os.path.basename(p_file)
+                if exception is not None:
+                    logging.error(str(exception))
+                    any_error = True
 
                 for item in output_objects:
                     # cast sasdata.dataloader.data_info.Data1D into
@@ -1388,13 +1584,7 @@ class DataExplorerWindow(DroppableDataLoadWidget):
                     # TODO : Fix it
                     new_data = self.manager.create_gui_data(item, p_file)
                     output[new_data.id] = new_data
-
-                    # Model update should be protected
-                    self.mutex.lock()
-                    self.updateModel(new_data, new_data.name)
-                    #self.model.reset()
-                    QtWidgets.QApplication.processEvents()
-                    self.mutex.unlock()
+                    new_data_list.append(new_data)
 
                     if hasattr(item, 'errors'):
                         for error_data in item.errors:
@@ -1405,28 +1595,31 @@ class DataExplorerWindow(DroppableDataLoadWidget):
                         logging.error("Loader returned an invalid object:\n %s" % str(item))
                         data_error = True
 
-            except Exception as ex:
-                logging.error(str(ex) + str(sys.exc_info()[1]))
+                if any_error or data_error or error_message != "":
+                    if error_message == "":
+                        error = "Error: " + str(exception) + "\n"
+                        error += "while loading Data: \n%s\n" % str(basename)
+                        error_message += "The data file you selected could not be loaded.\n"
+                        error_message += "Make sure the content of your file"
+                        error_message += " is properly formatted.\n\n"
+                        error_message += "When contacting the SasView team, mention the"
+                        error_message += " following:\n%s" % str(error)
+                    elif data_error:
+                        base_message = "Errors occurred while loading "
+                        base_message += "{0}\n".format(basename)
+                        base_message += "The data file loaded but with errors.\n"
+                        error_message = base_message + error_message
+                    else:
+                        error_message += "%s\n" % str(p_file)
 
-                any_error = True
-            if any_error or data_error or error_message != "":
-                if error_message == "":
-                    error = "Error: " + str(sys.exc_info()[1]) + "\n"
-                    error += "while loading Data: \n%s\n" % str(basename)
-                    error_message += "The data file you selected could not be loaded.\n"
-                    error_message += "Make sure the content of your file"
-                    error_message += " is properly formatted.\n\n"
-                    error_message += "When contacting the SasView team, mention the"
-                    error_message += " following:\n%s" % str(error)
-                elif data_error:
-                    base_message = "Errors occurred while loading "
-                    base_message += "{0}\n".format(basename)
-                    base_message += "The data file loaded but with errors.\n"
-                    error_message = base_message + error_message
-                else:
-                    error_message += "%s\n" % str(p_file)
+            # Model update should be protected
+            self.mutex.lock()
+            self.updateModelWithData(new_data_list)
+            QtWidgets.QApplication.processEvents()
+            self.mutex.unlock()
 
-            current_percentage = int(100.0* index/number_of_files)
+            files_read += len(results)
+            current_percentage = int(100.0 * files_read / number_of_files)
             self.communicator.progressBarUpdateSignal.emit(current_percentage)
 
         if any_error or error_message:
@@ -1823,6 +2016,13 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         self.model.clear()
         self.theory_model.clear()
 
+        # Forget the lazily loaded project
+        self._prefetch_thread.stop()
+        self._pending_analyses = {}
+        self._last_used = {}
+        self._mapped_project = None
+        self.closeProjectFile()
+
     def deleteSelectedItem(self):
         """
         Delete the current item
@@ -1986,6 +2186,31 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         """
         Add data and Info fields to the model item
         """
+        self.updateModelWithData([data], [p_file])
+
+    def updateModelWithData(self, data_list, names=None):
+        """
+        Add the data to the model in a single update
+
+        :param data_list: Data1D/Data2D objects
+        :param names: labels of the new rows, defaults to the data names
+        """
+        if not data_list:
+            return
+        if names is None:
+            names = [data.name for data in data_list]
+        items = [self.dataModelItem(data, name) for data, name in zip(data_list, names)]
+
+        # New rows in the model
+        self.model.beginResetModel()
+        for item in items:
+            self.model.appendRow(item)
+        self.model.endResetModel()
+
+    def dataModelItem(self, data, p_file):
+        """
+        Create the model item holding the data and its Info fields
+        """
         # Structure of the model
         # checkbox + basename
         #     |-------> Data.D object
@@ -2021,10 +2246,7 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         # Caption for the theories
         checkbox_item.setChild(2, QtGui.QStandardItem("FIT RESULTS"))
 
-        # New row in the model
-        self.model.beginResetModel()
-        self.model.appendRow(checkbox_item)
-        self.model.endResetModel()
+        return checkbox_item
 
     def updateModelFromPerspective(self, model_item):
         """
@@ -2103,6 +2325,8 @@ class DataExplorerWindow(DroppableDataLoadWidget):
         Slot for model (data/theory) changes.
         Currently only reacting to checkbox selection.
         """
+        if item.isCheckable() and item.checkState() == QtCore.Qt.Checked:
+            self.useItems([item])
         if len(self.current_view.selectedIndexes()) < 2:
             return
         self.setCheckItems(status=item.checkState())
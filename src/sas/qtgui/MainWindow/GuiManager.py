@@ -12,12 +12,8 @@ from PySide6.QtWidgets import *
 from PySide6.QtGui import *
 from PySide6.QtCore import Qt, QLocale
 
-import matplotlib as mpl
-
 import sas.system.version
 
-#mpl.use("Qt5Agg")
-
 from sas.system.version import __version__ as SASVIEW_VERSION, __release_date__ as SASVIEW_RELEASE_DATE
 
 from twisted.internet import reactor
@@ -26,51 +22,29 @@ from sas.qtgui.Utilities.ConnectionProxy import ConnectionProxy
 from sas.qtgui.Utilities.SasviewLogger import setup_qt_logging
 
 import sas.qtgui.Utilities.GuiUtils as GuiUtils
+import sas.qtgui.Utilities.ProjectArchive as ProjectArchive
 
 import sas.qtgui.Utilities.ObjectLibrary as ObjectLibrary
-from sas.qtgui.Utilities.TabbedModelEditor import TabbedModelEditor
-from sas.qtgui.Utilities.PluginManager import PluginManager
 from sas.qtgui.Utilities.GridPanel import BatchOutputPanel
 from sas.qtgui.Utilities.ResultPanel import ResultPanel
-from sas.qtgui.Utilities.OrientationViewer.OrientationViewer import show_orientation_viewer
 from sas.qtgui.Utilities.HidableDialog import hidable_dialog
-from sas.qtgui.Utilities.DocViewWidget import DocViewWindow
+from sas.qtgui.Utilities.LazyRegistry import LazyRegistry
 from sas.qtgui.Utilities.DocRegenInProgess import DocRegenProgress
-from sas.qtgui.Utilities.Reports.ReportDialog import ReportDialog
 from sas.qtgui.Utilities.Preferences.PreferencesPanel import PreferencesPanel
-from sas.qtgui.Utilities.About.About import About
 
 from sas.qtgui.MainWindow.Acknowledgements import Acknowledgements
 from sas.qtgui.MainWindow.WelcomePanel import WelcomePanel
-from sas.qtgui.MainWindow.CategoryManager import CategoryManager
-from sas.qtgui.MainWindow.PackageGatherer import PackageGatherer
 
 from sas.qtgui.MainWindow.DataManager import DataManager
 
-from sas.qtgui.Calculators.SldPanel import SldPanel
-from sas.qtgui.Calculators.DensityPanel import DensityPanel
-from sas.qtgui.Calculators.KiessigPanel import KiessigPanel
-from sas.qtgui.Calculators.SlitSizeCalculator import SlitSizeCalculator
-from sas.qtgui.Calculators.ResolutionCalculatorPanel import ResolutionCalculatorPanel
-from sas.qtgui.Calculators.DataOperationUtilityPanel import DataOperationUtilityPanel
-
-
 import sas.qtgui.Plotting.PlotHelper as PlotHelper
 
 # Perspectives
 import sas.qtgui.Perspectives as Perspectives
 from sas.qtgui.Perspectives.perspective import Perspective
 
-from sas.qtgui.Perspectives.Fitting.FittingPerspective import FittingWindow
-from sas.qtgui.Perspectives.Corfunc.CorfuncPerspective import CorfuncWindow
-from sas.qtgui.Perspectives.Invariant.InvariantPerspective import InvariantWindow
-from sas.qtgui.Perspectives.Inversion.InversionPerspective import InversionWindow
-
 from sas.qtgui.MainWindow.DataExplorer import DataExplorerWindow
 
-from sas.qtgui.Utilities.AddMultEditor import AddMultEditor
-from sas.qtgui.Utilities.ImageViewer import ImageViewer
-from sas.qtgui.Utilities.FileConverter import FileConverterWidget
 from sas.qtgui.Utilities.WhatsNew.WhatsNew import WhatsNew
 
 import sas
@@ -80,6 +54,19 @@ from sas.sascalc.doc_regen.makedocumentation import HELP_DIRECTORY_LOCATION, cre
 
 logger = logging.getLogger(__name__)
 
+# Calculators and other tool windows, created when first shown.
+# Perspectives and the remaining tools are imported by the actions opening
+# them, to keep their import out of the startup.
+TOOL_WINDOWS = LazyRegistry({
+    'SLDCalculator': 'sas.qtgui.Calculators.SldPanel:SldPanel',
+    'DVCalculator': 'sas.qtgui.Calculators.DensityPanel:DensityPanel',
+    'KIESSIGCalculator': 'sas.qtgui.Calculators.KiessigPanel:KiessigPanel',
+    'SlitSizeCalculator': 'sas.qtgui.Calculators.SlitSizeCalculator:SlitSizeCalculator',
+    'ResolutionCalculator': 'sas.qtgui.Calculators.ResolutionCalculatorPanel:ResolutionCalculatorPanel',
+    'DataOperation': 'sas.qtgui.Calculators.DataOperationUtilityPanel:DataOperationUtilityPanel',
+    'FileConverter': 'sas.qtgui.Utilities.FileConverter:FileConverterWidget',
+})
+
 
 class GuiManager:
     """
@@ -165,10 +152,7 @@ class GuiManager:
         # Preferences Panel must exist before perspectives are loaded
         self.preferences = PreferencesPanel(self._parent)
 
-        # Load all perspectives - Preferences panel must exist
-        self.loadAllPerspectives()
-
-        # Add FileDialog widget as docked - Perspectives must be loaded to ensure default perspective is shown
+        # Add FileDialog widget as docked - this shows the default perspective, loading it
         self.filesWidget = DataExplorerWindow(self._parent, self, manager=self._data_manager)
         ObjectLibrary.addObject('DataExplorer', self.filesWidget)
 
@@ -183,7 +167,7 @@ class GuiManager:
 
         # Add other, minor widgets
         self.ackWidget = Acknowledgements()
-        self.categoryManagerWidget = CategoryManager(self._parent, manager=self)
+        self.categoryManagerWidget = None
 
         self.grid_window = None
         self.grid_window = BatchOutputPanel(parent=self)
@@ -200,31 +184,30 @@ class GuiManager:
 
         self._workspace.toolBar.setVisible(config.TOOLBAR_SHOW)
 
-        # Add calculators - floating for usability
-        self.SLDCalculator = SldPanel(self)
-        self.DVCalculator = DensityPanel(self)
-        self.KIESSIGCalculator = KiessigPanel(self)
-        self.SlitSizeCalculator = SlitSizeCalculator(self)
-        self.ResolutionCalculator = ResolutionCalculatorPanel(self)
+        # Calculators - floating for usability - are created when first shown
+        self._tool_windows = {}
         self.GENSASCalculator = None
-        self.DataOperation = DataOperationUtilityPanel(self)
-        self.FileConverter = FileConverterWidget(self)
         self.WhatsNew = WhatsNew(self._parent)
         self.regenProgress = DocRegenProgress(self)
 
-    def loadAllPerspectives(self):
-        """ Load all the perspectives"""
-        # Close any existing perspectives to prevent multiple open instances
-        self.closeAllPerspectives()
-        # Load all perspectives
-        loaded_dict = {} # dictionary that will ultimately keep track of all perspective instances
-        for name, perspective in Perspectives.PERSPECTIVES.items():
+    def toolWindow(self, name):
+        """
+        Calculator or other tool window of the name in TOOL_WINDOWS,
+        created on first use
+        """
+        if name not in self._tool_windows:
+            self._tool_windows[name] = TOOL_WINDOWS[name](self)
+        return self._tool_windows[name]
+
+    def loadPerspective(self, name: str) -> Optional[Perspective]:
+        """
+        Instance of the named perspective, created on first use.
+        Returns None if the perspective can't be loaded.
+        """
+        if name not in self.loadedPerspectives:
             try:
                 # Instantiate perspective
-                loaded_perspective = perspective(parent=self)
-
-                # Save in main dict
-                loaded_dict[name] = loaded_perspective
+                loaded_perspective = Perspectives.PERSPECTIVES[name](parent=self)
 
                 # Register the perspective with the prefernce object
                 self.preferences.registerPerspectivePreferences(loaded_perspective)
@@ -232,9 +215,20 @@ class GuiManager:
             except Exception as e:
                 logger.error(f"Unable to load {name} perspective.\n{e}")
                 logger.error(e, exc_info=True)
+                return None
+
+            # Save in main dict
+            self.loadedPerspectives[name] = loaded_perspective
+
+        return self.loadedPerspectives[name]
 
-        # attach loaded perspectives to this class
-        self.loadedPerspectives = loaded_dict
+    def loadAllPerspectives(self):
+        """ Load all the perspectives"""
+        # Close any existing perspectives to prevent multiple open instances
+        self.closeAllPerspectives()
+        # Load all perspectives
+        for name in Perspectives.PERSPECTIVES:
+            self.loadPerspective(name)
 
     def closeAllPerspectives(self):
         # Close all perspectives if they are open
@@ -382,6 +376,8 @@ class GuiManager:
         else:
             url_abs = Path(url)
         try:
+            # Import moved here for startup performance reasons
+            from sas.qtgui.Utilities.DocViewWidget import DocViewWindow
             # Help window shows itself
             self.helpWindow = DocViewWindow(parent=self, source=url_abs)
         except Exception as ex:
@@ -398,11 +394,11 @@ class GuiManager:
         Respond to change of the perspective signal
         """
 
-        if new_perspective_name not in self.loadedPerspectives:
-            keylist = ', '.join(self.loadedPerspectives.keys())
+        if self.loadPerspective(new_perspective_name) is None:
+            keylist = ', '.join(Perspectives.PERSPECTIVES.keys())
             raise KeyError(
-                f"Perspective {new_perspective_name} is not in the dictionary "
-                f"- options are: {keylist} - probably one failed to load")
+                f"Perspective {new_perspective_name} could not be loaded "
+                f"- options are: {keylist}")
 
         # Uncheck all menu items
         for menuItem in self._workspace.menuAnalysis.actions():
@@ -456,21 +452,15 @@ class GuiManager:
         #
         # Selection on perspective choice menu
         #
-        # checking `isinstance`` fails in PySide6 with
-        # AttributeError: type object 'FittingWindow' has no attribute '_abc_impl'
-        if type(new_perspective) == FittingWindow:
-            self.checkAnalysisOption(self._workspace.actionFitting)
-
-        elif type(new_perspective) == InvariantWindow:
-            self.checkAnalysisOption(self._workspace.actionInvariant)
-
-        elif type(new_perspective) == InversionWindow:
-            self.checkAnalysisOption(self._workspace.actionInversion)
-
-        elif type(new_perspective) == CorfuncWindow:
-            self.checkAnalysisOption(self._workspace.actionCorfunc)
-
-
+        # by name, so that the other perspectives need not be imported
+        analysis_options = {
+            "Fitting": self._workspace.actionFitting,
+            "Invariant": self._workspace.actionInvariant,
+            "Inversion": self._workspace.actionInversion,
+            "Corfunc": self._workspace.actionCorfunc,
+        }
+        if new_perspective.name in analysis_options:
+            self.checkAnalysisOption(analysis_options[new_perspective.name])
 
         #
         # Set up the window
@@ -612,12 +602,14 @@ class GuiManager:
         """
         Log version number of locally installed python packages
         """
+        from sas.qtgui.MainWindow.PackageGatherer import PackageGatherer
         PackageGatherer().log_installed_modules()
 
     def log_imported_packages(self):
         """
         Log version number of python packages imported in this instance of SasView.
         """
+        from sas.qtgui.MainWindow.PackageGatherer import PackageGatherer
         PackageGatherer().log_imported_packages()
 
     def processVersion(self, version_info):
@@ -835,12 +827,17 @@ class GuiManager:
                     elif 'cs_tab' in key:
                         final_data[key] = value
 
+        # Analyses of a lazily loaded project not restored yet
+        for key, value in self.filesWidget.pendingAnalyses().items():
+            if key in final_data:
+                for name, params in value.items():
+                    final_data[key].setdefault(name, params)
+
         final_data['is_batch'] = analysis.get('is_batch', 'False')
         final_data['batch_grid'] = self.grid_window.data_dict
         final_data['visible_perspective'] = self._current_perspective.name
 
-        with open(filename, 'w') as outfile:
-            GuiUtils.saveData(outfile, final_data)
+        ProjectArchive.saveProject(filename, final_data)
 
     def actionSave_Analysis(self):
         """
@@ -908,6 +905,7 @@ class GuiManager:
             if report_data is None:
                 logging.info("Report data is empty, dialog not shown")
             else:
+                from sas.qtgui.Utilities.Reports.ReportDialog import ReportDialog
                 self.report_dialog = ReportDialog(report_data=report_data, parent=self._parent)
                 self.report_dialog.show()
 
@@ -996,42 +994,48 @@ class GuiManager:
     def actionCategory_Manager(self):
         """
         """
+        if self.categoryManagerWidget is None:
+            # Import moved here for startup performance reasons
+            from sas.qtgui.MainWindow.CategoryManager import CategoryManager
+            self.categoryManagerWidget = CategoryManager(self._parent, manager=self)
         self.categoryManagerWidget.show()
 
     #============ TOOLS =================
     def actionData_Operation(self):
         """
         """
+        # The panel must exist to receive the data
+        data_operation = self.toolWindow('DataOperation')
         data, theory = self.filesWidget.getAllFlatData()
         self.communicate.sendDataToPanelSignal.emit(dict(data, **theory))
 
-        self.DataOperation.show()
+        data_operation.show()
 
     def actionSLD_Calculator(self):
         """
         """
-        self.SLDCalculator.show()
+        self.toolWindow('SLDCalculator').show()
 
     def actionDensity_Volume_Calculator(self):
         """
         """
-        self.DVCalculator.show()
+        self.toolWindow('DVCalculator').show()
 
     def actionKiessig_Calculator(self):
         """
         """
-        self.KIESSIGCalculator.show()
+        self.toolWindow('KIESSIGCalculator').show()
 
     def actionSlit_Size_Calculator(self):
         """
         """
-        self.SlitSizeCalculator.show()
+        self.toolWindow('SlitSizeCalculator').show()
 
     def actionSAS_Resolution_Estimator(self):
         """
         """
         try:
-            self.ResolutionCalculator.show()
+            self.toolWindow('ResolutionCalculator').show()
         except Exception as ex:
             logging.error(str(ex))
             return
@@ -1073,12 +1077,15 @@ class GuiManager:
         """
         Make sasmodels orientation & jitter viewer available
         """
+        # Import moved here for startup performance reasons
+        from sas.qtgui.Utilities.OrientationViewer.OrientationViewer import show_orientation_viewer
         show_orientation_viewer()
 
     def actionImage_Viewer(self):
         """
         """
         try:
+            from sas.qtgui.Utilities.ImageViewer import ImageViewer
             self.image_viewer = ImageViewer(self)
             if sys.platform == "darwin":
                 self.image_viewer.menubar.setNativeMenuBar(False)
@@ -1092,7 +1099,7 @@ class GuiManager:
         Shows the File Converter widget.
         """
         try:
-            self.FileConverter.show()
+            self.toolWindow('FileConverter').show()
         except Exception as ex:
             logging.error(str(ex))
             return
@@ -1104,7 +1111,7 @@ class GuiManager:
         """
         # Make sure the perspective is correct
         per = self.perspective()
-        if not isinstance(per, FittingWindow):
+        if per is None or per.name != "Fitting":
             return
         per.addFit(None)
 
@@ -1113,7 +1120,7 @@ class GuiManager:
         Add a new Constrained and Simult. Fit page in the fitting perspective.
         """
         per = self.perspective()
-        if not isinstance(per, FittingWindow):
+        if per is None or per.name != "Fitting":
             return
         per.addConstraintTab()
 
@@ -1154,18 +1161,21 @@ class GuiManager:
     def actionAdd_Custom_Model(self):
         """
         """
+        from sas.qtgui.Utilities.TabbedModelEditor import TabbedModelEditor
         self.model_editor = TabbedModelEditor(self)
         self.model_editor.show()
 
     def actionEdit_Custom_Model(self):
         """
         """
+        from sas.qtgui.Utilities.TabbedModelEditor import TabbedModelEditor
         self.model_editor = TabbedModelEditor(self, edit_only=True)
         self.model_editor.show()
 
     def actionManage_Custom_Models(self):
         """
         """
+        from sas.qtgui.Utilities.PluginManager import PluginManager
         self.model_manager = PluginManager(self)
         self.model_manager.show()
 
@@ -1173,6 +1183,7 @@ class GuiManager:
         """
         """
         # Add Simple Add/Multiply Editor
+        from sas.qtgui.Utilities.AddMultEditor import AddMultEditor
         self.add_mult_editor = AddMultEditor(self)
         self.add_mult_editor.show()
 
@@ -1289,6 +1300,7 @@ class GuiManager:
         # Update the about box with current version and stuff
 
         # TODO: proper sizing
+        from sas.qtgui.Utilities.About.About import About
         about = About()
         about.exec()
 
@@ -1306,7 +1318,7 @@ class GuiManager:
         item = self.filesWidget.updateTheoryFromPerspective(index)
         # Now notify the perspective that the item was/wasn't replaced
         per = self.perspective()
-        if not isinstance(per, FittingWindow):
+        if per is None or per.name != "Fitting":
             # currently only fitting supports generation of theories.
             return
         per.currentTab.setTheoryItem(item)
@@ -3,6 +3,7 @@ import os
 import sys
 
 from sas.system.version import __version__
+from sas.system import startup_profile
 
 from PySide6.QtWidgets import QMainWindow
 from PySide6.QtWidgets import QMdiArea
@@ -88,6 +89,7 @@ def run_sasview():
     app.setAttribute(Qt.AA_ShareOpenGLContexts)
     app.setAttribute(Qt.AA_EnableHighDpiScaling)
     app.setStyleSheet("* {font-size: 11pt;}")
+    startup_profile.stage("Application created")
 
     splash = SplashScreen()
     splash.show()
@@ -110,10 +112,14 @@ def run_sasview():
 
     # Show the main SV window
     mainwindow = MainSasViewWindow()
+    startup_profile.stage("Main window created")
 
     # no more splash screen
     splash.finish(mainwindow)
 
+    # Report the startup imports, with --profile-startup
+    startup_profile.finish()
+
     # Time for the welcome window
     mainwindow.guiManager.showWelcomeMessage()
 
@@ -2,6 +2,7 @@ import sys
 import time
 import random
 import pytest
+import numpy
 
 
 from PySide6.QtGui import *
@@ -23,6 +24,7 @@ from sas.qtgui.UnitTesting.TestUtils import QtSignalSpy
 from sas.qtgui.Plotting.Plotter import Plotter
 from sas.qtgui.Plotting.Plotter2D import Plotter2D
 import sas.qtgui.Plotting.PlotHelper as PlotHelper
+import sas.qtgui.Utilities.ProjectArchive as ProjectArchive
 
 from sas.system.version import __version__ as SASVIEW_VERSION
 
@@ -374,6 +376,33 @@ class DataExplorerTest:
         QMessageBox.setText.assert_called_with(
             "Dummy Perspective does not allow replacing multiple data.")
 
+    def testHasMultiDataPages(self, form):
+        """
+        Constraint and batch pages are restored with the project
+        """
+        single = {'fit_params': [{'is_batch_fitting': ['False']}]}
+        batch = {'fit_params': [{'is_batch_fitting': ['True']}]}
+        assert not form.hasMultiDataPages({'id1': single, 'is_batch': 'False'})
+        assert form.hasMultiDataPages({'id1': single, 'id2': batch})
+        assert form.hasMultiDataPages({'id1': single, 'cs_tab1': {}})
+
+    def testHydrateAll(self, form, tmp_path):
+        """
+        The lazily loaded project file is closed once all is read
+        """
+        filename = str(tmp_path / "project.sasv")
+        ProjectArchive.saveProject(filename, {'id1': {'fit_params': {'x': numpy.arange(10.0)}}})
+        all_data = ProjectArchive.readProject(filename, lazy=True)
+        form._mapped_project = filename
+        form._project_maps = ProjectArchive.fileMappings(all_data)
+        form._pending_analyses = all_data
+        del all_data
+
+        form.hydrateAll()
+        assert form._mapped_project is None
+        assert form._project_maps == []
+        assert not ProjectArchive.mappedArrays(form._pending_analyses)
+
     @pytest.mark.xfail(reason="2022-09 already broken - input file issue")
     def testDataSelection(self, form):
         """
@@ -77,7 +77,8 @@ class MainWindowTest:
         sendDataButton = filesWidget.cmdSendTo
         # Verify defaults
         assert hasattr(gui, 'loadedPerspectives')
-        assert 4 == len(gui.loadedPerspectives)
+        # Only the perspective shown is loaded
+        assert [FIT] == list(gui.loadedPerspectives)
         # Load data
         file = ["cyl_400_20.txt"]
         filesWidget.readData(file)
@@ -91,6 +92,8 @@ class MainWindowTest:
         currentPers.setCurrentIndex(currentPers.findText(PR))
         QTest.mouseClick(sendDataButton, QtCore.Qt.LeftButton)
         check_after_load(PR)
+        # Loaded when first shown
+        assert {FIT, PR} == set(gui.loadedPerspectives)
         # Change back to Fitting Perspective and verify
         currentPers.setCurrentIndex(currentPers.findText(FIT))
         check_after_load(FIT)
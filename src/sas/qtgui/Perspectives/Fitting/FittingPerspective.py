@@ -235,6 +235,10 @@ class FittingWindow(QtWidgets.QTabWidget, Perspective):
         if self._allow_close:
             # reset the closability flag
             self.setClosable(value=False)
+            # Drop the pending model calculations of the fit pages
+            for tab in self.tabs:
+                if isinstance(tab, FittingWidget):
+                    tab.recalculation_scheduler.cancel()
             # Tell the MdiArea to close the container if it is visible
             if self.parentWidget():
                 self.parentWidget().close()
@@ -324,6 +328,9 @@ class FittingWindow(QtWidgets.QTabWidget, Perspective):
         No checks on validity of the index.
         """
         try:
+            # Drop the pending model calculation of the page
+            if isinstance(self.tabs[index], FittingWidget):
+                self.tabs[index].recalculation_scheduler.cancel()
             ObjectLibrary.deleteObjectByRef(self.tabs[index])
             self.removeTab(index)
             del self.tabs[index]
@@ -19,7 +19,6 @@ from PySide6 import QtWidgets
 from sasmodels import generate
 from sasmodels import modelinfo
 from sasmodels.sasview_model import SasviewModel
-from sasmodels.sasview_model import load_standard_models
 from sasmodels.sasview_model import MultiplicationModel
 from sasmodels.weights import MODELS as POLYDISPERSITY_MODELS
 
@@ -39,6 +38,7 @@ from sas.qtgui.Perspectives.Fitting.ConsoleUpdate import ConsoleUpdate
 
 from sas.qtgui.Perspectives.Fitting.ModelThread import Calc1D
 from sas.qtgui.Perspectives.Fitting.ModelThread import Calc2D
+from sas.qtgui.Perspectives.Fitting.RecalculationScheduler import RecalculationScheduler
 from sas.qtgui.Perspectives.Fitting.FittingLogic import FittingLogic
 from sas.qtgui.Perspectives.Fitting import FittingUtilities
 from sas.qtgui.Perspectives.Fitting.SmearingWidget import SmearingWidget
@@ -143,6 +143,9 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
         # Logics.data contains a single Data1D/Data2D object
         self._logic = [FittingLogic()]
 
+        # Model recalculations requested by the page, one at a time
+        self.recalculation_scheduler = RecalculationScheduler(self)
+
         # Main GUI setup up
         self.setupUi(self)
         self.setWindowTitle("Fitting")
@@ -252,6 +255,8 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
         self.is_chain_fitting = False
         # Is the fit job running?
         self.fit_started = False
+        # Whether a model calculation disabled the param table(s)
+        self.calculation_disabled_interactive = False
         # The current fit thread
         self.calc_fit = None
         # Current SasModel in view
@@ -2574,9 +2579,8 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
             self.master_category_dict = json.load(cat_file)
             self.regenerateModelDict()
 
-        # Load the model dict
-        models = load_standard_models()
-        for model in models:
+        # Load the model dict. The models are loaded when selected.
+        for model in models.ModelManager().cat_model_list():
             self.models[model.name] = model
 
         self.readCustomCategoryInfo()
@@ -3143,6 +3147,10 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
         '''return the method for result parsin on calc complete '''
         return self.completed1D if isinstance(self.data, Data1D) else self.completed2D
 
+    def methodPreviewForData(self):
+        '''return the method for showing a preview of the calculation, None if there is none '''
+        return None if isinstance(self.data, Data1D) else self.preview2D
+
     def updateKernelModelWithExtraParams(self, model=None):
         """
         Updates kernel model 'model' with extra parameters from
@@ -3160,9 +3168,15 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
             for key, value in self.magnet_params.items():
                 model.setParam(key, value)
 
-    def calculateQGridForModelExt(self, data=None, model=None, completefn=None, use_threads=True):
+    def calculateQGridForModelExt(self, data=None, model=None, completefn=None, use_threads=True,
+                                  exception_handler=None, disable_interactive=True, updatefn=None):
         """
         Wrapper for Calc1D/2D calls
+
+        exception_handler(etype, value, tb) is called if the calculation fails,
+        calcException by default. With disable_interactive=False the parameter
+        tables stay editable while the calculation runs. If updatefn is given,
+        2D calculations send it a quick preview before the full result.
         """
         if data is None:
             data = self.data
@@ -3175,10 +3189,21 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
         smearer = self.smearing_widget.smearer()
         weight = FittingUtilities.getWeight(data=data, is2d=self.is2D, flag=self.weighting)
 
+        if exception_handler is None:
+            exception_handler = self.calcException
+
         # Disable buttons/table
-        self.disableInteractiveElementsOnCalculate()
+        if disable_interactive:
+            self.calculation_disabled_interactive = True
+            self.disableInteractiveElementsOnCalculate()
+        calc_method = self.methodCalculateForData()
+        # Only 2D calculations make previews
+        calc_options = {}
+        if updatefn is not None and calc_method is Calc2D:
+            calc_options = dict(updatefn=updatefn, progressive=True)
+
         # Awful API to a backend method.
-        calc_thread = self.methodCalculateForData()(data=data,
+        calc_thread = calc_method(data=data,
                                                model=model,
                                                page_id=0,
                                                qmin=self.q_range_min,
@@ -3190,14 +3215,19 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
                                                toggle_mode_on=False,
                                                completefn=completefn,
                                                update_chisqr=True,
-                                               exception_handler=self.calcException,
-                                               source=None)
+                                               exception_handler=exception_handler,
+                                               source=None,
+                                               **calc_options)
         if use_threads:
             if config.USING_TWISTED:
                 # start the thread with twisted
                 thread = threads.deferToThread(calc_thread.compute)
                 thread.addCallback(completefn)
-                thread.addErrback(self.calculateDataFailed)
+                if exception_handler == self.calcException:
+                    thread.addErrback(self.calculateDataFailed)
+                else:
+                    thread.addErrback(lambda reason: exception_handler(
+                        reason.type, reason.value, reason.getTracebackObject()))
             else:
                 # Use the old python threads + Queue
                 calc_thread.queue()
@@ -3209,17 +3239,20 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
     def calculateQGridForModel(self):
         """
         Prepare the fitting data object, based on current ModelModel
+
+        Requests made while a calculation is running are merged, and only
+        the result of the latest one is plotted.
         """
         if self.kernel_module is None:
             return
-        self.calculateQGridForModelExt()
+        self.recalculation_scheduler.schedule()
 
     def calculateDataFailed(self, reason):
         """
         Thread returned error
         """
         # Bring the GUI to normal state
-        self.enableInteractiveElements()
+        self.enableInteractiveElementsOnCalculated()
         print("Calculate Data failed with ", reason)
 
     def completed1D(self, return_data):
@@ -3246,7 +3279,7 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
         Plot the current 1D data
         """
         # Bring the GUI to normal state
-        self.enableInteractiveElements()
+        self.enableInteractiveElementsOnCalculated()
         if return_data is None:
             return
         fitted_data = self.logic.new1DPlot(return_data, self.tab_id)
@@ -3305,12 +3338,21 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
         # Update radius_effective if relevant
         self.updateEffectiveRadius(return_data)
 
+    def preview2D(self, return_data):
+        """
+        Plot a preview of the 2D model, while the full calculation runs
+        """
+        fitted_data = self.logic.new2DPlot(return_data)
+        fitted_data.symbol = "Line"
+        self.createNewIndex(fitted_data)
+        self.communicate.plotUpdateSignal.emit([fitted_data])
+
     def complete2D(self, return_data):
         """
         Plot the current 2D data
         """
         # Bring the GUI to normal state
-        self.enableInteractiveElements()
+        self.enableInteractiveElementsOnCalculated()
 
         if return_data is None:
             return
@@ -3433,7 +3475,7 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
         Thread threw an exception.
         """
         # Bring the GUI to normal state
-        self.enableInteractiveElements()
+        self.enableInteractiveElementsOnCalculated()
         # TODO: remimplement thread cancellation
         logger.error("".join(traceback.format_exception(etype, value, tb)))
 
@@ -3957,6 +3999,17 @@ class FittingWidget(QtWidgets.QWidget, Ui_FittingWidgetUI):
         self.fit_started = False
         self.setInteractiveElements(True)
 
+    def enableInteractiveElementsOnCalculated(self):
+        """
+        Enable the param table(s) on calculate finish, if the calculation
+        disabled them. Calculations keeping the tables editable, like the
+        scheduled recalculations, leave them and a running fit alone.
+        """
+        if not self.calculation_disabled_interactive or self.fit_started:
+            return
+        self.calculation_disabled_interactive = False
+        self.enableInteractiveElements()
+
     def disableInteractiveElements(self):
         """
         Set button caption on fitting/calculate start
@@ -5,6 +5,7 @@
 import time
 import numpy
 import math
+from scipy.ndimage import distance_transform_edt, map_coordinates
 from sas.sascalc.data_util.calcthread import CalcThread
 from sas.sascalc.fit.MultiplicationModel import MultiplicationModel
 from sas import config
@@ -15,7 +16,18 @@ class Calc2D(CalcThread):
     This calculation assumes a 2-fold symmetry of the model
     where points are computed for one half of the detector
     and I(qx, qy) = I(-qx, -qy) is assumed.
+
+    In progressive mode, a preview is computed first, from about
+    preview_points pixels on a coarse grid covering one half of the
+    detector, interpolated to all the pixels and sent to updatefn, with the
+    same fields as the final result and preview=True. The model is then
+    evaluated on all the pixels as usual.
     """
+    # Number of pixels evaluated for the preview
+    preview_points = 4096
+    # Smallest number of pixels for which a preview is made
+    min_progressive_points = 4 * preview_points
+
     def __init__(self, data, model, smearer, qmin, qmax, page_id,
                  state=None,
                  weight=None,
@@ -28,11 +40,13 @@ class Calc2D(CalcThread):
                  yieldtime=0.04,
                  worktime=0.04,
                  exception_handler=None,
+                 progressive=False,
                  ):
         CalcThread.__init__(self, completefn, updatefn, yieldtime, worktime,
                             exception_handler=exception_handler)
         self.qmin = qmin
         self.qmax = qmax
+        self.progressive = progressive
         self.weight = weight
         self.fid = fid
         #self.qstep = qstep
@@ -77,41 +91,123 @@ class Calc2D(CalcThread):
         index_model = index_model & self.data.mask
         index_model = index_model & numpy.isfinite(self.data.data)
 
+        if self.progressive and self.updatefn is not None \
+                and numpy.count_nonzero(index_model) >= self.min_progressive_points:
+            self.updatefn(self.preview(index_model))
+            self.isquit()
+
+        value = self.evaluate(index_model)
+        output = numpy.zeros(len(self.data.qx_data))
+        # output default is None
+        # This method is to distinguish between masked
+        #point(nan) and data point = 0.
+        output = output / output
+        # set value for self.mask==True, else still None to Plottools
+        output[index_model] = value
+
+        res = self.result(output, index_model)
+
+        if config.USING_TWISTED:
+            return res
+        else:
+            self.completefn(res)
+
+    def evaluate(self, index):
+        """
+        Model values at the pixels selected by index
+        """
         if self.smearer is not None:
             # Set smearer w/ data, model and index.
             fn = self.smearer
             fn.set_model(self.model)
-            fn.set_index(index_model)
+            fn.set_index(index)
             # Calculate smeared Intensity
             #(by Gaussian averaging): DataLoader/smearing2d/Smearer2D()
-            value = fn.get_value()
+            return fn.get_value()
         else:
             # calculation w/o smearing
-            value = self.model.evalDistribution([
-                self.data.qx_data[index_model],
-                self.data.qy_data[index_model]
+            return self.model.evalDistribution([
+                self.data.qx_data[index],
+                self.data.qy_data[index]
             ])
-        output = numpy.zeros(len(self.data.qx_data))
-        # output default is None
-        # This method is to distinguish between masked
-        #point(nan) and data point = 0.
-        output = output / output
-        # set value for self.mask==True, else still None to Plottools
-        output[index_model] = value
+
+    def result(self, output, index_model, preview=False):
+        """
+        Dictionary of results sent to updatefn and completefn
+        """
         elapsed = time.time() - self.starttime
 
-        res = dict(image = output, data = self.data, page_id = self.page_id,
+        return dict(image = output, data = self.data, page_id = self.page_id,
             model = self.model, state = self.state,
             toggle_mode_on = self.toggle_mode_on, elapsed = elapsed,
             index = index_model, fid = self.fid,
             qmin = self.qmin, qmax = self.qmax,
             weight = self.weight, update_chisqr = self.update_chisqr,
-            source = self.source)
+            source = self.source, preview = preview)
 
-        if config.USING_TWISTED:
-            return res
-        else:
-            self.completefn(res)
+    def isSymmetric(self):
+        """
+        Check that I(qx, qy) = I(-qx, -qy), which is not the case
+        for models with magnetic moments
+        """
+        magnetic_params = getattr(self.model, 'magnetic_params', None) or []
+        return not any(self.model.getParam(name) != 0
+                       for name in magnetic_params if name.endswith('_M0'))
+
+    def preview(self, index_model):
+        """
+        Result with the model values interpolated from a subset of the
+        pixels, the one nearest to the centre of each cell of a coarse grid
+        over the half-plane qx >= 0. The other pixels are mirrored into this
+        half-plane if the model is symmetric.
+        """
+        qx = self.data.qx_data[index_model]
+        qy = self.data.qy_data[index_model]
+        if self.isSymmetric():
+            flip = qx < 0
+            qx = numpy.where(flip, -qx, qx)
+            qy = numpy.where(flip, -qy, qy)
+
+        # Pixel positions in units of grid cells
+        cells = int(math.sqrt(self.preview_points))
+        x = (qx - qx.min()) / (numpy.ptp(qx) or 1) * (cells - 1)
+        y = (qy - qy.min()) / (numpy.ptp(qy) or 1) * (cells - 1)
+        cell_x = numpy.rint(x).astype(int)
+        cell_y = numpy.rint(y).astype(int)
+
+        # Pick the pixel nearest to the centre of each cell
+        by_distance = numpy.argsort((x - cell_x)**2 + (y - cell_y)**2)
+        cell_id = (cell_x * cells + cell_y)[by_distance]
+        occupied, first = numpy.unique(cell_id, return_index=True)
+        picked = by_distance[first]
+        order = numpy.argsort(picked)
+
+        index_preview = numpy.zeros_like(index_model)
+        index_preview[numpy.flatnonzero(index_model)[picked[order]]] = True
+        value = numpy.empty(len(picked))
+        value[order] = self.evaluate(index_preview)
+
+        # Intensities span decades, interpolate their logarithm if possible
+        use_log = numpy.all(value > 0)
+        if use_log:
+            value = numpy.log(value)
+
+        # Values on the grid, empty cells take the value of the nearest occupied one
+        grid = numpy.zeros(cells * cells)
+        grid[occupied] = value
+        empty = numpy.ones(cells * cells, dtype=bool)
+        empty[occupied] = False
+        _, nearest = distance_transform_edt(empty.reshape(cells, cells), return_indices=True)
+        grid = grid.reshape(cells, cells)[nearest[0], nearest[1]]
+
+        interpolated = map_coordinates(grid, [x, y], order=1, mode='nearest')
+        if use_log:
+            interpolated = numpy.exp(interpolated)
+
+        output = numpy.full(len(self.data.qx_data), numpy.nan)
+        output[index_model] = interpolated
+
+        return self.result(output, index_model, preview=True)
 
 class Calc1D(CalcThread):
     """
@@ -0,0 +1,165 @@
+"""
+Scheduling of the model recalculations of a fit page.
+
+Every parameter edit, option change or plot request of a fit page asks for
+the model to be recalculated, and the requests come in bursts while the user
+types through the parameter values. Each calculation is followed by the
+chi2, residuals and polydispersity plots, so running all of them would keep
+the page busy long after the last edit. RecalculationScheduler runs at most
+one calculation at a time: requests made while it runs are merged into a
+single one started when it finishes, and results superseded by a newer
+request are dropped without updating the plots.
+"""
+import logging
+
+from PySide6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+
+class RecalculationScheduler(QtCore.QObject):
+    """
+    Recalculate the model of a fit page with latest-wins semantics.
+
+    The page provides calculateQGridForModelExt(), starting a calculation
+    with the given completion, exception and preview callbacks,
+    methodCompleteForData(), returning the method plotting its result,
+    methodPreviewForData(), returning the method plotting a preview or None,
+    and calcException(), reporting a failed calculation. Previews and errors
+    of superseded calculations are dropped too.
+    """
+    calculationPreviewSignal = QtCore.Signal(tuple)
+    calculationCompletedSignal = QtCore.Signal(tuple)
+    calculationFailedSignal = QtCore.Signal(tuple)
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.page = page
+        # Identifier of the latest request
+        self._job = 0
+        # Identifier of the calculation running, None when idle
+        self._running = None
+        self._pending = False
+        # Number of calculations whose results were dropped, for diagnostics
+        self.superseded = 0
+
+        self.calculationPreviewSignal.connect(self._postPreview)
+        self.calculationCompletedSignal.connect(self._postResult)
+        self.calculationFailedSignal.connect(self._postFailure)
+
+    def schedule(self):
+        """
+        Request a recalculation of the model. It starts at once if no other
+        calculation is running, otherwise when the running one finishes,
+        merged with any other request made in the meantime.
+        """
+        self._job += 1
+        self._pending = True
+        if self._running is None:
+            self._dispatch()
+
+    def cancel(self):
+        """
+        Drop the pending request and the result of the running calculation,
+        e.g. when the page is closed
+        """
+        self._job += 1
+        self._pending = False
+
+    def isPending(self):
+        """
+        Check for a calculation running or waiting to start
+        """
+        return self._pending or self._running is not None
+
+    def _dispatch(self):
+        """
+        Start the calculation for the latest request
+        """
+        self._pending = False
+        job = self._job
+        completefn = self.page.methodCompleteForData()
+        previewfn = self.page.methodPreviewForData()
+        updatefn = None
+        if previewfn is not None:
+            updatefn = lambda return_data: self._previewComputed(job, previewfn, return_data)
+
+        self._running = job
+        try:
+            self.page.calculateQGridForModelExt(
+                completefn=lambda return_data: self._calculationCompleted(job, completefn, return_data),
+                exception_handler=lambda *exc_info: self._calculationFailed(job, exc_info),
+                disable_interactive=False,
+                updatefn=updatefn)
+        except Exception:
+            self._running = None
+            raise
+
+    def _previewComputed(self, job, previewfn, return_data):
+        """
+        Called in the calculation thread: pass the preview to the GUI thread
+        """
+        try:
+            self.calculationPreviewSignal.emit((job, previewfn, return_data))
+        except RuntimeError:
+            pass
+
+    def _calculationCompleted(self, job, completefn, return_data):
+        """
+        Called in the calculation thread: pass the result to the GUI thread
+        """
+        try:
+            self.calculationCompletedSignal.emit((job, completefn, return_data))
+        except RuntimeError:
+            # The page was closed while calculating
+            pass
+
+    def _calculationFailed(self, job, exc_info):
+        """
+        Called in the calculation thread: pass the error to the GUI thread
+        """
+        try:
+            self.calculationFailedSignal.emit((job, exc_info))
+        except RuntimeError:
+            pass
+
+    def _postPreview(self, output):
+        """
+        Plot a preview, unless a newer calculation was requested since
+        """
+        job, previewfn, return_data = output
+        if job == self._job and self._running == job:
+            previewfn(return_data)
+
+    def _postResult(self, output):
+        """
+        Plot the result of a calculation, unless a newer one was requested since
+        """
+        job, completefn, return_data = output
+        self._running = None
+
+        if job == self._job:
+            completefn(return_data)
+        else:
+            self.superseded += 1
+            logger.debug("Skipping the plots of a superseded model calculation")
+
+        if self._pending:
+            self._dispatch()
+
+    def _postFailure(self, output):
+        """
+        Report a failed calculation, unless a newer one was requested since,
+        and start the pending one
+        """
+        job, exc_info = output
+        self._running = None
+
+        if job == self._job:
+            self.page.calcException(*exc_info)
+        else:
+            self.superseded += 1
+            logger.debug("Skipping the error of a superseded model calculation")
+
+        if self._pending:
+            self._dispatch()
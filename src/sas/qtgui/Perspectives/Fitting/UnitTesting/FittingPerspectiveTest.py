@@ -108,6 +108,15 @@ class FittingPerspectiveTest:
         assert widget.maxIndex == 4
         assert widget.getTabName() == "FitPage4"
 
+    def testCloseTabCancelsCalculation(self, widget, mocker):
+        '''Pending model calculations of a closed tab are dropped'''
+        widget.addFit(None)
+        tab = widget.tabs[1]
+        mocker.patch.object(tab.recalculation_scheduler, 'cancel')
+
+        widget.tabCloses(1)
+        assert tab.recalculation_scheduler.cancel.called
+
     def testAllowBatch(self, widget):
         '''Assure the perspective allows multiple datasets'''
         assert widget.allowBatch()
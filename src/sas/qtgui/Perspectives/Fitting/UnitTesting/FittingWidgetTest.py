@@ -447,6 +447,27 @@ class FittingWidgetTest:
             # Test the mock
             assert Calc2D.queue.called
 
+    def testCompleteKeepsInteractiveState(self, widget):
+        """
+        Check that only the calculations disabling the param tables enable them again
+        """
+        # A scheduled recalculation finishing while fitting
+        widget.fit_started = True
+        widget.disableInteractiveElements()
+        widget.complete1D(None)
+        assert widget.fit_started
+        assert widget.cmdFit.text() == 'Stop fit'
+        widget.calcException(ValueError, ValueError("failed"), None)
+        assert widget.cmdFit.text() == 'Stop fit'
+
+        # A calculation which disabled them
+        widget.fit_started = False
+        widget.calculation_disabled_interactive = True
+        widget.disableInteractiveElementsOnCalculate()
+        widget.complete2D(None)
+        assert widget.cmdFit.text() == 'Fit'
+        assert not widget.calculation_disabled_interactive
+
     def testCalculateResiduals(self, widget):
         """
         Check that the residuals are calculated and plots updated
@@ -0,0 +1,92 @@
+import pytest
+
+import numpy
+
+# Local
+from sas.qtgui.Perspectives.Fitting.ModelThread import Calc2D
+from sas.qtgui.Plotting.PlotterData import Data2D
+
+
+class DummyModel:
+    ''' Smooth, symmetric 2D model, recording the points evaluated '''
+    name = "dummy"
+    magnetic_params = ['sld_M0']
+
+    def __init__(self):
+        self.evaluated = []
+        self.M0 = 0.0
+
+    def getParam(self, name):
+        return self.M0
+
+    def evalDistribution(self, qdist):
+        qx, qy = qdist
+        self.evaluated.append(len(qx))
+        return numpy.exp(-(qx*10)**2 - (qy*20)**2) + 0.01
+
+
+class Calc2DTest:
+    '''Test the 2D model calculation'''
+
+    @pytest.fixture(autouse=True)
+    def data(self):
+        '''Detector of 200 x 200 pixels'''
+        q = numpy.linspace(-0.3, 0.3, 200)
+        qx, qy = [a.ravel() for a in numpy.meshgrid(q, q)]
+        n = len(qx)
+        data = Data2D(image=numpy.ones(n), qx_data=qx, qy_data=qy,
+                      err_image=numpy.ones(n), mask=numpy.ones(n, dtype=bool))
+        yield data
+
+    def calculate(self, data, model, progressive):
+        previews = []
+        results = []
+        calc = Calc2D(data=data, model=model, smearer=None, qmin=0.0, qmax=1.0, page_id=0,
+                      completefn=results.append, updatefn=previews.append,
+                      progressive=progressive)
+        calc.compute()
+        return previews, results[0]
+
+    def testDefault(self, data):
+        '''Without progressive mode, there is no preview'''
+        model = DummyModel()
+        previews, result = self.calculate(data, model, progressive=False)
+        assert previews == []
+        assert not result['preview']
+        assert model.evaluated == [len(data.qx_data)]
+
+    def testPreview(self, data):
+        '''The preview is interpolated from a few pixels on one half of the detector'''
+        model = DummyModel()
+        previews, result = self.calculate(data, model, progressive=True)
+
+        assert len(previews) == 1
+        assert previews[0]['preview']
+        assert not result['preview']
+
+        n_preview, n_full = model.evaluated
+        assert n_preview <= Calc2D.preview_points
+        assert n_full == len(data.qx_data)
+
+        # Only pixels with qx >= 0 are evaluated for the preview
+        assert n_preview <= numpy.count_nonzero(data.qx_data >= 0)
+
+        # Close to the full calculation, but for a few pixels
+        error = numpy.abs(previews[0]['image'] / result['image'] - 1)
+        assert numpy.percentile(error, 99) < 0.1
+        assert numpy.max(error) < 0.25
+
+    def testMagneticPreview(self, data):
+        '''Models with magnetic moments are not mirrored'''
+        model = DummyModel()
+        model.M0 = 1.0
+        previews, result = self.calculate(data, model, progressive=True)
+        error = numpy.abs(previews[0]['image'] / result['image'] - 1)
+        assert numpy.percentile(error, 99) < 0.1
+
+    def testSmallDetector(self, data):
+        '''Small detectors are calculated in one go'''
+        model = DummyModel()
+        data.mask[Calc2D.min_progressive_points // 2:] = False
+        previews, result = self.calculate(data, model, progressive=True)
+        assert previews == []
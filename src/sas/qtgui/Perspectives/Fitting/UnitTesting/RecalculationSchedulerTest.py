@@ -0,0 +1,156 @@
+import sys
+import threading
+
+import pytest
+
+from PySide6 import QtCore
+
+# Tested module
+from sas.qtgui.Perspectives.Fitting.RecalculationScheduler import RecalculationScheduler
+
+
+class DummyPage(QtCore.QObject):
+    ''' Fit page calculating its parameter value in a thread '''
+    def __init__(self):
+        super().__init__()
+        self.value = 0
+        self.fail = False
+        # Calculations wait for this before finishing
+        self.release = threading.Event()
+        self.release.set()
+        self.started = []
+        self.plotted = []
+        self.previews = []
+        self.errors = []
+        self.has_preview = False
+
+    def methodCompleteForData(self):
+        return self.plotted.append
+
+    def methodPreviewForData(self):
+        return self.previews.append if self.has_preview else None
+
+    def calculateQGridForModelExt(self, completefn, exception_handler, disable_interactive=True, updatefn=None):
+        assert not disable_interactive
+        assert (updatefn is not None) == self.has_preview
+        value = self.value
+        fail = self.fail
+        self.started.append(value)
+
+        def compute():
+            if updatefn is not None:
+                updatefn(-value)
+            self.release.wait()
+            if fail:
+                try:
+                    raise ValueError("calculation failed")
+                except ValueError:
+                    exception_handler(*sys.exc_info())
+            else:
+                completefn(value)
+
+        threading.Thread(target=compute).start()
+
+    def calcException(self, etype, value, tb):
+        self.errors.append(value)
+
+
+class RecalculationSchedulerTest:
+    '''Test the RecalculationScheduler'''
+
+    @pytest.fixture(autouse=True)
+    def scheduler(self, qapp):
+        '''Create/Destroy the RecalculationScheduler'''
+        page = DummyPage()
+        s = RecalculationScheduler(page)
+
+        yield s
+
+        page.release.set()
+        s.cancel()
+
+    def testSingleRequest(self, scheduler, qtbot):
+        '''An idle page starts calculating at once'''
+        scheduler.page.value = 1
+        scheduler.schedule()
+        assert scheduler.page.started == [1]
+        qtbot.waitUntil(lambda: not scheduler.isPending())
+        assert scheduler.page.plotted == [1]
+
+    def testCoalesce(self, scheduler, qtbot):
+        '''Requests made while calculating are merged into the latest'''
+        page = scheduler.page
+        page.release.clear()
+        for value in range(1, 11):
+            page.value = value
+            scheduler.schedule()
+
+        # Only the first is running
+        assert page.started == [1]
+        page.release.set()
+        qtbot.waitUntil(lambda: not scheduler.isPending())
+
+        # The first result is superseded, and not plotted
+        assert page.started == [1, 10]
+        assert page.plotted == [10]
+        assert scheduler.superseded == 1
+
+    def testCancel(self, scheduler, qtbot):
+        '''Results of cancelled calculations are not plotted'''
+        page = scheduler.page
+        page.release.clear()
+        scheduler.schedule()
+        scheduler.cancel()
+        page.release.set()
+        qtbot.waitUntil(lambda: not scheduler.isPending())
+        assert page.plotted == []
+
+    def testFailure(self, scheduler, qtbot):
+        '''Errors are reported, and the next request still runs'''
+        page = scheduler.page
+        page.fail = True
+        scheduler.schedule()
+        qtbot.waitUntil(lambda: not scheduler.isPending())
+        assert len(page.errors) == 1
+
+        page.fail = False
+        page.value = 2
+        scheduler.schedule()
+        qtbot.waitUntil(lambda: not scheduler.isPending())
+        assert page.plotted == [2]
+
+    def testSupersededFailure(self, scheduler, qtbot):
+        '''Errors of superseded calculations are not reported'''
+        page = scheduler.page
+        page.release.clear()
+        page.fail = True
+        scheduler.schedule()
+        page.fail = False
+        page.value = 2
+        scheduler.schedule()
+        page.release.set()
+        qtbot.waitUntil(lambda: not scheduler.isPending())
+        assert page.errors == []
+        assert page.plotted == [2]
+        assert scheduler.superseded == 1
+
+    def testPreview(self, scheduler, qtbot):
+        '''Previews are shown before the result, unless superseded'''
+        page = scheduler.page
+        page.has_preview = True
+        page.value = 1
+        scheduler.schedule()
+        qtbot.waitUntil(lambda: not scheduler.isPending())
+        assert page.previews == [-1]
+        assert page.plotted == [1]
+
+        page.release.clear()
+        page.value = 2
+        scheduler.schedule()
+        qtbot.waitUntil(lambda: page.previews == [-1, -2])
+        page.value = 3
+        scheduler.schedule()
+        page.release.set()
+        qtbot.waitUntil(lambda: not scheduler.isPending())
+        assert page.previews == [-1, -2, -3]
+        assert page.plotted == [1, 3]
@@ -11,8 +11,10 @@ from twisted.internet import reactor
 
 # sas-global
 from sas.sascalc.invariant import invariant
+from sas.sascalc.invariant.invariant_batch import compute_invariant_batch, results_to_table
 from sas.qtgui.Plotting.PlotterData import Data1D, DataRole
 import sas.qtgui.Utilities.GuiUtils as GuiUtils
+from sas.qtgui.Utilities.GridPanel import BatchInvariantOutputPanel
 
 # local
 from ..perspective import Perspective
@@ -96,6 +98,9 @@ class InvariantWindow(QtWidgets.QDialog, Ui_tabbedInvariantUI, Perspective):
 
         self._allow_close = False
 
+        # Batch calculation
+        self.batchResultsWindow = None
+
         # Modify font in order to display Angstrom symbol correctly
         new_font = 'font-family: -apple-system, "Helvetica Neue", "Ubuntu";'
         self.lblTotalQUnits.setStyleSheet(new_font)
@@ -925,10 +930,6 @@ class InvariantWindow(QtWidgets.QDialog, Ui_tabbedInvariantUI, Perspective):
         """
         assert data_item is not None
 
-        if self.txtName.text() == data_item[0].text():
-            logging.info('This file is already loaded in Invariant panel.')
-            return
-
         if not isinstance(data_item, list):
             msg = "Incorrect type passed to the Invariant Perspective"
             raise AttributeError(msg)
@@ -937,6 +938,15 @@ class InvariantWindow(QtWidgets.QDialog, Ui_tabbedInvariantUI, Perspective):
             msg = "Incorrect type passed to the Invariant Perspective"
             raise AttributeError(msg)
 
+        # Batch mode: compute all data sets with the current settings
+        if is_batch and len(data_item) > 1:
+            self.calculateBatch(data_item)
+            return
+
+        if self.txtName.text() == data_item[0].text():
+            logging.info('This file is already loaded in Invariant panel.')
+            return
+
         # only 1 file can be loaded
         self._model_item = data_item[0]
 
@@ -950,6 +960,87 @@ class InvariantWindow(QtWidgets.QDialog, Ui_tabbedInvariantUI, Perspective):
         # update GUI and model with info from loaded data
         self.updateGuiFromFile(data=data)
 
+    def getBatchSettings(self):
+        """
+        Collect the current background, scale, contrast and extrapolation
+        settings in the format used by compute_invariant_batch.
+        Returns None if a setting is not a valid number.
+        """
+        try:
+            self.updateFromModel()
+            settings = {'background': self._background,
+                        'scale': self._scale,
+                        'contrast': self._contrast,
+                        'porod_const': self._porod}
+            if self._low_extrapolate:
+                settings['low'] = {
+                    'npts': int(self._low_points),
+                    'function': "guinier" if self._low_guinier else "power_law",
+                    'power': None if self._low_fit else self._low_power_value,
+                    'q_limit': float(self.txtExtrapolQMin.text())}
+            if self._high_extrapolate:
+                settings['high'] = {
+                    'npts': int(self._high_points),
+                    'function': "power_law",
+                    'power': None if self._high_fit else self._high_power_value,
+                    'q_limit': float(self.txtExtrapolQMax.text())}
+        except ValueError as ex:
+            msg = "Invalid invariant settings for the batch calculation: {}".format(str(ex))
+            logging.warning(msg)
+            QtWidgets.QMessageBox.warning(self, 'Batch Invariant', msg, QtWidgets.QMessageBox.Ok)
+            return None
+        return settings
+
+    def calculateBatch(self, data_items):
+        """
+        Compute the invariant of several data sets in worker processes,
+        sharing the settings currently shown in the panel.
+        2D data sets are skipped.
+        """
+        datasets = []
+        for item in data_items:
+            data = GuiUtils.dataFromItem(item)
+            if isinstance(data, Data1D):
+                datasets.append(data)
+            else:
+                logging.warning('Invariant cannot be computed with 2D data, '
+                                'skipping {}'.format(item.text()))
+        if not datasets:
+            msg = "Invariant cannot be computed with 2D data."
+            QtWidgets.QMessageBox.warning(self, 'Batch Invariant', msg, QtWidgets.QMessageBox.Ok)
+            return
+
+        settings = self.getBatchSettings()
+        if settings is None:
+            return
+
+        self.cmdCalculate.setText("Calculating...")
+        self.cmdCalculate.setEnabled(False)
+
+        d = threads.deferToThread(compute_invariant_batch, datasets, settings)
+        d.addCallback(self.deferredBatchOutput)
+        d.addErrback(self.calculationFailed)
+
+    def deferredBatchOutput(self, results):
+        """
+        Show the batch results in the main thread
+        """
+        reactor.callFromThread(lambda: self.showBatchOutput(results))
+        self.allow_calculation()
+
+    def showBatchOutput(self, results):
+        """
+        Display the batch output in tabular form
+        """
+        table = results_to_table(results)
+        if self.batchResultsWindow is None:
+            self.batchResultsWindow = BatchInvariantOutputPanel(
+                parent=self._manager, output_data=table, perspective=self)
+        else:
+            self.batchResultsWindow.setupTable(
+                widget=self.batchResultsWindow.tblParams, data=table)
+        self.batchResultsWindow.show()
+
     def removeData(self, data_list=None):
         """Remove the existing data reference from the Invariant Persepective"""
         if not data_list or self._model_item not in data_list:
@@ -1127,9 +1218,9 @@ class InvariantWindow(QtWidgets.QDialog, Ui_tabbedInvariantUI, Perspective):
 
     def allowBatch(self):
         """
-        Tell the caller that we don't accept multiple data instances
+        Tell the caller that we accept multiple data instances
         """
-        return False
+        return True
 
     def allowSwap(self):
         """
@@ -166,7 +166,7 @@ class InvariantPerspectiveTest:
     def checkControlDefaults(self, widget):
         # All values in this list should assert to False
         false_list = [
-            widget._allow_close, widget.allowBatch(),
+            widget._allow_close,
             # disabled buttons
             widget.cmdStatus.isEnabled(), widget.cmdCalculate.isEnabled(),
             # read only text boxes
@@ -185,6 +185,8 @@ class InvariantPerspectiveTest:
             widget.txtExtrapolQMax.isEnabled(), widget.txtExtrapolQMin.isEnabled(),
             # enabled text boxes
             widget.txtVolFract.isReadOnly(), widget.txtVolFractErr.isReadOnly(),
+            # batch mode
+            widget.allowBatch(),
             widget.txtSpecSurf.isReadOnly(), widget.txtSpecSurfErr.isReadOnly(),
             widget.txtInvariantTot.isReadOnly(), widget.txtInvariantTotErr.isReadOnly(),
             # radio buttons exclusivity
@@ -421,6 +423,34 @@ class InvariantPerspectiveTest:
         widget.removeData([self.fakeData])
         self.checkControlDefaults(widget)
 
+    def testBatchInvalidSettings(self, widget, mocker):
+        """ Invalid extrapolation limits are reported instead of raised """
+        mocker.patch.object(QtWidgets.QMessageBox, 'warning')
+        widget.setData([self.fakeData])
+        widget.chkLowQ.setChecked(True)
+        widget.txtExtrapolQMin.setText('abc')
+        mocker.patch.object(threads, 'deferToThread')
+
+        assert widget.getBatchSettings() is None
+        widget.calculateBatch([self.fakeData, self.fakeData])
+        assert QtWidgets.QMessageBox.warning.call_count == 2
+        threads.deferToThread.assert_not_called()
+
+    def testBatch2DData(self, widget, mocker):
+        """ 2D data sets are left out of the batch """
+        mocker.patch.object(QtWidgets.QMessageBox, 'warning')
+        mocker.patch.object(threads, 'deferToThread')
+        data_2d = object()
+        item_2d = QtGui.QStandardItem("2d")
+        GuiUtils.dataFromItem.side_effect = lambda item: data_2d if item is item_2d else self.data
+
+        widget.calculateBatch([self.fakeData, item_2d])
+        assert threads.deferToThread.call_args[0][1] == [self.data]
+
+        widget.calculateBatch([item_2d])
+        QtWidgets.QMessageBox.warning.assert_called_once()
+        assert threads.deferToThread.call_count == 1
+
     def checkFakeDataState(self, widget):
         """ Ensure the state is constant every time the fake data set loaded """
         assert widget._data is not None
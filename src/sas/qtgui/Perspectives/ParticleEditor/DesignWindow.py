@@ -1,10 +1,11 @@
 import traceback
+import hashlib
 from typing import Optional
 
 from datetime import datetime
 
 import numpy as np
-from PySide6 import QtWidgets
+from PySide6 import QtGui, QtWidgets
 from PySide6.QtWidgets import QSpacerItem, QSizePolicy
 from PySide6.QtCore import Qt
 
@@ -19,7 +20,7 @@ from sas.qtgui.Perspectives.ParticleEditor.Plots.QCanvas import QCanvas
 
 
 from sas.qtgui.Perspectives.ParticleEditor.function_processor import process_code, FunctionDefinitionFailed
-from sas.qtgui.Perspectives.ParticleEditor.vectorise import vectorise_sld
+from sas.qtgui.Perspectives.ParticleEditor.vectorise import vectorise_sld, shutdown_process_pool
 
 
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
@@ -40,6 +41,9 @@ from sas.qtgui.Perspectives.ParticleEditor.util import format_time_estimate
 
 from sas.qtgui.Perspectives.ParticleEditor.calculations.calculate import calculate_scattering
 
+# Seed used when the fixed seed is not a valid number
+DEFAULT_SEED = 0
+
 def safe_float(text: str):
     try:
         return float(text)
@@ -141,6 +145,15 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
 
         self.qSamplesBox.valueChanged.connect(self.onTimeEstimateParametersChanged)
 
+        # Adaptive sampling
+        self.adaptiveSampling.toggled.connect(self.targetError.setEnabled)
+
+        # Seeds of the random sampling
+        self.randomSeed.setValidator(QtGui.QIntValidator(0, 2**31 - 1, self.randomSeed))
+
+        # Scattering calculation running, the window is kept open until it finishes
+        self.scattering_running = False
+
         #
         # Output Tabs
         #
@@ -169,6 +182,7 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
 
         self.sld_function: Optional[SLDFunction] = None
         self.sld_coordinate_mapping: Optional[CoordinateSystemTransform] = None
+        self.sld_source_hash: Optional[str] = None
         self.magnetism_function: Optional[np.ndarray] = None
         self.magnetism_coordinate_mapping: Optional[np.ndarray] = None
 
@@ -229,7 +243,8 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
             maybe_vectorised = vectorise_sld(
                 function,
                 warning_callback=self.codeWarning,
-                error_callback=self.codeError) # TODO: Deal with args
+                error_callback=self.codeError,
+                source_code=code) # TODO: Deal with args
 
             if maybe_vectorised is None:
                 return False
@@ -237,6 +252,7 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
             self.functionViewer.setSLDFunction(maybe_vectorised, xyz_converter)
             self.sld_function = maybe_vectorised
             self.sld_coordinate_mapping = xyz_converter
+            self.sld_source_hash = hashlib.sha256(code.encode()).hexdigest()  # Identifies cached SLD values
 
 
             now = datetime.now()
@@ -268,7 +284,7 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
         # All the methods need the radius, number of points, etc
         radius = float(self.sampleRadius.value())
         n_points = int(self.nSamplePoints.value())
-        seed = int(self.randomSeed.text()) if self.fixRandomSeed.isChecked() else None
+        seed = self.currentSeed()
 
         if sample_type == 0:
             return GridSampling(radius=radius, desired_points=n_points)
@@ -287,7 +303,8 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
 
             return SLDDefinition(
                 self.sld_function,
-                self.sld_coordinate_mapping)
+                self.sld_coordinate_mapping,
+                self.sld_source_hash)
 
         else:
             raise NotImplementedError("Careful handling of SLD Definitions not implemented yet")
@@ -309,8 +326,24 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
         """ Get a numpy vector representing the GUI specified polarisation vector"""
         return np.array([0,0,1])
 
-    def currentSeed(self):
-        return self.randomSeed
+    def currentSeed(self) -> Optional[int]:
+        """ Seed of the random sampling if it is fixed, None otherwise"""
+        if not self.fixRandomSeed.isChecked():
+            return None
+
+        try:
+            return int(self.randomSeed.text())
+        except ValueError:
+            self.codeWarning(f"Invalid random seed '{self.randomSeed.text()}', using {DEFAULT_SEED}")
+            self.randomSeed.setText(str(DEFAULT_SEED))
+            return DEFAULT_SEED
+
+    def targetRelativeError(self) -> Optional[float]:
+        """ Relative error to add points until, if adaptive sampling is selected"""
+        if self.adaptiveSampling.isChecked():
+            return 0.01 * float(self.targetError.value())
+        else:
+            return None
 
     def scatteringCalculation(self) -> ScatteringCalculation:
         """ Get the ScatteringCalculation object that represents the calculation that
@@ -324,6 +357,10 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
         seed = self.currentSeed()
         bounding_surface_check = self.continuityCheck.isChecked()
 
+        target_relative_error = self.targetRelativeError()
+        if not spatial_sampling.allows_bootstrap:
+            target_relative_error = None
+
         return ScatteringCalculation(
             q_sampling=q_sampling,
             angular_sampling=angular_distribution,
@@ -333,7 +370,8 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
             polarisation_vector=polarisation_vector,
             seed=seed,
             bounding_surface_sld_check=bounding_surface_check,
-            sample_chunk_size_hint=100_000
+            sample_chunk_size_hint=100_000,
+            target_relative_error=target_relative_error
             )
 
     def doScatter(self):
@@ -342,18 +380,30 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
         # attempt to build
         # don't do scattering if build fails
 
+        if self.scattering_running:
+            return
+
         build_success = self.doBuild()
 
         self.codeText("Calculating scattering...")
 
         if build_success:
             calc = self.scatteringCalculation()
+
+            if self.adaptiveSampling.isChecked() and calc.target_relative_error is None:
+                self.codeWarning("Adding points until the target error is reached needs random sampling, "
+                                 "using all the sample points")
+
+            # Partial results process the events, don't start another calculation or close the window
+            self.scattering_running = True
+            self.codeToolBar.scatterButton.setEnabled(False)
+
             try:
-                scattering_result = calculate_scattering(calc)
+                scattering_result = calculate_scattering(calc, progress_callback=self.onScatteringProgress)
 
                 # Time estimates
                 self.last_calculation_time = scattering_result.calculation_time
-                self.last_calculation_n_r = calc.spatial_sampling_method.n_points
+                self.last_calculation_n_r = scattering_result.n_points_used
 
                 self.onTimeEstimateParametersChanged()
 
@@ -364,10 +414,44 @@ class DesignWindow(QtWidgets.QDialog, Ui_DesignWindow):
             except Exception:
                 self.codeError(traceback.format_exc())
 
+            finally:
+                self.scattering_running = False
+                self.codeToolBar.scatterButton.setEnabled(True)
 
         else:
             self.codeError("Build failed, scattering cancelled")
 
+    def onScatteringProgress(self, partial_result: ScatteringOutput):
+        """ Show the partial results of an adaptive calculation"""
+
+        q_data = partial_result.q_space
+        error = q_data.upper_error - q_data.ordinate
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Bins of zero intensity only count if they have an error
+            relative_error = np.max(np.where(error > 0, error / np.abs(q_data.ordinate), 0.0))
+
+        self.codeText(f"{partial_result.n_points_used} points, largest relative error {100*relative_error:.3g}%")
+
+        self.outputCanvas.data = partial_result
+
+        # The calculation runs in the GUI thread
+        QtWidgets.QApplication.processEvents()
+
+    def closeEvent(self, event):
+        """ Keep the window open while the scattering is calculated"""
+        if self.scattering_running:
+            self.codeWarning("Scattering calculation running, wait for it to finish before closing")
+            event.ignore()
+        else:
+            shutdown_process_pool()
+            super().closeEvent(event)
+
+    def reject(self):
+        """ Keep the window open on escape while the scattering is calculated"""
+        if not self.scattering_running:
+            shutdown_process_pool()
+            super().reject()
+
     def display_calculation_result(self, scattering_result: ScatteringOutput):
         """ Update graphs and select tab"""
 
@@ -0,0 +1,143 @@
+""" Scattering calculation that adds random points until the intensity reaches a given relative error
+
+Points are added in sections of section_size points, and the amplitude of each section is kept. The
+intensity of all the points is |sum of the section amplitudes|^2, its error is estimated by bootstrapping,
+recalculating it for random resamplings (with replacement) of the sections. This needs a sampler whose
+points in different sections are independent, see SpatialDistribution.allows_bootstrap.
+
+Only max_sections amplitudes are kept, when there are more, pairs of sections are combined into one.
+
+The calculation stops when the relative error of every q bin is below the target, or when all the points
+of the sampler have been used.
+"""
+
+from typing import Optional, Callable, Tuple
+
+import numpy as np
+
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
+    SLDDefinition, MagnetismDefinition, AngularDistribution, QSample, CalculationParameters, SpatialDistribution)
+
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import scattering_amplitudes
+
+
+class BootstrapNotAllowed(Exception):
+    pass
+
+
+# Called with the intensity, its error, and the number of points used so far
+ProgressCallback = Callable[[np.ndarray, np.ndarray, int], None]
+
+
+def bootstrap_intensity(
+        real_parts: np.ndarray,
+        imaginary_parts: np.ndarray,
+        direction_weights: np.ndarray,
+        n_bootstrap: int,
+        rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+
+    """ Intensity of all the sections, and its bootstrap standard deviation
+
+    :param real_parts: n_sections x n_directions x n_q array of the real part of the section amplitudes
+    :param imaginary_parts: same for the imaginary part
+    """
+
+    n_sections, n_directions, n_q = real_parts.shape
+
+    real_parts = real_parts.reshape(n_sections, -1)
+    imaginary_parts = imaginary_parts.reshape(n_sections, -1)
+
+    def intensity(real_part, imaginary_part):
+        f_squared = (real_part**2 + imaginary_part**2).reshape(-1, n_directions, n_q)
+        return np.sum(f_squared * direction_weights.reshape(1, -1, 1), axis=1)
+
+    total = intensity(np.sum(real_parts, axis=0), np.sum(imaginary_parts, axis=0))[0]
+
+    # Number of times each section is picked in each resampling
+    counts = rng.multinomial(n_sections, np.full(n_sections, 1/n_sections), size=n_bootstrap)
+
+    resampled = intensity(counts @ real_parts, counts @ imaginary_parts)
+
+    return total, np.std(resampled, axis=0)
+
+
+def adaptive_scattering(
+        sld_definition: SLDDefinition,
+        magnetism_definition: Optional[MagnetismDefinition],
+        parameters: CalculationParameters,
+        point_generator: SpatialDistribution,
+        q_sample: QSample,
+        angular_distribution: AngularDistribution,
+        target_relative_error: float,
+        progress_callback: Optional[ProgressCallback] = None,
+        section_size: int = 10_000,
+        min_sections: int = 4,
+        max_sections: int = 64,
+        n_bootstrap: int = 32,
+        seed: Optional[int] = None,
+        chunk_size=1_000_000,
+        evaluation_chunk_size: int = 100_000) -> Tuple[np.ndarray, np.ndarray, int]:
+
+    """ Orientationally weighted intensity at the q magnitudes of q_sample, using no more points than needed
+    for the target relative error, and at most the number of points of the point generator
+
+    :param progress_callback: called with the intensity, error and number of points after each section,
+                              once there are min_sections
+    :param max_sections: when there are this many sections (an even number), pairs of them are combined,
+                         and the size of new sections doubled
+    :param evaluation_chunk_size: number of points the SLD is evaluated for at a time, at most section_size
+                                  so that the first sections don't evaluate more points than they use
+    :returns: intensity, error (standard deviation), number of points used
+    """
+
+    if not point_generator.allows_bootstrap:
+        raise BootstrapNotAllowed(f"Adaptive sampling is not possible with {point_generator.__class__.__name__} sampling")
+
+    if point_generator.n_points <= 0:
+        raise ValueError("Adaptive sampling needs at least one point")
+
+    q_magnitudes = q_sample()
+    direction_vectors, direction_weights = angular_distribution.sample_points_and_weights()
+
+    rng = np.random.default_rng(seed)
+
+    evaluation_chunk_size = min(evaluation_chunk_size, section_size)
+
+    real_parts = []
+    imaginary_parts = []
+
+    start_index = 0
+    while start_index < point_generator.n_points:
+        end_index = min(start_index + section_size, point_generator.n_points)
+
+        # TODO: Magnetism
+
+        real_part, imaginary_part = scattering_amplitudes(
+            sld_definition, parameters, point_generator, direction_vectors, q_magnitudes,
+            start_index=start_index, end_index=end_index, chunk_size=chunk_size,
+            evaluation_chunk_size=evaluation_chunk_size)
+
+        real_parts.append(real_part)
+        imaginary_parts.append(imaginary_part)
+
+        start_index = end_index
+
+        # Keep the memory bounded, by combining pairs of sections, and making new sections twice as large
+        if len(real_parts) == max_sections:
+            real_parts = [a + b for a, b in zip(real_parts[::2], real_parts[1::2])]
+            imaginary_parts = [a + b for a, b in zip(imaginary_parts[::2], imaginary_parts[1::2])]
+            section_size *= 2
+
+        if len(real_parts) < min_sections and end_index < point_generator.n_points:
+            continue
+
+        intensity, error = bootstrap_intensity(
+            np.array(real_parts), np.array(imaginary_parts), direction_weights, n_bootstrap, rng)
+
+        if progress_callback is not None:
+            progress_callback(intensity, error, end_index)
+
+        if np.all(error <= target_relative_error * np.abs(intensity)):
+            break
+
+    return intensity, error, end_index
@@ -1,8 +1,12 @@
 import time
+from typing import Callable, Optional
 
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import \
     ScatteringCalculation, QSpaceScattering, ScatteringOutput
 from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import scattering_via_fq
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fft import scattering_via_fft
+from sas.qtgui.Perspectives.ParticleEditor.calculations.adaptive import adaptive_scattering
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import Grid
 from sas.qtgui.Perspectives.ParticleEditor.calculations.boundary_check import (
     check_sld_continuity_at_boundary, check_mag_zero_at_boundary)
 
@@ -13,7 +17,15 @@ class MagBoundaryNonZero(Exception):
     pass
 
 
-def calculate_scattering(calculation: ScatteringCalculation) -> ScatteringOutput:
+def calculate_scattering(
+        calculation: ScatteringCalculation,
+        progress_callback: Optional[Callable[[ScatteringOutput], None]] = None) -> ScatteringOutput:
+
+    """ Run the scattering calculation
+
+    :param progress_callback: called with the partial results of an adaptive calculation
+                              (see ScatteringCalculation.target_relative_error) as points are added
+    """
 
     start_time = time.time()
 
@@ -33,36 +45,54 @@ def calculate_scattering(calculation: ScatteringCalculation) -> ScatteringOutput
     q_dist = calculation.q_sampling
     angular_dist = calculation.angular_sampling
 
-    scattering = scattering_via_fq(
-        sld_definition=sld_def,
-        magnetism_definition=mag_def,
-        parameters=params,
-        point_generator=spatial_dist,
-        q_sample=q_dist,
-        angular_distribution=angular_dist)
-
-    q_data = QSpaceScattering(q_dist, scattering)
-
-    output = ScatteringOutput(
-        q_space=q_data,
-        calculation_time=time.time() - start_time,
-        seed_used=None)
-
-    return output
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+    seed_used = getattr(spatial_dist, "seed", None)
+
+    def output(q_data: QSpaceScattering, n_points: int) -> ScatteringOutput:
+        return ScatteringOutput(
+            q_space=q_data,
+            calculation_time=time.time() - start_time,
+            seed_used=seed_used,
+            n_points_used=n_points)
+
+    if calculation.target_relative_error is not None:
+
+        def on_progress(intensity, error, n_points):
+            if progress_callback is not None:
+                progress_callback(output(QSpaceScattering(q_dist, intensity, intensity + error, intensity - error), n_points))
+
+        scattering, error, n_points = adaptive_scattering(
+            sld_definition=sld_def,
+            magnetism_definition=mag_def,
+            parameters=params,
+            point_generator=spatial_dist,
+            q_sample=q_dist,
+            angular_distribution=angular_dist,
+            target_relative_error=calculation.target_relative_error,
+            progress_callback=on_progress,
+            evaluation_chunk_size=calculation.sample_chunk_size_hint)
+
+        return output(QSpaceScattering(q_dist, scattering, scattering + error, scattering - error), n_points)
+
+    if calculation.grid_fft and isinstance(spatial_dist, Grid):
+        # Points on a grid, the SLD only needs evaluating once, and the sum over points is an FFT,
+        # interpolated at the q vectors. Near the minima of the intensity the interpolation is less
+        # accurate than the direct sum, so it is only used when asked for
+        scattering = scattering_via_fft(
+            sld_definition=sld_def,
+            magnetism_definition=mag_def,
+            parameters=params,
+            grid=spatial_dist,
+            q_sample=q_dist,
+            angular_distribution=angular_dist)
+
+    else:
+        scattering = scattering_via_fq(
+            sld_definition=sld_def,
+            magnetism_definition=mag_def,
+            parameters=params,
+            point_generator=spatial_dist,
+            q_sample=q_dist,
+            angular_distribution=angular_dist,
+            evaluation_chunk_size=calculation.sample_chunk_size_hint)
+
+    return output(QSpaceScattering(q_dist, scattering), spatial_dist.n_points)
@@ -1,122 +1,130 @@
-from typing import Optional, Tuple
-import time
+""" Orientationally averaged scattering by the Debye formula
+
+    I(q) = sum_i sld_i^2 + 2 sum_{i<j} sld_i sld_j sin(q r_ij) / (q r_ij)
+
+The pairs of points are visited in chunks (see sampling.chunking.Chunks), and the products of SLDs are
+accumulated into a histogram of the pair distances, so the memory used depends on the chunk size and the
+number of bins, not on the number of points or q values. The sum over q is done once, over the bins.
+"""
+
+from typing import Optional
 
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.special import jv as bessel
-from scipy.spatial.distance import cdist
 
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
-    ScatteringCalculation, ScatteringOutput, OrientationalDistribution, SamplingDistribution,
-    QSpaceScattering, QSpaceCalcDatum, RealSpaceScattering,
-    SLDDefinition, MagnetismDefinition, SpatialSample, QSample, CalculationParameters)
+    SLDDefinition, MagnetismDefinition, QSample, CalculationParameters)
 
-from sas.qtgui.Perspectives.ParticleEditor.sampling.chunking import SingleChunk, pairwise_chunk_iterator
+from sas.qtgui.Perspectives.ParticleEditor.sampling.chunking import Chunks
 from sas.qtgui.Perspectives.ParticleEditor.sampling.points import SpatialDistribution
 
-from sas.qtgui.Perspectives.ParticleEditor.calculations.run_function import run_sld, run_magnetism
-
-def debye(
-        sld_definition: SLDDefinition,
-        magnetism_definition: Optional[MagnetismDefinition],
-        parameters: CalculationParameters,
-        point_generator: SpatialDistribution,
-        q_sample: QSample,
-        minor_chunk_size=1000,
-        preallocate=True):
-
-    q = q_sample()
+from sas.qtgui.Perspectives.ParticleEditor.calculations.run_function import run_sld_chunk
 
-    output = np.zeros_like(q)
 
+def distances(points_1, points_2) -> np.ndarray:
+    """ Matrix of distances between two sets of points """
 
-    # First chunking layer, chunks for dealing with VERY large sample densities
-    # Uses less memory at the cost of using more processing power
-    for (x1_large, y1_large, z1_large), (x2_large, y2_large, z2_large) in SingleChunk(point_generator):
-        sld1 = run_sld(sld_definition, parameters, x1_large, y1_large, z1_large)
-        sld2 = run_sld(sld_definition, parameters, x2_large, y2_large, z2_large)
+    x1, y1, z1 = points_1
+    x2, y2, z2 = points_2
 
-        if magnetism_definition is None:
+    r = np.subtract.outer(x1, x2)
+    r **= 2
 
-            sld1_total_large = sld1
-            sld2_total_large = sld2
+    component = np.subtract.outer(y1, y2)
+    component **= 2
+    r += component
 
-        else:
-            raise NotImplementedError("Magnetism not implemented yet")
-            # TODO: implement magnetism
+    np.subtract(z1.reshape(-1, 1), z2.reshape(1, -1), out=component)
+    component **= 2
+    r += component
 
+    return np.sqrt(r, out=r)
 
 
-        # TODO: Preallocation, do we want it
-        if preallocate:
-            r_data_1 = np.zeros((minor_chunk_size, minor_chunk_size))
-            r_data_2 = np.zeros((minor_chunk_size, minor_chunk_size))
-            rq_data = np.zeros((minor_chunk_size**2, q_sample.n_points))
+def pair_distance_histogram(
+        sld_definition: SLDDefinition,
+        parameters: CalculationParameters,
+        point_generator: SpatialDistribution,
+        bin_count: int = 1_000,
+        chunk_size: int = 1_000):
 
-        for one, two in pairwise_chunk_iterator(
-                left_data=(x1_large, y1_large, z1_large, sld1_total_large),
-                right_data=(x2_large, y2_large, z2_large, sld2_total_large),
-                chunk_size=minor_chunk_size):
+    """ Sum of sld_i sld_j over the pairs of different points, binned by distance,
+    and the sum of sld_i^2 over the points
 
-            (x1, y1, z1, sld_total_1) = one
-            (x2, y2, z2, sld_total_2) = two
+    Each pair is counted once.
 
-            # Optimised calculation of euclidean distance, use pre-allocated memory
+    :returns: bin centres, binned sums, self term
+    """
 
-            if preallocate:
-                n1 = len(x1)
-                n2 = len(x2)
+    # Largest distance between two points in the sampling cube
+    r_max = 2 * np.sqrt(3) * point_generator.radius
+    bin_width = r_max / bin_count
 
-                r_data_1[:n1, :n2] = np.subtract.outer(x1, x2)
-                r_data_1 **= 2
+    histogram = np.zeros(bin_count)
+    self_term = 0.0
 
-                r_data_2[:n1, :n2] = np.subtract.outer(y1, y2)
-                r_data_1[:n1, :n2] += r_data_2[:n1, :n2] ** 2
+    left_points, left_sld = None, None
 
-                r_data_2[:n1, :n2] = np.subtract.outer(z1, z2)
-                r_data_1[:n1, :n2] += r_data_2[:n1, :n2] ** 2
+    chunks = Chunks(point_generator, chunk_size)
 
-                np.sqrt(r_data_1, out=r_data_1) # in place sqrt
+    for (range_1, range_2), (points_1, points_2) in zip(chunks.ranges(), chunks):
 
-                r_data_2[:n1, :n2] = np.multiply.outer(sld_total_1, sld_total_2)
+        if points_1 is not left_points:
+            left_points = points_1
+            left_sld = run_sld_chunk(sld_definition, parameters, point_generator, *range_1, points_1)
 
-                # Build a table of r times q values
+        if points_2 is points_1:
+            sld_2 = left_sld
+        else:
+            sld_2 = run_sld_chunk(sld_definition, parameters, point_generator, *range_2, points_2)
 
-                rq_data[:(n1 * n2), :] = np.multiply.outer(r_data_1[:n1, :n2].reshape(-1), q)
+        bins = distances(points_1, points_2)
+        bins /= bin_width
+        bins = np.minimum(bins.astype(int), bin_count - 1)
 
-                # Calculate sinc part
-                rq_data[:(n1 * n2), :] = np.sinc(rq_data[:(n1 * n2), :])
+        chunk_histogram = np.bincount(
+            bins.reshape(-1),
+            weights=np.multiply.outer(left_sld, sld_2).reshape(-1),
+            minlength=bin_count)
 
+        if points_2 is points_1:
+            # Diagonal chunk, has every pair twice, and each point with itself, at zero distance
+            point_self_term = np.sum(left_sld**2)
 
-                # Multiply by paired density
-                rq_data[:(n1 * n2), :] *= r_data_2[:n1, :n2].reshape(-1, 1)
+            chunk_histogram[0] -= point_self_term
+            chunk_histogram /= 2
 
+            self_term += point_self_term
 
-                # Multiply by r squared
-                np.multiply(r_data_1, r_data_1, out=r_data_1)
-                rq_data[:(n1 * n2), :] *= r_data_1[:n1, :n2].reshape(-1, 1)
+        histogram += chunk_histogram
 
-                # Add to q data
-                output += np.sum(rq_data, axis=0)
+    bin_centres = (np.arange(bin_count) + 0.5) * bin_width
 
-            else:
+    return bin_centres, histogram, self_term
 
-                # Non optimised
-                r_squared = np.subtract.outer(x1, x2) ** 2 + \
-                                np.subtract.outer(y1, y2) ** 2 + \
-                                np.subtract.outer(z1, z2) ** 2
 
-                # print(r_squared.shape)
+def debye(
+        sld_definition: SLDDefinition,
+        magnetism_definition: Optional[MagnetismDefinition],
+        parameters: CalculationParameters,
+        point_generator: SpatialDistribution,
+        q_sample: QSample,
+        bin_count: int = 1_000,
+        chunk_size: int = 1_000) -> np.ndarray:
 
-                correl = sld_total_1.reshape(1, -1) * sld_total_2.reshape(-1, 1)
-                correl = correl.reshape(-1, 1)
+    """ Orientationally averaged intensity at the q magnitudes of q_sample
 
-                rq = np.sqrt(r_squared.reshape(-1, 1)) * q.reshape(1,-1)
+    :param bin_count: number of pair distance bins, between 0 and the diagonal of the sampling cube
+    :param chunk_size: number of points in each chunk, chunk_size^2 distances are held at a time
+    """
 
-                # print(rq.shape)
+    if magnetism_definition is not None:
+        raise NotImplementedError("Magnetism not implemented yet")
+        # TODO: implement magnetism
 
-                output += np.sum(r_squared.reshape(-1, 1) * correl * np.sinc(rq), axis=0)
-                # output += np.sum(r_squared.reshape(-1, 1) * correl * np.sinc(rq), axis=0)
+    q = q_sample()
 
+    r, histogram, self_term = pair_distance_histogram(
+        sld_definition, parameters, point_generator, bin_count=bin_count, chunk_size=chunk_size)
 
-    return output
\ No newline at end of file
+    # np.sinc(x) is sin(pi x) / (pi x)
+    return self_term + 2 * np.sinc(np.multiply.outer(q, r) / np.pi) @ histogram
@@ -1,5 +1,11 @@
+""" Time and peak memory of the Debye calculation against the number of points
+
+Compares chunks of 1000 points with a single chunk of all the points
+"""
+
 import numpy as np
 import time
+import tracemalloc
 import matplotlib.pyplot as plt
 
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import SLDDefinition, CalculationParameters, QSample
@@ -30,15 +36,27 @@ calc_params = CalculationParameters(
                 sld_parameters={},
                 magnetism_parameters={})
 
-point_generator = Grid(100, 10_000)
-
 q = QSample(1e-3, 1, 101, True)
 
-for chunk_size in [1000]:
-    for preallocate in [False, True]:
+# A single chunk of n points holds a few n x n arrays, about 800MB for 6000 points
+point_counts = {
+    "Chunks of 1000": [1_000, 2_000, 5_000, 10_000, 20_000],
+    "Single chunk": [1_000, 2_000, 5_000]}
+
+fig, (time_axes, memory_axes) = plt.subplots(1, 2)
+
+for label in point_counts:
 
-        print("Chunk size %i%s"%(chunk_size, ", preallocate" if preallocate else ""))
+    times = []
+    memory = []
 
+    for n_points in point_counts[label]:
+
+        point_generator = Grid(100, n_points)
+
+        chunk_size = 1000 if label == "Chunks of 1000" else point_generator.n_points
+
+        tracemalloc.start()
         start_time = time.time()
 
         output = debye(
@@ -47,11 +65,21 @@ for chunk_size in [1000]:
             parameters=calc_params,
             point_generator=point_generator,
             q_sample=q,
-            minor_chunk_size=chunk_size,
-            preallocate=preallocate)
+            chunk_size=chunk_size)
+
+        times.append(time.time() - start_time)
+        memory.append(tracemalloc.get_traced_memory()[1] / 1024**2)
+        tracemalloc.stop()
+
+        print("%s, %i points: %.2fs, peak memory %.1fMB" % (label, point_generator.n_points, times[-1], memory[-1]))
 
-        print(time.time() - start_time)
+    time_axes.loglog(point_counts[label], times, label=label)
+    memory_axes.loglog(point_counts[label], memory, label=label)
 
-        plt.loglog(q(), output)
+time_axes.set_xlabel("Points")
+time_axes.set_ylabel("Time / s")
+memory_axes.set_xlabel("Points")
+memory_axes.set_ylabel("Peak memory / MB")
+memory_axes.legend()
 
-plt.show()
\ No newline at end of file
+plt.show()
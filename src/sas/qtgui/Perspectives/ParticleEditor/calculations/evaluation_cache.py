@@ -0,0 +1,163 @@
+""" Cache of evaluated SLD and magnetism values
+
+Evaluating the user's SLD function is usually the slowest part of a calculation, and its values do not
+change when only the q sampling or the angular distribution does. The values for each chunk of points
+are kept, keyed on
+
+    (function source hash, parameter values, sampler key, chunk start index, chunk end index)
+
+Values are held in memory up to a memory budget, beyond that the least recently used are written to
+memory mapped files in a temporary directory, up to a disk budget, beyond which they are dropped.
+
+Only definitions with a source hash (see SLDDefinition.source_hash) and samplers with a cache key
+(see SpatialDistribution.cache_key) are cached, for others there is nothing to tell whether the
+values have changed.
+"""
+
+from typing import Optional, Callable, Hashable, NamedTuple
+import os
+import tempfile
+import weakref
+
+import numpy as np
+
+from sas.sascalc.data_util.lru_cache import LRUCache
+
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import SpatialDistribution, CalculationParameters
+
+
+class _Spilled(NamedTuple):
+    """ Array written to disk, and its read only memory map"""
+    filename: str
+    nbytes: int
+    mapped: np.memmap
+
+
+def _release(mapping, filename: str):
+    """ Close the map of a dropped array once no array uses it any more, and delete its file"""
+    mapping.close()
+    try:
+        os.remove(filename)
+    except OSError:
+        # Already gone with the cache directory
+        pass
+
+
+class EvaluationCache:
+    """ Arrays by key, in memory up to memory_budget bytes, then on disk up to disk_budget bytes"""
+
+    def __init__(self, memory_budget: int = 256*1024**2, disk_budget: int = 4*1024**3):
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+
+        # The least recently used arrays are moved from memory to disk, and dropped from disk
+        self._memory = LRUCache(memory_budget=memory_budget, evicted=self._spill)
+        self._disk = LRUCache(memory_budget=disk_budget, sizeof=lambda spilled: spilled.nbytes)
+
+        self._directory: Optional[tempfile.TemporaryDirectory] = None
+        self._file_count = 0
+
+    @property
+    def memory_used(self) -> int:
+        return self._memory.memory_used
+
+    @property
+    def disk_used(self) -> int:
+        return self._disk.memory_used
+
+    def __len__(self):
+        return len(self._memory) + len(self._disk)
+
+    def __contains__(self, key: Hashable):
+        return key in self._memory or key in self._disk
+
+    def get(self, key: Hashable, calculate: Callable[[], np.ndarray]) -> np.ndarray:
+        """ Array of the key, calculated by calling calculate() if it is not in the cache.
+        The array returned is read only."""
+
+        value = self._memory.get(key)
+        if value is not None:
+            return value
+
+        spilled = self._disk.get(key)
+        if spilled is not None:
+            return spilled.mapped
+
+        def read_only():
+            value = np.array(calculate())
+            value.setflags(write=False)
+            return value
+
+        return self._memory.get(key, read_only)
+
+    def clear(self):
+        # Dropping the maps closes them and deletes their files, see _release
+        self._memory.clear()
+        self._disk.clear()
+
+        if self._directory is not None:
+            try:
+                self._directory.cleanup()
+            except OSError:
+                # Files still mapped on Windows are left behind
+                pass
+            self._directory = None
+
+    def _spill(self, key: Hashable, value: np.ndarray):
+        """ Move an array dropped from memory to disk. Its map is closed and its file deleted when
+        it is dropped from disk, or later if arrays returned by get still use it, see _release"""
+
+        filename = self._write(value)
+        mapped = np.load(filename, mmap_mode="r")
+        weakref.finalize(mapped, _release, mapped._mmap, filename)
+
+        self._disk.put(key, _Spilled(filename, value.nbytes, mapped))
+
+    def _write(self, value: np.ndarray) -> str:
+        """ Write the array to a new file in the cache directory"""
+
+        if self._directory is None:
+            self._directory = tempfile.TemporaryDirectory(prefix="sasview-particle-editor-")
+
+        filename = os.path.join(self._directory.name, f"{self._file_count}.npy")
+        self._file_count += 1
+
+        mapped = np.lib.format.open_memmap(filename, mode="w+", dtype=value.dtype, shape=value.shape)
+        mapped[...] = value
+        mapped.flush()
+        del mapped
+
+        return filename
+
+
+def parameter_key(parameters: CalculationParameters) -> Hashable:
+    """ Part of the key describing the parameters the SLD and magnetism depend on"""
+    return (
+        parameters.solvent_sld,
+        tuple(sorted(parameters.sld_parameters.items())),
+        tuple(sorted(parameters.magnetism_parameters.items())))
+
+
+def chunk_key(
+        kind: str,
+        source_hash: Optional[str],
+        parameters: CalculationParameters,
+        point_generator: SpatialDistribution,
+        start_index: int,
+        end_index: int) -> Optional[Hashable]:
+
+    """ Key for the values of a chunk of points, None if they cannot be cached
+
+    :param kind: "sld" or "magnetism"
+    """
+
+    sampler_key = point_generator.cache_key
+
+    if source_hash is None or sampler_key is None:
+        return None
+
+    return kind, source_hash, parameter_key(parameters), sampler_key, start_index, end_index
+
+
+# Cache used by the calculations
+evaluation_cache = EvaluationCache()
@@ -0,0 +1,96 @@
+""" Scattering calculation for grid sampled particles, using a fast fourier transform
+
+When the points lie on a regular grid, the amplitude F(q) = sum sld(r) exp(i q.r) is a discrete
+fourier transform of the SLD values on the grid. The SLD is evaluated once, the grid is zero padded
+to make the fourier space grid finer, and |F|^2 is interpolated (cubic spline) at the q vectors of
+each direction and q magnitude.
+
+On a grid with spacing d, the sum is periodic in each component of q with period 2 pi / d, so
+interpolating on the periodic fourier space grid gives the same result as the direct sum, up to the
+interpolation error, which decreases with the amount of padding.
+"""
+
+from typing import Optional
+
+import numpy as np
+from scipy.ndimage import map_coordinates
+
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
+    SLDDefinition, MagnetismDefinition, AngularDistribution, QSample, CalculationParameters)
+
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import Grid
+
+from sas.qtgui.Perspectives.ParticleEditor.calculations.run_function import run_sld_chunk
+
+
+def sld_on_grid(
+        sld_definition: SLDDefinition,
+        parameters: CalculationParameters,
+        grid: Grid,
+        chunk_size=1_000_000) -> np.ndarray:
+
+    """ Evaluate the SLD at the points of the grid, returns an n x n x n array indexed by x, y and z """
+
+    n = grid.n_points_per_axis
+    sld = np.empty(grid.n_points)
+
+    for start in range(0, grid.n_points, chunk_size):
+        end = min(start + chunk_size, grid.n_points)
+        sld[start:end] = run_sld_chunk(sld_definition, parameters, grid, start, end, grid.generate(start, end))
+
+    # Grid.generate varies z fastest and x slowest
+    return sld.reshape(n, n, n)
+
+
+def scattering_via_fft(
+        sld_definition: SLDDefinition,
+        magnetism_definition: Optional[MagnetismDefinition],
+        parameters: CalculationParameters,
+        grid: Grid,
+        q_sample: QSample,
+        angular_distribution: AngularDistribution,
+        oversampling: int = 3,
+        chunk_size=1_000_000) -> np.ndarray:
+
+    """ Orientationally weighted intensity at the q magnitudes of q_sample for a grid sampled particle
+
+    :param oversampling: the grid is zero padded to oversampling times its size in each direction,
+                         the memory used grows with its cube
+    """
+
+    q_magnitudes = q_sample()
+    direction_vectors, direction_weights = angular_distribution.sample_points_and_weights()
+
+    sld = sld_on_grid(sld_definition, parameters, grid, chunk_size)
+
+    # TODO: Magnetism
+
+    n = grid.n_points_per_axis
+    m = oversampling * n
+    spacing = grid.radius / n  # See Grid.generate
+
+    amplitude = np.fft.rfftn(sld, s=(m, m, m))
+    intensity = amplitude.real**2 + amplitude.imag**2
+    del amplitude
+
+    # The real transform only keeps the frequencies 0..m//2 of the last axis, the others
+    # follow from |F(-k)| = |F(k)| for a real SLD
+    negated = (-np.arange(m)) % m
+    n_kept = intensity.shape[2]
+    intensity = np.concatenate(
+        (intensity, intensity[np.ix_(negated, negated, m - np.arange(n_kept, m))]),
+        axis=2)
+
+    # Fourier space grid coordinates of each q vector, shape (3, directions, q)
+    k = np.multiply.outer(direction_vectors.T, q_magnitudes) * (m * spacing / (2*np.pi))
+
+    # Cubic interpolation on the periodic grid
+    f_squared = map_coordinates(
+        intensity,
+        k.reshape(3, -1),
+        order=3,
+        mode="grid-wrap").reshape(k.shape[1:])
+
+    f_squared *= direction_weights.reshape(-1, 1)
+
+    return np.sum(f_squared, axis=0)
@@ -1,54 +1,143 @@
+""" Scattering calculation by summing the amplitude over points, for each direction
+
+For each chunk of points, the distances along a block of directions are found with one matrix product,
+and the real and imaginary parts of the amplitude, sum sld cos(q.r) and sum sld sin(q.r), with two more.
+The SLD is evaluated over blocks of points that don't depend on the q sampling, which are split into
+chunks for the matrix products only.
+Blocks of directions are processed in parallel by a pool of threads, numpy releases the GIL while
+doing the work.
+"""
+
 from typing import Optional, Tuple
-import time
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.special import jv as bessel
-from scipy.spatial.distance import cdist
 
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
     SLDDefinition, MagnetismDefinition, AngularDistribution, QSample, CalculationParameters)
 
-from sas.qtgui.Perspectives.ParticleEditor.sampling.chunking import SingleChunk, pairwise_chunk_iterator
-from sas.qtgui.Perspectives.ParticleEditor.sampling.points import SpatialDistribution, PointGeneratorStepper
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import SpatialDistribution
 
-from sas.qtgui.Perspectives.ParticleEditor.calculations.run_function import run_sld, run_magnetism
+from sas.qtgui.Perspectives.ParticleEditor.calculations.run_function import run_sld_blocks
 
-def scattering_via_fq(
+
+def _add_amplitudes(
+        points: np.ndarray,
+        sld: np.ndarray,
+        directions: np.ndarray,
+        q_magnitudes: np.ndarray,
+        real_part: np.ndarray,
+        imaginary_part: np.ndarray):
+
+    """ Add the amplitudes of a chunk of points to real_part and imaginary_part, for a block of directions
+
+    :param points: n_points x 3 array of point positions
+    :param sld: SLD at the points
+    :param directions: n_directions x 3 array of direction vectors
+    :param real_part: n_directions x n_q output array
+    :param imaginary_part: n_directions x n_q output array
+    """
+
+    projected_distance = points @ directions.T  # n_points x n_directions
+
+    phase = np.multiply.outer(projected_distance, q_magnitudes).reshape(len(sld), -1)
+
+    real_part += (sld @ np.cos(phase)).reshape(real_part.shape)
+    imaginary_part += (sld @ np.sin(phase, out=phase)).reshape(imaginary_part.shape)
+
+
+def scattering_amplitudes(
         sld_definition: SLDDefinition,
-        magnetism_definition: Optional[MagnetismDefinition],
         parameters: CalculationParameters,
         point_generator: SpatialDistribution,
-        q_sample: QSample,
-        angular_distribution: AngularDistribution,
-        chunk_size=1_000_000) -> np.ndarray:
+        direction_vectors: np.ndarray,
+        q_magnitudes: np.ndarray,
+        start_index: int = 0,
+        end_index: Optional[int] = None,
+        chunk_size=1_000_000,
+        n_workers: Optional[int] = None,
+        evaluation_chunk_size: int = 100_000) -> Tuple[np.ndarray, np.ndarray]:
 
-    q_magnitudes = q_sample()
+    """ Real and imaginary parts of the amplitude of the points from start_index to end_index,
+    n_directions x n_q arrays
 
-    direction_vectors, direction_weights = angular_distribution.sample_points_and_weights()
-    fq = np.zeros((angular_distribution.n_points, q_sample.n_points), dtype=complex)  # Dictionary for fq for all angles
+    :param chunk_size: maximum number of point-direction-q values held by a thread at a time,
+                       the working memory is a few times 8*chunk_size bytes per thread
+    :param n_workers: number of threads to use, defaults to the number of processors
+    :param evaluation_chunk_size: number of points the SLD is evaluated (and cached) for at a time
+    """
 
-    for x, y, z in PointGeneratorStepper(point_generator, chunk_size):
+    n_q = len(q_magnitudes)
+    n_directions = direction_vectors.shape[0]
 
-        sld = run_sld(sld_definition, parameters, x, y, z).reshape(-1, 1)
+    if end_index is None:
+        end_index = point_generator.n_points
 
-        # TODO: Magnetism
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
 
-        for direction_index, direction_vector in enumerate(direction_vectors):
+    # Points at a time, and directions processed together for each chunk of points
+    points_per_chunk = max(1, min(end_index - start_index, chunk_size // n_q))
+    directions_per_block = max(1, min(chunk_size // (points_per_chunk * n_q), -(-n_directions // n_workers)))
 
-            projected_distance = x*direction_vector[0] + y*direction_vector[1] + z*direction_vector[2]
+    block_starts = range(0, n_directions, directions_per_block)
 
-            i_r_dot_q = np.multiply.outer(projected_distance, 1j*q_magnitudes)
+    real_part = np.zeros((n_directions, n_q))
+    imaginary_part = np.zeros((n_directions, n_q))
 
-            if direction_index in fq:
-                fq[direction_index, :] = np.sum(sld*np.exp(i_r_dot_q), axis=0)
-            else:
-                fq[direction_index, :] += np.sum(sld*np.exp(i_r_dot_q), axis=0)
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
 
-    f_squared = fq.real**2 + fq.imag**2
-    f_squared *= direction_weights.reshape(-1,1)
+        for (x, y, z), block_sld in run_sld_blocks(
+                sld_definition, parameters, point_generator, start_index, end_index, evaluation_chunk_size):
 
-    return np.sum(f_squared, axis=0)
+            # TODO: Magnetism
+
+            block_points = np.stack((x, y, z), axis=1)
+
+            for chunk_start in range(0, len(block_sld), points_per_chunk):
 
+                points = block_points[chunk_start:chunk_start + points_per_chunk]
+                sld = block_sld[chunk_start:chunk_start + points_per_chunk]
 
+                # Each block writes to its own rows of the output
+                futures = [
+                    executor.submit(
+                        _add_amplitudes,
+                        points,
+                        sld,
+                        direction_vectors[start:start + directions_per_block],
+                        q_magnitudes,
+                        real_part[start:start + directions_per_block],
+                        imaginary_part[start:start + directions_per_block])
+                    for start in block_starts]
 
+                for future in futures:
+                    future.result()
+
+    return real_part, imaginary_part
+
+
+def scattering_via_fq(
+        sld_definition: SLDDefinition,
+        magnetism_definition: Optional[MagnetismDefinition],
+        parameters: CalculationParameters,
+        point_generator: SpatialDistribution,
+        q_sample: QSample,
+        angular_distribution: AngularDistribution,
+        chunk_size=1_000_000,
+        n_workers: Optional[int] = None,
+        evaluation_chunk_size: int = 100_000) -> np.ndarray:
+
+    """ Orientationally weighted intensity at the q magnitudes of q_sample, see scattering_amplitudes """
+
+    direction_vectors, direction_weights = angular_distribution.sample_points_and_weights()
+
+    real_part, imaginary_part = scattering_amplitudes(
+        sld_definition, parameters, point_generator, direction_vectors, q_sample(),
+        chunk_size=chunk_size, n_workers=n_workers, evaluation_chunk_size=evaluation_chunk_size)
+
+    f_squared = real_part**2 + imaginary_part**2
+    f_squared *= direction_weights.reshape(-1, 1)
+
+    return np.sum(f_squared, axis=0)
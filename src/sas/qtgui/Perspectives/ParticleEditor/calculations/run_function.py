@@ -1,10 +1,15 @@
 """ Helper functions that run SLD and magnetism functions """
+from typing import Iterator, Tuple
+
 import numpy as np
 
-from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (SLDDefinition, MagnetismDefinition, CalculationParameters)
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
+    SLDDefinition, MagnetismDefinition, CalculationParameters, SpatialDistribution)
 
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.types import VectorComponents3
 
+from sas.qtgui.Perspectives.ParticleEditor.calculations.evaluation_cache import evaluation_cache, chunk_key
+
 
 def run_sld(sld_definition: SLDDefinition, parameters: CalculationParameters, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
     """ Evaluate the SLD function from the definition object at specified coordinates """
@@ -15,9 +20,8 @@ def run_sld(sld_definition: SLDDefinition, parameters: CalculationParameters, x:
     a, b, c = coordinate_transform(x, y, z)
 
     solvent_sld = parameters.solvent_sld # Hopefully the function can see this, but TODO: take py file environment with us from editor
-    parameter_dict = parameters.sld_parameters.copy()
 
-    return sld_function(a, b, c, **parameter_dict) - solvent_sld
+    return sld_function(a, b, c, **parameters.sld_parameters) - solvent_sld
 
 
 def run_magnetism(magnetism_definition: MagnetismDefinition, parameters: CalculationParameters, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> VectorComponents3:
@@ -29,6 +33,72 @@ def run_magnetism(magnetism_definition: MagnetismDefinition, parameters: Calcula
     a, b, c = coordinate_transform(x, y, z)
 
     solvent_sld = parameters.solvent_sld # Hopefully the function can see this, but TODO: take py file environment with us from editor
-    parameter_dict = parameters.sld_parameters.copy()
 
-    return magnetism_function(a, b, c, **parameter_dict)
+    return magnetism_function(a, b, c, **parameters.sld_parameters)
+
+
+def run_sld_chunk(
+        sld_definition: SLDDefinition,
+        parameters: CalculationParameters,
+        point_generator: SpatialDistribution,
+        start_index: int,
+        end_index: int,
+        points: VectorComponents3) -> np.ndarray:
+
+    """ Evaluate the SLD at the points start_index to end_index of the point generator, using the
+    cached values if there are any, see evaluation_cache. The array returned must not be changed. """
+
+    key = chunk_key("sld", sld_definition.source_hash, parameters, point_generator, start_index, end_index)
+
+    if key is None:
+        return run_sld(sld_definition, parameters, *points)
+
+    return evaluation_cache.get(key, lambda: run_sld(sld_definition, parameters, *points))
+
+
+def run_sld_blocks(
+        sld_definition: SLDDefinition,
+        parameters: CalculationParameters,
+        point_generator: SpatialDistribution,
+        start_index: int,
+        end_index: int,
+        block_size: int) -> Iterator[Tuple[VectorComponents3, np.ndarray]]:
+
+    """ Points from start_index to end_index of the point generator and their SLD, in pieces.
+
+    The SLD is evaluated with run_sld_chunk over blocks of block_size points counted from the first
+    point of the generator, whatever the range asked for, so that the cached values are found again
+    by calculations splitting the points differently. """
+
+    for block_start in range(block_size * (start_index // block_size), end_index, block_size):
+        block_end = min(block_start + block_size, point_generator.n_points)
+
+        points = point_generator.generate(block_start, block_end)
+        sld = run_sld_chunk(sld_definition, parameters, point_generator, block_start, block_end, points)
+
+        # Part of the block in the range
+        first = max(start_index, block_start) - block_start
+        last = min(end_index, block_end) - block_start
+
+        yield tuple(component[first:last] for component in points), sld[first:last]
+
+
+def run_magnetism_chunk(
+        magnetism_definition: MagnetismDefinition,
+        parameters: CalculationParameters,
+        point_generator: SpatialDistribution,
+        start_index: int,
+        end_index: int,
+        points: VectorComponents3) -> VectorComponents3:
+
+    """ Evaluate the magnetism at the points start_index to end_index of the point generator, using the
+    cached values if there are any, see evaluation_cache. The arrays returned must not be changed. """
+
+    key = chunk_key("magnetism", magnetism_definition.source_hash, parameters, point_generator, start_index, end_index)
+
+    if key is None:
+        return run_magnetism(magnetism_definition, parameters, *points)
+
+    mx, my, mz = evaluation_cache.get(key, lambda: np.stack(run_magnetism(magnetism_definition, parameters, *points)))
+
+    return mx, my, mz
@@ -52,6 +52,12 @@ class SpatialDistribution(ABC):
         """ Information to be displayed in the settings window next to the point number input """
         return ""
 
+    @property
+    def cache_key(self) -> Optional[tuple]:
+        """ Identifies the points generated, samplers with the same key must generate the same points
+        for the same indices. None if the values calculated for the points should not be cached"""
+        return None
+
     @abstractmethod
     def generate(self, start_index: int, end_index: int) -> VectorComponents3:
         """ Generate points from start_index up to end_index """
@@ -94,6 +100,7 @@ class SLDDefinition:
     """ Definition of the SLD scalar field"""
     sld_function: SLDFunction
     to_cartesian_conversion: CoordinateSystemTransform
+    source_hash: Optional[str] = None  # Hash of the code defining the function, for caching its values
 
 
 @dataclass
@@ -101,6 +108,7 @@ class MagnetismDefinition:
     """ Definition of the magnetism vector fields"""
     magnetism_function: MagnetismFunction
     to_cartesian_conversion: CoordinateSystemTransform
+    source_hash: Optional[str] = None  # Hash of the code defining the function, for caching its values
 
 
 @dataclass
@@ -123,6 +131,8 @@ class ScatteringCalculation:
     bounding_surface_sld_check: bool
     bin_count = 1_000
     sample_chunk_size_hint: int = 100_000
+    target_relative_error: Optional[float] = None  # Add points until reached, needs a sampler allowing bootstrap
+    grid_fft: bool = False  # Interpolate the FFT of Grid samples instead of the direct sum, faster but approximate
 
 
 @dataclass
@@ -149,5 +159,6 @@ class ScatteringOutput:
     q_space: Optional[QSpaceScattering]
     calculation_time: float
     seed_used: Optional[int]
+    n_points_used: Optional[int] = None
 
 
@@ -54,19 +54,58 @@ class Chunker(ABC):
     def _iterator(self) -> Tuple[VectorComponents3, VectorComponents3]:
         """ Python generator function that yields chunks """
 
+    @abstractmethod
+    def ranges(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """ Python generator function that yields the start and end indices of the points
+        in the chunks, in the same order as the chunks """
+
 
 class Chunks(Chunker):
     """ Class that takes a point generator, and produces all pairwise combinations in chunks
 
-    This trades off speed for space.
+    This trades off speed for space. Only the chunks on and above the diagonal of the diagram in the module docs
+    are produced (chunks 1-4, 6-8, 11, 12 and 16), as the others contain the same pairs the other way round,
+    and only two chunks of points are held at a time, points are generated again when they are needed.
+
+    Chunks on the diagonal are yielded as the same object twice, they contain each pair of points in both orders
+    and each point paired with itself, the others contain each pair once. Users of the chunker check for this
+    with `is` (as for SingleChunk, which is all diagonal).
     """
 
-    # TODO
+    def __init__(self, point_generator: SpatialDistribution, chunk_size: int):
+        super().__init__(point_generator)
+        self.chunk_size = chunk_size
+
+    def ranges(self):
+        n_points = self.point_generator.n_points
+        ranges = [(start, min(start + self.chunk_size, n_points)) for start in range(0, n_points, self.chunk_size)]
+
+        for i, left_range in enumerate(ranges):
+            for right_range in ranges[i:]:
+                yield left_range, right_range
+
+    def _iterator(self):
+        left_range, left = None, None
+
+        for new_left_range, right_range in self.ranges():
+
+            if new_left_range != left_range:
+                left_range = new_left_range
+                left = self.point_generator.generate(*left_range)
+
+            if right_range == left_range:
+                yield left, left
+            else:
+                yield left, self.point_generator.generate(*right_range)
 
 
 class SingleChunk(Chunker):
     """ Chunker that doesn't chunk """
 
+    def ranges(self):
+        all_points = (0, self.point_generator.n_points)
+        yield all_points, all_points
+
     def _iterator(self):
         points = self.point_generator.generate(0, self.point_generator.n_points)
         yield points, points
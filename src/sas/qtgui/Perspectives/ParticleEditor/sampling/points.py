@@ -7,14 +7,17 @@ Instances of the spatial sampler
 """
 
 import math
-import numpy as np
+from typing import Optional
 
-from collections import defaultdict
+import numpy as np
 
 
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.types import VectorComponents3
 from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import SpatialDistribution
 
+# Random points are drawn in blocks of this many points, each from its own seed
+RANDOM_BLOCK_SIZE = 10_000
+
 class BoundedByCube(SpatialDistribution):
 
     _boundary_base_points = np.array([
@@ -49,6 +52,10 @@ class Grid(BoundedByCube):
     def info(self):
         return f"{self.n_points_per_axis}x{self.n_points_per_axis}x{self.n_points_per_axis} = {self.n_points}"
 
+    @property
+    def cache_key(self):
+        return "Grid", self.radius, self.n_points_per_axis
+
     def generate(self, start_index: int, end_index: int) -> VectorComponents3:
         point_indices = np.arange(start_index, end_index)
 
@@ -69,24 +76,32 @@ class RandomCube(BoundedByCube):
 
         super().__init__(radius, n_points=desired_points, n_desired_points=desired_points)
 
-        self._seed_rng = np.random.default_rng(seed)
+        # Choose a seed if none is given, so that the points can be generated again
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
 
-        # Accessing this will generate random seeds if they don't exist and store them to be accessed if they do
-        self.seeds = defaultdict(lambda: self._seed_rng.integers(0, 0x7fff_ffff_ffff_ffff))
+        self.seed = seed
 
+    @property
     def allows_bootstrap(self) -> bool:
         return True
 
+    @property
+    def cache_key(self):
+        return "RandomCube", self.radius, self.seed
+
     def generate(self, start_index: int, end_index: int) -> VectorComponents3:
-        # This method of tracking seeds only works if the same start_indices are used each time points
-        # in a region are requested - i.e. if they're chunks form a grid
+        # The points of each block of RANDOM_BLOCK_SIZE depend on the seed and the block only,
+        # so that the same points are given whatever the chunks they are requested in
 
-        n_points = end_index - start_index
-        seed = self.seeds[start_index]
+        first_block = start_index // RANDOM_BLOCK_SIZE
+        end_block = max(first_block, -(-end_index // RANDOM_BLOCK_SIZE))
 
-        rng = np.random.default_rng(seed=seed)
+        blocks = [np.random.default_rng(seed=[self.seed, block]).random(size=(RANDOM_BLOCK_SIZE, 3))
+                  for block in range(first_block, end_block)]
 
-        xyz = rng.random(size=(n_points, 3))
+        offset = first_block * RANDOM_BLOCK_SIZE
+        xyz = np.concatenate(blocks or [np.empty((0, 3))])[start_index - offset:end_index - offset]
 
         xyz -= 0.5
         xyz *= 2*self.radius
@@ -95,22 +110,30 @@ class RandomCube(BoundedByCube):
 
 
 class PointGeneratorStepper:
-    """ Generate batches of step_size points from a PointGenerator instance
+    """ Generate batches of step_size points from a PointGenerator instance,
+    between start_index and end_index (defaults to all the points)
     """
 
-    def __init__(self, point_generator: SpatialDistribution, step_size: int, bootstrap_sections: int):
+    def __init__(self, point_generator: SpatialDistribution, step_size: int,
+                 start_index: int = 0, end_index: Optional[int] = None):
         self.point_generator = point_generator
         self.step_size = step_size
+        self.start_index = start_index
+        self.end_index = point_generator.n_points if end_index is None else end_index
 
-    def _iterator(self):
-        n_sections, remainder = divmod(self.point_generator.n_points, self.step_size)
+    def ranges(self):
+        """ Start and end indices of the batches """
+        n_sections, remainder = divmod(self.end_index - self.start_index, self.step_size)
 
         for i in range(n_sections):
-            yield self.point_generator.generate(i*self.step_size, (i+1)*self.step_size)
+            yield self.start_index + i*self.step_size, self.start_index + (i+1)*self.step_size
 
         if remainder != 0:
-            yield self.point_generator.generate(n_sections*self.step_size, self.point_generator.n_points)
+            yield self.start_index + n_sections*self.step_size, self.end_index
+
+    def _iterator(self):
+        for start_index, end_index in self.ranges():
+            yield self.point_generator.generate(start_index, end_index)
 
     def __iter__(self):
         return self._iterator()
-
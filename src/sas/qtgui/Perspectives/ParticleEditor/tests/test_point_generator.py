@@ -1,3 +1,4 @@
+import numpy as np
 
 from pytest import mark
 
@@ -30,3 +31,13 @@ def test_with_grid(npoints, splits):
 
 
 
+
+
+@mark.parametrize("splits", [42, 381, 9999])
+def test_random_points_independent_of_chunks(splits):
+    """ Random points should be the same whatever the chunks they are requested in """
+    point_generator = RandomCube(100, 25_000, seed=7)
+    expected = np.stack(point_generator.generate(0, point_generator.n_points))
+    chunked = np.concatenate([np.stack(points) for points in PointGeneratorStepper(point_generator, splits)], axis=1)
+
+    assert np.array_equal(chunked, expected)
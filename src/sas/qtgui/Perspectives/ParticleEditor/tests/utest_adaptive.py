@@ -0,0 +1,69 @@
+
+import numpy as np
+import pytest
+
+from sas.qtgui.Perspectives.ParticleEditor.calculations.adaptive import adaptive_scattering, BootstrapNotAllowed
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import scattering_via_fq
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import SLDDefinition, QSample
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.parameters import CalculationParameters
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import Grid, RandomCube
+from sas.qtgui.Perspectives.ParticleEditor.sampling.angles import Uniform
+
+
+def sphere(x, y, z):
+    return (x**2 + y**2 + z**2 < 20**2) * 1.0
+
+sld_definition = SLDDefinition(sphere, lambda x, y, z: (x, y, z))
+
+parameters = CalculationParameters(
+    solvent_sld=0.0, background=0.0, scale=1.0, sld_parameters={}, magnetism_parameters={})
+
+q_sample = QSample(0.001, 0.1, 20, True)
+
+
+def test_stops_at_target_error():
+    """ Should stop adding points once the error is small enough, and report the partial results"""
+    point_generator = RandomCube(25, 1_000_000, seed=1)
+
+    progress = []
+    intensity, error, n_points = adaptive_scattering(
+        sld_definition, None, parameters, point_generator, q_sample, Uniform(1),
+        target_relative_error=0.05, progress_callback=lambda *args: progress.append(args),
+        section_size=500)
+
+    assert n_points < point_generator.n_points
+    assert np.all(error <= 0.05 * intensity)
+
+    # Partial results of increasing size, the last one is the result
+    assert [args[2] for args in progress] == list(range(2_000, n_points + 1, 500))
+    assert np.all(progress[-1][0] == intensity)
+
+
+def test_uses_all_points_at_most():
+    """ Should stop with all the points of the sampler if the target is not reached, and
+    give the same result as the direct calculation"""
+    point_generator = RandomCube(25, 3_000, seed=2)
+
+    intensity, error, n_points = adaptive_scattering(
+        sld_definition, None, parameters, point_generator, q_sample, Uniform(1),
+        target_relative_error=1e-9, section_size=200, max_sections=4, chunk_size=200*q_sample.n_points)
+
+    assert n_points == 3_000
+
+    # Same points, generated in chunks of the same size, the random points depend on the chunks
+    expected = scattering_via_fq(sld_definition, None, parameters, RandomCube(25, 3_000, seed=2), q_sample, Uniform(1),
+                                 chunk_size=200*q_sample.n_points)
+
+    assert np.allclose(intensity, expected)
+
+
+def test_grid_not_allowed():
+    with pytest.raises(BootstrapNotAllowed):
+        adaptive_scattering(
+            sld_definition, None, parameters, Grid(25, 1000), q_sample, Uniform(1), target_relative_error=0.1)
+
+
+def test_no_points():
+    with pytest.raises(ValueError):
+        adaptive_scattering(
+            sld_definition, None, parameters, RandomCube(25, 0), q_sample, Uniform(1), target_relative_error=0.1)
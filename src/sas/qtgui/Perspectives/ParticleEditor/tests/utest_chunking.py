@@ -0,0 +1,38 @@
+
+from pytest import mark
+import numpy as np
+
+from sas.qtgui.Perspectives.ParticleEditor.sampling.chunking import Chunks
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import BoundedByCube, RandomCube
+
+
+class IndexPoints(BoundedByCube):
+    """ Points with their index as the x coordinate """
+    def generate(self, start_index: int, end_index: int):
+        x = np.arange(start_index, end_index, dtype=float)
+        return x, np.zeros_like(x), np.zeros_like(x)
+
+
+@mark.parametrize("chunk_size", [1, 7, 100, 1000])
+def test_chunks_count_pairs_once(chunk_size):
+    """ Every pair should be in exactly one chunk, diagonal chunks contain both orders and the point itself"""
+    n_points = 300
+    point_generator = IndexPoints(10, n_points, n_points)
+
+    counts = np.zeros((n_points, n_points))
+    for (x1, _, _), (x2, _, _) in Chunks(point_generator, chunk_size):
+        diagonal_factor = 0.5 if x1 is x2 else 1.0
+        counts[np.ix_(x1.astype(int), x2.astype(int))] += diagonal_factor
+
+    counts += counts.T
+
+    assert np.all(counts == 1)
+
+
+def test_chunks_diagonal_identity():
+    """ Diagonal chunks should be the same object twice"""
+    point_generator = RandomCube(10, 25, seed=1)
+    pairs = list(Chunks(point_generator, 10))
+
+    assert len(pairs) == 6
+    assert [one is two for one, two in pairs] == [True, False, False, True, False, True]
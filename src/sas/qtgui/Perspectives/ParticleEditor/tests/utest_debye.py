@@ -0,0 +1,53 @@
+
+from pytest import mark
+import numpy as np
+
+from sas.qtgui.Perspectives.ParticleEditor.calculations.debye import debye
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import scattering_via_fq
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import SLDDefinition, QSample
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.parameters import CalculationParameters
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import Grid, RandomCube
+from sas.qtgui.Perspectives.ParticleEditor.sampling.angles import Uniform
+
+
+def cylinder(x, y, z):
+    return ((x**2 + y**2 < 10**2) & (np.abs(z) < 25)) * (1.0 + 0.02*z)
+
+sld_definition = SLDDefinition(cylinder, lambda x, y, z: (x, y, z))
+
+parameters = CalculationParameters(
+    solvent_sld=0.2, background=0.0, scale=1.0, sld_parameters={}, magnetism_parameters={})
+
+q_sample = QSample(0.001, 0.5, 40, True)
+
+
+@mark.parametrize("chunk_size", [50, 333, 10_000])
+def test_debye_matches_pair_sum(chunk_size):
+    """ Histogram should give the sum over pairs, up to the binning of the distances"""
+    point_generator = Grid(60, 800)
+
+    x, y, z = point_generator.generate(0, point_generator.n_points)
+    sld = cylinder(x, y, z) - parameters.solvent_sld
+    r = np.sqrt(np.subtract.outer(x, x)**2 + np.subtract.outer(y, y)**2 + np.subtract.outer(z, z)**2)
+    q = q_sample()
+
+    expected = np.array([np.sum(np.multiply.outer(sld, sld) * np.sinc(q_value*r/np.pi)) for q_value in q])
+
+    calculated = debye(sld_definition, None, parameters, point_generator, q_sample,
+                       bin_count=10_000, chunk_size=chunk_size)
+
+    assert np.allclose(calculated, expected, rtol=1e-3, atol=1e-4*expected[0])
+
+
+def test_debye_matches_orientational_average():
+    """ Debye formula is the orientational average of |F|^2"""
+    point_generator = RandomCube(30, 1_000, seed=2)
+
+    calculated = debye(sld_definition, None, parameters, point_generator, q_sample,
+                       bin_count=10_000, chunk_size=300)
+
+    # Weights of the directions add up to 4 pi
+    averaged = scattering_via_fq(sld_definition, None, parameters, point_generator, q_sample, Uniform(12),
+                                 chunk_size=300*q_sample.n_points) / (4*np.pi)
+
+    assert np.allclose(calculated, averaged, rtol=2e-2)
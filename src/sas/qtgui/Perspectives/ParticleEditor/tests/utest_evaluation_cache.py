@@ -0,0 +1,101 @@
+
+import os
+
+import numpy as np
+
+from sas.qtgui.Perspectives.ParticleEditor.calculations.evaluation_cache import EvaluationCache, evaluation_cache
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import scattering_via_fq
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import SLDDefinition, QSample
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.parameters import CalculationParameters
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import RandomCube
+from sas.qtgui.Perspectives.ParticleEditor.sampling.angles import Uniform, ZDelta
+
+
+def test_spill_to_disk():
+    """ Arrays beyond the memory budget should be written to disk, and beyond the disk budget dropped"""
+    cache = EvaluationCache(memory_budget=2*800, disk_budget=3*800)
+
+    for i in range(6):
+        cache.get(i, lambda: np.full(100, float(i)))
+
+    assert cache.memory_used == 2*800
+    assert cache.disk_used == 3*800
+    assert 0 not in cache
+
+    # Read back from disk, without calculating again
+    value = cache.get(1, lambda: None)
+    assert isinstance(value, np.memmap)
+    assert np.all(value == 1.0)
+    assert not value.flags.writeable
+
+    # In memory
+    assert np.all(cache.get(5, lambda: None) == 5.0)
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_dropped_files_closed():
+    """ Dropped files should be unmapped and deleted, once the arrays returned don't use them"""
+    cache = EvaluationCache(memory_budget=800, disk_budget=800)
+
+    cache.get(0, lambda: np.zeros(100))
+    cache.get(1, lambda: np.ones(100))
+    filename = cache._disk.get(0).filename
+
+    cache.get(2, lambda: np.full(100, 2.0))
+    assert 0 not in cache
+    assert not os.path.exists(filename)
+
+    # In use
+    in_use = cache.get(1, lambda: None)[10:]
+    mapping = in_use.base._mmap
+    filename = cache._disk.get(1).filename
+
+    cache.get(3, lambda: np.full(100, 3.0))
+    cache.get(4, lambda: np.full(100, 4.0))
+    assert 1 not in cache
+    assert not mapping.closed
+    assert np.all(in_use == 1.0)
+
+    del in_use
+    assert mapping.closed
+    assert not os.path.exists(filename)
+
+    cache.clear()
+
+
+def test_sld_evaluated_once():
+    """ Changing the q and angular sampling should not evaluate the SLD again, changing parameters should"""
+
+    calls = []
+    def sld(x, y, z, a):
+        calls.append(len(x))
+        return a * (x**2 + y**2 + z**2 < 20**2)
+
+    definition = SLDDefinition(sld, lambda x, y, z: (x, y, z), source_hash="test_sld_evaluated_once")
+
+    def parameters(a):
+        return CalculationParameters(
+            solvent_sld=0.0, background=0.0, scale=1.0, sld_parameters={"a": a}, magnetism_parameters={})
+
+    evaluation_cache.clear()
+
+    scattering_via_fq(definition, None, parameters(1.0), RandomCube(25, 1000, seed=1),
+                      QSample(0.001, 0.1, 10, True), ZDelta(), chunk_size=3000)
+    n_calls = len(calls)
+
+    scattering_via_fq(definition, None, parameters(1.0), RandomCube(25, 1000, seed=1),
+                      QSample(0.001, 0.1, 10, False), Uniform(2), chunk_size=3000)
+    assert len(calls) == n_calls
+
+    scattering_via_fq(definition, None, parameters(2.0), RandomCube(25, 1000, seed=1),
+                      QSample(0.001, 0.1, 10, False), Uniform(2), chunk_size=3000)
+    assert len(calls) == 2*n_calls
+
+    # More q values, the points are split into smaller chunks for the products, but evaluated as before
+    scattering_via_fq(definition, None, parameters(2.0), RandomCube(25, 1000, seed=1),
+                      QSample(0.001, 0.1, 30, False), Uniform(2), chunk_size=3000)
+    assert len(calls) == 2*n_calls
+
+    evaluation_cache.clear()
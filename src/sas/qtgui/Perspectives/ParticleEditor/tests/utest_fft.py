@@ -0,0 +1,88 @@
+
+from pytest import mark
+import numpy as np
+
+from sas.qtgui.Perspectives.ParticleEditor.calculations.calculate import calculate_scattering
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fft import scattering_via_fft, sld_on_grid
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import (
+    SLDDefinition, QSample, ParticleDefinition, ScatteringCalculation)
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.parameters import CalculationParameters
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import Grid
+from sas.qtgui.Perspectives.ParticleEditor.sampling.angles import Uniform, ZDelta
+
+
+def off_centre_sphere(x, y, z):
+    return ((x - 3)**2 + y**2 + (z + 2)**2 < 15**2) * (1 + 0.01*x)
+
+sld_definition = SLDDefinition(off_centre_sphere, lambda x, y, z: (x, y, z))
+
+parameters = CalculationParameters(
+    solvent_sld=0.0, background=0.0, scale=1.0, sld_parameters={}, magnetism_parameters={})
+
+
+def direct_sum(grid, q_sample, angular_distribution):
+    """ Intensity by summing over the points and directions"""
+    x, y, z = grid.generate(0, grid.n_points)
+    sld = off_centre_sphere(x, y, z)
+    q = q_sample()
+
+    directions, weights = angular_distribution.sample_points_and_weights()
+
+    intensity = np.zeros_like(q)
+    for direction, weight in zip(directions, weights):
+        projected = x*direction[0] + y*direction[1] + z*direction[2]
+        f = np.sum(sld.reshape(-1, 1) * np.exp(1j*np.multiply.outer(projected, q)), axis=0)
+        intensity += weight * np.abs(f)**2
+
+    return intensity
+
+
+def test_sld_on_grid_order():
+    """ SLD array should be indexed by x, y and z"""
+    grid = Grid(100, 10**3)
+    sld = sld_on_grid(SLDDefinition(lambda x, y, z: x + 10*y + 100*z, lambda x, y, z: (x, y, z)),
+                      parameters, grid, chunk_size=77)
+
+    axis = grid.generate(0, grid.n_points_per_axis)[2]
+
+    assert np.allclose(sld, axis[:, None, None] + 10*axis[None, :, None] + 100*axis[None, None, :])
+
+
+@mark.parametrize("angular_distribution", [ZDelta(), Uniform(3)])
+def test_fft_matches_direct_sum(angular_distribution):
+    """ FFT engine should agree with the sum over points, beyond the Nyquist q too"""
+    grid = Grid(100, 20**3)
+    q_sample = QSample(0.005, 1.5, 40, True)
+
+    expected = direct_sum(grid, q_sample, angular_distribution)
+    calculated = scattering_via_fft(
+        sld_definition, None, parameters, grid, q_sample, angular_distribution, oversampling=4)
+
+    assert np.allclose(calculated, expected, rtol=1e-2, atol=1e-3*np.max(expected))
+
+
+@mark.parametrize("grid_fft", [False, True])
+def test_grid_fft_opt_in(grid_fft):
+    """ Grid samples should be summed directly, unless the FFT is asked for"""
+    grid = Grid(100, 20**3)
+    q_sample = QSample(0.0005, 0.5, 30, True)
+
+    calculation = ScatteringCalculation(
+        q_sampling=q_sample,
+        angular_sampling=ZDelta(),
+        spatial_sampling_method=grid,
+        particle_definition=ParticleDefinition(sld_definition, None),
+        parameter_settings=parameters,
+        polarisation_vector=None,
+        seed=None,
+        bounding_surface_sld_check=False,
+        grid_fft=grid_fft)
+
+    calculated = calculate_scattering(calculation).q_space.ordinate
+
+    if grid_fft:
+        expected = scattering_via_fft(sld_definition, None, parameters, grid, q_sample, ZDelta())
+        assert np.allclose(calculated, expected)
+    else:
+        expected = direct_sum(grid, q_sample, ZDelta())
+        assert np.allclose(calculated, expected, rtol=1e-6)
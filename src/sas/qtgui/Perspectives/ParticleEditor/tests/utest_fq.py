@@ -0,0 +1,45 @@
+
+from pytest import mark
+import numpy as np
+
+from sas.qtgui.Perspectives.ParticleEditor.calculations.fq import scattering_via_fq
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.calculation import SLDDefinition, QSample
+from sas.qtgui.Perspectives.ParticleEditor.datamodel.parameters import CalculationParameters
+from sas.qtgui.Perspectives.ParticleEditor.sampling.points import Grid
+from sas.qtgui.Perspectives.ParticleEditor.sampling.angles import Uniform, ZDelta
+
+
+def ellipsoid(x, y, z):
+    return ((x/30)**2 + (y/20)**2 + (z/10)**2 < 1) * (2.0 + 0.01*x)
+
+sld_definition = SLDDefinition(ellipsoid, lambda x, y, z: (x, y, z))
+
+parameters = CalculationParameters(
+    solvent_sld=0.5, background=0.0, scale=1.0, sld_parameters={}, magnetism_parameters={})
+
+
+@mark.parametrize("chunk_size", [1_000, 50_000, 1_000_000])
+@mark.parametrize("n_workers", [1, 3])
+@mark.parametrize("angular_distribution", [ZDelta(), Uniform(2)])
+def test_fq_matches_direct_sum(chunk_size, n_workers, angular_distribution):
+    """ Result should not depend on how the points and directions are split up"""
+    points = Grid(80, 2_000)
+    q_sample = QSample(0.001, 0.5, 30, True)
+
+    x, y, z = points.generate(0, points.n_points)
+    sld = ellipsoid(x, y, z) - parameters.solvent_sld
+    q = q_sample()
+
+    directions, weights = angular_distribution.sample_points_and_weights()
+
+    expected = np.zeros_like(q)
+    for direction, weight in zip(directions, weights):
+        projected = x*direction[0] + y*direction[1] + z*direction[2]
+        f = np.sum(sld.reshape(-1, 1) * np.exp(1j*np.multiply.outer(projected, q)), axis=0)
+        expected += weight * np.abs(f)**2
+
+    calculated = scattering_via_fq(
+        sld_definition, None, parameters, points, q_sample, angular_distribution,
+        chunk_size=chunk_size, n_workers=n_workers)
+
+    assert np.allclose(calculated, expected)
@@ -0,0 +1,69 @@
+
+import numpy as np
+import pytest
+
+from sas.qtgui.Perspectives.ParticleEditor import vectorise
+from sas.qtgui.Perspectives.ParticleEditor.function_processor import process_code
+from sas.qtgui.Perspectives.ParticleEditor.vectorise import vectorise_sld
+
+scalar_code = """
+def sld(x, y, z, a=2.0):
+    if x > y:
+        return a
+    else:
+        return z
+"""
+
+def ignore(text):
+    pass
+
+def expected(x, y, z, a):
+    return np.where(x > y, a, z)
+
+points = tuple(np.random.default_rng(1).random((3, 25_000)))
+
+
+def test_numpy_function_unchanged():
+    function, _, _, _ = process_code("def sld(x, y, z):\n    return x + y + z\n")
+    assert vectorise_sld(function, ignore, ignore) is function
+
+
+@pytest.mark.skipif(vectorise.USE_NUMBA, reason="numba compiles the function")
+@pytest.mark.parametrize("n_processes, path", [(1, "python loop"), (2, "process pool")])
+def test_scalar_function_paths(n_processes, path, monkeypatch):
+    """ Scalar functions should be evaluated in a process pool when the source is known"""
+
+    # Split the points between the processes
+    monkeypatch.setattr(vectorise, "min_points_per_process", 1_000)
+
+    function, _, _, _ = process_code(scalar_code)
+    vectorised = vectorise_sld(function, ignore, ignore, source_code=scalar_code, n_processes=n_processes)
+
+    assert vectorised.path == path
+    assert np.all(vectorised(*points, a=3.0) == expected(*points, 3.0))
+
+
+def test_scalar_function_without_source():
+    function, _, _, _ = process_code(scalar_code)
+    vectorised = vectorise_sld(function, ignore, ignore, n_processes=2)
+
+    assert vectorised.path in ("python loop", "numba")
+    assert np.all(vectorised(*points) == expected(*points, 2.0))
+
+
+@pytest.mark.skipif(vectorise.USE_NUMBA, reason="numba compiles the function")
+def test_process_pool_shared(monkeypatch):
+    """ Functions built again from the same code should use the same processes"""
+    monkeypatch.setattr(vectorise, "min_points_per_process", 1_000)
+
+    pools = []
+    for _ in range(2):
+        function, _, _, _ = process_code(scalar_code)
+        vectorised = vectorise_sld(function, ignore, ignore, source_code=scalar_code, n_processes=2)
+        vectorised(*points)
+        pools.append(vectorise._pool)
+
+    assert pools[0] is pools[1]
+
+    vectorise.shutdown_process_pool()
+    assert vectorise._pool is None
@@ -1,9 +1,38 @@
+""" Checks that SLD functions handle numpy arrays, and wrappers for the ones that don't
+
+Functions that only take scalar values are evaluated point by point, in order of preference
+  * by a numpy ufunc compiled by numba, if numba is installed and can compile the function
+  * by a pool of processes, each evaluating part of the points in a python loop, when the source code
+    of the function is available (functions defined by exec can't be sent to another process, so each
+    process defines the function again from the source)
+  * by a python loop
+"""
+
+import os
+import inspect
+import threading
 import traceback
-from typing import List, Union, Callable
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Union, Callable, Optional
 import numpy as np
 
+from sas.qtgui.Perspectives.ParticleEditor.function_processor import process_code
+
+try:
+    if os.environ.get('SAS_NUMBA', '1').lower() in ('1', 'yes', 'true', 't'):
+        import numba
+        USE_NUMBA = True
+    else:
+        raise ImportError("fail")
+except ImportError:
+    USE_NUMBA = False
+
 test_n = 7
 
+# Inputs smaller than this are evaluated in the calling process
+min_points_per_process = 10_000
+
 def clean_traceback(trace: str):
     """ Tracebacks from vectorise contain potentially confusing information from the
     vectorisation infrastructure. Clean it up and replace empty filename with something else"""
@@ -14,12 +43,151 @@ def clean_traceback(trace: str):
     return "".join(["Input data" + part for part in parts])
 
 
+def _python_loop(fun: Callable, x, y, z, args, kwargs) -> np.ndarray:
+    out = np.zeros_like(x)
+    for i, (xi, yi, zi) in enumerate(zip(x, y, z)):
+        out[i] = fun(xi, yi, zi, *args, **kwargs)
+    return out
+
+
+class LoopVectorised:
+    """ Evaluates a scalar function at each point in turn """
+    path = "python loop"
+
+    def __init__(self, fun: Callable):
+        self.fun = fun
+
+    def __call__(self, x, y, z, *args, **kwargs):
+        return _python_loop(self.fun, x, y, z, args, kwargs)
+
+
+class NumbaVectorised:
+    """ Evaluates a scalar function compiled into a numpy ufunc by numba """
+    path = "numba"
+
+    def __init__(self, fun: Callable):
+        self.parameters = list(inspect.signature(fun).parameters.values())[3:]
+        self.ufunc = numba.vectorize(fun)
+
+    def __call__(self, x, y, z, *args, **kwargs):
+        # ufuncs don't take keyword arguments
+        args = list(args) + [kwargs.get(parameter.name, parameter.default)
+                             for parameter in self.parameters[len(args):]]
+        return self.ufunc(x, y, z, *args).astype(float)
+
+
+# SLD function in a process of the pool, defined from the source code by _initialise_worker
+_worker_function: Optional[Callable] = None
+
+def _ignore(text: str):
+    pass
+
+def _initialise_worker(source_code: str):
+    global _worker_function
+    _worker_function, _, _, _ = process_code(
+        source_code, text_callback=_ignore, warning_callback=_ignore, error_callback=_ignore)
+
+def _evaluate_in_worker(x, y, z, args, kwargs) -> np.ndarray:
+    return _python_loop(_worker_function, x, y, z, args, kwargs)
+
+
+# Pool of the function evaluated last. Building and scattering with the same function use the same processes,
+# the pool is shut down when a different function needs one, or by shutdown_process_pool
+_pool_lock = threading.Lock()
+_pool_key = None
+_pool: Optional[ProcessPoolExecutor] = None
+
+def _process_pool(source_code: str, n_processes: int) -> ProcessPoolExecutor:
+    global _pool, _pool_key
+
+    with _pool_lock:
+        if _pool is None or _pool_key != (source_code, n_processes):
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+
+            # Processes are started rather than forked, the calculations use threads which don't survive forking
+            _pool = ProcessPoolExecutor(
+                max_workers=n_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialise_worker,
+                initargs=(source_code,))
+            _pool_key = (source_code, n_processes)
+
+        return _pool
+
+def shutdown_process_pool():
+    """ Stop the processes evaluating scalar SLD functions, if any """
+    global _pool, _pool_key
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_key = None
+
+
+class ProcessPoolVectorised:
+    """ Evaluates a scalar function at each point, sharing the points between a pool of processes """
+    path = "process pool"
+
+    def __init__(self, fun: Callable, source_code: str, n_processes: int):
+        self.fun = fun
+        self.source_code = source_code
+        self.n_processes = n_processes
+
+    def __call__(self, x, y, z, *args, **kwargs):
+        n_chunks = min(4 * self.n_processes, len(x) // min_points_per_process)
+
+        if n_chunks < 2:
+            return _python_loop(self.fun, x, y, z, args, kwargs)
+
+        executor = _process_pool(self.source_code, self.n_processes)
+
+        chunks = zip(np.array_split(x, n_chunks), np.array_split(y, n_chunks), np.array_split(z, n_chunks))
+
+        futures = [executor.submit(_evaluate_in_worker, xi, yi, zi, args, kwargs) for xi, yi, zi in chunks]
+
+        return np.concatenate([future.result() for future in futures])
+
+
+def scalar_function_evaluator(fun: Callable, source_code: Optional[str], n_processes: int, *args, **kwargs):
+    """ Fastest available wrapper for a function that only takes scalar coordinates """
+
+    if USE_NUMBA:
+        try:
+            vectorised = NumbaVectorised(fun)
+            input_values = np.zeros((test_n,))
+            vectorised(input_values, input_values, input_values, *args, **kwargs)
+
+            return vectorised
+
+        except Exception:
+            # Not something numba can compile
+            pass
+
+    if source_code is not None and n_processes > 1:
+        return ProcessPoolVectorised(fun, source_code, n_processes)
+
+    return LoopVectorised(fun)
+
+
 def vectorise_sld(fun: Callable,
                   warning_callback: Callable[[str], None],
                   error_callback: Callable[[str], None],
-                  *args, **kwargs):
+                  *args,
+                  source_code: Optional[str] = None,
+                  n_processes: Optional[int] = None,
+                  **kwargs):
     """ Check whether an SLD function can handle numpy arrays properly,
-    if not, create a wrapper that that can"""
+    if not, create a wrapper that that can
+
+    :param source_code: code defining the function as sld, to define it in other processes
+    :param n_processes: number of processes to evaluate functions that only take scalars,
+                        defaults to the number of processors
+    """
+
+    if n_processes is None:
+        n_processes = os.cpu_count() or 1
 
     # Basically, the issue is with if statements,
     # and we're looking for a ValueError with certain text
@@ -45,17 +213,17 @@ def vectorise_sld(fun: Callable,
             try:
                 fun(0, 0, 0, *args, **kwargs)
 
+                vectorised = scalar_function_evaluator(fun, source_code, n_processes, *args, **kwargs)
 
-                def vectorised(x,y,z,*args,**kwargs):
-                    out = np.zeros_like(x)
-                    for i, (xi,yi,zi) in enumerate(zip(x,y,z)):
-                        out[i] = fun(xi, yi, zi, *args, **kwargs)
-                    return out
+                if vectorised.path == "numba":
+                    warning_callback("The specified SLD function does not handle vector values of coordinates, "
+                                     "it has been compiled with numba to evaluate it at each point.")
 
-                warning_callback("The specified SLD function does not handle vector values of coordinates, "
-                                 "a vectorised version has been created, but is probably **much** slower than "
-                                 "one that uses numpy (np.) functions. See the vectorisation example for "
-                                 "more details.")
+                else:
+                    warning_callback("The specified SLD function does not handle vector values of coordinates, "
+                                     "a vectorised version has been created, but is probably **much** slower than "
+                                     "one that uses numpy (np.) functions. See the vectorisation example for "
+                                     f"more details. It will be evaluated in a {vectorised.path}.")
 
                 return vectorised
 
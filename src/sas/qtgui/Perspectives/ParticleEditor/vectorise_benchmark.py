@@ -0,0 +1,54 @@
+""" Evaluation speed of SLD functions, for the ways vectorise_sld can evaluate them
+
+Prints which path was taken and the number of points evaluated per second
+"""
+
+import os
+import time
+
+import numpy as np
+
+from sas.qtgui.Perspectives.ParticleEditor.function_processor import process_code
+from sas.qtgui.Perspectives.ParticleEditor.vectorise import vectorise_sld
+
+numpy_code = """
+def sld(x, y, z):
+    return 1.0 * (x**2 + y**2 + z**2 < 50**2)
+"""
+
+scalar_code = """
+def sld(x, y, z):
+    if x**2 + y**2 + z**2 < 50**2:
+        return 1.0
+    else:
+        return 0.0
+"""
+
+def ignore(text):
+    pass
+
+def benchmark(name, code, n_processes, n_points=1_000_000):
+    function, _, _, _ = process_code(code)
+
+    vectorised = vectorise_sld(function, ignore, print, source_code=code, n_processes=n_processes)
+    path = getattr(vectorised, "path", "numpy")
+
+    rng = np.random.default_rng(0)
+    x, y, z = (rng.random(n_points) - 0.5) * 200, (rng.random(n_points) - 0.5) * 200, (rng.random(n_points) - 0.5) * 200
+
+    # First call starts the processes of a pool, or compiles
+    vectorised(x[:100_000], y[:100_000], z[:100_000])
+
+    start_time = time.time()
+    vectorised(x, y, z)
+    elapsed = time.time() - start_time
+
+    print(f"{name}, {n_processes} processes: {path}, {n_points/elapsed:.3g} points per second")
+
+
+if __name__ == "__main__":
+    n_processes = os.cpu_count() or 1
+
+    benchmark("Numpy function", numpy_code, n_processes)
+    benchmark("Scalar function", scalar_code, 1)
+    benchmark("Scalar function", scalar_code, n_processes)
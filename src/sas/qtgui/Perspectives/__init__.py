@@ -1,14 +1,12 @@
 # Available perspectives.
-# When adding a new perspective, this dictionary needs to be updated
+# When adding a new perspective, this dictionary needs to be updated.
+# Perspectives are imported when first used, see LazyRegistry.
 
-from .Fitting.FittingPerspective import FittingWindow
-from .Invariant.InvariantPerspective import InvariantWindow
-from .Inversion.InversionPerspective import InversionWindow
-from .Corfunc.CorfuncPerspective import CorfuncWindow
+from sas.qtgui.Utilities.LazyRegistry import LazyRegistry
 
-PERSPECTIVES = {
-    FittingWindow.name: FittingWindow,
-    InvariantWindow.name: InvariantWindow,
-    InversionWindow.name: InversionWindow,
-    CorfuncWindow.name: CorfuncWindow,
-}
\ No newline at end of file
+PERSPECTIVES = LazyRegistry({
+    "Fitting": "sas.qtgui.Perspectives.Fitting.FittingPerspective:FittingWindow",
+    "Invariant": "sas.qtgui.Perspectives.Invariant.InvariantPerspective:InvariantWindow",
+    "Inversion": "sas.qtgui.Perspectives.Inversion.InversionPerspective:InversionWindow",
+    "Corfunc": "sas.qtgui.Perspectives.Corfunc.CorfuncPerspective:CorfuncWindow",
+})
@@ -38,6 +38,7 @@ class BoxSum(QtWidgets.QDialog, Ui_BoxSumUI):
         self.mapper.addMapping(self.lblSum, 6, b"text")
         self.mapper.addMapping(self.lblSumErr, 7, b"text")
         self.mapper.addMapping(self.lblNumPoints, 8, b"text")
+        self.mapper.addMapping(self.lblArea, 9, b"text")
 
         # Populate the widgets with data from the first column
         self.mapper.toFirst()
@@ -0,0 +1,110 @@
+"""
+Multi-resolution images of 2D data for display.
+
+A detector image with more pixels than the screen area it is drawn on does
+not need to be resampled by matplotlib on every redraw. ImagePyramid keeps
+successively halved copies of the image so the plotter can show the level
+matching the pixel density of the viewport, and switch to a finer one when
+the user zooms in.
+"""
+import math
+
+import numpy
+
+
+def downsample(image):
+    """
+    Halve the image in both directions.
+
+    Each output pixel is the mean of the finite pixels of a 2x2 block of the
+    input; blocks without any finite pixel are NaN. Images with an odd number
+    of rows or columns are padded with NaN.
+
+    :param image: 2D array
+    :return: 2D array of shape ceil(rows/2), ceil(cols/2)
+    """
+    rows, cols = image.shape
+    padded = numpy.full((rows + rows % 2, cols + cols % 2), numpy.nan)
+    padded[:rows, :cols] = image
+    blocks = padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2)
+    finite = numpy.isfinite(blocks)
+    total = numpy.where(finite, blocks, 0.0).sum(axis=(1, 3))
+    count = finite.sum(axis=(1, 3))
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        return numpy.where(count > 0, total / count, numpy.nan)
+
+
+class ImagePyramid(object):
+    """
+    Image with lower resolution versions of itself.
+
+    Level 0 is the image itself, level n is halved n times. Levels are
+    computed when first requested.
+    """
+    def __init__(self, image, extent):
+        """
+        :param image: 2D array, as passed to imshow
+        :param extent: (xmin, xmax, ymin, ymax) of the image
+        """
+        self.extent = tuple(extent)
+        self._levels = [image]
+
+    @property
+    def image(self):
+        """ Full resolution image """
+        return self._levels[0]
+
+    @property
+    def shape(self):
+        """ Shape of the full resolution image """
+        return self._levels[0].shape
+
+    @property
+    def max_level(self):
+        """ Coarsest level, for which the image is a single pixel wide or high """
+        return max(0, math.ceil(math.log2(max(min(self.shape), 1))))
+
+    def level(self, n):
+        """
+        Image at level n, clipped to the available levels
+        """
+        n = min(max(n, 0), self.max_level)
+        while len(self._levels) <= n:
+            self._levels.append(downsample(self._levels[-1]))
+        return self._levels[n]
+
+    def levelExtent(self, n):
+        """
+        Extent of the image at level n.
+
+        Padding of odd sized levels extends the image by less than one of
+        its pixels to the right and top.
+        """
+        n = min(max(n, 0), self.max_level)
+        xmin, xmax, ymin, ymax = self.extent
+        rows, cols = self.shape
+        level_rows, level_cols = self.level(n).shape
+        xmax = xmin + (xmax - xmin) * level_cols * 2**n / cols
+        ymax = ymin + (ymax - ymin) * level_rows * 2**n / rows
+        return (xmin, xmax, ymin, ymax)
+
+    def selectLevel(self, xlim, ylim, width, height):
+        """
+        Coarsest level still providing at least one image pixel per screen
+        pixel over the visible area.
+
+        :param xlim: visible x range
+        :param ylim: visible y range
+        :param width: width of the axes in screen pixels
+        :param height: height of the axes in screen pixels
+        """
+        xmin, xmax, ymin, ymax = self.extent
+        rows, cols = self.shape
+        if width <= 0 or height <= 0 or xmax == xmin or ymax == ymin:
+            return 0
+        visible_cols = cols * abs(xlim[1] - xlim[0]) / abs(xmax - xmin)
+        visible_rows = rows * abs(ylim[1] - ylim[0]) / abs(ymax - ymin)
+        density = min(visible_cols / width, visible_rows / height)
+        if not numpy.isfinite(density) or density < 2:
+            return 0
+        return min(int(math.floor(math.log2(density))), self.max_level)
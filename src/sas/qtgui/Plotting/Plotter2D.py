@@ -18,6 +18,8 @@ from sas.qtgui.Plotting.PlotterBase import PlotterBase
 from sas.qtgui.Plotting.ColorMap import ColorMap
 from sas.qtgui.Plotting.BoxSum import BoxSum
 from sas.qtgui.Plotting.SlicerParameters import SlicerParameters
+from sas.qtgui.Plotting.SlicerUpdater import SlicerUpdater
+from sas.qtgui.Plotting.ImagePyramid import ImagePyramid
 
 from sas.qtgui.Plotting.Slicers.BoxSlicer import BoxInteractorX
 from sas.qtgui.Plotting.Slicers.BoxSlicer import BoxInteractorY
@@ -50,10 +52,21 @@ class Plotter2DWidget(PlotterBase):
         # Reference to the current slicer
         self.slicer = None
         self.slicer_widget = None
+        # Debounced, background updates of the slicer plots
+        self.slicer_updater = SlicerUpdater(self)
         self.vmin = None
         self.vmax = None
         self.im = None
         self.cb = None
+        # Images of the plotted arrays, by scale and zmin
+        self._image_source = None
+        self._images = {}
+        # Pyramid and level currently shown
+        self._pyramid = None
+        self._pyramid_level = 0
+        # Axes on which zooming refines the image
+        self._view_axes = None
+        self.canvas.mpl_connect('resize_event', self.onViewChanged)
         # Masking properties
         self._show_masked_data = False  # TODO: Tie into configuration system
         self._masked_data = []
@@ -260,6 +273,7 @@ class Plotter2DWidget(PlotterBase):
         if self.slicer is None:
             return
 
+        self.slicer_updater.cancel()
         self.slicer.clear()
         self.canvas.draw()
         self.slicer = None
@@ -412,7 +426,7 @@ class Plotter2DWidget(PlotterBase):
         # Now that we've identified the right plot, update the 2D data the slicer uses
         self.slicer.data = self.data0
         # Replot now that the 2D data is updated
-        self.slicer._post_data()
+        self.slicer_updater.schedule(self.slicer)
 
     def setSlicer(self, slicer, reset=True):
         """
@@ -421,6 +435,7 @@ class Plotter2DWidget(PlotterBase):
         """
         # Clear current slicer
         if self.slicer is not None:
+            self.slicer_updater.cancel()
             self.slicer.clear()
 
         # Clear the old slicer plots so they don't reappear later
@@ -608,41 +623,16 @@ class Plotter2DWidget(PlotterBase):
             return
         if data.ndim == 0:
             return
-        elif data.ndim == 1:
-            output = PlotUtilities.build_matrix(data, self.qx_data, self.qy_data)
-        else:
-            output = copy.deepcopy(data)
 
-        # get the x and y_bin arrays.
-        x_bins, y_bins = PlotUtilities.get_bins(self.qx_data, self.qy_data)
-        self.data0.x_bins = x_bins
-        self.data0.y_bins = y_bins
+        pyramid = self.getImage(data)
+        # Show the level matching the view; the 3D surface needs the full image
+        level = self.selectImageLevel(pyramid, update) if self.dimension != 3 else 0
+        output = pyramid.level(level)
+        extent = pyramid.levelExtent(level)
+        self._pyramid = pyramid
+        self._pyramid_level = level
 
         zmin_temp = self.zmin
-        # check scale
-        if self.scale == 'log_{10}':
-            #with numpy.errstate(all='ignore'):
-            #    output = numpy.log10(output)
-            #index = numpy.isfinite(output)
-            #if not index.all():
-            #    cutoff = (numpy.quantile(output[index], 0.05) - numpy.log10(2) if index.any() else 0.)
-            #    output[output < cutoff] = cutoff
-            #    output[~index] = cutoff
-            try:
-                if  self.zmin <= 0  and len(output[output > 0]) > 0:
-                    zmin_temp = self.zmin
-                    output[output > 0] = numpy.log10(output[output > 0])
-                elif self.zmin <= 0:
-                    zmin_temp = self.zmin
-                    output[output > 0] = numpy.zeros(len(output))
-                    output[output <= 0] = MIN_Z
-                else:
-                    zmin_temp = self.zmin
-                    output[output > 0] = numpy.log10(output[output > 0])
-            except:
-                #Too many problems in 2D plot with scale
-                output[output > 0] = numpy.log10(output[output > 0])
-                pass
 
         vmin, vmax = None, None
 
@@ -657,13 +647,19 @@ class Plotter2DWidget(PlotterBase):
                 zmax_temp = self.vmax
             if self.im is not None and update:
                 self.im.set_data(output)
+                if tuple(self.im.get_extent()) != extent:
+                    self.im.set_extent(extent)
             else:
                 self.im = self.ax.imshow(output, interpolation='nearest',
                                 origin='lower',
                                 vmin=zmin_temp, vmax=zmax_temp,
                                 cmap=self.cmap,
-                                extent=(self.xmin, self.xmax,
-                                        self.ymin, self.ymax))
+                                extent=extent)
+                if self._view_axes is not self.ax:
+                    # Show the level matching the view on zoom
+                    self.ax.callbacks.connect('xlim_changed', self.onViewChanged)
+                    self.ax.callbacks.connect('ylim_changed', self.onViewChanged)
+                    self._view_axes = self.ax
 
             # color bar for the plot
             cbax = self.figure.add_axes([0.88, 0.2, 0.02, 0.7])
@@ -722,6 +718,85 @@ class Plotter2DWidget(PlotterBase):
         else:
             self.figure.canvas.draw()
 
+    def getImage(self, data):
+        """
+        Image pyramid of the data in the current scale.
+
+        Images are kept until new arrays are plotted, so toggling the scale
+        or changing the color map does not rebuild or rescale them.
+        """
+        source = (data, self.qx_data, self.qy_data,
+                  self.xmin, self.xmax, self.ymin, self.ymax)
+        if self._image_source is None or \
+                any(a is not b for a, b in zip(self._image_source[:3], source[:3])) or \
+                self._image_source[3:] != source[3:]:
+            if data.ndim == 1:
+                output = PlotUtilities.build_matrix(data, self.qx_data, self.qy_data)
+            else:
+                output = copy.deepcopy(data)
+            # get the x and y_bin arrays.
+            x_bins, y_bins = PlotUtilities.get_bins(self.qx_data, self.qy_data)
+            self._image_source = source
+            self._images = {'bins': (x_bins, y_bins), 'linear': ImagePyramid(
+                output, (self.xmin, self.xmax, self.ymin, self.ymax))}
+
+        self.data0.x_bins, self.data0.y_bins = self._images['bins']
+
+        key = 'linear' if self.scale != 'log_{10}' else ('log_{10}', self.zmin)
+        if key in self._images:
+            return self._images[key]
+
+        output = copy.deepcopy(self._images['linear'].image)
+        try:
+            if self.zmin <= 0 and len(output[output > 0]) > 0:
+                output[output > 0] = numpy.log10(output[output > 0])
+            elif self.zmin <= 0:
+                output[output > 0] = numpy.zeros(len(output))
+                output[output <= 0] = MIN_Z
+            else:
+                output[output > 0] = numpy.log10(output[output > 0])
+        except:
+            #Too many problems in 2D plot with scale
+            output[output > 0] = numpy.log10(output[output > 0])
+        pyramid = ImagePyramid(output, self._images['linear'].extent)
+        self._images[key] = pyramid
+        return pyramid
+
+    def selectImageLevel(self, pyramid, update=True):
+        """
+        Pyramid level matching the pixel density of the current view
+        """
+        bbox = self.ax.bbox
+        if self.im is None or not update or \
+                (self.ax.get_autoscalex_on() and self.ax.get_autoscaley_on()):
+            # The whole image is about to be shown
+            xlim = pyramid.extent[0:2]
+            ylim = pyramid.extent[2:4]
+        else:
+            xlim = self.ax.get_xlim()
+            ylim = self.ax.get_ylim()
+        return pyramid.selectLevel(xlim, ylim, bbox.width, bbox.height)
+
+    def onViewChanged(self, event=None):
+        """
+        Show the image level matching the new limits or size of the axes
+        """
+        if self.im is None or self._pyramid is None or self.dimension == 3:
+            return
+        if self.im.axes is not self.ax:
+            return
+        pyramid = self._pyramid
+        xlim = self.ax.get_xlim()
+        ylim = self.ax.get_ylim()
+        level = pyramid.selectLevel(xlim, ylim, self.ax.bbox.width, self.ax.bbox.height)
+        if level == self._pyramid_level:
+            return
+        # Set first, set_extent changes the limits of autoscaled axes
+        self._pyramid_level = level
+        self.im.set_data(pyramid.level(level))
+        self.im.set_extent(pyramid.levelExtent(level))
+        self.canvas.draw_idle()
+
     def imageShow(self, img, origin=None):
         """
         Show background image
@@ -270,17 +270,20 @@ class SlicerParameters(QtWidgets.QDialog, Ui_SlicerParametersUI):
             if not isChecked:
                 continue
             plot = item.text()
-            # Apply plotter to a plot
-            self.applyPlotter(plot)
+            # Apply plotter to a plot, with its 1D plots updated at once
+            self.applyPlotter(plot, flush=True)
             # Save 1D plots if required
             plots.append(plot)
+        # The 1D plots of this slicer may still wait for an update
+        self.parent.slicer_updater.flushNow()
         if self.isSave and self.model is not None:
             self.save1DPlotsForPlot(plots)
         pass  # debug anchor
 
-    def applyPlotter(self, plot):
+    def applyPlotter(self, plot, flush=False):
         """
-        Apply the current slicer to a plot
+        Apply the current slicer to a plot.
+        The 1D plots are updated in the background, unless flush is True.
         """
         # don't assign to itself
         if plot == self.parent.data[0].name:
@@ -302,6 +305,8 @@ class SlicerParameters(QtWidgets.QDialog, Ui_SlicerParametersUI):
         plotter.slicer._model = self.model
         # force conversion model->parameters in slicer
         plotter.slicer.setParamsFromModel()
+        if flush:
+            plotter.slicer_updater.flushNow(plotter.slicer)
 
     def prepareFilePathFromData(self, data):
         """
@@ -0,0 +1,206 @@
+"""
+Scheduling of the slicer updates of a 2D plot.
+
+Slicer events (the end of a drag, a parameter edit or new 2D data) arrive in
+bursts, for instance while a fit keeps updating the plotted model. Rather
+than averaging the data and redrawing the 1D plots on the GUI thread for
+every one of them, SlicerUpdater waits for the events to settle, computes
+the average in a worker thread, drops results superseded by a newer
+request and sends the 1D plot updates out at most once per frame.
+"""
+import logging
+
+from PySide6 import QtCore
+
+from sas.sascalc.data_util.calcthread import CalcThread
+
+logger = logging.getLogger(__name__)
+
+# Time without slicer events before the average is computed [ms]
+DEBOUNCE_INTERVAL = 50
+# Time over which 1D plot updates are gathered, about one frame [ms]
+FRAME_INTERVAL = 16
+
+
+class SlicerAverageThread(CalcThread):
+    """
+    Compute a slicer average
+    """
+    def compute(self, job, averager, data):
+        """
+        Average the data and hand the result over to the completion
+        callback, with the error raised if the ROI holds no data.
+        """
+        result = None
+        error = None
+        try:
+            result = averager(data)
+        except ValueError as ex:
+            error = ex
+        self.complete(job=job, result=result, error=error)
+
+
+class SlicerUpdater(QtCore.QObject):
+    """
+    Debounce the slicer updates of a plotter, compute the averages in a
+    worker thread with latest-wins semantics and batch the 1D plot updates.
+
+    Slicers which can be averaged in the background provide
+    _get_averager(), returning the averager for their current parameters,
+    and _post_average(result), plotting its result. Other slicers are
+    updated with _post_data() on the GUI thread once the events settle.
+    """
+    averageComputedSignal = QtCore.Signal(tuple)
+
+    def __init__(self, plotter, delay=DEBOUNCE_INTERVAL):
+        super().__init__(plotter)
+        self.plotter = plotter
+        self._slicer = None
+        self._update_model = False
+        # Identifier of the latest average sent to the worker
+        self._job = 0
+        # Pending plot updates, by plot id
+        self._plots = {}
+
+        self._thread = SlicerAverageThread(completefn=self._averageCompleted)
+        self.averageComputedSignal.connect(self._postAverage)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._dispatch)
+
+        self._frame_timer = QtCore.QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setInterval(FRAME_INTERVAL)
+        self._frame_timer.timeout.connect(self.flush)
+
+    def schedule(self, slicer):
+        """
+        Request an update of the slicer average. Requests made before the
+        previous one is dispatched are merged.
+        """
+        self._slicer = slicer
+        # Keep the slicer model in sync if any of the merged requests asks
+        self._update_model = self._update_model or slicer.update_model
+        self._timer.start()
+
+    def cancel(self):
+        """
+        Drop the pending and running updates, e.g. when the slicer is removed
+        """
+        self._timer.stop()
+        self._slicer = None
+        self._update_model = False
+        self._job += 1
+        self._thread.stop()
+
+    def flushNow(self, slicer=None):
+        """
+        Bring the 1D plots of a slicer up to date at once, on the calling
+        thread, e.g. before saving them. The pending request is taken if no
+        slicer is given, and any average still computing is dropped.
+        """
+        self._timer.stop()
+        if slicer is None:
+            slicer = self._slicer
+        if slicer is None and self._thread.isrunning():
+            # The running average is recomputed in place
+            slicer = self.plotter.slicer
+        update_model = self._update_model
+        self._slicer = None
+        self._update_model = False
+        # Results of averages still running are now outdated
+        self._job += 1
+
+        if slicer is not None:
+            if not hasattr(slicer, '_get_averager'):
+                slicer._post_data()
+            else:
+                averager = slicer._get_averager()
+                if averager is not None:
+                    try:
+                        result = averager(slicer.data)
+                    except ValueError as ex:
+                        logger.warning(str(ex))
+                    else:
+                        current_update_model = slicer.update_model
+                        slicer.update_model = update_model or current_update_model
+                        try:
+                            slicer._post_average(result)
+                        finally:
+                            slicer.update_model = current_update_model
+        self.flush()
+
+    def isPending(self):
+        """
+        Check for updates waiting to be dispatched or computed
+        """
+        return self._timer.isActive() or self._thread.isrunning()
+
+    def _dispatch(self):
+        """
+        Send the latest request to the worker thread
+        """
+        slicer = self._slicer
+        update_model = self._update_model
+        self._slicer = None
+        self._update_model = False
+        if slicer is None:
+            return
+        if not hasattr(slicer, '_get_averager'):
+            slicer._post_data()
+            return
+        averager = slicer._get_averager()
+        if averager is None:
+            return
+        self._job += 1
+        # Replace any request still waiting for the worker
+        self._thread.requeue((self._job, slicer, update_model), averager, slicer.data)
+
+    def _averageCompleted(self, job, result, error):
+        """
+        Called in the worker thread: pass the result to the GUI thread
+        """
+        try:
+            self.averageComputedSignal.emit((job, result, error))
+        except RuntimeError:
+            # The plotter was closed while averaging
+            pass
+
+    def _postAverage(self, output):
+        """
+        Plot a computed average, unless a newer one was requested since
+        """
+        (job, slicer, update_model), result, error = output
+        if job != self._job or slicer is not self.plotter.slicer:
+            return
+        if error is not None:
+            logger.warning(str(error))
+            return
+        current_update_model = slicer.update_model
+        slicer.update_model = update_model
+        try:
+            slicer._post_average(result)
+        finally:
+            slicer.update_model = current_update_model
+
+    def postPlot(self, item, plot):
+        """
+        Queue a 1D plot update. Updates of the same plot within a frame
+        are merged and only the latest is displayed.
+        """
+        self._plots[plot.id] = (item, plot)
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def flush(self):
+        """
+        Display the queued 1D plot updates
+        """
+        self._frame_timer.stop()
+        plots = list(self._plots.values())
+        self._plots = {}
+        for item, plot in plots:
+            # forcePlotDisplaySignal updates the plot in place when shown
+            self.plotter.manager.communicator.forcePlotDisplaySignal.emit([item, plot])
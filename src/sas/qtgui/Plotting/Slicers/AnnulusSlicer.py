@@ -96,12 +96,24 @@ class AnnulusInteractor(BaseInteractor, SlicerModel):
         :param nbins: the number of points to plot
 
         """
-        # Data to average
-        data = self.data
-        if data is None:
+        sect = self._get_averager(nbins)
+        if sect is None:
             return
+        self._post_average(sect(self.data))
+
+    def _get_averager(self, nbins=None):
+        """
+        Create the ring averager for the current annulus parameters.
 
-        from sasdata.data_util.manipulations import Ring
+        :param nbins: the number of points to plot
+        :return: the averager, or None if there is no data to average
+
+        """
+        # Data to average
+        if self.data is None:
+            return None
+
+        from sas.qtgui.Plotting.Slicers.SlicerGeometry import Ring
         rmin = min(numpy.fabs(self.inner_circle.get_radius()),
                    numpy.fabs(self.outer_circle.get_radius()))
         rmax = max(numpy.fabs(self.inner_circle.get_radius()),
@@ -109,9 +121,16 @@ class AnnulusInteractor(BaseInteractor, SlicerModel):
         if nbins is not None:
             self.nbins = nbins
         # Create the data1D Q average of data2D
-        sect = Ring(r_min=rmin, r_max=rmax, nbins=self.nbins)
-        sector = sect(self.data)
+        return Ring(r_min=rmin, r_max=rmax, nbins=self.nbins)
+
+    def _post_average(self, sector):
+        """
+        Plot the annulus average computed by the averager.
+
+        :param sector: Data1D returned by the averager
 
+        """
+        data = self.data
         if hasattr(sector, "dxl"):
             dxl = sector.dxl
         else:
@@ -147,8 +166,7 @@ class AnnulusInteractor(BaseInteractor, SlicerModel):
         if self._item.parent() is not None:
             item = self._item.parent()
         GuiUtils.updateModelItemWithPlot(item, new_plot, new_plot.id)
-        self.base.manager.communicator.plotUpdateSignal.emit([new_plot])
-        self.base.manager.communicator.forcePlotDisplaySignal.emit([item, new_plot])
+        self.base.slicer_updater.postPlot(item, new_plot)
 
         if self.update_model:
             self.setModelFromParams()
@@ -190,7 +208,7 @@ class AnnulusInteractor(BaseInteractor, SlicerModel):
         Called when any dragging motion ends.
         Redraw the plot with new parameters.
         """
-        self._post_data(self.nbins)
+        self.base.slicer_updater.schedule(self)
         self.draw()
 
     def restore(self, ev):
@@ -235,7 +253,7 @@ class AnnulusInteractor(BaseInteractor, SlicerModel):
         self.inner_circle.set_cursor(inner, self.inner_circle._inner_mouse_y)
         self.outer_circle.set_cursor(outer, self.outer_circle._inner_mouse_y)
         # Post the data given the nbins entered by the user
-        self._post_data(self.nbins)
+        self.base.slicer_updater.schedule(self)
         self.draw()
 
     def draw(self):
@@ -359,7 +377,7 @@ class RingInteractor(BaseInteractor):
         self._inner_mouse_x = x
         self._inner_mouse_y = y
         self.base.update()
-        self.base.draw()
+        self.draw_idle()
 
     def set_cursor(self, x, y):
         """
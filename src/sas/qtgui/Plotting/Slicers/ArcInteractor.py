@@ -117,7 +117,7 @@ class ArcInteractor(BaseInteractor):
                               np.power(self._mouse_y, 2))
         self.has_move = True
         self.base.update()
-        self.base.draw()
+        self.draw_idle()
 
     def set_cursor(self, x, y):
         self.move(x, y, None)
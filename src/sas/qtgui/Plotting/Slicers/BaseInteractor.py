@@ -85,6 +85,14 @@ class BaseInteractor(object):
         """
         pass
 
+    def draw_idle(self):
+        """
+        Request a redraw of the canvas holding the interactor. Requests
+        made before the canvas gets to redraw, as during a drag, are
+        coalesced into a single redraw.
+        """
+        self.axes.figure.canvas.draw_idle()
+
     def connect_markers(self, markers):
         """
         Connect markers to callbacks
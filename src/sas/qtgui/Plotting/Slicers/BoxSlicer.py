@@ -284,7 +284,7 @@ class BoxInteractor(BaseInteractor, SlicerModel):
         if self._item.parent() is not None:
             item = self._item.parent()
         GuiUtils.updateModelItemWithPlot(item, new_plot, new_plot.id)
-        self.base.manager.communicator.forcePlotDisplaySignal.emit([item, new_plot])
+        self.base.slicer_updater.postPlot(item, new_plot)
 
         if self.update_model:
             self.setModelFromParams()
@@ -542,7 +542,7 @@ class PointInteractor(BaseInteractor):
             self.y = y
         self.has_move = True
         self.base.update()
-        self.base.draw()
+        self.draw_idle()
 
     def setCursor(self, x, y):
         """
@@ -721,7 +721,7 @@ class VerticalDoubleLine(BaseInteractor):
             self.x2 = self.center_x - self.half_width
             self.has_move = True
             self.base.update()
-            self.base.draw()
+            self.draw_idle()
         else:
             if self.valid_move == True:
                 self.valid_move = False
@@ -903,7 +903,7 @@ class HorizontalDoubleLine(BaseInteractor):
             self.y2 = self.center_y - self.half_height
             self.has_move = True
             self.base.update()
-            self.base.draw()
+            self.draw_idle()
         else:
             if self.valid_move == True:
                 self.valid_move = False
@@ -933,7 +933,7 @@ class BoxInteractorX(BoxInteractor):
         """
         Post data creating by averaging in Qx direction
         """
-        from sasdata.data_util.manipulations import SlabX
+        from sas.qtgui.Plotting.Slicers.SlicerGeometry import SlabX
         super()._post_data(SlabX, direction="X")
 
 
@@ -952,5 +952,5 @@ class BoxInteractorY(BoxInteractor):
         """
         Post data creating by averaging in Qy direction
         """
-        from sasdata.data_util.manipulations import SlabY
+        from sas.qtgui.Plotting.Slicers.SlicerGeometry import SlabY
         super()._post_data(SlabY, direction="Y")
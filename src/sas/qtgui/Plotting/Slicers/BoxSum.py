@@ -4,7 +4,7 @@ from PySide6 import QtGui
 from sas.qtgui.Utilities.GuiUtils import formatNumber, toDouble
 
 from sas.qtgui.Plotting.Slicers.BaseInteractor import BaseInteractor
-from sasdata.data_util.manipulations import Boxavg, Boxsum
+from sas.qtgui.Plotting.Slicers.SlicerGeometry import Boxsum
 
 from sas.qtgui.Plotting.SlicerModel import SlicerModel
 
@@ -63,6 +63,8 @@ class BoxSumCalculator(BaseInteractor):
         self.total = 0
         self.totalerror = 0
         self.points = 0
+        # Area of the pixels summed, in 1/A^2
+        self.area = 0
         # Flag to determine if the current figure has moved
         # set to False == no motion , set to True== motion
         self.has_move = False
@@ -100,7 +102,7 @@ class BoxSumCalculator(BaseInteractor):
         self.postData()
 
         # set up the model
-        self._model = QtGui.QStandardItemModel(1, 9)
+        self._model = QtGui.QStandardItemModel(1, 10)
         self.setModelFromParams()
         self.update_model = True
         self._model.itemChanged.connect(self.setParamsFromModel)
@@ -138,6 +140,7 @@ class BoxSumCalculator(BaseInteractor):
         self._model.setData(self._model.index(0, 6), formatNumber(parameters['sum']))
         self._model.setData(self._model.index(0, 7), formatNumber(parameters['sum_error']))
         self._model.setData(self._model.index(0, 8), formatNumber(parameters['num_points']))
+        self._model.setData(self._model.index(0, 9), formatNumber(parameters['area']))
 
     def setParamsFromModel(self):
         """
@@ -223,11 +226,16 @@ class BoxSumCalculator(BaseInteractor):
         y_min = self.vertical_lines.y2
         y_max = self.vertical_lines.y1
         #computation of the sum and its error
-        box = Boxavg(x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max)
-        self.count, self.error = box(self.data)
         # Dig out number of points summed, SMK & PDB, 04/03/2013
         boxtotal = Boxsum(x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max)
         self.total, self.totalerror, self.points = boxtotal(self.data)
+        self.area = boxtotal.area
+        # The average follows from the same pass over the ROI
+        if self.points == 0:
+            self.count, self.error = 0, 0
+        else:
+            self.count = self.total / self.points
+            self.error = self.totalerror / self.points
         if self.update_model:
             self.setModelFromParams()
 
@@ -262,6 +270,7 @@ class BoxSumCalculator(BaseInteractor):
         params["avg_error"] = self.error
         params["sum"] = self.total
         params["sum_error"] = self.totalerror
+        params["area"] = self.area
         return params
 
     def getResult(self):
@@ -274,6 +283,7 @@ class BoxSumCalculator(BaseInteractor):
         result["avg_error"] = self.error
         result["sum"] = self.total
         result["sum_error"] = self.totalerror
+        result["area"] = self.area
         return result
 
     def setParams(self, params):
@@ -395,7 +405,7 @@ class PointInteractor(BaseInteractor):
         self.y = y
         self.has_move = True
         self.base.update()
-        self.base.draw()
+        self.draw_idle()
 
     def setCursor(self, x, y):
         """
@@ -563,7 +573,7 @@ class VerticalDoubleLine(BaseInteractor):
         self.half_width = numpy.fabs(self.x1 - self.x2) / 2
         self.has_move = True
         self.base.update()
-        self.base.draw()
+        self.draw_idle()
 
     def setCursor(self, x, y):
         """
@@ -727,7 +737,7 @@ class HorizontalDoubleLine(BaseInteractor):
         self.half_height = numpy.fabs(self.y1) - self.center_y
         self.has_move = True
         self.base.update()
-        self.base.draw()
+        self.draw_idle()
 
     def setCursor(self, x, y):
         """
@@ -143,7 +143,7 @@ class RadiusInteractor(BaseInteractor):
         self.phi = phi
         self.has_move = True
         self.base.update()
-        self.base.draw()
+        self.draw_idle()
 
     def set_cursor(self, x, y):
         self.move(x, y, None)
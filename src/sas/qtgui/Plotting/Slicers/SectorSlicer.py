@@ -136,13 +136,22 @@ class SectorInteractor(BaseInteractor, SlicerModel):
         compute sector averaging of data2D into data1D
         :param nbins: the number of point to plot for the average 1D data
         """
-        # Get the data2D to average
-        data = self.data
+        sect = self._get_averager(nbins)
         # If we have no data, just return
-        if data is None:
+        if sect is None:
             return
-        # Averaging
-        from sasdata.data_util.manipulations import SectorQ
+        self._post_average(sect(self.data))
+
+    def _get_averager(self, nbins=None):
+        """
+        Create the sector averager for the current position of the slicer
+        :param nbins: the number of point to plot for the average 1D data
+        :return: the averager, or None if there is no data to average
+        """
+        # If we have no data, just return
+        if self.data is None:
+            return None
+        from sas.qtgui.Plotting.Slicers.SlicerGeometry import SectorQ
         radius = self.qmax
         phimin = -self.left_line.phi + self.main_line.theta
         phimax = self.left_line.phi + self.main_line.theta
@@ -153,7 +162,14 @@ class SectorInteractor(BaseInteractor, SlicerModel):
                        phi_max=phimax + numpy.pi, nbins=nbins)
 
         sect.fold = self.fold
-        sector = sect(self.data)
+        return sect
+
+    def _post_average(self, sector):
+        """
+        Plot the sector average computed by the averager
+        :param sector: Data1D returned by the averager
+        """
+        data = self.data
         # Create 1D data resulting from average
 
         if hasattr(sector, "dxl"):
@@ -188,8 +204,7 @@ class SectorInteractor(BaseInteractor, SlicerModel):
             item = self._item.parent()
         GuiUtils.updateModelItemWithPlot(item, new_plot, new_plot.id)
 
-        self.base.manager.communicator.plotUpdateSignal.emit([new_plot])
-        self.base.manager.communicator.forcePlotDisplaySignal.emit([item, new_plot])
+        self.base.slicer_updater.postPlot(item, new_plot)
 
         if self.update_model:
             self.setModelFromParams()
@@ -218,7 +233,7 @@ class SectorInteractor(BaseInteractor, SlicerModel):
         Called a dragging motion ends.Get slicer event
         """
         # Post parameters
-        self._post_data(self.nbins)
+        self.base.slicer_updater.schedule(self)
 
     def restore(self, ev):
         """
@@ -281,7 +296,7 @@ class SectorInteractor(BaseInteractor, SlicerModel):
         self.left_line.update(phi=phi, delta=None, mline=self.main_line,
                               side=True, left=True)
         # Post the new corresponding data
-        self._post_data(nbins=self.nbins)
+        self.base.slicer_updater.schedule(self)
         self.draw()
 
     def draw(self):
@@ -466,7 +481,7 @@ class SideInteractor(BaseInteractor):
         if self.phi > numpy.pi:
             self.phi = 2 * numpy.pi - numpy.fabs(self.theta2 - self.theta)
         self.base.update()
-        self.base.draw()
+        self.draw_idle()
 
     def set_cursor(self, x, y):
         self.move(x, y, None)
@@ -585,7 +600,7 @@ class LineInteractor(BaseInteractor):
         self.theta = numpy.arctan2(y, x)
         self.has_move = True
         self.base.update()
-        self.base.draw()
+        self.draw_idle()
 
     def set_cursor(self, x, y):
         self.move(x, y, None)
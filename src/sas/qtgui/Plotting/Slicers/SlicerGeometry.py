@@ -0,0 +1,572 @@
+"""
+Vectorised averaging of Data2D for the slicers.
+
+The averagers defined here are drop-in replacements for the ones of
+sasdata.data_util.manipulations used by the slicers and give the same
+results. Instead of looping over every pixel of the detector on each update,
+the pixel geometry of a data set (phi, the pixel areas and the q, qx, qy,
+phi orderings) is computed once and kept in a GeometryIndex. An averager then only looks at
+the pixels which can fall inside its region of interest, found by binary
+search in the sorted orderings, and accumulates its bins with numpy.bincount.
+"""
+import math
+import threading
+import weakref
+
+import numpy as np
+
+from sasdata.dataloader.data_info import Data1D
+from sasdata.data_util import manipulations
+from sasdata.data_util.manipulations import flip_phi
+
+# Geometry indices of the data sets currently shown, dropped with the data
+_indices = weakref.WeakKeyDictionary()
+# Slicers may average in a worker thread
+_indices_lock = threading.Lock()
+
+
+class GeometryIndex:
+    """
+    Pixel geometry of a Data2D, shared by all the slicers averaging it.
+
+    The orderings are only built the first time they are needed. The index
+    keeps references to the q arrays it was built from, so replacing any
+    of them on the data set invalidates it.
+    """
+    def __init__(self, data2D):
+        self.qx = data2D.qx_data
+        self.qy = data2D.qy_data
+        self.q = data2D.q_data
+        self.x_bins = getattr(data2D, 'x_bins', None)
+        self.y_bins = getattr(data2D, 'y_bins', None)
+        self._phi = None
+        self._pixel_area = None
+        self._orderings = {}
+        self._dq = None
+        self._dq_sources = None
+
+    def matches(self, data2D):
+        """
+        Check that the index was built from the current q arrays of data2D
+        """
+        return (self.qx is data2D.qx_data and self.qy is data2D.qy_data
+                and self.q is data2D.q_data)
+
+    @property
+    def phi(self):
+        """
+        Angle of every pixel, in the [0, 2pi] range used by the averagers
+        """
+        if self._phi is None:
+            self._phi = np.arctan2(self.qy, self.qx) + math.pi
+        return self._phi
+
+    @property
+    def pixel_area(self):
+        """
+        Area covered by every pixel in the (qx, qy) plane, in 1/A^2.
+
+        The pixels are taken to lie on the rectangular grid given by the
+        x_bins and y_bins of the data, or by the distinct qx and qy values
+        if they are not set. Each pixel extends halfway to its neighbours.
+        """
+        if self._pixel_area is None:
+            width = _grid_widths(self.qx, self.x_bins)
+            height = _grid_widths(self.qy, self.y_bins)
+            self._pixel_area = width * height
+        return self._pixel_area
+
+    def area(self, pixels):
+        """
+        Total area of the given pixels in the (qx, qy) plane, in 1/A^2.
+        """
+        return float(np.sum(self.pixel_area[pixels]))
+
+    def _ordering(self, name):
+        """
+        Return the pixel indices sorted by the named quantity and the
+        sorted values.
+        """
+        if name not in self._orderings:
+            values = self.phi if name == 'phi' else getattr(self, name)
+            order = np.argsort(values, kind='stable')
+            self._orderings[name] = (order, values[order])
+        return self._orderings[name]
+
+    def _bounds(self, name, low, high):
+        order, values = self._ordering(name)
+        start = np.searchsorted(values, low, side='left')
+        stop = np.searchsorted(values, high, side='right')
+        return order, start, max(start, stop)
+
+    def count(self, name, low, high):
+        """
+        Number of pixels with low <= value <= high for the named quantity,
+        one of 'q', 'qx', 'qy' or 'phi'.
+        """
+        _, start, stop = self._bounds(name, low, high)
+        return stop - start
+
+    def find(self, name, low, high):
+        """
+        Indices of the pixels with low <= value <= high for the named
+        quantity, one of 'q', 'qx', 'qy' or 'phi'.
+        """
+        order, start, stop = self._bounds(name, low, high)
+        return order[start:stop]
+
+    def find_box(self, x_min, x_max, y_min, y_max):
+        """
+        Indices of the pixels which can be inside a box, taken from the
+        axis cutting the fewest pixels.
+        """
+        if self.count('qx', x_min, x_max) <= self.count('qy', y_min, y_max):
+            return self.find('qx', x_min, x_max)
+        return self.find('qy', y_min, y_max)
+
+    def get_dq(self, data2D):
+        """
+        Resolution of every pixel as given by manipulations.get_dq_data,
+        or None if the data has no resolution.
+        """
+        if data2D.dqx_data is None or data2D.dqy_data is None:
+            return None
+        sources = (data2D.dqx_data, data2D.dqy_data)
+        if self._dq_sources is None or self._dq_sources[0] is not sources[0] \
+                or self._dq_sources[1] is not sources[1]:
+            self._dq = _get_dq_data(data2D)
+            self._dq_sources = sources
+        return self._dq
+
+
+def get_geometry_index(data2D):
+    """
+    Return the geometry index of a data set, building it if needed.
+    """
+    with _indices_lock:
+        index = _indices.get(data2D)
+        if index is None or not index.matches(data2D):
+            index = GeometryIndex(data2D)
+            _indices[data2D] = index
+    return index
+
+
+def _grid_widths(values, centres=None):
+    """
+    Width of the grid cell of each value along one axis. The cell edges are
+    halfway between the grid centres, which default to the distinct values.
+    """
+    if centres is None or len(centres) == 0:
+        centres = np.unique(values)
+    else:
+        centres = np.unique(np.asarray(centres, dtype=float))
+    if len(centres) < 2:
+        return np.zeros(len(values))
+    widths = np.gradient(centres)
+    # Pixel positions may differ from the centres by rounding errors
+    position = np.clip(np.searchsorted(centres, values), 1, len(centres) - 1)
+    nearest = np.where(values - centres[position - 1] < centres[position] - values,
+                       position - 1, position)
+    return widths[nearest]
+
+
+def _get_dq_data(data2D):
+    """
+    Vectorised manipulations.get_dq_data, evaluated on every pixel rather
+    than on the pixels with finite data only.
+    """
+    q_data = data2D.q_data
+    dqx_data = data2D.dqx_data
+    dqy_data = data2D.dqy_data
+    z_max = np.max(q_data)
+    z_min = np.min(q_data)
+    i_max = np.argmax(q_data)
+    i_min = np.argmin(q_data)
+    # Find dqx and dqy at q = 0
+    dq_overlap_x = (dqx_data[i_min] * z_max - dqx_data[i_max] * z_min) / (z_max - z_min)
+    if dq_overlap_x > np.min(dqx_data):
+        dq_overlap_x = np.min(dqx_data)
+    dq_overlap_x *= dq_overlap_x
+    dq_overlap_y = (dqy_data[i_min] * z_max - dqy_data[i_max] * z_min) / (z_max - z_min)
+    if dq_overlap_y > np.min(dqy_data):
+        dq_overlap_y = np.min(dqy_data)
+    dq_overlap_y *= dq_overlap_y
+
+    dq_overlap = np.sqrt((dq_overlap_x + dq_overlap_y) / 2.0)
+    if dq_overlap < 0:
+        dq_overlap = dqy_data[i_min]
+    return np.sqrt(dqx_data**2 + (dqy_data - dq_overlap)**2)
+
+
+def _select(data2D, candidates):
+    """
+    Keep the unmasked candidate pixels with finite data.
+
+    :return: the pixel indices, in detector order, and their data
+    """
+    pixels = np.unique(candidates)
+    values = data2D.data[pixels]
+    keep = np.isfinite(values) & np.asarray(data2D.mask[pixels], dtype=bool)
+    return pixels[keep], values[keep]
+
+
+def _error_terms(data2D, pixels, values):
+    """
+    Contribution of each pixel to the squared error of a bin. Pixels
+    without an error use the counting error, abs(data).
+    """
+    if data2D.err_data is None:
+        return np.abs(values)
+    errors = data2D.err_data[pixels]
+    return np.where(errors == 0.0, np.abs(values), errors * errors)
+
+
+def _in_wing(phi, phi_min, phi_max, closed=True):
+    """
+    Check which angles fall between phi_min and phi_max, the interval
+    wrapping around 2pi if phi_min > phi_max. The lower bound is only
+    included if closed is True and the interval does not wrap.
+    """
+    if phi_min > phi_max:
+        return (phi > phi_min) | (phi < phi_max)
+    if closed:
+        return (phi >= phi_min) & (phi < phi_max)
+    return (phi > phi_min) & (phi < phi_max)
+
+
+def _wing_ranges(phi_min, phi_max):
+    """
+    Angular intervals covering a wing, split at the 2pi discontinuity.
+    """
+    if phi_min > phi_max:
+        return [(phi_min, np.inf), (-np.inf, phi_max)]
+    return [(phi_min, phi_max)]
+
+
+def _bin_index(values, n_bins, min_value, max_value, base=None):
+    """
+    Vectorised manipulations.Binning.get_bin_index
+    """
+    if base:
+        temp_x = n_bins * (np.log(values) / math.log(base) - math.log(min_value, base))
+        temp_y = math.log(max_value, base) - math.log(min_value, base)
+    else:
+        temp_x = n_bins * (values - min_value)
+        temp_y = max_value - min_value
+    return np.floor(temp_x / temp_y).astype(int)
+
+
+def _check_detectors(data2D, msg):
+    if len(data2D.detector) > 1:
+        msg += "%g" % len(data2D.detector)
+        raise RuntimeError(msg)
+
+
+class _IndexedSector:
+    """
+    Sector averaging over the pixels found through the geometry index.
+    """
+    def _agv(self, data2D, run='phi'):
+        """
+        Perform sector averaging.
+
+        :param data2D: Data2D object
+        :param run:  define the varying parameter ('phi' , or 'sector')
+
+        :return: Data1D object
+        """
+        if data2D.__class__.__name__ not in ["Data2D", "plottable_2D"]:
+            raise RuntimeError("Ring averaging only take plottable_2D objects")
+        is_phi = run.lower() == 'phi'
+
+        # Get the min and max into the region: 0 <= phi < 2Pi, for the
+        # sector and the opposite side sector, the "minor wing"
+        phi_min = flip_phi(self.phi_min)
+        phi_max = flip_phi(self.phi_max)
+        phi_min_minor = flip_phi(phi_min - math.pi)
+        phi_max_minor = flip_phi(phi_max - math.pi)
+
+        # Candidate pixels are taken from the ring r_min <= q <= r_max or
+        # from the angular range of the wings, whichever is smaller
+        index = get_geometry_index(data2D)
+        ranges = _wing_ranges(phi_min, phi_max)
+        if not is_phi:
+            ranges += _wing_ranges(phi_min_minor, phi_max_minor)
+        n_ring = index.count('q', self.r_min, self.r_max)
+        if sum(index.count('phi', low, high) for low, high in ranges) < n_ring:
+            candidates = np.concatenate([index.find('phi', low, high)
+                                         for low, high in ranges])
+        else:
+            candidates = index.find('q', self.r_min, self.r_max)
+        pixels, values = _select(data2D, candidates)
+
+        q_data = data2D.q_data[pixels]
+        q_value = q_data
+        phi_value = index.phi[pixels]
+        is_in = _in_wing(phi_value, phi_min, phi_max)
+        if not is_phi:
+            # Pixels of the minor wing get a negative q when the wings are
+            # kept separate
+            minor = ~is_in & _in_wing(phi_value, phi_min_minor,
+                                      phi_max_minor, closed=False)
+            is_in |= minor
+            if not self.fold:
+                q_value = np.where(minor, -q_value, q_value)
+        is_in &= (self.r_min <= q_data) & (q_data <= self.r_max)
+        pixels = pixels[is_in]
+        values = values[is_in]
+        q_value = q_value[is_in]
+        phi_value = phi_value[is_in]
+
+        # Get the binning index
+        if is_phi:
+            bin_min = phi_min
+            bin_max = phi_max + 2 * np.pi if phi_min > phi_max else phi_max
+            i_bin = _bin_index(np.where(phi_min > phi_value,
+                                        phi_value + 2 * np.pi, phi_value),
+                               self.nbins, bin_min, bin_max, self.base)
+        else:
+            bin_min = self.r_min if self.fold else -self.r_max
+            bin_max = self.r_max
+            i_bin = _bin_index(q_value, self.nbins, bin_min, bin_max, self.base)
+        # Take care of the edge case at phi = 2pi.
+        i_bin[i_bin == self.nbins] = self.nbins - 1
+        in_bins = (i_bin >= 0) & (i_bin < self.nbins)
+        if not in_bins.all():
+            pixels = pixels[in_bins]
+            values = values[in_bins]
+            q_value = q_value[in_bins]
+            i_bin = i_bin[in_bins]
+
+        y = np.bincount(i_bin, weights=values, minlength=self.nbins)
+        x = np.bincount(i_bin, weights=q_value, minlength=self.nbins)
+        y_err = np.bincount(i_bin, weights=_error_terms(data2D, pixels, values),
+                            minlength=self.nbins)
+        y_counts = np.bincount(i_bin, minlength=self.nbins).astype(float)
+        dq_data = index.get_dq(data2D)
+        x_err = None
+        if dq_data is not None:
+            x_err = np.bincount(i_bin, weights=dq_data[pixels],
+                                minlength=self.nbins)
+
+        # Organize the results
+        with np.errstate(divide='ignore', invalid='ignore'):
+            y = y / y_counts
+            y_err = np.sqrt(y_err) / y_counts
+            if is_phi:
+                step = (bin_max - bin_min) / self.nbins
+                x = (np.arange(self.nbins) + 0.5) * step + phi_min
+            else:
+                x = x / y_counts
+
+        idx = (np.isfinite(y) & np.isfinite(y_err))
+        if x_err is not None:
+            d_x = x_err[idx] / y_counts[idx]
+        else:
+            d_x = None
+        if not idx.any():
+            msg = "Average Error: No points inside sector of ROI to average..."
+            raise ValueError(msg)
+        return Data1D(x=x[idx], y=y[idx], dy=y_err[idx], dx=d_x)
+
+
+class SectorPhi(_IndexedSector, manipulations.SectorPhi):
+    """
+    Sector average as a function of phi, see manipulations.SectorPhi.
+    """
+
+
+class SectorQ(_IndexedSector, manipulations.SectorQ):
+    """
+    Sector average as a function of Q for both wings, see
+    manipulations.SectorQ.
+    """
+
+
+class Ring(manipulations.Ring):
+    """
+    Angular distribution of counts in a ring, see manipulations.Ring.
+    """
+    def __call__(self, data2D):
+        """
+        Apply the ring to the data set.
+        Returns the angular distribution for a given q range
+
+        :param data2D: Data2D object
+
+        :return: Data1D object
+        """
+        if data2D.__class__.__name__ not in ["Data2D", "plottable_2D"]:
+            raise RuntimeError("Ring averaging only take plottable_2D objects")
+        nbins = self.nbins_phi
+
+        index = get_geometry_index(data2D)
+        pixels, values = _select(data2D, index.find('q', self.r_min, self.r_max))
+        q_value = data2D.q_data[pixels]
+        is_in = (self.r_min <= q_value) & (q_value <= self.r_max)
+        pixels = pixels[is_in]
+        values = values[is_in]
+
+        # Shift the phi values to center the first bin at zero
+        phi_shift = math.pi / nbins
+        i_phi = np.floor(nbins * (index.phi[pixels] + phi_shift)
+                         / (2 * math.pi)).astype(int)
+        # Take care of the edge case at phi = 2pi.
+        i_phi[i_phi >= nbins] = 0
+
+        phi_bins = np.bincount(i_phi, weights=values, minlength=nbins)
+        phi_err = np.bincount(i_phi, weights=_error_terms(data2D, pixels, values),
+                              minlength=nbins)
+        phi_counts = np.bincount(i_phi, minlength=nbins).astype(float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            phi_bins = phi_bins / phi_counts
+            phi_err = np.sqrt(phi_err) / phi_counts
+        phi_values = 2.0 * math.pi / nbins * np.arange(nbins, dtype=float)
+
+        idx = (np.isfinite(phi_bins))
+
+        if not idx.any():
+            msg = "Average Error: No points inside ROI to average..."
+            raise ValueError(msg)
+
+        return Data1D(x=phi_values[idx], y=phi_bins[idx], dy=phi_err[idx])
+
+
+class _IndexedSlab:
+    """
+    Slab averaging over the pixels found through the geometry index.
+    """
+    def _avg(self, data2D, maj):
+        """
+        Compute average I(Q_maj) for a region of interest.
+        The major axis is defined as the axis of Q_maj.
+        The minor axis is the axis that we average over.
+
+        :param data2D: Data2D object
+        :param maj: major axis, 'x' or 'y'
+        :return: Data1D object
+        """
+        _check_detectors(data2D, "_Slab._avg: invalid number of  detectors: ")
+
+        # Bin width calculation returns negative values when either axis has
+        # no points above 0.
+        self.bin_width = abs(self.bin_width)
+
+        # Build array of Q intervals
+        if maj not in ('x', 'y'):
+            raise RuntimeError("_Slab._avg: unrecognized axis %s" % str(maj))
+        if maj == 'x':
+            axis_min, axis_max = self.x_min, self.x_max
+        else:
+            axis_min, axis_max = self.y_min, self.y_max
+        if self.fold:
+            # The limits are taken from the side further from 0, starting at
+            # 0 if the box straddles it
+            q_max = max(abs(axis_min), abs(axis_max))
+            if axis_min * axis_max >= 0:
+                q_min = min(abs(axis_min), abs(axis_max))
+            else:
+                q_min = 0
+        else:
+            q_min, q_max = axis_min, axis_max
+        nbins = int(math.ceil((q_max - q_min) / self.bin_width))
+
+        index = get_geometry_index(data2D)
+        pixels, values = _select(data2D, index.find_box(self.x_min, self.x_max,
+                                                        self.y_min, self.y_max))
+        qx = data2D.qx_data[pixels]
+        qy = data2D.qy_data[pixels]
+        is_in = (self.x_min <= qx) & (qx < self.x_max) & \
+                (self.y_min <= qy) & (qy < self.y_max)
+        q_value = qx if maj == 'x' else qy
+        if self.fold:
+            # Only use the data inside the box when it is not centered on 0
+            q_value = np.abs(q_value)
+            is_in &= (q_min <= q_value) & (q_value < q_max)
+        pixels = pixels[is_in]
+        values = values[is_in]
+        q_value = q_value[is_in]
+
+        i_q = np.ceil((q_value - q_min) / self.bin_width).astype(int) - 1
+        # skip outside of max bins
+        in_bins = (i_q >= 0) & (i_q < nbins)
+        pixels = pixels[in_bins]
+        values = values[in_bins]
+        q_value = q_value[in_bins]
+        i_q = i_q[in_bins]
+
+        x = np.bincount(i_q, weights=q_value, minlength=nbins)
+        y = np.bincount(i_q, weights=values, minlength=nbins)
+        err_y = np.bincount(i_q, weights=_error_terms(data2D, pixels, values),
+                            minlength=nbins)
+        y_counts = np.bincount(i_q, minlength=nbins).astype(float)
+
+        # Average the sums
+        with np.errstate(divide='ignore', invalid='ignore'):
+            err_y = np.sqrt(err_y) / y_counts
+            y = y / y_counts
+            x = x / y_counts
+        idx = (np.isfinite(y) & np.isfinite(x))
+
+        if not idx.any():
+            msg = "Average Error: No points inside ROI to average..."
+            raise ValueError(msg)
+        return Data1D(x=x[idx], y=y[idx], dy=err_y[idx])
+
+
+class SlabY(_IndexedSlab, manipulations.SlabY):
+    """
+    Compute average I(Qy) for a region of interest, see manipulations.SlabY.
+    """
+
+
+class SlabX(_IndexedSlab, manipulations.SlabX):
+    """
+    Compute average I(Qx) for a region of interest, see manipulations.SlabX.
+    """
+
+
+class _IndexedBox:
+    """
+    Box summation over the pixels found through the geometry index.
+    """
+    def _sum(self, data2D):
+        """
+        Perform the sum in the region of interest
+
+        :param data2D: Data2D object
+        :return: number of counts,
+            error on number of counts, number of entries summed
+        """
+        _check_detectors(data2D, "Circular averaging: invalid number of detectors: ")
+
+        index = get_geometry_index(data2D)
+        pixels, values = _select(data2D, index.find_box(self.x_min, self.x_max,
+                                                        self.y_min, self.y_max))
+        qx = data2D.qx_data[pixels]
+        qy = data2D.qy_data[pixels]
+        is_in = (self.x_min <= qx) & (self.x_max > qx) & \
+                (self.y_min <= qy) & (self.y_max > qy)
+        pixels = pixels[is_in]
+        values = values[is_in]
+
+        y = float(np.sum(values))
+        err_y = float(np.sum(_error_terms(data2D, pixels, values)))
+        y_counts = float(len(values))
+        # Area of the pixels summed, in 1/A^2
+        self.area = index.area(pixels)
+        return y, err_y, y_counts
+
+
+class Boxsum(_IndexedBox, manipulations.Boxsum):
+    """
+    Perform the sum of counts in a 2D region of interest, see
+    manipulations.Boxsum.
+    """
+
+
+class Boxavg(_IndexedBox, manipulations.Boxavg):
+    """
+    Perform the average of counts in a 2D region of interest, see
+    manipulations.Boxavg.
+    """
@@ -150,10 +150,22 @@ class WedgeInteractor(BaseInteractor, SlicerModel):
         Probably by creating the 1D plot object in those top level classes along
         with the specifc attributes.
         """
-        # Data to average
-        data = self.data
-        if data is None:
+        sect = self._get_averager(new_sector, nbins)
+        if sect is None:
             return
+        self._post_average(sect(self.data))
+
+    def _get_averager(self, new_sector=None, nbins=None):
+        """
+        Create the sector averager for the current position of the wedge
+
+        :param new_sector: slicer used for directional averaging in Q or Phi
+        :param nbins: the number of point plotted when averaging
+        :return: the averager, or None if there is no data to average
+        """
+        # Data to average
+        if self.data is None:
+            return None
 
         if self.inner_arc.radius < self.outer_arc.radius:
             rmin = self.inner_arc.radius
@@ -177,8 +189,14 @@ class WedgeInteractor(BaseInteractor, SlicerModel):
         sect = self.averager(r_min=rmin, r_max=rmax, phi_min=phimin + np.pi,
                              phi_max=phimax + np.pi, nbins=self.nbins)
         sect.fold = False
-        sector = sect(self.data)
+        return sect
+
+    def _post_average(self, sector):
+        """
+        Plot the wedge average computed by the averager
 
+        :param sector: Data1D returned by the averager
+        """
         if hasattr(sector, "dxl"):
             dxl = sector.dxl
         else:
@@ -219,8 +237,7 @@ class WedgeInteractor(BaseInteractor, SlicerModel):
             item = self._item.parent()
         GuiUtils.updateModelItemWithPlot(item, new_plot, new_plot.id)
 
-        self.base.manager.communicator.plotUpdateSignal.emit([new_plot])
-        self.base.manager.communicator.forcePlotDisplaySignal.emit([item, new_plot])
+        self.base.slicer_updater.postPlot(item, new_plot)
 
         if self.update_model:
             self.setModelFromParams()
@@ -269,7 +286,7 @@ class WedgeInteractor(BaseInteractor, SlicerModel):
         Post the slicer new parameters and creates a new Data1D
         corresponding to the new average
         """
-        self._post_data()
+        self.base.slicer_updater.schedule(self)
 
     def restore(self, ev):
         """
@@ -321,7 +338,7 @@ class WedgeInteractor(BaseInteractor, SlicerModel):
         self.radial_lines.update(r1=self.r1, r2=self.r2,
                                  theta=self.theta, phi=self.phi)
         self.central_line.update(theta=self.theta)
-        self._post_data()
+        self.base.slicer_updater.schedule(self)
         self.draw()
 
     def draw(self):
@@ -345,7 +362,7 @@ class WedgeInteractorQ(WedgeInteractor):
         super()._post_data()
 
     def _post_data(self, new_sector=None, nbins=None):
-        from sasdata.data_util.manipulations import SectorQ
+        from sas.qtgui.Plotting.Slicers.SlicerGeometry import SectorQ
         super()._post_data(SectorQ)
 
 
@@ -362,6 +379,6 @@ class WedgeInteractorPhi(WedgeInteractor):
         super()._post_data()
 
     def _post_data(self, new_sector=None, nbins=None):
-        from sasdata.data_util.manipulations import SectorPhi
+        from sas.qtgui.Plotting.Slicers.SlicerGeometry import SectorPhi
         super()._post_data(SectorPhi)
 
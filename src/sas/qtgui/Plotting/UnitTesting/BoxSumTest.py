@@ -16,7 +16,7 @@ class BoxSumTest:
         '''Create/Destroy the BoxSum'''
         # example model
         model = QtGui.QStandardItemModel()
-        parameters = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
+        parameters = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
         for index, parameter in enumerate(parameters):
             model.setData(model.index(0, index),parameter)
         w = BoxSum(None, model=model)
@@ -37,3 +37,4 @@ class BoxSumTest:
         assert isinstance(widget.mapper.mappedWidgetAt(6), QtWidgets.QLabel)
         assert isinstance(widget.mapper.mappedWidgetAt(7), QtWidgets.QLabel)
         assert isinstance(widget.mapper.mappedWidgetAt(8), QtWidgets.QLabel)
+        assert isinstance(widget.mapper.mappedWidgetAt(9), QtWidgets.QLabel)
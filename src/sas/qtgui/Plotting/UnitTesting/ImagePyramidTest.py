@@ -0,0 +1,118 @@
+import numpy
+import pytest
+
+from sas.qtgui.Plotting.PlotterData import Data2D
+
+# Tested module
+from sas.qtgui.Plotting.ImagePyramid import ImagePyramid, downsample
+import sas.qtgui.Plotting.Plotter2D as Plotter2D
+
+
+class ImagePyramidTest:
+    '''Test the ImagePyramid'''
+
+    def testDownsample(self):
+        '''Blocks are averaged over their finite pixels'''
+        image = numpy.array([[1.0, 3.0, 5.0],
+                             [numpy.nan, 2.0, 7.0],
+                             [4.0, 4.0, numpy.nan]])
+        result = downsample(image)
+        assert result.shape == (2, 2)
+        assert result[0, 0] == pytest.approx(2.0)
+        assert result[0, 1] == pytest.approx(6.0)
+        assert result[1, 0] == pytest.approx(4.0)
+        assert numpy.isnan(result[1, 1])
+
+    def testLevels(self):
+        '''Levels are halved down to a single row'''
+        image = numpy.arange(64.0 * 16).reshape(64, 16)
+        pyramid = ImagePyramid(image, (0.0, 1.0, -2.0, 2.0))
+        assert pyramid.max_level == 4
+        assert pyramid.level(0) is image
+        assert pyramid.level(2).shape == (16, 4)
+        assert pyramid.level(10).shape == (4, 1)
+        assert pyramid.level(1)[0, 0] == pytest.approx(numpy.mean(image[:2, :2]))
+        # Levels are computed once
+        assert pyramid.level(2) is pyramid.level(2)
+        assert pyramid.levelExtent(2) == pytest.approx((0.0, 1.0, -2.0, 2.0))
+
+    def testPaddedExtent(self):
+        '''Padded levels extend the image by part of a pixel'''
+        pyramid = ImagePyramid(numpy.ones((5, 5)), (0.0, 5.0, 0.0, 10.0))
+        assert pyramid.level(1).shape == (3, 3)
+        assert pyramid.levelExtent(1) == pytest.approx((0.0, 6.0, 0.0, 12.0))
+
+    def testSelectLevel(self):
+        '''The coarsest level with a pixel per screen pixel is selected'''
+        pyramid = ImagePyramid(numpy.ones((1024, 1024)), (-1.0, 1.0, -1.0, 1.0))
+        # The full image on 200 screen pixels
+        assert pyramid.selectLevel((-1, 1), (-1, 1), 200, 200) == 2
+        # More screen pixels than image pixels
+        assert pyramid.selectLevel((-1, 1), (-1, 1), 2000, 2000) == 0
+        # Zoomed in
+        assert pyramid.selectLevel((-0.25, 0.25), (-0.25, 0.25), 200, 200) == 0
+        # The least dense direction decides
+        assert pyramid.selectLevel((-1, 1), (-0.25, 0.25), 100, 100) == 1
+        # No screen area
+        assert pyramid.selectLevel((-1, 1), (-1, 1), 0, 0) == 0
+
+
+class Plotter2DImageTest:
+    '''Test the display of a large image in Plotter2D'''
+
+    @pytest.fixture(autouse=True)
+    def plotter(self, qapp):
+        '''Create/Destroy the Plotter2D with a 256x256 image'''
+        class dummy_manager(object):
+            def communicator(self):
+                return None
+
+        p = Plotter2D.Plotter2D(parent=dummy_manager(), quickplot=True)
+        qx, qy = numpy.meshgrid(numpy.linspace(-0.1, 0.1, 256),
+                                numpy.linspace(-0.1, 0.1, 256))
+        image = 100 * numpy.exp(-100 * (qx**2 + qy**2))
+        data = Data2D(image=image.ravel(), qx_data=qx.ravel(), qy_data=qy.ravel(),
+                      q_data=numpy.hypot(qx, qy).ravel(),
+                      mask=numpy.ones(qx.size, dtype=bool))
+        data.xmin, data.xmax = -0.1, 0.1
+        data.ymin, data.ymax = -0.1, 0.1
+        data.zmin, data.zmax = image.min(), image.max()
+        p.data = data
+
+        yield p
+
+        p.figure.clf()
+
+    def testImageCache(self, plotter):
+        '''Scaled images are reused when toggling the scale'''
+        plotter.plot()
+        log_image = plotter._pyramid
+        plotter.onToggleScale(None)
+        linear_image = plotter._pyramid
+        assert linear_image is not log_image
+        assert numpy.nanmax(linear_image.image) == pytest.approx(100, rel=0.05)
+        assert numpy.nanmax(log_image.image) == pytest.approx(2, rel=0.05)
+
+        # New data creates new images
+        plotter.plot(data=plotter.data0)
+        assert plotter._pyramid is linear_image
+        plotter.data0.data = plotter.data0.data.copy()
+        plotter.plot()
+        assert plotter._pyramid is not linear_image
+
+    def testZoom(self, plotter):
+        '''The shown level follows the zoom'''
+        # A small figure shows less than one screen pixel per image pixel
+        plotter.figure.set_size_inches(1.5, 1.5)
+        plotter.plot()
+        assert plotter._pyramid_level > 0
+        assert plotter.im.get_array().shape[0] < 256
+
+        plotter.ax.set_xlim(-0.01, 0.01)
+        plotter.ax.set_ylim(-0.01, 0.01)
+        assert plotter._pyramid_level == 0
+        assert plotter.ax.get_xlim() == pytest.approx((-0.01, 0.01))
+
+        plotter.ax.set_xlim(-0.1, 0.1)
+        plotter.ax.set_ylim(-0.1, 0.1)
+        assert plotter._pyramid_level > 0
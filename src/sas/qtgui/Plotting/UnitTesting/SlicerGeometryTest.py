@@ -0,0 +1,120 @@
+import math
+
+import numpy as np
+import pytest
+
+from sasdata.data_util import manipulations
+
+# Local
+from sas.qtgui.Plotting.PlotterData import Data2D
+from sas.qtgui.Plotting.Slicers import SlicerGeometry
+
+
+class SlicerGeometryTest:
+    '''Test the vectorised slicer averagers against sasdata'''
+
+    @pytest.fixture(autouse=True)
+    def data(self):
+        '''Create a Data2D with masked and non-finite pixels'''
+        rng = np.random.default_rng(1234)
+        qx, qy = np.meshgrid(np.linspace(-0.1, 0.1, 41),
+                             np.linspace(-0.08, 0.12, 37))
+        qx = qx.ravel()
+        qy = qy.ravel()
+        q = np.sqrt(qx**2 + qy**2)
+        values = 100 * rng.random(qx.size)
+        values[rng.random(qx.size) < 0.05] = np.nan
+        errors = np.sqrt(np.abs(values))
+        errors[rng.random(qx.size) < 0.1] = 0
+        mask = rng.random(qx.size) > 0.05
+        data = Data2D(image=values, err_image=errors, qx_data=qx, qy_data=qy,
+                      q_data=q, mask=mask, xmin=-0.1, xmax=0.1,
+                      ymin=-0.08, ymax=0.12)
+        data.dqx_data = 0.001 + 0.01 * q
+        data.dqy_data = 0.002 + 0.005 * q
+        yield data
+
+    def assertSameAverage(self, reference, result):
+        '''Compare the Data1D returned by sasdata and SlicerGeometry'''
+        for name in ('x', 'y', 'dy', 'dx'):
+            expected = getattr(reference, name)
+            actual = getattr(result, name)
+            if expected is None:
+                assert actual is None
+            else:
+                assert np.allclose(expected, actual, rtol=1e-12, atol=0)
+
+    @pytest.mark.parametrize("name", ["SectorQ", "SectorPhi"])
+    @pytest.mark.parametrize("fold", [True, False])
+    @pytest.mark.parametrize("phi_min, phi_max",
+                             [(0.2, 0.9), (-0.3, 0.4), (2.5, 4.0), (3.0, -2.9)])
+    def testSector(self, data, name, fold, phi_min, phi_max):
+        '''Sector averages match manipulations.SectorQ/SectorPhi'''
+        averagers = []
+        for module in (manipulations, SlicerGeometry):
+            averager = getattr(module, name)(r_min=0.01, r_max=0.09,
+                                             phi_min=phi_min + math.pi,
+                                             phi_max=phi_max + math.pi, nbins=17)
+            averager.fold = fold
+            averagers.append(averager)
+        self.assertSameAverage(averagers[0](data), averagers[1](data))
+        assert averagers[1].__class__.__name__ == name
+
+    @pytest.mark.parametrize("r_min, r_max", [(0.02, 0.05), (0.0, 0.2)])
+    def testRing(self, data, r_min, r_max):
+        '''Ring averages match manipulations.Ring'''
+        reference = manipulations.Ring(r_min, r_max, nbins=23)(data)
+        result = SlicerGeometry.Ring(r_min, r_max, nbins=23)(data)
+        self.assertSameAverage(reference, result)
+
+    @pytest.mark.parametrize("name", ["SlabX", "SlabY"])
+    @pytest.mark.parametrize("fold", [True, False])
+    @pytest.mark.parametrize("box", [(-0.05, 0.03, -0.02, 0.07),
+                                     (0.01, 0.06, -0.05, -0.01)])
+    def testSlab(self, data, name, fold, box):
+        '''Slab averages match manipulations.SlabX/SlabY'''
+        reference = getattr(manipulations, name)(*box, bin_width=0.007, fold=fold)
+        result = getattr(SlicerGeometry, name)(*box, bin_width=0.007, fold=fold)
+        self.assertSameAverage(reference(data), result(data))
+
+    def testBox(self, data):
+        '''Box sums and averages match manipulations.Boxsum/Boxavg'''
+        box = (-0.05, 0.03, -0.02, 0.07)
+        assert np.allclose(manipulations.Boxsum(*box)(data),
+                           SlicerGeometry.Boxsum(*box)(data))
+        assert np.allclose(manipulations.Boxavg(*box)(data),
+                           SlicerGeometry.Boxavg(*box)(data))
+        # Empty ROI
+        assert SlicerGeometry.Boxsum(0.5, 0.6, 0.5, 0.6)(data) == (0, 0, 0.0)
+
+    def testEmptyROI(self, data):
+        '''Averaging an empty ROI raises ValueError'''
+        with pytest.raises(ValueError):
+            SlicerGeometry.Ring(0.5, 0.6)(data)
+        with pytest.raises(ValueError):
+            SlicerGeometry.SlabX(0.5, 0.6, 0.5, 0.6, bin_width=0.01)(data)
+
+    def testIndexCache(self, data):
+        '''The geometry index is shared until the q arrays change'''
+        index = SlicerGeometry.get_geometry_index(data)
+        assert SlicerGeometry.get_geometry_index(data) is index
+        assert index.count('q', 0.0, 1.0) == data.q_data.size
+        found = index.find('qx', -0.01, 0.01)
+        assert np.all(np.abs(data.qx_data[found]) <= 0.01)
+        assert len(found) == np.count_nonzero(np.abs(data.qx_data) <= 0.01)
+
+        data.qx_data = data.qx_data.copy()
+        assert SlicerGeometry.get_geometry_index(data) is not index
+
+    def testPixelArea(self, data):
+        '''Pixel areas follow the grid spacing, and the box sum reports its area'''
+        index = SlicerGeometry.get_geometry_index(data)
+        pixel_area = 0.005 * 0.2 / 36
+        assert np.allclose(index.pixel_area, pixel_area)
+        assert np.isclose(index.area(np.arange(data.q_data.size)),
+                          data.q_data.size * pixel_area)
+
+        boxsum = SlicerGeometry.Boxsum(-0.05, 0.05, -0.02, 0.04)
+        _, _, n_points = boxsum(data)
+        assert n_points > 0
+        assert np.isclose(boxsum.area, n_points * pixel_area)
@@ -0,0 +1,185 @@
+import pytest
+from unittest.mock import MagicMock
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from sas.qtgui.Plotting.PlotterData import Data1D
+from sas.qtgui.Plotting.SlicerParameters import SlicerParameters
+
+# Tested module
+from sas.qtgui.Plotting.SlicerUpdater import SlicerUpdater
+
+
+class DummyPlotter(QtCore.QObject):
+    ''' Minimal plotter holding a slicer '''
+    def __init__(self):
+        super().__init__()
+        self.slicer = None
+        self.manager = MagicMock()
+
+
+class DummySlicer:
+    ''' Slicer averaging in the background '''
+    def __init__(self):
+        self.data = 2.0
+        self.update_model = True
+        self.scale = 1.0
+        self.posted = []
+
+    def _get_averager(self):
+        scale = self.scale
+        return lambda data: data * scale
+
+    def _post_average(self, result):
+        self.posted.append((result, self.update_model))
+
+
+class DummyBoxSlicer:
+    ''' Slicer updated on the GUI thread '''
+    def __init__(self):
+        self.update_model = True
+        self.count = 0
+
+    def _post_data(self):
+        self.count += 1
+
+
+class DummyManager(QtWidgets.QWidget):
+    ''' Main window receiving the saved 1D plots '''
+    def __init__(self):
+        super().__init__()
+        self.communicator = MagicMock()
+        self.updateModelFromPerspective = MagicMock()
+
+
+class DummyPlotSlicer(DummySlicer):
+    ''' Slicer showing its average in a 1D plot window '''
+    def __init__(self, window):
+        super().__init__()
+        self.window = window
+
+    def _post_average(self, result):
+        super()._post_average(result)
+        self.window.data = [Data1D(x=[1.0], y=[result])]
+        self.window.data[0].name = "test_plot_sector"
+
+
+class SlicerUpdaterTest:
+    '''Test the SlicerUpdater'''
+
+    @pytest.fixture(autouse=True)
+    def updater(self, qapp):
+        '''Create/Destroy the SlicerUpdater'''
+        plotter = DummyPlotter()
+        u = SlicerUpdater(plotter, delay=10)
+
+        yield u
+
+        u.cancel()
+
+    def testDebounce(self, updater, qtbot):
+        '''Bursts of requests result in a single update'''
+        slicer = DummyBoxSlicer()
+        updater.plotter.slicer = slicer
+        for _ in range(5):
+            updater.schedule(slicer)
+        qtbot.waitUntil(lambda: slicer.count > 0)
+        qtbot.wait(50)
+        assert slicer.count == 1
+
+    def testBackgroundAverage(self, updater, qtbot):
+        '''The latest request is averaged and posted'''
+        slicer = DummySlicer()
+        updater.plotter.slicer = slicer
+        slicer.update_model = False
+        updater.schedule(slicer)
+        slicer.update_model = True
+        slicer.scale = 3.0
+        updater.schedule(slicer)
+        qtbot.waitUntil(lambda: len(slicer.posted) > 0)
+        qtbot.wait(50)
+        # The merged requests ask for a model update
+        assert slicer.posted == [(6.0, True)]
+        assert not updater.isPending()
+
+    def testCancel(self, updater, qtbot):
+        '''Nothing is posted for a removed slicer'''
+        slicer = DummySlicer()
+        updater.plotter.slicer = slicer
+        updater.schedule(slicer)
+        updater.cancel()
+        qtbot.wait(100)
+        assert slicer.posted == []
+
+        # A result for a slicer no longer on the plot is dropped
+        updater.schedule(slicer)
+        updater.plotter.slicer = None
+        qtbot.wait(100)
+        assert slicer.posted == []
+
+    def testPostPlot(self, updater, qtbot):
+        '''Updates of a plot within a frame are merged'''
+        signal = updater.plotter.manager.communicator.forcePlotDisplaySignal
+        first = MagicMock(id="plot")
+        last = MagicMock(id="plot")
+        other = MagicMock(id="other")
+        updater.postPlot("item", first)
+        updater.postPlot("item", last)
+        updater.postPlot("item", other)
+        qtbot.waitUntil(lambda: signal.emit.call_count > 0)
+        qtbot.wait(50)
+        assert signal.emit.call_count == 2
+        signal.emit.assert_any_call(["item", last])
+        signal.emit.assert_any_call(["item", other])
+
+    def testFlushNow(self, updater, qtbot):
+        '''The pending request is averaged and plotted at once'''
+        signal = updater.plotter.manager.communicator.forcePlotDisplaySignal
+        slicer = DummySlicer()
+        updater.plotter.slicer = slicer
+        slicer.update_model = False
+        updater.schedule(slicer)
+        slicer.scale = 3.0
+        updater.postPlot("item", MagicMock(id="plot"))
+        updater.flushNow()
+        assert slicer.posted == [(6.0, False)]
+        assert signal.emit.call_count == 1
+        assert not updater.isPending()
+
+        # Nothing more is posted later
+        qtbot.wait(50)
+        assert slicer.posted == [(6.0, False)]
+
+        # An explicit slicer is averaged even without a request
+        updater.flushNow(slicer)
+        assert slicer.posted == [(6.0, False), (6.0, False)]
+
+    def testApplySave(self, updater, qtbot, mocker):
+        '''The 1D plots saved on Apply use the latest slicer parameters'''
+        plotter = updater.plotter
+        plotter.manager = DummyManager()
+        plotter.data = [MagicMock()]
+        plotter.data[0].name = "test_plot"
+        plotter.slicer_updater = updater
+        window = MagicMock()
+        slicer = DummyPlotSlicer(window)
+        plotter.slicer = slicer
+        updater.flushNow(slicer)
+
+        widget = SlicerParameters(parent=plotter, model=QtGui.QStandardItemModel(),
+                                  active_plots={"test_plot": plotter,
+                                                "test_plot_sector": window},
+                                  communicator=MagicMock())
+        mocker.patch.object(widget, 'serializeData')
+        mocker.patch.object(widget, 'prepareFilePathFromData', return_value="test_plot_sector.txt")
+        widget.onGeneratePlots(True)
+
+        # A parameter edit, still waiting for the update when saving
+        slicer.scale = 5.0
+        updater.schedule(slicer)
+        widget.onApply()
+
+        widget.serializeData.assert_called_once()
+        saved = widget.serializeData.call_args[0][0]
+        assert saved.y[0] == 10.0
+        widget.close()
@@ -15,7 +15,6 @@ import os
 import logging
 import traceback
 
-from sasmodels.sasview_model import load_standard_models
 
 from sas.sascalc.fit import models
 
@@ -108,7 +107,8 @@ class AddMultEditor(QtWidgets.QDialog, Ui_AddMultEditorUI):
 
     def readModels(self, std_only=False):
         """ Generate list of all models """
-        s_models = load_standard_models()
+        # Listing the models only needs their metadata, from the model index
+        s_models = models.ModelManager().cat_model_list()
         models_dict = {}
         for model in s_models:
             # Check if plugin model is a layered model
@@ -501,3 +501,52 @@ class BatchInversionOutputPanel(BatchOutputPanel):
         """Tell the parent window the window closed"""
         self.parent.batchResultsWindow = None
         event.accept()
+
+
+class BatchInvariantOutputPanel(BatchOutputPanel):
+    """
+        Class for stateless grid-like printout of invariant results for any
+        number of data sets
+    """
+    def __init__(self, parent=None, output_data=None, perspective=None):
+
+        super(BatchInvariantOutputPanel, self).__init__(parent=parent)
+        # Invariant perspective showing this window
+        self.perspective = perspective
+        _translate = QtCore.QCoreApplication.translate
+        self.setWindowTitle(_translate("GridPanelUI", "Batch Invariant Results"))
+        self.setupTable(widget=self.tblParams, data=output_data)
+        self.has_data = output_data is not None
+
+    def setupTable(self, widget=None, data=None):
+        """
+        Create tablewidget items and show them, based on a
+        {column header: [values]} dictionary of the results
+        """
+        if data is None or widget is None:
+            return
+
+        widget.setColumnCount(len(data))
+        widget.setRowCount(max((len(values) for values in data.values()), default=0))
+        for i_col, (column, values) in enumerate(data.items()):
+            widget.setHorizontalHeaderItem(i_col, QtWidgets.QTableWidgetItem(column))
+            for i_row, value in enumerate(values):
+                if isinstance(value, float):
+                    value = GuiUtils.formatNumber(value, high=True)
+                widget.setItem(i_row, i_col, QtWidgets.QTableWidgetItem(str(value)))
+
+        widget.resizeColumnsToContents()
+
+    def onHelp(self):
+        """
+        Open a local url in the default browser
+        """
+        url = "/user/qtgui/Perspectives/Invariant/invariant_help.html"
+        self.parent.showHelp(url)
+
+    def closeEvent(self, event):
+        """Tell the parent window the window closed"""
+        if self.perspective is not None:
+            self.perspective.batchResultsWindow = None
+        self.windowClosedSignal.emit()
+        event.accept()
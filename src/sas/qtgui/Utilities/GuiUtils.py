@@ -1104,9 +1104,13 @@ def checkModel(path):
 
     return result
 
-def saveData(fp, data):
+def saveData(fp, data, arrays=None):
     """
     save content of data to fp (a .write()-supporting file-like object)
+
+    If *arrays* is given, it is called with every ndarray and returns the
+    reference to store in place of the array content, or None to store the
+    content as a list.
     """
 
     def add_type(dict, type):
@@ -1146,7 +1150,9 @@ def saveData(fp, data):
 
         # ndarray
         if isinstance(o, np.ndarray):
-            content = {'data':o.tolist()}
+            content = arrays(o) if arrays is not None else None
+            if content is None:
+                content = {'data':o.tolist()}
             return add_type(content, type(o))
 
         if isinstance(o, types.FunctionType):
@@ -1167,12 +1173,17 @@ def saveData(fp, data):
         logging.info("data cannot be serialized to json: %s" % type(o))
         return None
 
-    json.dump(data, fp, indent=2, sort_keys=True, default=jdefault)
+    # Array references are small; only indent the all-text format
+    indent = 2 if arrays is None else None
+    json.dump(data, fp, indent=indent, sort_keys=True, default=jdefault)
 
-def readDataFromFile(fp):
+def readDataFromFile(fp, arrays=None):
     '''
     Reads in Data1D/Data2 datasets from the file.
     Datasets are stored in the JSON format.
+
+    Arrays stored outside of the JSON document are read by calling
+    *arrays* with their reference.
     '''
     supported = [
         tuple, set, types.FunctionType,
@@ -1187,14 +1198,9 @@ def readDataFromFile(fp):
         pass
 
     def simple_type(cls, data, level):
-        class Empty(object):
-            def __init__(self):
-                for key, value in data.items():
-                    setattr(self, key, generate(value, level))
-
-        # create target object
-        o = Empty()
-        o.__class__ = cls
+        # create target object, without calling its constructor
+        o = object.__new__(cls)
+        o.__dict__.update((key, generate(value, level)) for key, value in data.items())
 
         return o
 
@@ -1226,6 +1232,12 @@ def readDataFromFile(fp):
 
         # ndarray
         if cls == np.ndarray:
+            if 'blob' in data:
+                # project archive - array stored next to the JSON document
+                if arrays is None:
+                    logging.info('no array storage for: %s' % data['blob'])
+                    return None
+                return arrays(data)
             o = data['data']
             if isinstance(o, list):
                 # new format - ndarray as ascii list
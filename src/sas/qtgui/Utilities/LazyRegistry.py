@@ -0,0 +1,46 @@
+"""
+Registry of classes imported on first use.
+
+Perspectives and tool windows pull in large parts of the application, and
+of numpy, scipy and matplotlib, when their modules are imported. Naming
+them by module instead of importing them keeps this cost out of the
+startup of SasView, and only pays it for the windows actually opened.
+"""
+import importlib
+from collections.abc import Mapping
+
+
+class LazyRegistry(Mapping):
+    """
+    Classes by name, given as "module:class" and imported when first
+    looked up. Listing the names or checking for a name imports nothing.
+    """
+    def __init__(self, locations):
+        """
+        :param locations: dictionary of "module:class" by name
+        """
+        self._locations = dict(locations)
+        self._classes = {}
+
+    def __getitem__(self, name):
+        if name not in self._classes:
+            module_name, class_name = self._locations[name].split(':')
+            module = importlib.import_module(module_name)
+            self._classes[name] = getattr(module, class_name)
+        return self._classes[name]
+
+    def __contains__(self, name):
+        # Mapping looks the name up, importing the class
+        return name in self._locations
+
+    def __iter__(self):
+        return iter(self._locations)
+
+    def __len__(self):
+        return len(self._locations)
+
+    def isLoaded(self, name):
+        """
+        Check whether the class of the name was already imported
+        """
+        return name in self._classes
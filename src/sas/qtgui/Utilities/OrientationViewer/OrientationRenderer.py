@@ -0,0 +1,196 @@
+"""
+Background rendering of the orientation viewer scattering images.
+
+Computing an image for the parallelepiped takes from milliseconds to
+seconds, depending on the polydispersity, which is too slow to do on the
+GUI thread while a slider is being dragged. OrientationRenderer renders the
+images in a worker thread: a coarse preview while the sliders move and a
+full quality image when they are released. Rendered images are kept in an
+LRU cache keyed on the quantised angles, and while dragging, the previews
+of the next angles in the direction of motion are rendered ahead of time.
+"""
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+from PySide6 import QtCore
+
+from sas.sascalc.data_util.calcthread import CalcThread
+from sas.sascalc.data_util.lru_cache import LRUCache
+from sas.qtgui.Utilities.OrientationViewer.OrientationViewerController import Orientation
+
+# Angle step of the previews [degrees]
+PREVIEW_STEP = 5
+# Number of previews rendered ahead in the direction of motion
+PREFETCH_STEPS = 2
+# Number of images kept
+CACHE_SIZE = 256
+
+# Cache key: whether the image is a preview, and the quantised orientation
+RenderKey = Tuple[bool, Orientation]
+
+
+def quantise(orientation: Orientation, step: int) -> Orientation:
+    """ Round all the angles of an orientation to a multiple of step degrees"""
+    return Orientation(*(step * int(round(angle / step)) for angle in orientation))
+
+
+class ImageCache(LRUCache):
+    """ Least recently used cache of rendered images """
+
+    def __init__(self, size: int = CACHE_SIZE):
+        super().__init__(maxsize=size)
+
+
+class OrientationRenderThread(CalcThread):
+    """
+    Render a list of images, stopping when a newer list is requested
+    """
+    def compute(self, job, tasks, render, latest_job):
+        """
+        Render the images of tasks, a list of (key, orientation, preview),
+        handing each over to the completion callback.
+        """
+        for key, orientation, preview in tasks:
+            if job != latest_job():
+                return
+            image = render(orientation, preview)
+            self.complete(job=job, key=key, image=image)
+
+
+class OrientationRenderer(QtCore.QObject):
+    """
+    Render the images for the orientation viewer in a worker thread.
+
+    render(orientation, preview) computes the image of an orientation, at
+    coarse quality if preview is True. request() asks for the image of an
+    orientation, which is sent through imageReady, straight away if it is
+    in the cache, otherwise when it has been rendered. Images of orientations
+    requested before the latest one are cached but not sent.
+    """
+    imageReady = QtCore.Signal(object)
+    _imageRenderedSignal = QtCore.Signal(tuple)
+
+    def __init__(self,
+                 render: Callable[[Orientation, bool], np.ndarray],
+                 parent=None,
+                 preview_step: int = PREVIEW_STEP,
+                 prefetch_steps: int = PREFETCH_STEPS,
+                 cache_size: int = CACHE_SIZE):
+        super().__init__(parent)
+        self.render = render
+        self.preview_step = preview_step
+        self.prefetch_steps = prefetch_steps
+        self.cache = ImageCache(cache_size)
+
+        # Image to send when it is rendered
+        self._wanted: Optional[RenderKey] = None
+        self._last_requested: Optional[Orientation] = None
+        # Identifier of the latest list of images sent to the worker
+        self._job = 0
+
+        self._thread = OrientationRenderThread(completefn=self._imageRendered)
+        self._imageRenderedSignal.connect(self._postImage)
+
+    def key(self, orientation: Orientation, preview: bool) -> RenderKey:
+        """ Cache key of an image, full quality images are at the whole degree angles of the sliders"""
+        return preview, quantise(orientation, self.preview_step if preview else 1)
+
+    def request(self, orientation: Orientation, preview: bool = False):
+        """
+        Ask for the image of an orientation, a coarse one if preview is
+        True. The best cached image is sent at once: a full quality one if
+        there is one, then a preview.
+        """
+        full_key = self.key(orientation, False)
+        preview_key = self.key(orientation, True)
+
+        cached_full = self.cache.get(full_key)
+        if cached_full is not None:
+            self._wanted = None
+            self._job += 1
+            self.imageReady.emit(cached_full)
+
+        else:
+            cached_preview = self.cache.get(preview_key)
+            if cached_preview is not None:
+                self.imageReady.emit(cached_preview)
+
+            if preview:
+                self._wanted = None if cached_preview is not None else preview_key
+            else:
+                self._wanted = full_key
+
+            tasks = [] if self._wanted is None else [(self._wanted, self._wanted[1], preview)]
+            if preview:
+                tasks += self._prefetchTasks(preview_key[1])
+
+            self._queue(tasks)
+
+        self._last_requested = orientation
+
+    def cancel(self):
+        """
+        Drop the pending and running renders, e.g. when the viewer is closed
+        """
+        self._wanted = None
+        self._job += 1
+        self._thread.stop()
+
+    def isPending(self):
+        """
+        Check for images being rendered
+        """
+        return self._thread.isrunning()
+
+    def _prefetchTasks(self, orientation: Orientation):
+        """
+        Previews of the next orientations in the direction the sliders move,
+        nearest first, which are not in the cache
+        """
+        if self._last_requested is None:
+            return []
+
+        last = quantise(self._last_requested, self.preview_step)
+        moves = [current - previous for current, previous in zip(orientation, last)]
+        if not any(moves):
+            return []
+
+        steps = [int(np.sign(move)) * self.preview_step for move in moves]
+
+        tasks = []
+        for i in range(1, self.prefetch_steps + 1):
+            neighbour = Orientation(*(angle + i*step for angle, step in zip(orientation, steps)))
+            key = (True, neighbour)
+            if key not in self.cache:
+                tasks.append((key, neighbour, True))
+
+        return tasks
+
+    def _queue(self, tasks):
+        """
+        Send a list of images to render to the worker, replacing the previous one
+        """
+        self._job += 1
+        if tasks:
+            self._thread.requeue(self._job, tasks, self.render, lambda: self._job)
+
+    def _imageRendered(self, job, key, image):
+        """
+        Called in the worker thread: pass the image to the GUI thread
+        """
+        try:
+            self._imageRenderedSignal.emit((key, image))
+        except RuntimeError:
+            # The viewer was closed while rendering
+            pass
+
+    def _postImage(self, output):
+        """
+        Cache a rendered image, and send it if it is the one wanted
+        """
+        key, image = output
+        self.cache.put(key, image)
+
+        if key == self._wanted:
+            self._wanted = None
+            self.imageReady.emit(image)
@@ -4,6 +4,7 @@ from typing import Optional, List
 import numpy as np
 from PySide6.QtGui import QIcon
 from scipy.special import erfinv
+from scipy.ndimage import zoom
 
 from PySide6 import QtWidgets
 from PySide6.QtWidgets import QSizePolicy
@@ -23,6 +24,7 @@ from sas.qtgui.GL.cube import Cube
 from sas.qtgui.GL.color import uniform_coloring
 
 from sas.qtgui.Utilities.OrientationViewer.OrientationViewerController import OrientationViewierController, Orientation
+from sas.qtgui.Utilities.OrientationViewer.OrientationRenderer import OrientationRenderer
 
 
 class OrientationViewer(QtWidgets.QWidget):
@@ -43,6 +45,9 @@ class OrientationViewer(QtWidgets.QWidget):
 
     n_ghosts_per_perameter = 8
     n_q_samples = 128
+    n_preview_q_samples = 64
+    polydispersity_samples = 200
+    preview_polydispersity_samples = 40
     log_I_max = 10
     log_I_min = -3
     q_max = 0.5
@@ -174,6 +179,12 @@ class OrientationViewer(QtWidgets.QWidget):
         self.controller.sliderMoved.connect(self.on_angle_changing)
 
         self.calculator = OrientationViewer.create_calculator()
+        self.preview_calculator = OrientationViewer.create_calculator(OrientationViewer.n_preview_q_samples)
+
+        # Images are computed in a worker thread, and shown when ready
+        self.renderer = OrientationRenderer(self.scattering_data, self)
+        self.renderer.imageReady.connect(self._set_image_data)
+
         self.on_angle_changed(Orientation())
 
     @property
@@ -185,11 +196,9 @@ class OrientationViewer(QtWidgets.QWidget):
         self._colormap_name = colormap_name
         self.surface.colormap = self._colormap_name
 
-    def _set_image_data(self, orientation: Orientation):
+    def _set_image_data(self, data: np.ndarray):
         """ Set the data on the plot"""
 
-        data = self.scattering_data(orientation)
-
         scaled_data = (np.log(data) - OrientationViewer.log_I_min) / OrientationViewer.log_I_range
         self.image_plane_data = np.clip(scaled_data, 0, 1)
 
@@ -224,8 +233,7 @@ class OrientationViewer(QtWidgets.QWidget):
 
         self.orient_ghosts(orientation)
 
-
-        self._set_image_data(orientation)
+        self.renderer.request(orientation)
 
 
     def on_angle_changing(self, orientation: Optional[Orientation]):
@@ -246,37 +254,52 @@ class OrientationViewer(QtWidgets.QWidget):
 
         self.scene.update()
 
+        self.renderer.request(orientation, preview=True)
+
     @staticmethod
-    def create_calculator():
+    def create_calculator(n_q_samples: int = n_q_samples):
         """
         Make a parallelepiped model calculator for q range -qmax to qmax with n samples
         """
         model_info = load_model_info("parallelepiped")
         model = build_model(model_info)
-        q = np.linspace(-OrientationViewer.q_max, OrientationViewer.q_max, OrientationViewer.n_q_samples)
+        q = np.linspace(-OrientationViewer.q_max, OrientationViewer.q_max, n_q_samples)
         data = empty_data2D(q, q)
         calculator = DirectModel(data, model)
 
         return calculator
 
 
-    def polydispersity_sample_count(self, orientation):
+    def polydispersity_sample_count(self, orientation, total_samples=polydispersity_samples):
         """ Work out how many samples to do for the polydispersity"""
         polydispersity = [orientation.dtheta, orientation.dphi, orientation.dpsi]
         is_polydisperse = [1 if x > 0 else 0 for x in polydispersity]
         n_polydisperse = np.sum(is_polydisperse)
 
-        samples = int(200 / (n_polydisperse**2 + 1)) #
+        samples = int(total_samples / (n_polydisperse**2 + 1)) #
 
         return (samples * x for x in is_polydisperse)
 
-    def scattering_data(self, orientation: Orientation) -> np.ndarray:
+    def scattering_data(self, orientation: Orientation, preview: bool = False) -> np.ndarray:
+        """ Scattering image for an orientation, a quick, coarse one if preview is True.
+
+        Called in the renderer thread.
+        """
 
         # add the orientation parameters to the model parameters
 
-        theta_pd_n, phi_pd_n, psi_pd_n = self.polydispersity_sample_count(orientation)
+        if preview:
+            calculator = self.preview_calculator
+            n_q_samples = OrientationViewer.n_preview_q_samples
+            total_samples = OrientationViewer.preview_polydispersity_samples
+        else:
+            calculator = self.calculator
+            n_q_samples = OrientationViewer.n_q_samples
+            total_samples = OrientationViewer.polydispersity_samples
+
+        theta_pd_n, phi_pd_n, psi_pd_n = self.polydispersity_sample_count(orientation, total_samples)
 
-        data = self.calculator(
+        data = calculator(
             theta=orientation.theta,
             theta_pd=orientation.dtheta,
             theta_pd_type=OrientationViewer.polydispersity_distribution,
@@ -294,9 +317,17 @@ class OrientationViewer(QtWidgets.QWidget):
             length_c=OrientationViewer.c,
             background=np.exp(OrientationViewer.log_I_min))
 
-        return np.reshape(data, (OrientationViewer.n_q_samples, OrientationViewer.n_q_samples))
+        data = np.reshape(data, (n_q_samples, n_q_samples))
+
+        if preview:
+            # Stretch the coarse image over the full size surface
+            data = zoom(data, OrientationViewer.n_q_samples / n_q_samples, order=1)
+
+        return data
 
     def closeEvent(self, event):
+        self.renderer.cancel()
+
         try:
             _orientation_viewers.remove(self)
         except ValueError: # Not in list
@@ -0,0 +1,360 @@
+"""
+Reading and writing of SasView project files.
+
+Projects are stored in a zip archive holding the JSON document written by
+GuiUtils.saveData as manifest.json, with every array replaced by a reference
+to a member of the archive containing its raw, little-endian content. The
+members are stored uncompressed so arrays are written straight from their
+buffers and can be read back in a single copy, or mapped from the file and
+only read when first used.
+
+Projects in the previous, all-JSON format are still read, and written when
+the file name ends in .json.
+"""
+import copy
+import io
+import mmap
+import os
+import struct
+import threading
+import zipfile
+
+import numpy
+
+from sas.sascalc.data_util.calcthread import CalcThread
+from sas.qtgui.Utilities import GuiUtils
+
+# Extension of project archives
+PROJECT_EXTENSION = '.sasv'
+# Name of the JSON document in the archive
+MANIFEST = 'manifest.json'
+# Zip comment identifying the archive format, followed by its version
+ARCHIVE_FORMAT = b'SasView project'
+ARCHIVE_VERSION = 1
+
+# Zip local file header, up to the file name and extra field lengths
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+
+class ArchiveWriter(object):
+    """
+    Store arrays in a project archive.
+
+    Instances are passed to GuiUtils.saveData, which calls them for every
+    array it serializes.
+    """
+    def __init__(self, archive):
+        """
+        :param archive: zipfile.ZipFile open for writing
+        """
+        self.archive = archive
+        # References to stored arrays by array id, for arrays shared
+        # between datasets. The arrays are kept alive to keep the ids valid.
+        self._stored = {}
+
+    def __call__(self, array):
+        """
+        Write the array to a new member of the archive and return its
+        reference, or None if the array can't be stored as raw data.
+        """
+        if array.dtype.hasobject or array.dtype.fields is not None:
+            return None
+        if id(array) in self._stored:
+            return self._stored[id(array)][1]
+        # No copy for arrays already contiguous and little-endian
+        content = numpy.asarray(array, dtype=array.dtype.newbyteorder('<'), order='C')
+        name = 'arrays/%d' % len(self._stored)
+        with self.archive.open(name, 'w', force_zip64=True) as blob:
+            blob.write(content.data)
+        reference = {'blob': name, 'dtype': content.dtype.str, 'shape': list(content.shape)}
+        self._stored[id(array)] = (array, reference)
+        return reference
+
+
+class ArchiveReader(object):
+    """
+    Read arrays from a project archive.
+
+    Instances are passed to GuiUtils.readDataFromFile, which calls them with
+    the reference of every array stored in the archive.
+    """
+    def __init__(self, filename, archive, lazy=False):
+        """
+        :param filename: path of the archive
+        :param archive: zipfile.ZipFile open for reading
+        :param lazy: return views of a copy-on-write map of the file instead
+            of reading the arrays. Their content is read when first used
+            and changes are not written back to the file.
+        """
+        self.filename = filename
+        self.archive = archive
+        self.lazy = lazy
+        self._map = None
+
+    def __call__(self, reference):
+        """
+        Array for the reference
+        """
+        info = self.archive.getinfo(reference['blob'])
+        dtype = numpy.dtype(reference['dtype'])
+        shape = tuple(reference['shape'])
+        if self.lazy and info.compress_type == zipfile.ZIP_STORED and info.file_size > 0:
+            array = numpy.frombuffer(self._mapping(), dtype=dtype, count=info.file_size // dtype.itemsize,
+                                     offset=self._dataOffset(info)).reshape(shape)
+        else:
+            array = numpy.empty(shape, dtype=dtype)
+            content = array.reshape(-1).view(numpy.uint8)
+            with self.archive.open(info) as blob:
+                if blob.readinto(content) != content.nbytes:
+                    raise ValueError("Truncated array %s" % reference['blob'])
+        return array.astype(dtype.newbyteorder('='), copy=False)
+
+    def _mapping(self):
+        """
+        Copy-on-write map of the whole file, shared by all arrays
+        """
+        if self._map is None:
+            with open(self.filename, 'rb') as archive_file:
+                self._map = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        return self._map
+
+    def _dataOffset(self, info):
+        """
+        Position of the member content in the file
+        """
+        header = _LOCAL_HEADER.unpack_from(self._mapping(), info.header_offset)
+        name_length, extra_length = header[-2:]
+        return info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+
+
+def _fileMapping(array):
+    """
+    Map of the project file the array is a view of, or None
+    """
+    base = array.base
+    while isinstance(base, numpy.ndarray):
+        base = base.base
+    if isinstance(base, memoryview):
+        base = base.obj
+    return base if isinstance(base, mmap.mmap) else None
+
+
+def isMapped(array):
+    """
+    Check whether the array is a view of a project file mapped by a lazy read
+    """
+    return _fileMapping(array) is not None
+
+
+def _walk(o, visit, level=0, seen=None):
+    """
+    Call visit(owner, key, array) for the mapped arrays reachable from o
+    through object attributes, lists and dictionaries
+    """
+    if seen is None:
+        seen = set()
+    if level > 16 or id(o) in seen:
+        return
+    seen.add(id(o))
+    if isinstance(o, numpy.ndarray):
+        return
+    if isinstance(o, dict):
+        items = list(o.items())
+    elif isinstance(o, list):
+        items = list(enumerate(o))
+    elif hasattr(o, '__dict__') and not isinstance(o, type):
+        items = list(vars(o).items())
+    else:
+        return
+    for key, value in items:
+        if isinstance(value, numpy.ndarray):
+            if isMapped(value):
+                visit(o, key, value)
+        else:
+            _walk(value, visit, level + 1, seen)
+
+
+def mappedArrays(o):
+    """
+    Arrays of o still mapped from a project file
+    """
+    arrays = []
+    _walk(o, lambda owner, key, array: arrays.append(array))
+    return arrays
+
+
+def fileMappings(o):
+    """
+    Maps of the project files the arrays of o are read from
+    """
+    mappings = {}
+    def add(owner, key, array):
+        mapping = _fileMapping(array)
+        mappings[id(mapping)] = mapping
+    _walk(o, add)
+    return list(mappings.values())
+
+
+def closeMappings(mappings):
+    """
+    Close maps of project files, so that the files can be replaced.
+    Maps still used by arrays can't be closed.
+
+    :return: the maps left open
+    """
+    remaining = []
+    for mapping in mappings:
+        try:
+            mapping.close()
+        except BufferError:
+            remaining.append(mapping)
+    return remaining
+
+
+def hydrate(o):
+    """
+    Replace the arrays of o still mapped from a project file by in-memory
+    copies, so that the file is no longer needed.
+
+    :return: number of arrays copied
+    """
+    copied = []
+    def copy(owner, key, array):
+        value = numpy.array(array)
+        if isinstance(owner, (dict, list)):
+            owner[key] = value
+        else:
+            setattr(owner, key, value)
+        copied.append(key)
+    _walk(o, copy)
+    return len(copied)
+
+
+def detachMapped(o):
+    """
+    Shallow copy of o with its mapped arrays set to None, and these arrays
+    by attribute name. Allows copying o without reading the arrays, which
+    can then be set on the copy.
+    """
+    stub = copy.copy(o)
+    arrays = {name: value for name, value in vars(o).items()
+              if isinstance(value, numpy.ndarray) and isMapped(value)}
+    for name in arrays:
+        setattr(stub, name, None)
+    return stub, arrays
+
+
+# Bytes of an array read by the prefetch between checks for a stop request
+PREFETCH_BLOCK = 2**26
+
+
+class PrefetchThread(CalcThread):
+    """
+    Read the mapped arrays of a lazily loaded project in the background, so
+    that they are in memory by the time they are used.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Held while reading from the maps
+        self._reading = threading.Lock()
+
+    def compute(self, objects):
+        """
+        Read the arrays of the objects, in order
+        """
+        try:
+            for o in objects:
+                for array in mappedArrays(o):
+                    content = array.reshape(-1).view(numpy.uint8)
+                    for start in range(0, len(content), PREFETCH_BLOCK):
+                        with self._reading:
+                            self.isquit()
+                            # Touching a byte per page is enough to have it read
+                            content[start:start + PREFETCH_BLOCK:mmap.PAGESIZE].sum()
+        except KeyboardInterrupt:
+            # Stopped, e.g. when the project is closed
+            return
+        self.complete()
+
+    def stopReading(self, timeout=1.0):
+        """
+        Stop the prefetch and wait up to timeout seconds for the block being
+        read to be done. Once stopped, the prefetch no longer reads from the
+        maps until more work is queued.
+
+        :return: whether the prefetch stopped within the timeout
+        """
+        self.stop()
+        if not self._reading.acquire(timeout=timeout):
+            return False
+        self._reading.release()
+        return True
+
+
+def isProjectArchive(filename):
+    """
+    Check whether the file is a project archive
+    """
+    if not zipfile.is_zipfile(filename):
+        return False
+    with zipfile.ZipFile(filename) as archive:
+        return archive.comment.startswith(ARCHIVE_FORMAT)
+
+
+def saveProjectArchive(filename, data):
+    """
+    Write the project to a new archive.
+
+    The archive is written next to the target and moved in place when
+    complete, so a failed save leaves any previous file intact.
+    """
+    temp_name = filename + '.part'
+    try:
+        with zipfile.ZipFile(temp_name, 'w', zipfile.ZIP_STORED, allowZip64=True) as archive:
+            archive.comment = b'%s %d' % (ARCHIVE_FORMAT, ARCHIVE_VERSION)
+            manifest = io.StringIO()
+            GuiUtils.saveData(manifest, data, arrays=ArchiveWriter(archive))
+            # Small and highly compressible, unlike the array content
+            archive.writestr(MANIFEST, manifest.getvalue(), compress_type=zipfile.ZIP_DEFLATED)
+        os.replace(temp_name, filename)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+
+def readProjectArchive(filename, lazy=False):
+    """
+    Read the project stored in an archive. With lazy, arrays are mapped from
+    the file and only read when used, see ArchiveReader.
+    """
+    with zipfile.ZipFile(filename) as archive:
+        if not archive.comment.startswith(ARCHIVE_FORMAT):
+            raise ValueError("%s is not a SasView project" % filename)
+        version = int(archive.comment[len(ARCHIVE_FORMAT):] or 0)
+        if version > ARCHIVE_VERSION:
+            raise ValueError("%s was saved by a newer version of SasView" % filename)
+        manifest = io.StringIO(archive.read(MANIFEST).decode('utf-8'))
+        return GuiUtils.readDataFromFile(manifest, arrays=ArchiveReader(filename, archive, lazy))
+
+
+def saveProject(filename, data):
+    """
+    Save the project to the file, as JSON if its name ends in .json and as
+    a project archive otherwise
+    """
+    if os.path.splitext(filename)[1].lower() == '.json':
+        with open(filename, 'w') as outfile:
+            GuiUtils.saveData(outfile, data)
+    else:
+        saveProjectArchive(filename, data)
+
+
+def readProject(filename, lazy=False):
+    """
+    Read the project from an archive or a JSON file
+    """
+    if isProjectArchive(filename):
+        return readProjectArchive(filename, lazy=lazy)
+    with open(filename, 'r') as infile:
+        return GuiUtils.readDataFromFile(infile)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'PluginDefinitionUI.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QGridLayout, QGroupBox,
+    QHeaderView, QLineEdit, QSizePolicy, QTableWidget,
+    QTableWidgetItem, QTextBrowser, QWidget)
+
+class Ui_PluginDefinition(object):
+    def setupUi(self, PluginDefinition):
+        if not PluginDefinition.objectName():
+            PluginDefinition.setObjectName(u"PluginDefinition")
+        PluginDefinition.resize(723, 784)
+        self.gridLayout_7 = QGridLayout(PluginDefinition)
+        self.gridLayout_7.setObjectName(u"gridLayout_7")
+        self.groupBox_6 = QGroupBox(PluginDefinition)
+        self.groupBox_6.setObjectName(u"groupBox_6")
+        self.gridLayout_5 = QGridLayout(self.groupBox_6)
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.txtName = QLineEdit(self.groupBox_6)
+        self.txtName.setObjectName(u"txtName")
+
+        self.gridLayout_5.addWidget(self.txtName, 0, 0, 1, 1)
+
+        self.chkOverwrite = QCheckBox(self.groupBox_6)
+        self.chkOverwrite.setObjectName(u"chkOverwrite")
+
+        self.gridLayout_5.addWidget(self.chkOverwrite, 0, 1, 1, 1)
+
+
+        self.gridLayout_7.addWidget(self.groupBox_6, 0, 0, 1, 1)
+
+        self.groupBox_5 = QGroupBox(PluginDefinition)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.gridLayout_4 = QGridLayout(self.groupBox_5)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.txtDescription = QLineEdit(self.groupBox_5)
+        self.txtDescription.setObjectName(u"txtDescription")
+
+        self.gridLayout_4.addWidget(self.txtDescription, 0, 0, 1, 1)
+
+
+        self.gridLayout_7.addWidget(self.groupBox_5, 1, 0, 1, 1)
+
+        self.groupBox = QGroupBox(PluginDefinition)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout_3 = QGridLayout(self.groupBox)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.groupBox_3 = QGroupBox(self.groupBox)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout = QGridLayout(self.groupBox_3)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.tblParams = QTableWidget(self.groupBox_3)
+        if (self.tblParams.columnCount() < 2):
+            self.tblParams.setColumnCount(2)
+        __qtablewidgetitem = QTableWidgetItem()
+        self.tblParams.setHorizontalHeaderItem(0, __qtablewidgetitem)
+        __qtablewidgetitem1 = QTableWidgetItem()
+        self.tblParams.setHorizontalHeaderItem(1, __qtablewidgetitem1)
+        if (self.tblParams.rowCount() < 1):
+            self.tblParams.setRowCount(1)
+        __qtablewidgetitem2 = QTableWidgetItem()
+        self.tblParams.setVerticalHeaderItem(0, __qtablewidgetitem2)
+        self.tblParams.setObjectName(u"tblParams")
+
+        self.gridLayout.addWidget(self.tblParams, 0, 0, 1, 1)
+
+
+        self.gridLayout_3.addWidget(self.groupBox_3, 0, 0, 1, 1)
+
+        self.groupBox_4 = QGroupBox(self.groupBox)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.gridLayout_2 = QGridLayout(self.groupBox_4)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.tblParamsPD = QTableWidget(self.groupBox_4)
+        if (self.tblParamsPD.columnCount() < 2):
+            self.tblParamsPD.setColumnCount(2)
+        __qtablewidgetitem3 = QTableWidgetItem()
+        self.tblParamsPD.setHorizontalHeaderItem(0, __qtablewidgetitem3)
+        __qtablewidgetitem4 = QTableWidgetItem()
+        self.tblParamsPD.setHorizontalHeaderItem(1, __qtablewidgetitem4)
+        if (self.tblParamsPD.rowCount() < 1):
+            self.tblParamsPD.setRowCount(1)
+        __qtablewidgetitem5 = QTableWidgetItem()
+        self.tblParamsPD.setVerticalHeaderItem(0, __qtablewidgetitem5)
+        self.tblParamsPD.setObjectName(u"tblParamsPD")
+
+        self.gridLayout_2.addWidget(self.tblParamsPD, 0, 0, 1, 1)
+
+
+        self.gridLayout_3.addWidget(self.groupBox_4, 0, 1, 1, 1)
+
+
+        self.gridLayout_7.addWidget(self.groupBox, 2, 0, 1, 1)
+
+        self.groupBox_2 = QGroupBox(PluginDefinition)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout_6 = QGridLayout(self.groupBox_2)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.txtFunction = QTextBrowser(self.groupBox_2)
+        self.txtFunction.setObjectName(u"txtFunction")
+        self.txtFunction.setReadOnly(False)
+
+        self.gridLayout_6.addWidget(self.txtFunction, 0, 0, 1, 1)
+
+
+        self.gridLayout_7.addWidget(self.groupBox_2, 3, 0, 1, 1)
+
+        QWidget.setTabOrder(self.txtName, self.chkOverwrite)
+        QWidget.setTabOrder(self.chkOverwrite, self.txtDescription)
+        QWidget.setTabOrder(self.txtDescription, self.tblParams)
+        QWidget.setTabOrder(self.tblParams, self.tblParamsPD)
+        QWidget.setTabOrder(self.tblParamsPD, self.txtFunction)
+
+        self.retranslateUi(PluginDefinition)
+
+        QMetaObject.connectSlotsByName(PluginDefinition)
+    # setupUi
+
+    def retranslateUi(self, PluginDefinition):
+        PluginDefinition.setWindowTitle(QCoreApplication.translate("PluginDefinition", u"Plugin Definition", None))
+        self.groupBox_6.setTitle(QCoreApplication.translate("PluginDefinition", u"Plugin name", None))
+        self.txtName.setPlaceholderText(QCoreApplication.translate("PluginDefinition", u"Enter a plugin name", None))
+        self.chkOverwrite.setText(QCoreApplication.translate("PluginDefinition", u"Overwrite existing plugin model of this name", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("PluginDefinition", u"Description", None))
+        self.txtDescription.setPlaceholderText(QCoreApplication.translate("PluginDefinition", u"Enter a description of the model", None))
+        self.groupBox.setTitle(QCoreApplication.translate("PluginDefinition", u"Fit parameters", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("PluginDefinition", u"Non-polydisperse", None))
+        ___qtablewidgetitem = self.tblParams.horizontalHeaderItem(0)
+        ___qtablewidgetitem.setText(QCoreApplication.translate("PluginDefinition", u"Parameters", None));
+        ___qtablewidgetitem1 = self.tblParams.horizontalHeaderItem(1)
+        ___qtablewidgetitem1.setText(QCoreApplication.translate("PluginDefinition", u"Initial\n"
+"value", None));
+        self.groupBox_4.setTitle(QCoreApplication.translate("PluginDefinition", u"Polydisperse", None))
+        ___qtablewidgetitem2 = self.tblParamsPD.horizontalHeaderItem(0)
+        ___qtablewidgetitem2.setText(QCoreApplication.translate("PluginDefinition", u"Parameters", None));
+        ___qtablewidgetitem3 = self.tblParamsPD.horizontalHeaderItem(1)
+        ___qtablewidgetitem3.setText(QCoreApplication.translate("PluginDefinition", u"Initial\n"
+"value", None));
+        self.groupBox_2.setTitle(QCoreApplication.translate("PluginDefinition", u"Function(x)", None))
+        self.txtFunction.setHtml(QCoreApplication.translate("PluginDefinition", u"<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+"</style></head><body style=\" font-family:'MS Shell Dlg 2'; font-size:6.6pt; font-weight:400; font-style:normal;\">\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:7.8pt;\"><br /></p></body></html>", None))
+    # retranslateUi
+
@@ -12,12 +12,13 @@ from sas.qtgui.UnitTesting.TestUtils import QtSignalSpy
 
 from sas.sascalc.fit.AbstractFitEngine import FResult
 from sas.sascalc.fit.AbstractFitEngine import FitData1D
+from sas.sascalc.invariant.invariant_batch import results_to_table
 from sasmodels.sasview_model import load_standard_models
 from sas.qtgui.Plotting.PlotterData import Data1D
 
 import sas.qtgui.Utilities.GuiUtils as GuiUtils
 # Local
-from sas.qtgui.Utilities.GridPanel import BatchOutputPanel
+from sas.qtgui.Utilities.GridPanel import BatchOutputPanel, BatchInvariantOutputPanel
 
 
 class BatchOutputPanelTest:
@@ -147,3 +148,51 @@ Chi2,Data,scale,background,radius_equat_core,x_core,thick_shell,x_polar_shell,sl
     def testSetupTableFromCSV(self, widget):
         '''Test generation of grid table rows from a CSV file'''
         pass
+
+
+class BatchInvariantOutputPanelTest:
+    '''Test the batch invariant output dialog'''
+    @pytest.fixture(autouse=True)
+    def widget(self, qapp):
+        '''Create/Destroy the dialog'''
+        class dummy_manager(object):
+            _parent = QtWidgets.QWidget()
+            def communicator(self):
+                return GuiUtils.Communicate()
+            def communicate(self):
+                return GuiUtils.Communicate()
+        results = [{'name': 'frame_1', 'qstar': 1.5e-4, 'qstar_err': 1e-6,
+                    'volume_fraction': 0.01, 'volume_fraction_err': 1e-4,
+                    'surface': np.nan, 'error': ''},
+                   {'name': 'frame_2', 'qstar': np.nan, 'qstar_err': np.nan,
+                    'volume_fraction': np.nan, 'volume_fraction_err': np.nan,
+                    'surface': np.nan, 'error': 'failed'}]
+        w = BatchInvariantOutputPanel(parent=dummy_manager(), output_data=results_to_table(results))
+
+        yield w
+
+        '''Destroy the GUI'''
+        w.close()
+
+    def testDefaults(self, widget):
+        '''Test the GUI in its default state'''
+        assert widget.windowTitle() == "Batch Invariant Results"
+        assert widget.has_data
+
+    def testDataFromTable(self, widget):
+        '''Test dictionary generation from the results'''
+        params = widget.dataFromTable(widget.tblParams)
+        assert len(params) == 7
+        assert params['Data'] == ['frame_1', 'frame_2']
+        assert params['Q* [1/(cm A^3)]'][0] == '0.00015'
+        assert params['Volume Fraction'][1] == 'nan'
+        assert params['Error'][1] == 'failed'
+
+    def testClose(self, widget):
+        '''Test the perspective is told the window closed'''
+        class dummy_perspective(object):
+            batchResultsWindow = widget
+        perspective = dummy_perspective()
+        widget.perspective = perspective
+        widget.close()
+        assert perspective.batchResultsWindow is None
@@ -0,0 +1,49 @@
+import sys
+
+import pytest
+
+# Tested module
+from sas.qtgui.Utilities.LazyRegistry import LazyRegistry
+import sas.qtgui.Perspectives as Perspectives
+
+
+class LazyRegistryTest:
+    '''Test the registry of classes imported on first use'''
+
+    @pytest.fixture(autouse=True)
+    def module(self, tmp_path, monkeypatch):
+        '''Create a module which is not imported yet'''
+        (tmp_path / "lazy_registry_sample.py").write_text("class Sample:\n    pass\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        yield "lazy_registry_sample"
+        sys.modules.pop("lazy_registry_sample", None)
+
+    def testLazyImport(self, module):
+        '''Classes are imported when first looked up'''
+        registry = LazyRegistry({"Sample": module + ":Sample"})
+
+        assert list(registry) == ["Sample"]
+        assert "Sample" in registry
+        assert len(registry) == 1
+        assert module not in sys.modules
+        assert not registry.isLoaded("Sample")
+
+        cls = registry["Sample"]
+        assert cls.__name__ == "Sample"
+        assert module in sys.modules
+        assert registry.isLoaded("Sample")
+        assert registry["Sample"] is cls
+
+    def testMissing(self, module):
+        '''Unknown names and classes raise'''
+        registry = LazyRegistry({"Sample": module + ":Missing"})
+        with pytest.raises(KeyError):
+            registry["Other"]
+        with pytest.raises(AttributeError):
+            registry["Sample"]
+
+    def testPerspectives(self):
+        '''Perspectives are registered by name'''
+        assert sorted(Perspectives.PERSPECTIVES) == ["Corfunc", "Fitting", "Invariant", "Inversion"]
+        for name, perspective in Perspectives.PERSPECTIVES.items():
+            assert perspective.name == name
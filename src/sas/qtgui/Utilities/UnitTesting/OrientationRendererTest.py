@@ -0,0 +1,110 @@
+import pytest
+
+import numpy as np
+
+# Tested module
+from sas.qtgui.Utilities.OrientationViewer.OrientationRenderer import (
+    ImageCache, OrientationRenderer, quantise)
+from sas.qtgui.Utilities.OrientationViewer.OrientationViewerController import Orientation
+
+
+class DummyRender:
+    ''' Image made of the angles, recording the renders '''
+    def __init__(self):
+        self.rendered = []
+
+    def __call__(self, orientation, preview):
+        self.rendered.append((orientation, preview))
+        return np.array(orientation) + (0.5 if preview else 0.0)
+
+
+class OrientationRendererTest:
+    '''Test the OrientationRenderer'''
+
+    @pytest.fixture(autouse=True)
+    def renderer(self, qapp):
+        '''Create/Destroy the OrientationRenderer'''
+        r = OrientationRenderer(DummyRender(), preview_step=5, prefetch_steps=2, cache_size=8)
+        r.images = []
+        r.imageReady.connect(r.images.append)
+
+        yield r
+
+        r.cancel()
+
+    def testQuantise(self):
+        '''Angles are rounded to the step'''
+        assert quantise(Orientation(12, 13, -7, 0, 2, 3), 5) == Orientation(10, 15, -5, 0, 0, 5)
+        assert quantise(Orientation(12, 13, -7, 0, 2, 3), 1) == Orientation(12, 13, -7, 0, 2, 3)
+
+    def testImageCache(self):
+        '''The least recently used images are dropped'''
+        cache = ImageCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def testFullImage(self, renderer, qtbot):
+        '''A full quality image is rendered, and then served from the cache'''
+        orientation = Orientation(10, 20, 30, 0, 0, 0)
+        renderer.request(orientation)
+        qtbot.waitUntil(lambda: len(renderer.images) > 0)
+        assert np.all(renderer.images[0] == np.array(orientation))
+
+        renderer.request(orientation)
+        assert len(renderer.images) == 2
+        assert renderer.render.rendered == [(orientation, False)]
+
+    def testPreview(self, renderer, qtbot):
+        '''Previews are rendered at the quantised angles'''
+        renderer.request(Orientation(12, 0, 0, 0, 0, 0), preview=True)
+        qtbot.waitUntil(lambda: len(renderer.images) > 0)
+        assert np.all(renderer.images[0] == np.array(Orientation(10, 0, 0, 0, 0, 0)) + 0.5)
+
+        # Same preview, from the cache
+        renderer.request(Orientation(11, 0, 0, 0, 0, 0), preview=True)
+        assert len(renderer.images) == 2
+        assert len(renderer.render.rendered) == 1
+
+    def testPrefetch(self, renderer, qtbot):
+        '''The previews ahead of the slider are rendered'''
+        renderer.request(Orientation(10, 0, 0, 0, 0, 0), preview=True)
+        qtbot.waitUntil(lambda: len(renderer.images) > 0)
+        renderer.request(Orientation(15, 0, 0, 0, 0, 0), preview=True)
+        qtbot.waitUntil(lambda: not renderer.isPending() and len(renderer.cache) == 4)
+
+        for theta in (20, 25):
+            assert (True, Orientation(theta, 0, 0, 0, 0, 0)) in renderer.cache
+
+        # The next preview is shown without rendering
+        n_rendered = len(renderer.render.rendered)
+        renderer.request(Orientation(20, 0, 0, 0, 0, 0), preview=True)
+        assert np.all(renderer.images[-1] == np.array(Orientation(20, 0, 0, 0, 0, 0)) + 0.5)
+        qtbot.wait(50)
+        assert (True, Orientation(30, 0, 0, 0, 0, 0)) in renderer.cache
+        assert len(renderer.render.rendered) == n_rendered + 1
+
+    def testFullAfterPreview(self, renderer, qtbot):
+        '''On release, the preview is shown until the full image is ready'''
+        orientation = Orientation(10, 0, 0, 0, 0, 0)
+        renderer.request(orientation, preview=True)
+        qtbot.waitUntil(lambda: len(renderer.images) > 0)
+
+        renderer.request(orientation)
+        assert len(renderer.images) == 2
+        qtbot.waitUntil(lambda: len(renderer.images) > 2)
+        assert np.all(renderer.images[-1] == np.array(orientation))
+
+    def testSuperseded(self, renderer, qtbot):
+        '''Images of older requests are cached but not shown'''
+        renderer.request(Orientation(10, 0, 0, 0, 0, 0))
+        renderer.request(Orientation(20, 0, 0, 0, 0, 0))
+        qtbot.waitUntil(lambda: len(renderer.images) > 0)
+        qtbot.wait(50)
+        assert len(renderer.images) == 1
+        assert np.all(renderer.images[0] == np.array(Orientation(20, 0, 0, 0, 0, 0)))
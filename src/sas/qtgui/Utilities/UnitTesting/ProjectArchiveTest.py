@@ -0,0 +1,185 @@
+import json
+import zipfile
+
+import numpy
+import pytest
+
+from sas.qtgui.Plotting.PlotterData import Data1D
+from sas.qtgui.Plotting.PlotterData import Data2D
+
+# Tested module
+import sas.qtgui.Utilities.ProjectArchive as ProjectArchive
+
+
+class ProjectArchiveTest:
+    '''Test the project archive'''
+
+    @pytest.fixture(autouse=True)
+    def project(self):
+        '''Create a project with 1D and 2D data'''
+        x = numpy.linspace(0.001, 0.5, 200)
+        data1d = Data1D(x=x, y=numpy.exp(-x), dy=0.1 * numpy.exp(-x))
+        data1d.name = "data1d"
+        data1d.id = "data1d_id"
+
+        qx, qy = numpy.meshgrid(numpy.linspace(-0.1, 0.1, 32),
+                                numpy.linspace(-0.1, 0.1, 32))
+        data2d = Data2D(image=numpy.hypot(qx, qy).ravel(),
+                        err_image=numpy.ones(qx.size),
+                        qx_data=qx.ravel(), qy_data=qy.ravel(),
+                        q_data=numpy.hypot(qx, qy).ravel(),
+                        mask=numpy.ones(qx.size, dtype=bool))
+        data2d.name = "data2d"
+        data2d.id = "data2d_id"
+
+        # A theory sharing the x array of the data
+        theory = Data1D(x=x, y=2 * numpy.exp(-x))
+        theory.name = "theory"
+
+        yield {
+            'data1d_id': {'fit_data': [data1d, {'checked': True}, [theory]]},
+            'data2d_id': {'fit_data': [data2d, {'checked': False}, []]},
+            'is_batch': 'False',
+        }
+
+    def assertSameProject(self, project, result):
+        '''Compare the datasets of the saved and loaded projects'''
+        assert result['is_batch'] == 'False'
+        data1d, properties, (theory,) = result['data1d_id']['fit_data']
+        assert properties == {'checked': True}
+        original = project['data1d_id']['fit_data'][0]
+        assert isinstance(data1d, Data1D)
+        assert data1d.name == "data1d"
+        numpy.testing.assert_array_equal(data1d.x, original.x)
+        numpy.testing.assert_array_equal(data1d.dy, original.dy)
+        numpy.testing.assert_array_equal(theory.y, 2 * numpy.exp(-original.x))
+
+        data2d = result['data2d_id']['fit_data'][0]
+        original = project['data2d_id']['fit_data'][0]
+        assert isinstance(data2d, Data2D)
+        numpy.testing.assert_array_equal(data2d.data, original.data)
+        numpy.testing.assert_array_equal(data2d.qy_data, original.qy_data)
+        assert data2d.mask.dtype == bool
+        numpy.testing.assert_array_equal(data2d.mask, original.mask)
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def testArchive(self, project, tmp_path, lazy):
+        '''Projects are saved as archives of raw arrays'''
+        filename = str(tmp_path / "project.sasv")
+        ProjectArchive.saveProject(filename, project)
+
+        assert ProjectArchive.isProjectArchive(filename)
+        with zipfile.ZipFile(filename) as archive:
+            names = archive.namelist()
+            manifest = json.loads(archive.read(ProjectArchive.MANIFEST))
+        # Arrays are not part of the manifest
+        data1d = manifest['data1d_id']['fit_data'][0]
+        assert set(data1d['x']) == {'__type__', 'blob', 'dtype', 'shape'}
+        # The array shared by the data and the theory is stored once
+        theory = manifest['data1d_id']['fit_data'][2][0]
+        assert theory['x']['blob'] == data1d['x']['blob']
+        assert len([name for name in names if name.startswith('arrays/')]) > 5
+
+        result = ProjectArchive.readProject(filename, lazy=lazy)
+        self.assertSameProject(project, result)
+        # Loaded arrays can be modified
+        data1d = result['data1d_id']['fit_data'][0]
+        data1d.y[0] = -1.0
+        # Lazily loaded arrays are mapped from the file until hydrated
+        assert ProjectArchive.isMapped(data1d.x) == lazy
+        assert bool(ProjectArchive.mappedArrays(result)) == lazy
+        ProjectArchive.hydrate(result)
+        assert not ProjectArchive.mappedArrays(result)
+        assert data1d.y[0] == -1.0
+        self.assertSameProject(project, result)
+
+    def testCloseMappings(self, project, tmp_path):
+        '''The project file is closed once its arrays are hydrated'''
+        filename = str(tmp_path / "project.sasv")
+        ProjectArchive.saveProject(filename, project)
+        result = ProjectArchive.readProject(filename, lazy=True)
+        mappings = ProjectArchive.fileMappings(result)
+        assert len(mappings) == 1
+
+        # Still used by the arrays
+        assert ProjectArchive.closeMappings(mappings) == mappings
+        ProjectArchive.hydrate(result)
+        assert ProjectArchive.closeMappings(mappings) == []
+        assert mappings[0].closed
+
+        # The file can be replaced
+        ProjectArchive.saveProject(filename, result)
+        self.assertSameProject(project, ProjectArchive.readProject(filename))
+
+    def testPrefetch(self, project, tmp_path, qtbot):
+        '''The prefetch thread reads the mapped arrays'''
+        filename = str(tmp_path / "project.sasv")
+        ProjectArchive.saveProject(filename, project)
+        result = ProjectArchive.readProject(filename, lazy=True)
+
+        completed = []
+        thread = ProjectArchive.PrefetchThread(completefn=lambda: completed.append(True))
+        thread.queue([value['fit_data'] for value in result.values() if 'fit_data' in value])
+        qtbot.waitUntil(lambda: len(completed) > 0)
+
+    def testPrefetchStop(self, project, tmp_path, qtbot):
+        '''The prefetch stops reading the maps when asked to'''
+        filename = str(tmp_path / "project.sasv")
+        ProjectArchive.saveProject(filename, project)
+        result = ProjectArchive.readProject(filename, lazy=True)
+
+        completed = []
+        thread = ProjectArchive.PrefetchThread(completefn=lambda: completed.append(True))
+        thread.queue([value['fit_data'] for value in result.values() if 'fit_data' in value])
+        assert thread.stopReading(timeout=5.0)
+        qtbot.waitUntil(lambda: not thread.isrunning())
+
+        # Blocked by a read in progress
+        thread._reading.acquire()
+        try:
+            assert not thread.stopReading(timeout=0.01)
+        finally:
+            thread._reading.release()
+
+    def testJSON(self, project, tmp_path):
+        '''Projects named .json are written and read in the JSON format'''
+        filename = str(tmp_path / "project.json")
+        ProjectArchive.saveProject(filename, project)
+
+        assert not ProjectArchive.isProjectArchive(filename)
+        with open(filename) as infile:
+            content = json.load(infile)
+        assert isinstance(content['data1d_id']['fit_data'][0]['x']['data'], list)
+        self.assertSameProject(project, ProjectArchive.readProject(filename))
+
+    def testArrayTypes(self, tmp_path):
+        '''Byte order, shape and type of arrays are kept'''
+        project = {'arrays': {
+            'big_endian': numpy.arange(6, dtype='>i4').reshape(2, 3),
+            'strided': numpy.arange(10.0)[::2],
+            'scalar': numpy.array(2.5),
+            'empty': numpy.zeros((0, 3)),
+            'text': numpy.array(['a', 'bcd']),
+            'objects': numpy.array([None, 1], dtype=object),
+        }}
+        filename = str(tmp_path / "arrays.sasv")
+        ProjectArchive.saveProject(filename, project)
+        result = ProjectArchive.readProject(filename)['arrays']
+
+        for name, array in project['arrays'].items():
+            assert result[name].shape == array.shape
+            assert result[name].tolist() == array.tolist()
+        assert result['big_endian'].dtype == numpy.dtype('int32')
+        assert result['text'].dtype == numpy.dtype('U3')
+
+    def testFailedSave(self, project, tmp_path, mocker):
+        '''A failed save keeps the previous file'''
+        filename = tmp_path / "project.sasv"
+        ProjectArchive.saveProject(str(filename), project)
+        content = filename.read_bytes()
+
+        mocker.patch.object(ProjectArchive.GuiUtils, 'saveData', side_effect=OSError)
+        with pytest.raises(OSError):
+            ProjectArchive.saveProject(str(filename), project)
+        assert filename.read_bytes() == content
+        assert list(tmp_path.iterdir()) == [filename]
@@ -261,6 +261,10 @@ class CalcThread:
             self._running = True
 
             if len(self._queue) == 0:
+                # Release the lock on the way out so that the thread object
+                # can be given more work later
+                self._running = False
+                self._lock.release()
                 break
 
             self._interrupting = False
@@ -277,8 +281,6 @@ class CalcThread:
             except Exception:
                 self.exception()
 
-        self._running = False
-
 
 # ======================================================================
 # Demonstration of calcthread in action
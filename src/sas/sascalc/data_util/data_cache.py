@@ -0,0 +1,254 @@
+"""
+Cache of parsed data files.
+
+Parsing a data file with sasdata's Loader is slow compared to reading the
+resulting Data1D/Data2D objects back from their pickled form, so the
+parsed objects are stored under the user directory, keyed on a hash of the
+file content and extension, which selects the reader. Files are only hashed
+again when their modification time or size changes, and the same content
+loaded from files of the same type shares one entry.
+
+The entries are evicted in least recently used order when their total
+size exceeds the size of the cache. Entries written by another version of
+the cache or of sasdata are not used.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+
+import sasdata
+
+from sas.system.user import get_user_dir
+
+logger = logging.getLogger(__name__)
+
+# Version of the entries, changed whenever their content or key changes
+CACHE_VERSION = 2
+# Default size of the cache, in bytes
+DEFAULT_MAX_SIZE = 512 * 2**20
+# Block size used when hashing files
+_HASH_BLOCK = 2**20
+
+
+class DataCache(object):
+    """
+    Parsed data objects, by file.
+
+    The cache is safe to use from several processes at once: entries are
+    written to temporary files and moved in place when complete.
+    """
+    def __init__(self, directory=None, max_size=DEFAULT_MAX_SIZE):
+        """
+        :param directory: where the entries are stored, defaults to
+            data_cache in the user directory
+        :param max_size: largest total size of the entries, in bytes
+        """
+        if directory is None:
+            directory = os.path.join(get_user_dir(), 'data_cache')
+        self.directory = directory
+        self.max_size = max_size
+        # Total size of the entries, counted on the first store
+        self._size = None
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, 'data', key + '.pickle')
+
+    def _record_path(self, path):
+        name = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, 'files', name + '.json')
+
+    def _write(self, target, content):
+        """
+        Atomically replace the target file with the content
+        """
+        folder = os.path.dirname(target)
+        os.makedirs(folder, exist_ok=True)
+        handle, temp_name = tempfile.mkstemp(dir=folder, suffix='.part')
+        try:
+            with os.fdopen(handle, 'wb') as temp_file:
+                temp_file.write(content)
+            os.replace(temp_name, target)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
+
+    def key(self, path):
+        """
+        Key of the content of the file. The extension of the file is part
+        of the key, as the Loader picks the reader from it.
+
+        The key recorded for the file is used while the modification time
+        and size of the file are unchanged, otherwise the file is hashed.
+        """
+        status = os.stat(path)
+        record_path = self._record_path(path)
+        try:
+            with open(record_path) as record_file:
+                record = json.load(record_file)
+            if record['mtime_ns'] == status.st_mtime_ns and record['size'] == status.st_size \
+                    and record.get('version') == CACHE_VERSION:
+                return record['key']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        content_hash = hashlib.sha256()
+        extension = os.path.splitext(path)[1].lower()
+        content_hash.update(b'%d %s %s\n' % (CACHE_VERSION, sasdata.__version__.encode('utf-8'),
+                                              extension.encode('utf-8')))
+        with open(path, 'rb') as data_file:
+            for block in iter(lambda: data_file.read(_HASH_BLOCK), b''):
+                content_hash.update(block)
+        key = content_hash.hexdigest()
+        record = {'mtime_ns': status.st_mtime_ns, 'size': status.st_size, 'key': key,
+                  'version': CACHE_VERSION}
+        try:
+            self._write(record_path, json.dumps(record).encode('utf-8'))
+        except OSError as ex:
+            logger.debug("Data cache: can't record %s: %s", path, ex)
+        return key
+
+    def get(self, path, key=None):
+        """
+        Parsed content of the file, or None if it is not in the cache
+        """
+        if key is None:
+            key = self.key(path)
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                data = pickle.load(entry_file)
+            # Most recently used
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            logger.warning("Data cache: removing unreadable entry for %s: %s", path, ex)
+            self._remove(entry_path)
+            return None
+        # The entry may have been stored for another file with the same content
+        filename = os.path.basename(path)
+        for item in data:
+            if hasattr(item, 'filename'):
+                item.filename = filename
+        return data
+
+    def put(self, path, data, key=None):
+        """
+        Store the parsed content of the file
+        """
+        if key is None:
+            key = self.key(path)
+        try:
+            content = pickle.dumps(list(data), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as ex:
+            logger.debug("Data cache: can't store %s: %s", path, ex)
+            return
+        if len(content) > self.max_size:
+            return
+        self._write(self._entry_path(key), content)
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += len(content)
+        if self._size > self.max_size:
+            self.evict()
+
+    def load(self, path, loader):
+        """
+        Parsed content of the file, from the cache if possible, otherwise
+        parsed with the loader and stored.
+
+        :param path: file to load
+        :param loader: sasdata Loader
+        :return: list of data objects, as returned by Loader.load
+        """
+        try:
+            key = self.key(path)
+            data = self.get(path, key)
+        except OSError as ex:
+            # Unreadable files are reported by the loader
+            logger.debug("Data cache: can't look up %s: %s", path, ex)
+            return loader.load(path)
+        if data is None:
+            data = loader.load(path)
+            try:
+                self.put(path, data, key)
+            except OSError as ex:
+                logger.warning("Data cache: can't store %s: %s", path, ex)
+        return data
+
+    def _entries(self):
+        """
+        (modification time, size, path) of the entries
+        """
+        entries = []
+        try:
+            with os.scandir(os.path.join(self.directory, 'data')) as scan:
+                for entry in scan:
+                    if entry.name.endswith('.pickle'):
+                        try:
+                            status = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((status.st_mtime_ns, status.st_size, entry.path))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def size(self):
+        """
+        Total size of the entries, in bytes
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits in its
+        size, and the file records of removed entries
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        while entries and total > self.max_size:
+            _, size, path = entries.pop(0)
+            self._remove(path)
+            total -= size
+        self._size = total
+
+        kept = {os.path.basename(path)[:-len('.pickle')] for _, _, path in entries}
+        try:
+            with os.scandir(os.path.join(self.directory, 'files')) as scan:
+                records = [entry.path for entry in scan if entry.name.endswith('.json')]
+        except FileNotFoundError:
+            records = []
+        for record_path in records:
+            try:
+                with open(record_path) as record_file:
+                    key = json.load(record_file)['key']
+            except (OSError, ValueError, KeyError, TypeError):
+                key = None
+            if key not in kept:
+                self._remove(record_path)
+
+    def clear(self):
+        """
+        Remove all entries
+        """
+        for folder in ('data', 'files'):
+            try:
+                with os.scandir(os.path.join(self.directory, folder)) as scan:
+                    paths = [entry.path for entry in scan if entry.is_file()]
+            except FileNotFoundError:
+                continue
+            for path in paths:
+                self._remove(path)
+        self._size = 0
@@ -0,0 +1,120 @@
+"""
+Least recently used cache of values by key.
+
+Values are kept in an OrderedDict ordered by last use, and the least recently
+used ones are dropped beyond a number of values or a memory budget. The cache
+is safe to use from several threads.
+"""
+import threading
+from collections import OrderedDict
+
+
+def _nbytes(value):
+    """
+    Memory held by a value, for arrays
+    """
+    return getattr(value, 'nbytes', 0)
+
+
+class LRUCache(object):
+    """
+    Values by key, dropping the least recently used ones beyond maxsize
+    values or beyond memory_budget bytes, as measured by sizeof(value). The
+    value added last is kept whatever its size. With neither limit, nothing
+    is dropped.
+
+    evicted(key, value) is called for each value dropped to make room for
+    another, e.g. to move it somewhere else or to release its resources. It
+    is called with the lock held, and must not use the cache.
+    """
+    def __init__(self, maxsize=None, memory_budget=None, sizeof=_nbytes, evicted=None):
+        self.maxsize = maxsize
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+        self._sizeof = sizeof
+        self._evicted = evicted
+        # Values and their sizes, least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, create=None):
+        """
+        Value of the key, created by calling create() if it is not in the
+        cache, or None without create.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+        if create is None:
+            return None
+
+        # Created outside the lock, two threads may both create the value,
+        # the first one added is kept
+        value = create()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+            self._add(key, value)
+        return value
+
+    def put(self, key, value):
+        """
+        Add or replace the value of the key
+        """
+        with self._lock:
+            self._remove(key)
+            self._add(key, value)
+
+    def pop(self, key, default=None):
+        """
+        Remove the value of the key and return it, default if it is missing
+        """
+        with self._lock:
+            if key not in self._entries:
+                return default
+            return self._remove(key)
+
+    def discard(self, match):
+        """
+        Drop the values of the keys for which match(key) is true
+        """
+        with self._lock:
+            for key in [key for key in self._entries if match(key)]:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.memory_used = 0
+
+    def _add(self, key, value):
+        size = self._sizeof(value) if self.memory_budget is not None else 0
+        self._entries[key] = (value, size)
+        self.memory_used += size
+
+        while len(self._entries) > 1 and self._over_budget():
+            dropped_key = next(iter(self._entries))
+            dropped = self._remove(dropped_key)
+            if self._evicted is not None:
+                self._evicted(dropped_key, dropped)
+
+    def _remove(self, key):
+        if key not in self._entries:
+            return None
+        value, size = self._entries.pop(key)
+        self.memory_used -= size
+        return value
+
+    def _over_budget(self):
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            return True
+        return self.memory_budget is not None and self.memory_used > self.memory_budget
@@ -0,0 +1,112 @@
+"""
+Parallel loading of data files.
+
+Files are parsed by sasdata's Loader in a pool of worker processes and the
+parsed Data1D/Data2D objects are returned to the caller in batches, in the
+order of the files. Parsing is independent for every file, so
+loading a folder of many files keeps every processor busy instead of one.
+
+Few files are not worth the cost of starting the workers, and are parsed
+in the calling process. So are files parsed with a given Loader: the
+workers only know the readers sasdata registers by default, not those
+registered at run time.
+"""
+import math
+import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from sasdata.dataloader.loader import Loader
+
+logger = logging.getLogger(__name__)
+
+# Smallest number of files parsed by worker processes
+MIN_PARALLEL_FILES = 8
+# Largest number of files sent to a worker at a time. Small batches return
+# the first data early and keep the progress reports regular.
+MAX_CHUNK_SIZE = 16
+
+# Loader of the worker process, created on first use
+_loader = None
+
+
+def load_file(path, loader=None, cache=None):
+    """
+    Parse a single file.
+
+    :param path: file to parse
+    :param loader: Loader to use, defaults to one per process
+    :param cache: DataCache holding previously parsed files, if any
+    :return: tuple of the path, the list of parsed data objects and the
+        exception raised while parsing, if any
+    """
+    global _loader
+    if loader is None:
+        if _loader is None:
+            _loader = Loader()
+        loader = _loader
+    try:
+        if cache is not None:
+            return path, cache.load(path, loader), None
+        return path, loader.load(path), None
+    except Exception as ex:
+        return path, [], ex
+
+
+def _load_chunk(paths, cache):
+    """
+    Parse a chunk of files in a worker.
+    """
+    return [load_file(path, cache=cache) for path in paths]
+
+
+def load_files(paths, n_workers=None, chunk_size=None, loader=None, cache=None):
+    """
+    Parse the files, in parallel when there are enough of them.
+
+    Generates lists of load_file results for consecutive files, in the
+    order of the paths. A batch is returned once it and all the batches
+    before it are parsed.
+
+    :param paths: sequence of files to parse
+    :param n_workers: number of worker processes. None or 0 uses one per
+        processor, 1 parses the files in the calling process.
+    :param chunk_size: number of files sent to a worker at a time.
+        Defaults to an even split in four chunks per worker, of at most
+        MAX_CHUNK_SIZE files.
+    :param loader: Loader with readers registered at run time. The files
+        are then all parsed in the calling process with it.
+    :param cache: DataCache holding previously parsed files, if any
+    """
+    paths = list(paths)
+    if not n_workers:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, len(paths))
+    if n_workers <= 1 or len(paths) < MIN_PARALLEL_FILES or loader is not None:
+        for path in paths:
+            yield [load_file(path, loader, cache)]
+        return
+
+    if chunk_size is None:
+        chunk_size = min(MAX_CHUNK_SIZE, max(1, math.ceil(len(paths) / (4 * n_workers))))
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    logger.debug("Loading %d files in %d processes", len(paths), n_workers)
+
+    # Workers are started rather than forked, loading runs on a thread of the
+    # GUI process and threads don't survive forking
+    with ProcessPoolExecutor(max_workers=n_workers,
+                             mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(_load_chunk, chunk, cache) for chunk in chunks]
+        try:
+            for future, chunk in zip(futures, chunks):
+                try:
+                    results = future.result()
+                except Exception as ex:
+                    # The worker died or its results could not be sent back
+                    results = [(path, [], ex) for path in chunk]
+                yield results
+        finally:
+            # Closed before completion, e.g. by an error in the caller
+            for future in futures:
+                future.cancel()
@@ -7,6 +7,8 @@ import os
 import sys
 import time
 import datetime
+import hashlib
+import json
 import logging
 import traceback
 import py_compile
@@ -15,7 +17,10 @@ import io
 
 from six import reraise
 
-from sasmodels.sasview_model import load_custom_model, load_standard_models
+import sasmodels
+import sasmodels.models
+from sasmodels.core import list_models, load_model_info
+from sasmodels.sasview_model import MODELS, load_custom_model, make_model_from_info
 
 from sas.system.user import get_user_dir
 
@@ -30,6 +35,25 @@ logger = logging.getLogger(__name__)
 PLUGIN_DIR = 'plugin_models'
 PLUGIN_LOG = os.path.join(get_user_dir(), PLUGIN_DIR, "plugins.log")
 PLUGIN_NAME_BASE = '[plug-in] '
+# Metadata of the plugin models, kept in the plugin directory
+PLUGIN_INDEX = 'plugin_index.json'
+PLUGIN_INDEX_VERSION = 1
+# Model attributes stored in the plugin index
+PLUGIN_METADATA = {
+    'name': '',
+    'id': '',
+    'category': None,
+    'is_structure_factor': False,
+    'is_form_factor': False,
+    'is_multiplicity_model': False,
+}
+# Metadata of the standard models, kept in the user directory
+MODEL_INDEX = 'model_index.json'
+MODEL_INDEX_VERSION = 1
+
+# Stand-ins of the standard models, by name. They are kept out of the
+# sasmodels MODELS registry, which only ever holds loaded model classes.
+_standard_models = {}  # type: Dict[str, LazyStandardModel]
 
 
 def plugin_log(message):
@@ -158,41 +182,341 @@ def compile_file(dir):
     return None
 
 
-def find_plugin_models():
+class LazyModel(object):
     """
-    Find custom models
+    Stand-in for a plugin model class, holding the attributes needed to list
+    the model. The model is loaded when instantiated or when any other
+    attribute is used.
+    """
+    def __init__(self, path, metadata):
+        self.path = path
+        self.filename = path
+        self.metadata = metadata
+        for key, default in PLUGIN_METADATA.items():
+            setattr(self, key, metadata.get(key, default))
+        self._model = None
+
+    def load(self):
+        """
+        Return the model class, loading it if needed
+        """
+        if self._model is None:
+            self._model = load_plugin_model(self.path)
+        return self._model
+
+    def unload(self):
+        """
+        Forget the model class, so that it is loaded again when used
+        """
+        self._model = None
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        # Only called for attributes missing from the stand-in
+        if name.startswith('__') or name == '_model':
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self):
+        return "<%s %s>" % (type(self).__name__, self.name)
+
+
+class LazyStandardModel(LazyModel):
+    """
+    Stand-in for a standard model class, built from the model index
+    """
+    def __init__(self, metadata):
+        super(LazyStandardModel, self).__init__(metadata['filename'], metadata)
+
+    def load(self):
+        """
+        Return the model class, loading it if needed
+        """
+        if self._model is None:
+            model = MODELS.get(self.name)
+            if model is None or model.filename != self.filename:
+                model = make_model_from_info(load_model_info(self.id))
+                MODELS[self.name] = model
+            self._model = model
+        return self._model
+
+
+def load_plugin_model(path):
+    """
+    Load a plugin model with sasmodels, which renames the plugins using the
+    name of a model it already knows. The standard model of the same name
+    is loaded first if it is still a stand-in, so that the plugin is renamed
+    rather than replacing the standard model.
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    if name in _standard_models:
+        _standard_models[name].load()
+    model = load_custom_model(path)
+    standard = _standard_models.get(model.name)
+    if standard is not None and MODELS.get(model.name) is model:
+        # Named differently from its file: restore the standard model and
+        # load the plugin again to have it renamed
+        MODELS[model.name] = standard.load()
+        model = load_custom_model(path)
+    return model
+
+
+def _model_metadata(model):
+    """
+    Attributes of the model class needed to list the model
+    """
+    metadata = {key: getattr(model, key, default)
+                for key, default in PLUGIN_METADATA.items()}
+    for key, default in PLUGIN_METADATA.items():
+        if isinstance(default, bool):
+            metadata[key] = bool(metadata[key])
+    info = getattr(model, '_model_info', None)
+    if info is not None:
+        metadata['category'] = info.category
+    return metadata
+
+
+def _standard_models_signature():
+    """
+    Signature of the installed standard models, changed by any update of
+    sasmodels or of its model files
+    """
+    signature = hashlib.sha1(sasmodels.__version__.encode('utf-8'))
+    models_dir = os.path.dirname(os.path.abspath(sasmodels.models.__file__))
+    with os.scandir(models_dir) as scan:
+        for entry in sorted(scan, key=lambda entry: entry.name):
+            if entry.is_file():
+                signature.update(b'%s %d\n' % (entry.name.encode('utf-8'), entry.stat().st_mtime_ns))
+    return signature.hexdigest()
+
+
+def build_model_index():
+    """
+    Metadata of the standard models, by name. Loads every model.
+    """
+    index = {}
+    for name in list_models():
+        try:
+            model = make_model_from_info(load_model_info(name))
+        except Exception:
+            logger.error(traceback.format_exc())
+            continue
+        metadata = _model_metadata(model)
+        metadata['filename'] = model.filename
+        index[model.name] = metadata
+    return index
+
+
+def read_model_index(index_path=None):
+    """
+    Metadata of the standard models, by name, from the model index. The
+    index is built and saved when missing or out of date.
+
+    :param index_path: index file, defaults to MODEL_INDEX in the user
+        directory
+    """
+    if index_path is None:
+        index_path = os.path.join(get_user_dir(), MODEL_INDEX)
+    signature = _standard_models_signature()
+    try:
+        with io.open(index_path, encoding='utf-8') as index_file:
+            index = json.load(index_file)
+        if index.get('version') == MODEL_INDEX_VERSION and index.get('signature') == signature:
+            return index['models']
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
+    logger.info("Building the model index %s", index_path)
+    models = build_model_index()
+    index = {'version': MODEL_INDEX_VERSION, 'signature': signature, 'models': models}
+    try:
+        with io.open(index_path + '.part', 'w', encoding='utf-8') as index_file:
+            json.dump(index, index_file, indent=1, default=str)
+        os.replace(index_path + '.part', index_path)
+    except OSError as exc:
+        logger.warning("Could not save the model index %r: %s", index_path, exc)
+    return models
+
+
+class PluginRegistry(object):
+    """
+    Plugin models of a directory, updated incrementally.
+
+    Files are only imported when new or changed since the last update,
+    according to their modification time and size, then the hash of their
+    content. The metadata of the models is saved in an index in the
+    directory, so that the models of unchanged files can be listed in a new
+    session without importing them.
     """
-    # List of plugin objects
-    plugins_dir = find_plugins_dir()
-    # Go through files in plug-in directory
-    if not os.path.isdir(plugins_dir):
-        msg = "SasView couldn't locate Model plugin folder %r." % plugins_dir
-        logger.warning(msg)
+    def __init__(self, plugins_dir=None):
+        """
+        :param plugins_dir: directory of the plugin models, defaults to the
+            user plugin directory
+        """
+        self.plugins_dir = plugins_dir
+        # Index entries by plugin path
+        self._files = None
+        # LazyModel by plugin path
+        self._models = {}
+        # Plugins which failed to load and were reported in this session
+        self._reported = set()
+
+    def _directory(self):
+        return self.plugins_dir if self.plugins_dir is not None else find_plugins_dir()
+
+    def _read_index(self, plugins_dir):
+        """
+        Entries of the index, or no entries if the index is missing or
+        written for another version
+        """
+        try:
+            with io.open(os.path.join(plugins_dir, PLUGIN_INDEX), encoding='utf-8') as index_file:
+                index = json.load(index_file)
+            if (index.get('version') == PLUGIN_INDEX_VERSION
+                    and index.get('sasmodels') == sasmodels.__version__):
+                return index['files']
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
         return {}
 
-    plugin_log("looking for models in: %s" % plugins_dir)
-    # compile_file(plugins_dir)  #always recompile the folder plugin
-    logger.info("plugin model dir: %s", plugins_dir)
+    def _write_index(self, plugins_dir):
+        index = {'version': PLUGIN_INDEX_VERSION,
+                 'sasmodels': sasmodels.__version__,
+                 'files': self._files}
+        index_path = os.path.join(plugins_dir, PLUGIN_INDEX)
+        try:
+            with io.open(index_path + '.part', 'w', encoding='utf-8') as index_file:
+                json.dump(index, index_file, indent=1)
+            os.replace(index_path + '.part', index_path)
+        except OSError as exc:
+            logger.warning("Could not save the plugin index %r: %s", index_path, exc)
+
+    def _load(self, path, entry):
+        """
+        Import the plugin and record its metadata in the entry
+        """
+        try:
+            model = load_plugin_model(path)
+        except Exception:
+            msg = traceback.format_exc()
+            msg += "\nwhile accessing model in %r" % path
+            plugin_log(msg)
+            logger.warning("Failed to load plugin %r. See %s for details",
+                           path, PLUGIN_LOG)
+            self._reported.add(path)
+            entry['metadata'] = None
+            self._models.pop(path, None)
+            return
+        metadata = _model_metadata(model)
+        entry['metadata'] = metadata
+        lazy_model = LazyModel(path, metadata)
+        lazy_model._model = model
+        self._models[path] = lazy_model
+
+    def update(self):
+        """
+        Load the new and changed plugins and drop the deleted ones.
 
-    plugins = {}
-    for filename in os.listdir(plugins_dir):
-        name, ext = os.path.splitext(filename)
-        if ext == '.py' and not name == '__init__':
-            path = os.path.abspath(os.path.join(plugins_dir, filename))
+        :return: True if any plugin was added, changed or deleted
+        """
+        plugins_dir = os.path.abspath(self._directory())
+        if not os.path.isdir(plugins_dir):
+            msg = "SasView couldn't locate Model plugin folder %r." % plugins_dir
+            logger.warning(msg)
+            changed = bool(self._models)
+            self._models.clear()
+            return changed
+        if self._files is None:
+            plugin_log("looking for models in: %s" % plugins_dir)
+            logger.info("plugin model dir: %s", plugins_dir)
+            self._files = self._read_index(plugins_dir)
+
+        loaded = set()
+        touched = False
+        paths = set()
+        for filename in sorted(os.listdir(plugins_dir)):
+            name, ext = os.path.splitext(filename)
+            if ext != '.py' or name == '__init__':
+                continue
+            path = os.path.join(plugins_dir, filename)
             try:
-                model = load_custom_model(path)
-                # TODO: add [plug-in] tag to model name in sasview_model
-                #if not model.name.startswith(PLUGIN_NAME_BASE):
-                #    model.name = PLUGIN_NAME_BASE + model.name
-                plugins[model.name] = model
-            except Exception as exc:
-                msg = traceback.format_exc()
-                msg += "\nwhile accessing model in %r" % path
-                plugin_log(msg)
-                logger.warning("Failed to load plugin %r. See %s for details",
-                               path, PLUGIN_LOG)
+                status = os.stat(path)
+            except OSError:
+                continue
+            paths.add(path)
+            entry = self._files.get(path)
+            if (entry is not None and entry['mtime_ns'] == status.st_mtime_ns
+                    and entry['size'] == status.st_size):
+                content_hash = entry['hash']
+            else:
+                with open(path, 'rb') as plugin_file:
+                    content_hash = hashlib.sha256(plugin_file.read()).hexdigest()
+            if entry is None or entry['hash'] != content_hash:
+                # New or changed
+                entry = {'mtime_ns': status.st_mtime_ns, 'size': status.st_size,
+                         'hash': content_hash}
+                self._files[path] = entry
+                self._load(path, entry)
+                loaded.add(path)
+                continue
+            if entry['mtime_ns'] != status.st_mtime_ns or entry['size'] != status.st_size:
+                # Touched but unchanged
+                entry['mtime_ns'], entry['size'] = status.st_mtime_ns, status.st_size
+                touched = True
+            if entry['metadata'] is None:
+                if path not in self._reported:
+                    logger.warning("Plugin %r failed to load when last changed. See %s for details",
+                                   path, PLUGIN_LOG)
+                    self._reported.add(path)
+            elif path not in self._models:
+                self._models[path] = LazyModel(path, entry['metadata'])
+
+        deleted = [path for path in self._files
+                   if os.path.dirname(path) == plugins_dir and path not in paths]
+        for path in deleted:
+            del self._files[path]
+            self._models.pop(path, None)
+            self._reported.discard(path)
+        changed = bool(loaded or deleted)
+        if changed:
+            # Models combining other plugins are loaded again when used
+            for path, model in self._models.items():
+                if path not in loaded:
+                    model.unload()
+        if changed or touched:
+            self._write_index(plugins_dir)
+        return changed
+
+    def models(self):
+        """
+        Plugin models by name
+        """
+        return {model.name: model for model in self._models.values()}
+
+
+# Registry of the user plugin models, shared by the model managers
+_plugin_registry = None
 
-    return plugins
+
+def plugin_registry():
+    """
+    Registry of the user plugin models
+    """
+    global _plugin_registry
+    if _plugin_registry is None:
+        _plugin_registry = PluginRegistry()
+    return _plugin_registry
+
+
+def find_plugin_models():
+    """
+    Find custom models
+    """
+    registry = plugin_registry()
+    registry.update()
+    return registry.models()
 
 
 class ModelManagerBase(object):
@@ -204,10 +528,8 @@ class ModelManagerBase(object):
     model_dictionary = None  # type: Dict[str, Model]
     #: constant list of standard models
     standard_models = None  # type: Dict[str, Model]
-    #: list of plugin models reset each time the plugin directory is queried
+    #: list of plugin models reset each time the plugin directory changes
     plugin_models = None  # type: Dict[str, Model]
-    #: timestamp on the plugin directory at the last plugin update
-    last_time_dir_modified = 0  # type: int
 
     def __init__(self):
         # the model dictionary is allocated at the start and updated to
@@ -215,26 +537,20 @@ class ModelManagerBase(object):
         # than reassign to it.
         self.model_dictionary = {}
 
-        #Build list automagically from sasmodels package
-        self.standard_models = {model.name: model
-                                for model in load_standard_models()}
+        # Build list automagically from the index of the sasmodels package.
+        # The models are loaded when used.
+        self.standard_models = {name: LazyStandardModel(metadata)
+                                for name, metadata in read_model_index().items()}
+        _standard_models.update(self.standard_models)
         # Look for plugins
         self.plugins_reset()
 
     def _is_plugin_dir_changed(self):
         """
-        check the last time the plugin dir has changed and return true
-        is the directory was modified else return false
+        Load the plugins added or changed since the last update and return
+        true if any plugin was added, changed or deleted
         """
-        is_modified = False
-        plugin_dir = find_plugins_dir()
-        if os.path.isdir(plugin_dir):
-            mod_time = os.path.getmtime(plugin_dir)
-            if  self.last_time_dir_modified != mod_time:
-                is_modified = True
-                self.last_time_dir_modified = mod_time
-
-        return is_modified
+        return plugin_registry().update()
 
     def composable_models(self):
         """
@@ -247,14 +563,12 @@ class ModelManagerBase(object):
 
     def plugins_update(self):
         """
-        return a dictionary of model if
-        new models were added else return empty dictionary
+        return a dictionary of model, updated with the plugins
+        added, changed or deleted since the last update
         """
-        return self.plugins_reset()
-        #if self._is_plugin_dir_changed():
-        #    return self.plugins_reset()
-        #else:
-        #    return {}
+        if self._is_plugin_dir_changed():
+            return self.plugins_reset()
+        return self.get_model_list()
 
     def plugins_reset(self):
         """
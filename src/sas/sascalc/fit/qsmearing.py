@@ -11,6 +11,7 @@
 import math
 import logging
 import sys
+import hashlib
 
 import numpy as np  # type: ignore
 from numpy import pi, exp # type:ignore
@@ -21,6 +22,57 @@ from sasmodels.resolution2d import Pinhole2D
 
 from sasdata.data_util.nxsunit import Converter
 
+from sas.sascalc.data_util.lru_cache import LRUCache
+
+
+class ResolutionRegistry(LRUCache):
+    """
+    Resolution functions shared by all the fit problems on the same data.
+
+    Building a resolution function (the extended q_calc grid and the weight
+    matrix of Pinhole1D and Slit1D, the Hankel transform of SESANS data or the
+    oversampled grid of Pinhole2D) can take longer than evaluating the model.
+    Every fit page and every fit on a data set used to build its own; the
+    registry builds each once and hands the same object out again, keyed on
+    the content of the arrays it is built from, so copies of a data set share
+    it too.
+
+    The resolution functions are used read only. They are kept up to
+    memory_budget bytes, beyond which the least recently used are dropped.
+    """
+    def __init__(self, memory_budget=512*1024**2):
+        super(ResolutionRegistry, self).__init__(memory_budget=memory_budget, sizeof=_nbytes)
+
+
+def _nbytes(resolution):
+    """
+    Memory held by the arrays of a resolution function
+    """
+    total = 0
+    for value in vars(resolution).values():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        total += sum(v.nbytes for v in values if isinstance(v, np.ndarray))
+    return total
+
+
+def array_key(*arrays):
+    """
+    Digest of the content of arrays, None and scalars included
+    """
+    digest = hashlib.sha1()
+    for array in arrays:
+        if array is None:
+            digest.update(b"None")
+        else:
+            array = np.ascontiguousarray(array)
+            digest.update(str((array.dtype.str, array.shape)).encode())
+            digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+# Registry used by the smearers
+resolution_registry = ResolutionRegistry()
+
 
 def smear_selection(data, model=None):
     """
@@ -63,9 +115,11 @@ def smear_selection(data, model=None):
         zaccept = Converter("1/A")(q_max, "1/" + data.source.wavelength_unit),
 
         Rmax = 10000000
-        hankel = SesansTransform(data.x, SElength,
-                                 data.source.wavelength,
-                                 zaccept, Rmax)
+        key = ("sesans", array_key(data.x, SElength, data.source.wavelength, zaccept), Rmax)
+        hankel = resolution_registry.get(
+            key, lambda: SesansTransform(data.x, SElength,
+                                         data.source.wavelength,
+                                         zaccept, Rmax))
         # Then return the actual transform, as if it were a smearing function
         return PySmear(hankel, model, offset=0)
 
@@ -144,12 +198,16 @@ def slit_smear(data, model=None):
     width = data.dxw if data.dxw is not None else 0
     height = data.dxl if data.dxl is not None else 0
     # TODO: width and height seem to be reversed
-    return PySmear(Slit1D(q, height, width), model)
+    resolution = resolution_registry.get(
+        ("slit", array_key(q, height, width)), lambda: Slit1D(q, height, width))
+    return PySmear(resolution, model)
 
 def pinhole_smear(data, model=None):
     q = data.x
     width = data.dx if data.dx is not None else 0
-    return PySmear(Pinhole1D(q, width), model)
+    resolution = resolution_registry.get(
+        ("pinhole", array_key(q, width)), lambda: Pinhole1D(q, width))
+    return PySmear(resolution, model)
 
 
 class PySmear2D(object):
@@ -165,6 +223,9 @@ class PySmear2D(object):
         self.index = None
         self.coords = 'polar'
         self.smearer = True
+        # Digest of the data arrays, and the data it was computed for
+        self._data_key = None
+        self._keyed_data = None
 
     def set_accuracy(self, accuracy='Low'):
         """
@@ -199,6 +260,18 @@ class PySmear2D(object):
         """
         self.model = model
 
+    def _get_data_key(self):
+        """
+        Digest of the data arrays the resolution depends on, computed once
+        for each data set
+        """
+        if self._keyed_data is not self.data:
+            data = self.data
+            self._data_key = array_key(data.qx_data, data.qy_data, data.q_data,
+                                       data.dqx_data, data.dqy_data)
+            self._keyed_data = data
+        return self._data_key
+
     def set_index(self, index=None):
         """
         Set index.
@@ -213,9 +286,12 @@ class PySmear2D(object):
         then find smeared intensity
         """
         if self.smearer:
-            res = Pinhole2D(data=self.data, index=self.index,
-                            nsigma=3.0, accuracy=self.accuracy,
-                            coords=self.coords)
+            key = ("pinhole2d", self._get_data_key(), array_key(self.index),
+                   self.accuracy, self.coords)
+            res = resolution_registry.get(
+                key, lambda: Pinhole2D(data=self.data, index=self.index,
+                                       nsigma=3.0, accuracy=self.accuracy,
+                                       coords=self.coords))
             val = self.model.evalDistribution(res.q_calc)
             return res.apply(val)
         else:
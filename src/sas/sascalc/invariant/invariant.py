@@ -162,12 +162,11 @@ class Guinier(Transform):
 
         :param x: array of q-values
         """
-        p1 = np.array([self.dscale * math.exp(-((self.radius * q) ** 2 / 3)) \
-                          for q in x])
-        p2 = np.array([self.scale * math.exp(-((self.radius * q) ** 2 / 3))\
-                     * (-(q ** 2 / 3)) * 2 * self.radius * self.dradius for q in x])
-        diq2 = p1 * p1 + p2 * p2
-        return np.array([math.sqrt(err) for err in diq2])
+        x = np.asarray(x, dtype=float)
+        exp_term = np.exp(-((self.radius * x) ** 2 / 3))
+        p1 = self.dscale * exp_term
+        p2 = self.scale * exp_term * (-(x ** 2 / 3)) * 2 * self.radius * self.dradius
+        return np.sqrt(p1 * p1 + p2 * p2)
 
     def _guinier(self, x):
         r"""
@@ -188,7 +187,7 @@ class Guinier(Transform):
         if self.radius <= 0:
             msg = "Rg expected positive value, but got %s" % self.radius
             raise ValueError(msg)
-        value = np.array([math.exp(-((self.radius * i) ** 2 / 3)) for i in x])
+        value = np.exp(-((self.radius * np.asarray(x, dtype=float)) ** 2 / 3))
         return self.scale * value
 
 class PowerLaw(Transform):
@@ -238,11 +237,10 @@ class PowerLaw(Transform):
         Returns the error on I(q) for the given array of q-values
         :param x: array of q-values
         """
-        p1 = np.array([self.dscale * math.pow(q, -self.power) for q in x])
-        p2 = np.array([self.scale * self.power * math.pow(q, -self.power - 1)\
-                           * self.dpower for q in x])
-        diq2 = p1 * p1 + p2 * p2
-        return np.array([math.sqrt(err) for err in diq2])
+        x = np.asarray(x, dtype=float)
+        p1 = self.dscale * np.power(x, -self.power)
+        p2 = self.scale * self.power * np.power(x, -self.power - 1) * self.dpower
+        return np.sqrt(p1 * p1 + p2 * p2)
 
     def _power_law(self, x):
         """
@@ -265,7 +263,7 @@ class PowerLaw(Transform):
             msg = "scale expected positive value, but got %s" % self.scale
             raise ValueError(msg)
 
-        value = np.array([math.pow(i, -self.power) for i in x])
+        value = np.power(np.asarray(x, dtype=float), -self.power)
         return self.scale * value
 
 class Extrapolator(object):
@@ -424,6 +422,10 @@ class InvariantCalculator(object):
         # Extrapolation range
         self._low_q_limit = Q_MINIMUM
 
+        # Memoised extrapolated contributions to the invariant, keyed on the
+        # extrapolation settings. Only valid for the current data set.
+        self._extrapolation_cache = {}
+
     @property
     def background(self):
         return self._background
@@ -442,6 +444,7 @@ class InvariantCalculator(object):
 
     def set_data(self, data):
         self._data = self._get_data(data)
+        self._extrapolation_cache = {}
 
     def _get_data(self, data):
         """
@@ -514,31 +517,8 @@ class InvariantCalculator(object):
             msg += " and greater than 1; got x=%s, y=%s" % (len(data.x), len(data.y))
             raise ValueError(msg)
         else:
-            # Take care of smeared data
-            if self._smeared is None:
-                gx = data.x * data.x
-            # assumes that len(x) == len(dxl).
-            else:
-                gx = data.dxl * data.x
-
-            n = len(data.x) - 1
-            #compute the first delta q
-            dx0 = (data.x[1] - data.x[0]) / 2
-            #compute the last delta q
-            dxn = (data.x[n] - data.x[n - 1]) / 2
-            total = 0
-            total += gx[0] * data.y[0] * dx0
-            total += gx[n] * data.y[n] * dxn
-
-            if len(data.x) == 2:
-                return total
-            else:
-                #iterate between for element different
-                #from the first and the last
-                for i in range(1, n - 1):
-                    dxi = (data.x[i + 1] - data.x[i - 1]) / 2
-                    total += gx[i] * data.y[i] * dxi
-                return total
+            weights = self._get_qstar_weights(data)
+            return np.sum(weights * np.asarray(data.y, dtype=float))
 
     def _get_qstar_uncertainty(self, data):
         """
@@ -570,31 +550,43 @@ class InvariantCalculator(object):
             # None instead
             if data.dy is None:
                 return None
-            dy = data.dy
-            # Take care of smeared data
-            if self._smeared is None:
-                gx = data.x * data.x
-            # assumes that len(x) == len(dxl).
-            else:
-                gx = data.dxl * data.x
-
-            n = len(data.x) - 1
-            #compute the first delta
-            dx0 = (data.x[1] - data.x[0]) / 2
-            #compute the last delta
-            dxn = (data.x[n] - data.x[n - 1]) / 2
-            total = 0
-            total += (gx[0] * dy[0] * dx0) ** 2
-            total += (gx[n] * dy[n] * dxn) ** 2
-            if len(data.x) == 2:
-                return math.sqrt(total)
-            else:
-                #iterate between for element different
-                #from the first and the last
-                for i in range(1, n - 1):
-                    dxi = (data.x[i + 1] - data.x[i - 1]) / 2
-                    total += (gx[i] * dy[i] * dxi) ** 2
-                return math.sqrt(total)
+            terms = self._get_qstar_weights(data) * np.asarray(data.dy, dtype=float)
+            return math.sqrt(np.sum(terms * terms))
+
+    def _get_qstar_weights(self, data):
+        """
+        Compute the integration weights g(x_i) * dx_i used for the invariant
+        and its uncertainty, so that both sums reduce to a single dot product.
+
+        g(x) = x**2 for pinhole data and g(x) = dxl * x for smeared data.
+        The bin widths are: ::
+
+            dx0 = (x1 - x0)/2
+            dxi = (xi+1 - xi-1)/2  for 0 < i < n-1
+            dxn = (xn - xn-1)/2
+
+        The point at n-1 is given a zero weight to remain consistent with
+        the historical loop-based implementation.
+
+        :param data: Data1D with at least two points
+        :return: array of weights, one per data point
+        """
+        x = np.asarray(data.x, dtype=float)
+        # Take care of smeared data
+        if self._smeared is None:
+            gx = x * x
+        # assumes that len(x) == len(dxl).
+        else:
+            gx = np.asarray(data.dxl, dtype=float) * x
+
+        n = len(x) - 1
+        dx = np.zeros(len(x))
+        # first and last delta q
+        dx[0] = (x[1] - x[0]) / 2
+        dx[n] = (x[n] - x[n - 1]) / 2
+        # elements different from the first and the last
+        dx[1:n - 1] = (x[2:n] - x[0:n - 2]) / 2
+        return gx * dx
 
     def _get_extrapolated_data(self, model, npts=INTEGRATION_NSTEPS,
                                q_start=Q_MINIMUM, q_end=Q_MAXIMUM):
@@ -650,6 +642,15 @@ class InvariantCalculator(object):
         # Distribution starting point
         self._low_q_limit = low_q_limit if low_q_limit else Q_MINIMUM
 
+        key = ('low', self._low_extrapolation_npts,
+               self._low_extrapolation_function.__class__.__name__,
+               self._low_extrapolation_power, qmin, qmax, self._low_q_limit)
+        cached = self._get_cached_extrapolation(
+            key, self._low_extrapolation_function)
+        if cached is not None:
+            self._low_extrapolation_power_fitted = cached[0]
+            return cached[1]
+
         # Extrapolate the low-Q data
         p, _ = self._fit(model=self._low_extrapolation_function,
                          qmin=qmin,
@@ -666,7 +667,10 @@ class InvariantCalculator(object):
         # may not be a Guinier or simple power law. The following is
         # a conservative estimation for the systematic error.
         err = qmin * qmin * math.fabs((qmin - self._low_q_limit) * (data.y[0] - data.y[INTEGRATION_NSTEPS - 1]))
-        return self._get_qstar(data), self._get_qstar_uncertainty(data) + err
+        result = self._get_qstar(data), self._get_qstar_uncertainty(data) + err
+        self._set_cached_extrapolation(key, self._low_extrapolation_function,
+                                       p[0], result)
+        return result
 
     def get_qstar_high(self, high_q_limit=None):
         """
@@ -689,6 +693,15 @@ class InvariantCalculator(object):
 
         high_q_limit = high_q_limit if high_q_limit else Q_MAXIMUM
 
+        key = ('high', self._high_extrapolation_npts,
+               self._high_extrapolation_function.__class__.__name__,
+               self._high_extrapolation_power, qmin, qmax, high_q_limit)
+        cached = self._get_cached_extrapolation(
+            key, self._high_extrapolation_function)
+        if cached is not None:
+            self._high_extrapolation_power_fitted = cached[0]
+            return cached[1]
+
         # fit the data with a model to get the appropriate parameters
         p, _ = self._fit(model=self._high_extrapolation_function,
                          qmin=qmin,
@@ -701,7 +714,37 @@ class InvariantCalculator(object):
             model=self._high_extrapolation_function,
             npts=INTEGRATION_NSTEPS, q_start=qmax, q_end=high_q_limit)
 
-        return self._get_qstar(data), self._get_qstar_uncertainty(data)
+        result = self._get_qstar(data), self._get_qstar_uncertainty(data)
+        self._set_cached_extrapolation(key, self._high_extrapolation_function,
+                                       p[0], result)
+        return result
+
+    def _get_cached_extrapolation(self, key, model):
+        """
+        Look up a memoised extrapolated contribution to the invariant.
+
+        On a hit, the fitted parameters are restored onto the extrapolation
+        model so that get_extra_data_low/high keep returning the curve that
+        matches the returned invariant.
+
+        :param key: tuple describing the extrapolation settings
+        :param model: Transform instance used for the extrapolation
+        :return: (fitted power, (q_star, dq_star)) or None
+        """
+        entry = self._extrapolation_cache.get(key)
+        if entry is None:
+            return None
+        model_state, power_fitted, result = entry
+        model.__dict__.update(model_state)
+        return power_fitted, result
+
+    def _set_cached_extrapolation(self, key, model, power_fitted, result):
+        """
+        Store an extrapolated contribution to the invariant together with
+        the fitted state of the extrapolation model.
+        """
+        self._extrapolation_cache[key] = (dict(model.__dict__),
+                                          power_fitted, result)
 
     def get_extra_data_low(self, npts_in=None, q_start=None, npts=20):
         """
@@ -1053,3 +1096,162 @@ class InvariantCalculator(object):
         #                 dcontrast)**2 / (4 * math.pi**2 * constrast**6))
    
         return s, ds
+
+    def get_batch(self, contrasts, porod_const=None, settings=None):
+        """
+        Compute Q*, the volume fraction and the specific surface for a sweep
+        over contrast values and extrapolation settings in one call.
+
+        The invariant of the data and of each extrapolation is computed once
+        per setting; the volume fraction and the specific surface are then
+        evaluated for all contrasts at once. Results that cannot be computed
+        for a given contrast (e.g. negative discriminant) are set to NaN
+        rather than raising.
+
+        Each extrapolation setting is a dict with optional 'low' and 'high'
+        entries. These are dicts holding the keyword arguments of
+        set_extrapolation (npts, function, power) and an optional 'q_limit'
+        passed on to get_qstar_low/get_qstar_high. A setting of None means
+        no extrapolation. ::
+
+            settings = [None,
+                        {'low': {'npts': 10, 'function': 'guinier'}},
+                        {'high': {'npts': 20, 'function': 'power_law',
+                                  'q_limit': 1.0}}]
+
+        The extrapolation parameters of the calculator are restored on exit.
+
+        :param contrasts: sequence of contrast values [1/A^2]
+        :param porod_const: Porod constant [1/(cm A^4)]; if None the specific
+            surface is not computed
+        :param settings: sequence of extrapolation settings
+
+        :return: list with one dict per setting, holding 'qstar',
+            'qstar_err' and arrays over contrasts for 'volume_fraction',
+            'volume_fraction_err' and 'surface'
+        """
+        if settings is None:
+            settings = [None]
+        contrasts = np.asarray(contrasts, dtype=float)
+
+        # The specific surface does not depend on the invariant
+        surface = None
+        if porod_const is not None:
+            with np.errstate(divide='ignore'):
+                surface = 1.0e-8 * porod_const / (2 * math.pi * contrasts ** 2)
+
+        saved_state = self._get_extrapolation_state()
+        try:
+            qstar_data = self._get_qstar(self._data)
+            qstar_data_err = self._get_qstar_uncertainty(self._data)
+            results = []
+            for setting in settings:
+                setting = setting or {}
+                qstar = qstar_data
+                err2 = qstar_data_err * qstar_data_err
+                for extrapolation_range in ('low', 'high'):
+                    if extrapolation_range not in setting:
+                        continue
+                    options = dict(setting[extrapolation_range])
+                    q_limit = options.pop('q_limit', None)
+                    default_function = 'guinier' if extrapolation_range == 'low' \
+                        else 'power_law'
+                    options.setdefault('function', default_function)
+                    self.set_extrapolation(extrapolation_range, **options)
+                    if extrapolation_range == 'low':
+                        qs, dqs = self.get_qstar_low(q_limit)
+                    else:
+                        qs, dqs = self.get_qstar_high(q_limit)
+                    qstar += qs
+                    err2 += dqs * dqs
+                qstar_err = math.sqrt(err2)
+                volume, volume_err = _get_volume_fraction_array(qstar, qstar_err,
+                                                                contrasts)
+                results.append({'qstar': qstar,
+                                'qstar_err': qstar_err,
+                                'volume_fraction': volume,
+                                'volume_fraction_err': volume_err,
+                                'surface': surface})
+        finally:
+            self._set_extrapolation_state(saved_state)
+        return results
+
+    def _get_extrapolation_state(self):
+        """
+        :return: a copy of the extrapolation parameters of the calculator
+        """
+        names = ['_low_extrapolation_npts', '_low_extrapolation_function',
+                 '_low_extrapolation_power', '_low_extrapolation_power_fitted',
+                 '_high_extrapolation_npts', '_high_extrapolation_function',
+                 '_high_extrapolation_power', '_high_extrapolation_power_fitted',
+                 '_low_q_limit']
+        return {name: getattr(self, name) for name in names}
+
+    def _set_extrapolation_state(self, state):
+        """
+        Restore extrapolation parameters saved with _get_extrapolation_state
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+def _get_volume_fraction_array(qstar, qstar_err, contrasts):
+    """
+    Vectorised equivalent of InvariantCalculator.get_volume_fraction_with_error
+    for a single invariant and an array of contrasts.
+
+    :return: volume fractions and their uncertainties; NaN where the volume
+        fraction cannot be computed
+    """
+    volume = np.full(contrasts.shape, np.nan)
+    uncertainty = np.full(contrasts.shape, np.nan)
+    if qstar <= 0:
+        return volume, uncertainty
+
+    valid = contrasts > 0
+    k = np.zeros(contrasts.shape)
+    k[valid] = 1.e-8 * qstar / (2 * (math.pi * contrasts[valid]) ** 2)
+    discrim = 1 - 4 * k
+    valid &= discrim >= 0
+    root = np.sqrt(np.where(valid, discrim, 0))
+    volume1 = 0.5 * (1 - root)
+    volume2 = 0.5 * (1 + root)
+    use1 = valid & (volume1 >= 0) & (volume1 <= 1)
+    use2 = valid & ~use1 & (volume2 >= 0) & (volume2 <= 1)
+    volume[use1] = volume1[use1]
+    volume[use2] = volume2[use2]
+
+    # Same convention as get_volume_fraction_with_error
+    computed = use1 | use2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        err = np.fabs((k * qstar_err) / (qstar * root))
+    err[computed & (1 - k * qstar <= 0)] = -1
+    uncertainty[computed] = err[computed]
+    return volume, uncertainty
+
+
+def get_batch(datasets, contrasts, porod_const=None, settings=None,
+              background=0, scale=1):
+    """
+    Compute Q*, volume fraction and specific surface for many data sets,
+    contrasts and extrapolation settings in one call.
+
+    See InvariantCalculator.get_batch for the format of the settings.
+
+    :param datasets: sequence of Data1D objects
+    :param contrasts: sequence of contrast values [1/A^2]
+    :param porod_const: Porod constant [1/(cm A^4)], or None
+    :param settings: sequence of extrapolation settings
+    :param background: background subtracted from every data set
+    :param scale: scale applied to every data set
+
+    :return: one list of results per data set, each holding one dict
+        per extrapolation setting
+    """
+    results = []
+    for data in datasets:
+        calculator = InvariantCalculator(data, background=background,
+                                         scale=scale)
+        results.append(calculator.get_batch(contrasts, porod_const=porod_const,
+                                            settings=settings))
+    return results
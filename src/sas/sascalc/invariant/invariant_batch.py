@@ -0,0 +1,159 @@
+"""
+Batch invariant analysis.
+
+Computes Q*, the volume fraction and the specific surface for a list of
+Data1D objects sharing the same background, scale, contrast and
+extrapolation settings. The data sets are distributed over a pool of
+worker processes, which makes it practical to reduce time-resolved series
+of thousands of frames to Q*(t), phi(t) and S(t).
+
+The settings are a dictionary: ::
+
+    settings = {'background': 0.0,
+                'scale': 1.0,
+                'contrast': 8.0e-6,
+                'porod_const': None,
+                'low': {'npts': 10, 'function': 'guinier', 'q_limit': 1e-5},
+                'high': {'npts': 10, 'function': 'power_law', 'power': 4}}
+
+'low' and 'high' are optional and use the format described in
+InvariantCalculator.get_batch.
+"""
+import math
+import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from sas.sascalc.invariant.invariant import InvariantCalculator
+
+logger = logging.getLogger(__name__)
+
+# Column headers of the results table, in display order
+TABLE_COLUMNS = ['Data', 'Q* [1/(cm A^3)]', 'Q* (Err)', 'Volume Fraction',
+                 'Volume Fraction (Err)', 'Specific Surface [1/A]', 'Error']
+
+# Keys of the result dictionaries matching TABLE_COLUMNS
+RESULT_KEYS = ['name', 'qstar', 'qstar_err', 'volume_fraction',
+               'volume_fraction_err', 'surface', 'error']
+
+
+def compute_invariant(data, settings):
+    """
+    Compute the invariant and derived quantities for a single data set.
+
+    This is the unit of work handed to the worker processes, so it must
+    remain a module level function.
+
+    :param data: Data1D object
+    :param settings: shared settings, see the module documentation
+
+    :return: dictionary with the keys listed in RESULT_KEYS. Quantities
+        that could not be computed are NaN and the reason is given in 'error'.
+    """
+    result = {'name': getattr(data, 'name', None) or getattr(data, 'filename', ''),
+              'qstar': math.nan, 'qstar_err': math.nan,
+              'volume_fraction': math.nan, 'volume_fraction_err': math.nan,
+              'surface': math.nan, 'error': ''}
+    try:
+        extrapolation = _get_extrapolation(data, settings)
+        calculator = InvariantCalculator(data,
+                                         background=settings.get('background', 0),
+                                         scale=settings.get('scale', 1))
+        output = calculator.get_batch([settings['contrast']],
+                                      porod_const=settings.get('porod_const'),
+                                      settings=[extrapolation])[0]
+    except Exception as ex:
+        result['error'] = str(ex)
+        return result
+
+    result['qstar'] = output['qstar']
+    result['qstar_err'] = output['qstar_err']
+    result['volume_fraction'] = float(output['volume_fraction'][0])
+    result['volume_fraction_err'] = float(output['volume_fraction_err'][0])
+    if output['surface'] is not None:
+        result['surface'] = float(output['surface'][0])
+    if math.isnan(result['volume_fraction']):
+        result['error'] = "Could not compute the volume fraction"
+    return result
+
+
+def _get_extrapolation(data, settings):
+    """
+    Build the extrapolation setting for a given data set. As in the
+    Invariant perspective, extrapolation limits that fall inside the
+    q-range of the data are ignored and the defaults are used instead.
+    """
+    extrapolation = {}
+    for key in ('low', 'high'):
+        if not settings.get(key):
+            continue
+        options = dict(settings[key])
+        q_limit = options.get('q_limit')
+        if q_limit is not None:
+            if (key == 'low' and q_limit > min(data.x)) or \
+                    (key == 'high' and q_limit < max(data.x)):
+                options['q_limit'] = None
+        extrapolation[key] = options
+    return extrapolation
+
+
+def _compute_chunk(datasets, settings):
+    """
+    Process a chunk of data sets in a worker.
+    """
+    return [compute_invariant(data, settings) for data in datasets]
+
+
+def compute_invariant_batch(datasets, settings, n_workers=None, chunk_size=None):
+    """
+    Compute the invariant for many data sets in parallel.
+
+    :param datasets: sequence of Data1D objects
+    :param settings: shared settings, see the module documentation
+    :param n_workers: number of worker processes. None or 0 uses one per
+        processor, 1 runs in the calling process.
+    :param chunk_size: number of data sets sent to a worker at a time.
+        Defaults to an even split in four chunks per worker.
+
+    :return: list of result dictionaries, in the order of the data sets
+    """
+    datasets = list(datasets)
+    if not n_workers:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, len(datasets))
+    if n_workers <= 1:
+        results = _compute_chunk(datasets, settings)
+    else:
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(len(datasets) / (4 * n_workers)))
+        chunks = [datasets[i:i + chunk_size]
+                  for i in range(0, len(datasets), chunk_size)]
+
+        # The batch is started from a worker thread of the GUI, where
+        # forking is unsafe, so the workers are spawned
+        results = []
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+            futures = [executor.submit(_compute_chunk, chunk, settings)
+                       for chunk in chunks]
+            for future in futures:
+                results.extend(future.result())
+
+    failed = sum(1 for result in results if result['error'])
+    if failed:
+        logger.warning("Invariant could not be computed for %d of %d data sets",
+                       failed, len(results))
+    return results
+
+
+def results_to_table(results):
+    """
+    Convert batch results to a {column header: [values]} dictionary,
+    the layout used by BatchOutputPanel.dataFromTable and writeBatchToFile.
+
+    :param results: list of result dictionaries
+    :return: dictionary of columns
+    """
+    return {column: [result[key] for result in results]
+            for column, key in zip(TABLE_COLUMNS, RESULT_KEYS)}
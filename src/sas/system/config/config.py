@@ -205,6 +205,20 @@ class Config(ConfigBase, metaclass=ConfigMeta):
         # Using Matplotlib Toolbar in Main Plotting Function
         self.USE_MATPLOTLIB_TOOLBAR = False
 
+        # If True, project archives are opened without reading the data and
+        # restoring the analyses up front: arrays are read when the data is
+        # used and analyses restored when the data is sent to a perspective
+        self.LAZY_PROJECT_LOADING = True
+
+        # Number of processes parsing data files when loading many files at
+        # once. 0 uses one per processor, 1 parses the files one at a time.
+        self.DATA_LOADING_WORKERS = 0
+
+        # Size of the cache of parsed data files in the user directory, in MB.
+        # Files loaded again are read from the cache unless modified. 0
+        # disables the cache.
+        self.DATA_CACHE_SIZE = 512
+
         # Default fitting optimizer
         self.FITTING_DEFAULT_OPTIMIZER = 'lm'
 
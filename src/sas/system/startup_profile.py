@@ -0,0 +1,180 @@
+"""
+Import time profile of the SasView startup.
+
+Started by *sasview --profile-startup*, the profile times the import of
+every module from the start of the command line interface until the main
+window is shown, and then prints the modules and packages taking the most
+time, together with the time at which each stage of the startup completed.
+
+Imports are timed by a finder placed first on sys.meta_path, which wraps
+the loader found by the other finders. The time of a module includes the
+modules it imports, its own time excludes them.
+"""
+import importlib.abc
+import sys
+import time
+from collections import defaultdict
+
+# Number of modules listed in the report
+TOP_MODULES = 25
+# Number of packages listed in the report
+TOP_PACKAGES = 15
+
+_profile = None
+
+
+class _Profile(object):
+    """
+    Import times and startup stages
+    """
+    def __init__(self):
+        self.start = time.perf_counter()
+        # Time of each module, including and excluding its imports
+        self.total = {}
+        self.own = {}
+        # Modules being imported, as [name, start time, time of imports]
+        self.stack = []
+        # Time of each stage, by name
+        self.stages = []
+
+    def enter(self, name):
+        self.stack.append([name, time.perf_counter(), 0.0])
+
+    def exit(self):
+        name, start, imports = self.stack.pop()
+        elapsed = time.perf_counter() - start
+        self.total[name] = self.total.get(name, 0.0) + elapsed
+        self.own[name] = self.own.get(name, 0.0) + elapsed - imports
+        if self.stack:
+            self.stack[-1][2] += elapsed
+
+
+class _TimedLoader(object):
+    """
+    Loader timing the creation and execution of a module
+    """
+    def __init__(self, loader, profile):
+        self._loader = loader
+        self._profile = profile
+
+    def create_module(self, spec):
+        # Extension modules do their work here
+        self._profile.enter(spec.name)
+        try:
+            return self._loader.create_module(spec)
+        finally:
+            self._profile.exit()
+
+    def exec_module(self, module):
+        self._profile.enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profile.exit()
+            # Code checking the type of the loader sees the original one
+            if getattr(module, '__loader__', None) is self:
+                module.__loader__ = self._loader
+            spec = getattr(module, '__spec__', None)
+            if spec is not None and spec.loader is self:
+                spec.loader = self._loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """
+    Finder wrapping the loaders found by the other finders in _TimedLoader
+    """
+    def __init__(self, profile):
+        self._profile = profile
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        if loader is not None and hasattr(loader, 'exec_module') and hasattr(loader, 'create_module'):
+            spec.loader = _TimedLoader(loader, self._profile)
+        return spec
+
+
+def start():
+    """
+    Start timing the imports
+    """
+    global _profile
+    if _profile is not None:
+        return
+    _profile = _Profile()
+    sys.meta_path.insert(0, _TimingFinder(_profile))
+
+
+def stop():
+    """
+    Stop timing the imports, keeping the times for the report
+    """
+    sys.meta_path[:] = [finder for finder in sys.meta_path if not isinstance(finder, _TimingFinder)]
+
+
+def is_running():
+    """
+    Check whether the startup is being profiled
+    """
+    return _profile is not None and any(isinstance(finder, _TimingFinder) for finder in sys.meta_path)
+
+
+def stage(name):
+    """
+    Record the completion of a stage of the startup
+    """
+    if is_running():
+        _profile.stages.append((name, time.perf_counter() - _profile.start))
+
+
+def report():
+    """
+    Text of the profile
+    """
+    if _profile is None:
+        return "Startup was not profiled"
+    elapsed = time.perf_counter() - _profile.start
+    imports = sum(_profile.own.values())
+    lines = ["SasView startup profile",
+             "%d modules imported in %.2f s, of %.2f s since start" % (len(_profile.own), imports, elapsed),
+             ""]
+
+    if _profile.stages:
+        lines.append("Stage                                       Time (s)")
+        for name, at in _profile.stages:
+            lines.append("%-40s %11.3f" % (name, at))
+        lines.append("")
+
+    packages = defaultdict(float)
+    for name, own in _profile.own.items():
+        packages[name.split('.')[0]] += own
+    lines.append("Package                                 Import (s)")
+    for name, own in sorted(packages.items(), key=lambda item: -item[1])[:TOP_PACKAGES]:
+        lines.append("%-40s %11.3f" % (name, own))
+    lines.append("")
+
+    lines.append("Module                                                 Total (s)    Self (s)")
+    for name, total in sorted(_profile.total.items(), key=lambda item: -item[1])[:TOP_MODULES]:
+        lines.append("%-52s %12.3f %11.3f" % (name, total, _profile.own[name]))
+    return "\n".join(lines)
+
+
+def finish(stream=None):
+    """
+    Complete the profile and print its report, if the startup is profiled
+    """
+    if not is_running():
+        return
+    stage("Main window shown")
+    stop()
+    print(report(), file=stream if stream is not None else sys.stderr)
@@ -0,0 +1,168 @@
+"""
+Queue of fits, run by a pool of worker threads.
+
+The start view saves a fit with the QUEUED status and returns at once. The
+database is the queue: a worker claims the oldest queued fit by changing
+its status from QUEUED to RUNNING, which succeeds for a single worker, so
+that several server processes can share the queue. Fits queued by another
+process, or before the server restarted, are found by the workers polling
+the database.
+
+The status and results of a fit are read from its database entry while it
+is queued or running. A worker running a fit updates its heartbeat
+regularly, and fits left RUNNING with an old heartbeat by a worker which
+crashed or was killed are queued again when a worker starts.
+"""
+import threading
+from datetime import timedelta
+from logging import getLogger
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from ..models import AnalysisBase
+from .models import Fit
+
+jobs_logger = getLogger(__name__)
+
+# Seconds between polls of the database for fits queued by other processes
+POLL_INTERVAL = 5.0
+# Seconds between updates of the heartbeat of a running fit
+HEARTBEAT_INTERVAL = 30.0
+# Seconds without heartbeat after which a running fit is queued again
+STALE_AFTER = 5 * HEARTBEAT_INTERVAL
+
+
+class FitQueue:
+    """
+    Run the queued fits, in the order they were received
+    """
+    def __init__(self, run, n_workers=None):
+        """
+        run: function taking a Fit and returning its results
+        n_workers: number of worker threads, defaults to settings.FIT_WORKERS.
+        With none, fits are only run by run_pending.
+        """
+        self.run = run
+        self.n_workers = n_workers
+        self._workers = []
+        self._lock = threading.Lock()
+        # Released once per submitted fit, to wake a worker
+        self._pending = threading.Semaphore(0)
+
+    def start(self):
+        """
+        Start the workers if they are not running
+        """
+        n_workers = self.n_workers
+        if n_workers is None:
+            n_workers = getattr(settings, "FIT_WORKERS", 1)
+        with self._lock:
+            while len(self._workers) < n_workers:
+                worker = threading.Thread(target=self._work, name=f"fit-worker-{len(self._workers)}",
+                                          daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def submit(self, fit_db):
+        """
+        Queue the fit, saved with the QUEUED status, and wake a worker
+        """
+        self.start()
+        self._pending.release()
+        jobs_logger.info(f"Fit {fit_db.id} queued")
+
+    def claim(self):
+        """
+        Oldest queued fit, now RUNNING, or None if no fit is queued
+        """
+        queued = Fit.objects.filter(status=Fit.StatusChoices.QUEUED).order_by("time_recieved", "id")
+        while True:
+            fit_id = queued.values_list("id", flat=True).first()
+            if fit_id is None:
+                return None
+            # A single conditional UPDATE of the table holding the status
+            now = timezone.now()
+            claimed = AnalysisBase.objects.filter(id=fit_id, status=Fit.StatusChoices.QUEUED).update(
+                status=Fit.StatusChoices.RUNNING, time_started=now, time_heartbeat=now)
+            if claimed:
+                return Fit.objects.get(id=fit_id)
+            # Claimed by another worker first
+
+    def requeue_stale(self):
+        """
+        Queue again the RUNNING fits whose heartbeat is older than
+        STALE_AFTER, left by a worker which stopped. Returns their number.
+        """
+        cutoff = timezone.now() - timedelta(seconds=STALE_AFTER)
+        stale = AnalysisBase.objects.filter(status=Fit.StatusChoices.RUNNING).filter(
+            Q(time_heartbeat__lt=cutoff) | Q(time_heartbeat__isnull=True))
+        count = stale.update(status=Fit.StatusChoices.QUEUED, time_started=None, time_heartbeat=None)
+        if count:
+            jobs_logger.warning(f"{count} stale running fits queued again")
+        return count
+
+    def execute(self, fit_db):
+        """
+        Run the fit and store its results, or the error raised, see Fit.save_results
+        """
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(fit_db.id, stop_heartbeat),
+                                     name=f"fit-heartbeat-{fit_db.id}", daemon=True)
+        heartbeat.start()
+        try:
+            result = self.run(fit_db)
+            fit_db.save_results(result)
+            error = None
+        except Exception as e:
+            jobs_logger.exception(f"Fit {fit_db.id} failed")
+            result = None
+            error = str(e)
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+        Fit.objects.filter(id=fit_db.id).update(
+            results=error, analysis_success=error is None,
+            status=Fit.StatusChoices.COMPLETE, time_complete=timezone.now())
+        return result
+
+    def run_pending(self):
+        """
+        Run the queued fits in the calling thread until none is left.
+        Returns the number of fits run.
+        """
+        count = 0
+        while (fit_db := self.claim()) is not None:
+            self.execute(fit_db)
+            count += 1
+        return count
+
+    def _heartbeat(self, fit_id, stop):
+        """
+        Update the heartbeat of the running fit until stop is set
+        """
+        try:
+            while not stop.wait(HEARTBEAT_INTERVAL):
+                AnalysisBase.objects.filter(id=fit_id, status=Fit.StatusChoices.RUNNING).update(
+                    time_heartbeat=timezone.now())
+        except Exception:
+            jobs_logger.exception(f"Fit {fit_id} heartbeat error")
+        finally:
+            close_old_connections()
+
+    def _work(self):
+        try:
+            self.requeue_stale()
+        except Exception:
+            jobs_logger.exception("Fit worker error")
+        while True:
+            self._pending.acquire(timeout=POLL_INTERVAL)
+            try:
+                self.run_pending()
+            except Exception:
+                jobs_logger.exception("Fit worker error")
+            finally:
+                # The thread keeps its connection between fits otherwise
+                close_old_connections()
@@ -0,0 +1,19 @@
+# Status moves to AnalysisBase, see analyze 0002_analysisbase_status. The field is
+# renamed first so that it does not clash with the field of the base class.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fitting', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='fit',
+            old_name='status',
+            new_name='fit_status',
+        ),
+    ]
@@ -0,0 +1,61 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def copy_status(apps, schema_editor):
+    Fit = apps.get_model('fitting', 'Fit')
+    for fit in Fit.objects.all():
+        fit.status = fit.fit_status
+        fit.save(update_fields=['status'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyze', '0002_analysisbase_status'),
+        ('fitting', '0002_rename_fit_status'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_status, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='fit',
+            name='fit_status',
+        ),
+        migrations.AddField(
+            model_name='fit',
+            name='chisq',
+            field=models.FloatField(blank=True, help_text='reduced chi squared of the fit', null=True),
+        ),
+        migrations.CreateModel(
+            name='FitParameterResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Parameter Name', max_length=100)),
+                ('value', models.FloatField(blank=True, help_text='value at the end of the fit', null=True)),
+                ('uncertainty', models.FloatField(blank=True, help_text='uncertainty of a fitted value', null=True)),
+                ('fitted', models.BooleanField(default=False, help_text='was the parameter fitted?')),
+                ('fit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='parameter_results', to='fitting.fit')),
+                ('parameter', models.ForeignKey(blank=True, help_text='parameter given in the request, if any', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='results', to='fitting.fitparameter')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FitArray',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='q, data, theory or residuals', max_length=50)),
+                ('dtype', models.CharField(help_text='little-endian numpy type of the content', max_length=20)),
+                ('shape', models.JSONField(default=list, help_text='shape of the array')),
+                ('content', models.BinaryField(help_text='raw content of the array')),
+                ('fit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='arrays', to='fitting.fit')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='fitparameterresult',
+            constraint=models.UniqueConstraint(fields=('fit', 'name'), name='unique_fit_parameter_result'),
+        ),
+        migrations.AddConstraint(
+            model_name='fitarray',
+            constraint=models.UniqueConstraint(fields=('fit', 'name'), name='unique_fit_array'),
+        ),
+    ]
@@ -1,23 +1,21 @@
 from logging import getLogger
 
-from django.db import models
+import numpy as np
+from django.db import models, transaction
 
 from ..models import AnalysisBase, AnalysisParameterBase
 
 models_logger = getLogger(__name__)
 
 class Fit(AnalysisBase):
+    #error of a failed fit, the results are stored in FitParameterResult and FitArray
     results = models.CharField(max_length=1000000, blank=True, 
                                null=True, help_text="the string result")
     results_trace = [
     ]
 
-    class StatusChoices(models.IntegerChoices):
-        QUEUED = 1, "Queued"
-        RUNNING = 2, "Running"
-        COMPLETE = 3, "Complete"
-
-    status = models.IntegerField(default=StatusChoices.QUEUED, choices=StatusChoices.choices)
+    chisq = models.FloatField(blank=True, null=True,
+                              help_text="reduced chi squared of the fit")
 
     q_minimum = models.FloatField(default=0.0005, null=True, 
                                  blank=True, help_text="Minimum Q value for the fit")
@@ -36,6 +34,26 @@ class Fit(AnalysisBase):
     optimizer = models.CharField(blank=True, max_length=50, 
                                  help_text="optimizer string")
 
+    def save_results(self, result):
+        """
+        Replace the stored results by result, a dictionary of
+        "chisq": reduced chi squared or None,
+        "parameters": {name: (value, uncertainty or None, fitted)},
+        "arrays": {name: array}
+        """
+        parameters = {x.name: x for x in FitParameter.objects.filter(base_id=self.pk)}
+        with transaction.atomic():
+            self.parameter_results.all().delete()
+            self.arrays.all().delete()
+            FitParameterResult.objects.bulk_create([
+                FitParameterResult(fit=self, parameter=parameters.get(name), name=name,
+                                   value=value, uncertainty=uncertainty, fitted=fitted)
+                for name, (value, uncertainty, fitted) in result["parameters"].items()])
+            FitArray.objects.bulk_create([
+                FitArray.from_array(self, name, array) for name, array in result["arrays"].items()])
+            self.chisq = result["chisq"]
+            self.save(update_fields=["chisq"])
+
 
 class FitParameter(AnalysisParameterBase):
     polydisperse = models.BooleanField(default=False, 
@@ -43,3 +61,51 @@ class FitParameter(AnalysisParameterBase):
 
     magnetic = models.BooleanField(default=False, 
                                    help_text="is this a magnetic parameter?")
+
+
+class FitParameterResult(models.Model):
+    fit = models.ForeignKey(Fit, related_name="parameter_results",
+                            on_delete=models.CASCADE)
+
+    parameter = models.ForeignKey(FitParameter, blank=True, null=True, related_name="results",
+                                  on_delete=models.SET_NULL, help_text="parameter given in the request, if any")
+
+    name = models.CharField(max_length=100, help_text="Parameter Name")
+
+    value = models.FloatField(blank=True, null=True, help_text="value at the end of the fit")
+
+    uncertainty = models.FloatField(blank=True, null=True, help_text="uncertainty of a fitted value")
+
+    fitted = models.BooleanField(default=False, help_text="was the parameter fitted?")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["fit", "name"], name="unique_fit_parameter_result"),
+        ]
+
+
+class FitArray(models.Model):
+    fit = models.ForeignKey(Fit, related_name="arrays", on_delete=models.CASCADE)
+
+    name = models.CharField(max_length=50, help_text="q, data, theory or residuals")
+
+    dtype = models.CharField(max_length=20, help_text="little-endian numpy type of the content")
+
+    shape = models.JSONField(default=list, help_text="shape of the array")
+
+    content = models.BinaryField(help_text="raw content of the array")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["fit", "name"], name="unique_fit_array"),
+        ]
+
+    @classmethod
+    def from_array(cls, fit, name, array):
+        array = np.asarray(array)
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+        return cls(fit=fit, name=name, dtype=array.dtype.str, shape=list(array.shape),
+                   content=array.tobytes())
+
+    def array(self):
+        return np.frombuffer(bytes(self.content), dtype=self.dtype).reshape(self.shape)
@@ -1,11 +1,13 @@
 # Create your tests here.
 import shutil
 import json
+from datetime import timedelta
 
 from django.conf import settings
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIRequestFactory, APIClient, force_authenticate, APITestCase
 
@@ -18,7 +20,9 @@ from .models import (
     Fit,
     FitParameter
 )
+from .jobs import STALE_AFTER
 from .views import (
+    fit_queue,
     start,
     start_fit,
 )
@@ -58,6 +62,8 @@ class TestLists(APITestCase):
         self.assertEqual(request.data, {"optimizers": [['amoeba', 'de', 'dream', 'newton', 'scipy.leastsq', 'lm']]})
 
 
+#fits are run by calling fit_queue.run_pending() in the tests
+@override_settings(FIT_WORKERS=0)
 class TestFitStart(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(username="testUser", password="secret", id = 1)
@@ -128,7 +134,48 @@ class TestFitStart(TestCase):
             ]
         }
         request = self.client.post('/v1/analyze/fit/', data=json.dumps(data), content_type="application/json")
-        self.assertEqual(request.data,{'authenticated': True, 'fit_id': 1, 'results': '0.03(13)'})
+        self.assertEqual(request.data,{'authenticated': True, 'fit_id': 1, 'status': Fit.StatusChoices.QUEUED})
+        request = self.client.get('/v1/analyze/fit/1/results/')
+        self.assertEqual(request.data, {'status': Fit.StatusChoices.QUEUED, 'results': None})
+
+        self.assertEqual(fit_queue.run_pending(), 1)
+        fit_db = Fit.objects.get(id = 1)
+        self.assertEqual(fit_db.status, Fit.StatusChoices.COMPLETE)
+        self.assertTrue(fit_db.analysis_success)
+        self.assertLessEqual(fit_db.time_recieved, fit_db.time_started)
+        self.assertLessEqual(fit_db.time_started, fit_db.time_complete)
+        request = self.client.get('/v1/analyze/fit/1/status/')
+        self.assertEqual(request.data["status_name"], "Complete")
+
+        request = self.client.get('/v1/analyze/fit/1/results/')
+        results = request.data["results"]
+        self.assertTrue(results["parameters"]["radius"]["fitted"])
+        self.assertIsNotNone(results["parameters"]["radius"]["uncertainty"])
+        self.assertFalse(results["parameters"]["sld"]["fitted"])
+        self.assertEqual(set(results["arrays"]), {"q", "data", "theory", "residuals"})
+        self.assertEqual(fit_db.parameter_results.get(name = "radius").parameter.name, "radius")
+        request = self.client.get('/v1/analyze/fit/1/results/theory/')
+        self.assertEqual(len(request.data["values"]), len(fit_db.arrays.get(name = "q").array()))
+
+    def test_queue_order(self):
+        first = Fit.objects.create(model = "sphere", data_id = self.public_test_data)
+        second = Fit.objects.create(model = "cylinder", data_id = self.public_test_data)
+        self.assertEqual(fit_queue.claim().id, first.id)
+        self.assertEqual(fit_queue.claim().id, second.id)
+        self.assertIsNone(fit_queue.claim())
+        self.assertEqual(Fit.objects.get(id = first.id).status, Fit.StatusChoices.RUNNING)
+
+    def test_requeue_stale(self):
+        stale = Fit.objects.create(model = "sphere", data_id = self.public_test_data)
+        running = Fit.objects.create(model = "cylinder", data_id = self.public_test_data)
+        self.assertEqual(fit_queue.claim().id, stale.id)
+        self.assertEqual(fit_queue.claim().id, running.id)
+        Fit.objects.filter(id = stale.id).update(
+            time_heartbeat = timezone.now() - timedelta(seconds = STALE_AFTER + 1))
+        self.assertEqual(fit_queue.requeue_stale(), 1)
+        self.assertEqual(Fit.objects.get(id = stale.id).status, Fit.StatusChoices.QUEUED)
+        self.assertEqual(Fit.objects.get(id = running.id).status, Fit.StatusChoices.RUNNING)
+        self.assertEqual(fit_queue.claim().id, stale.id)
 
     def tearDown(self):
         shutil.rmtree(settings.MEDIA_ROOT)
@@ -13,6 +13,7 @@ info_patterns = [
     #path("parameter_history/"),
     #TODO allow user to find specific parts of results
     path("results/", views.view_results, name = "current results"),
+    path("results/<str:name>/", views.view_result_array, name = "result array"),
     #TODO impliment results trace
     #path("results_history/")
 ]
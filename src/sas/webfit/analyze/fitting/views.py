@@ -10,8 +10,8 @@ from bumps.names import *
 from bumps import fitters
 from bumps.formatnum import format_uncertainty
 from sasdata.dataloader.loader import Loader
-from sasmodels.core import load_model, load_model_info, list_models
-from sasmodels.data import load_data, empty_data1D, empty_data2D, empty_sesans
+from sasmodels.core import list_models
+from sasmodels.data import empty_data1D, empty_data2D, empty_sesans
 from sasmodels.bumps_model import Model, Experiment
 from sasmodels.direct_model import DirectModel
 from sas.sascalc.fit.models import ModelManager
@@ -19,14 +19,17 @@ from sas.sascalc.fit.models import ModelManager
 #TODO categoryinstallers should belong in SasView.Systen rather than in QTGUI
 from sas.qtgui.Utilities.CategoryInstaller import CategoryInstaller
 
+from caches import get_data, get_model
 from serializers import (
     FitSerializer,
     FitParameterSerializer,
 )
 from .models import (
     Fit,
+    FitArray,
     FitParameter,
 )
+from .jobs import FitQueue
 
 
 fit_logger = getLogger(__name__)
@@ -34,7 +37,7 @@ model_manager = ModelManager()
 #TODO add view that gets previous fit results
 #TODO finish view for get status
 
-#start() only puts all the request data into the db, start_fit() runs calculations
+#start() only puts all the request data into the db and queues the fit, start_fit() runs calculations
 """
 Documentation for user input: User input should look like this:
 {
@@ -67,7 +70,7 @@ def start(request, version = None):
         
         fit_db = get_object_or_404(Fit, id = base_serializer.data["id"])
 
-        if not load_model(fit_db.model.lower()):
+        if not get_model(fit_db.model.lower()):
             fit_db.delete()
             return HttpResponseBadRequest("No model selected for fitting")
 
@@ -89,37 +92,35 @@ def start(request, version = None):
                     parameter_serializer.save()
                 all_param_dbs.append(get_object_or_404(FitParameter, base_id = fit_db.id, name = x["name"]))
 
-        #TODO move below data to created queuing function
-        result = start_fit(fit_db)
-        
-        #TODO result_serializer should actually be formatted to save result.model.state() in parameter database, 
+        #the fit is run by a worker, its progress is polled with status() and view_results()
+        #TODO results should be formatted to save result.model.state() in parameter database,
         #with parameter name like "name = 'fit_radius'"
-        result_serializer = FitSerializer(fit_db, data = {"results": str(result), "status":3}, partial=True)
-        if result_serializer.is_valid():
-            result_serializer.save()
-        else:
-            return Response(result_serializer.errors)
-        fit_db = get_object_or_404(Fit, id = result_serializer.data["id"])
-        
+        fit_queue.submit(fit_db)
+
         #add "warnings": ... later
-        return Response({"authenticated":request.user.is_authenticated, "fit_id":fit_db.id, "results":result})
+        return Response({"authenticated":request.user.is_authenticated, "fit_id":fit_db.id,
+                         "status":Fit.StatusChoices.QUEUED})
 
     return HttpResponseBadRequest()
 
 
 def start_fit(fit_db):
-    #fit_db.status = 2
-    current_model = load_model(fit_db.model.lower())
+    current_model = get_model(fit_db.model.lower())
 
     pars, par_limits = get_parameters(fit_db.id)
 
     q_min = np.log10(fit_db.q_minimum)
     q_max = np.log10(fit_db.q_maximum)
     #TODO figure out how to set qmin/qmax for normal Data1D
-    test_data = load_data(fit_db.data_id.file.path) if fit_db.data_id else empty_data1D(np.logspace(q_min, q_max, 10000))
+    test_data = get_data(fit_db.data_id) if fit_db.data_id else empty_data1D(np.logspace(q_min, q_max, 10000))
     if not par_limits or test_data.y is None:
         model = DirectModel(test_data, current_model)
-        result = model(**pars)
+        theory = model(**pars)
+        result = {
+            "chisq": None,
+            "parameters": {name: (value, None, False) for name, value in pars.items()},
+            "arrays": {"q": test_data.x, "theory": theory},
+        }
     else:
         model = Model(current_model, **pars)
         if par_limits:
@@ -146,17 +147,27 @@ def start_fit(fit_db):
             fitted = fit(problem, method=fit_db.optimizer)
         else:
             fitted = fit(problem)
-        #TODO results to be formatted differently later
-        result = M.__getstate__()
-        result['_data'] = test_data.__str__()
-        result['_model'] = fit_db.model
-        result['_resolution'] = str(M.resolution.q) + ', ' + str(M.resolution.q_calc)
-        result['model'] = model.state()
-        result["parameter_limits"] = str(model.length.bounds.limits)
-        result["old_parameters"] = pars
+        #uncertainties of the fitted parameters, saved as FitParameterResult rows
+        uncertainties = dict(zip(problem.labels(), fitted.dx if fitted.dx is not None else []))
+        parameters = {name: (value, uncertainties.get(name), name in uncertainties)
+                      for name, value in model.state().items() if isinstance(value, (int, float))}
+        #fitted points, saved as FitArray blobs
+        if hasattr(test_data, "err_data"):
+            q, data = test_data.q_data[M.index], test_data.data[M.index]
+        else:
+            q, data = test_data.x[M.index], test_data.y[M.index]
+        result = {
+            "chisq": problem.chisq(),
+            "parameters": parameters,
+            "arrays": {"q": q, "data": data, "theory": M.theory(), "residuals": M.residuals()},
+        }
     return result
 
 
+#runs the queued fits
+fit_queue = FitQueue(run=start_fit)
+
+
 def get_parameters(fit_id):
     #what this returns
     """
@@ -171,7 +182,7 @@ def get_parameters(fit_id):
     pars = {}
     par_limits = {}
     fit_db = get_object_or_404(Fit, id = fit_id)
-    default_parameters = load_model_info(fit_db.model.lower()).parameters.defaults
+    default_parameters = get_model(fit_db.model.lower()).info.parameters.defaults
     if fit_db.analysisparameterbase_set.all():
         for x in fit_db.analysisparameterbase_set.all():
             #TODO add check if x.name is a valid parameter else return HTTPBadRequest
@@ -181,12 +192,37 @@ def get_parameters(fit_id):
     return pars, par_limits
 
 
+def format_results(fit_obj):
+    #results are empty until the fit is complete, arrays are listed by name and read with view_result_array()
+    if fit_obj.status != Fit.StatusChoices.COMPLETE:
+        return None
+    if not fit_obj.analysis_success:
+        return {"error":fit_obj.results}
+    parameters = {}
+    for x in fit_obj.parameter_results.all():
+        parameters[x.name] = {"value":x.value, "uncertainty":x.uncertainty, "fitted":x.fitted}
+    arrays = list(fit_obj.arrays.values_list("name", flat=True))
+    return {"chisq":fit_obj.chisq, "parameters":parameters, "arrays":arrays}
+
+
 @api_view(['GET'])
 def view_results(request, fit_id, version=None):
     if request.method == 'GET':
         fit_obj = get_object_or_404(Fit, id = fit_id)
-        #results = json.loads(fit_obj.results)
-        return Response({"results":fit_obj.results})
+        if not (fit_obj.is_public or request.user.is_authenticated):
+            return HttpResponseForbidden("user is not logged in")
+        return Response({"status":fit_obj.status, "results":format_results(fit_obj)})
+    return HttpResponseBadRequest()
+
+
+@api_view(['GET'])
+def view_result_array(request, fit_id, name, version=None):
+    if request.method == 'GET':
+        fit_obj = get_object_or_404(Fit, id = fit_id)
+        if not (fit_obj.is_public or request.user.is_authenticated):
+            return HttpResponseForbidden("user is not logged in")
+        array_obj = get_object_or_404(FitArray, fit = fit_obj, name = name)
+        return Response({"name":name, "values":array_obj.array().tolist()})
     return HttpResponseBadRequest()
 
 
@@ -195,14 +231,22 @@ def status(request, fit_id = None, version = None):
     if request.method == "GET":
         #TODO figure out private later <- probs write in Fit model
         return_info = {}
+        #fits queued while no worker was running are picked up once polled
+        fit_queue.start()
         if fit_id:
             fit_obj = get_object_or_404(Fit, id = fit_id)
             if fit_obj.is_public or request.user.is_authenticated:
-                return_info = {"fit_id" : fit_id, "status" : fit_obj.status}
+                return_info = {"fit_id" : fit_id, "status" : fit_obj.status,
+                               "status_name" : fit_obj.get_status_display(),
+                               "time_recieved" : fit_obj.time_recieved,
+                               "time_started" : fit_obj.time_started,
+                               "time_complete" : fit_obj.time_complete,
+                               "success" : fit_obj.analysis_success}
         elif request.user.is_authenticated:
-            fit_obj = Fit.objects.filter(current_user = request.user)
-            for x in fit_obj:
-                return_info[x.id] = x.status
+            #served by the (current_user, status) index
+            fit_obj = Fit.objects.filter(current_user = request.user).values_list("id", "status")
+            for fit_id, fit_status in fit_obj:
+                return_info[fit_id] = fit_status
         return Response(return_info)
     return HttpResponseBadRequest()
 
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyze', '0001_initial'),
+        ('fitting', '0002_rename_fit_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysisbase',
+            name='status',
+            field=models.IntegerField(choices=[(1, 'Queued'), (2, 'Running'), (3, 'Complete')], default=1),
+        ),
+        migrations.AddIndex(
+            model_name='analysisbase',
+            index=models.Index(fields=['current_user', 'status'], name='analysis_user_status_idx'),
+        ),
+    ]
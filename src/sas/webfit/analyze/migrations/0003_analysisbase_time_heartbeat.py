@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyze', '0002_analysisbase_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysisbase',
+            name='time_heartbeat',
+            field=models.DateTimeField(blank=True, help_text='analysis last reported running', null=True),
+        ),
+    ]
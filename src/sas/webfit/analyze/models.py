@@ -27,6 +27,8 @@ class AnalysisBase(models.Model):
                                         null=True, help_text="analysis initiated")
     time_complete = models.DateTimeField(auto_now=False, blank=True, 
                                         null=True, help_text="analysis stopped")
+    time_heartbeat = models.DateTimeField(auto_now=False, blank=True, 
+                                          null=True, help_text="analysis last reported running")
 
     #write a func in analysis.views to check if fit status is complete
     analysis_success = models.BooleanField(default=False, 
@@ -36,6 +38,18 @@ class AnalysisBase(models.Model):
     is_public = models.BooleanField(default=False, 
                                     help_text="does the user want their data to be public")
 
+    class StatusChoices(models.IntegerChoices):
+        QUEUED = 1, "Queued"
+        RUNNING = 2, "Running"
+        COMPLETE = 3, "Complete"
+
+    status = models.IntegerField(default=StatusChoices.QUEUED, choices=StatusChoices.choices)
+
+    class Meta:
+        indexes = [
+            #listing of the analyses of a user by status
+            models.Index(fields=["current_user", "status"], name="analysis_user_status_idx"),
+        ]
     
 class AnalysisParameterBase(models.Model):
     base_id = models.ForeignKey(AnalysisBase, default=None, 
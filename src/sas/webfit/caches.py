@@ -0,0 +1,67 @@
+"""
+Process-level caches shared by the webfit requests.
+
+Compiled sasmodels kernels are kept by model name and precision, and
+parsed data files by Data id and file modification time, so that repeated
+fits of the same model to the same data neither compile the model nor
+parse the file again. Both caches are bounded and drop their least
+recently used entries first. Data entries are dropped when the file of a
+Data entry is replaced, see upload().
+"""
+import copy
+import os
+from logging import getLogger
+
+from django.conf import settings
+from sasdata.dataloader.loader import Loader
+from sasmodels.core import load_model
+from sasmodels.data import load_data
+
+from sas.sascalc.data_util.data_cache import DataCache
+from sas.sascalc.data_util.lru_cache import LRUCache
+
+caches_logger = getLogger(__name__)
+
+
+#compiled kernels, by (model name, dtype)
+model_cache = LRUCache(getattr(settings, "MODEL_CACHE_SIZE", 32))
+#parsed data, by (Data id, file modification time, loader)
+data_cache = LRUCache(getattr(settings, "DATA_CACHE_SIZE", 64))
+#parsed data files stored on disk, shared by the server processes
+file_cache = DataCache()
+
+
+def get_model(name, dtype=None):
+    """
+    Compiled sasmodels kernel of the model, see sasmodels.core.load_model
+    """
+    return model_cache.get((name, dtype), lambda: load_model(name, dtype=dtype))
+
+
+def _data_key(data_db, loader):
+    return (data_db.id, os.stat(data_db.file.path).st_mtime_ns, loader)
+
+
+def get_data(data_db):
+    """
+    Data of the Data entry as loaded by sasmodels.data.load_data, for fitting.
+    Returns a copy, which the fit can change.
+    """
+    data = data_cache.get(_data_key(data_db, "sasmodels"), lambda: load_data(data_db.file.path))
+    return copy.deepcopy(data)
+
+
+def get_data_list(data_db):
+    """
+    List of data objects of the Data entry as loaded by the sasdata Loader.
+    The objects are shared by the requests and must not be changed.
+    """
+    path = data_db.file.path
+    return data_cache.get(_data_key(data_db, "sasdata"), lambda: file_cache.load(path, Loader()))
+
+
+def invalidate_data(data_id):
+    """
+    Drop the cached data of the Data entry, when its file is replaced
+    """
+    data_cache.discard(lambda key: key[0] == data_id)
@@ -10,6 +10,7 @@ from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.test import APIClient, force_authenticate, APITestCase
 
+from caches import data_cache, get_data, get_data_list
 from .models import Data
 from .views import (
     list_data,
@@ -98,6 +99,20 @@ class TestingDatabase(APITestCase):
         self.assertEqual(request2.status_code, status.HTTP_403_FORBIDDEN)
         Data.objects.get(id = 2).delete()
 
+    def test_is_data_cached(self):
+        data_cache.clear()
+        first = get_data_list(self.data)
+        self.assertIs(get_data_list(self.data), first)
+        #fits get their own copy
+        fit_data = get_data(self.data)
+        self.assertIsNot(get_data(self.data), fit_data)
+        self.assertEqual(len(data_cache), 2)
+
+        file = open(find("cyl_400_40.txt"))
+        self.client.put('/v1/data/upload/2/', data = {"file":file, "is_public":False})
+        self.assertEqual(len(data_cache), 0)
+        Data.objects.get(id = 2).delete()
+
     #TODO write tests for download
     '''
     def test_does_download(self):
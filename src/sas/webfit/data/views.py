@@ -9,7 +9,7 @@ from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 
-from sasdata.dataloader.loader import Loader
+from caches import get_data_list, invalidate_data
 from serializers import DataSerializer
 from .models import Data
 from .forms import DataForm
@@ -40,15 +40,14 @@ def list_data(request, username = None, version = None):
 @api_view(['GET'])
 def data_info(request, db_id, version = None):
     if request.method == 'GET':
-        loader = Loader()
         data_db = get_object_or_404(Data, id = db_id)
         if data_db.is_public:
-            data_list= loader.load(data_db.file.path)
+            data_list = get_data_list(data_db)
             contents = [str(data) for data in data_list]
             return_data = {data_db.file_name:contents}
         #rewrite with "user.is_authenticated"
         elif (data_db.current_user == request.user) and request.user.is_authenticated:
-            data_list = loader.load(data_db.file.path)
+            data_list = get_data_list(data_db)
             contents = [str(data) for data in data_list]
             return_data = {data_db.file_name:contents}
         else:
@@ -81,6 +80,7 @@ def upload(request, data_id = None, version = None):
                 form = DataForm(request.data, request.FILES, instance=db)
                 if form.is_valid():
                     form.save()
+                    invalidate_data(db.id)
                 serializer = DataSerializer(db, data={"file_name":os.path.basename(form.instance.file.path)}, partial = True)
             else:
                 return HttpResponseForbidden("user is not logged in")
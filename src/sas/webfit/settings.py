@@ -222,6 +222,18 @@ MEDIA_URL = '/media/'
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Fitting queue
+# Number of threads running the queued fits in each server process. With 0,
+# queued fits are only run by FitQueue.run_pending, e.g. in tests.
+
+FIT_WORKERS = 2
+
+# Caches
+# Number of compiled models and of parsed data files kept by each server process.
+
+MODEL_CACHE_SIZE = 32
+DATA_CACHE_SIZE = 64
+
 def perform_import(val, setting_name):
     """
     If the given setting is a string import notation,
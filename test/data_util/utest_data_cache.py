@@ -0,0 +1,121 @@
+"""
+Unit tests for the cache of parsed data files
+"""
+
+import os
+import os.path
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from sasdata.dataloader.loader import Loader
+
+from sas.sascalc.data_util.data_cache import DataCache
+
+
+def find(filename):
+    return os.path.join(os.path.dirname(__file__), '..', 'sasinvariant', 'data', filename)
+
+
+class TestDataCache(unittest.TestCase):
+    """
+        Test the cache of parsed data files
+    """
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "sphere.txt")
+        shutil.copy(find("100nmSpheresNodQ.txt"), self.path)
+        self.cache = DataCache(os.path.join(self.folder, 'cache'))
+        self.loader = mock.Mock(wraps=Loader())
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_load(self):
+        """
+            Files are parsed once, until modified
+        """
+        data = self.cache.load(self.path, self.loader)
+        cached = self.cache.load(self.path, self.loader)
+        self.assertEqual(self.loader.load.call_count, 1)
+        self.assertEqual(cached[0].x.tolist(), data[0].x.tolist())
+        self.assertEqual(cached[0].y.tolist(), data[0].y.tolist())
+        self.assertEqual(cached[0].filename, "sphere.txt")
+
+        with open(self.path, 'a') as data_file:
+            data_file.write("0.5 1.0 0.1\n")
+        modified = self.cache.load(self.path, self.loader)
+        self.assertEqual(self.loader.load.call_count, 2)
+        self.assertEqual(len(modified[0].x), len(data[0].x) + 1)
+
+    def test_same_content(self):
+        """
+            Files with the same content share an entry
+        """
+        copy_path = os.path.join(self.folder, "copy.txt")
+        shutil.copy(self.path, copy_path)
+        self.cache.load(self.path, self.loader)
+        data = self.cache.load(copy_path, self.loader)
+        self.assertEqual(self.loader.load.call_count, 1)
+        self.assertEqual(data[0].filename, "copy.txt")
+
+    def test_extension(self):
+        """
+            Files of different types don't share an entry
+        """
+        xml_path = os.path.join(self.folder, "sphere.xml")
+        shutil.copy(self.path, xml_path)
+        self.assertNotEqual(self.cache.key(self.path), self.cache.key(xml_path))
+        self.cache.load(self.path, self.loader)
+        self.cache.load(xml_path, self.loader)
+        self.assertEqual(self.loader.load.call_count, 2)
+
+    def test_eviction(self):
+        """
+            The least recently used entries are removed from a full cache
+        """
+        paths = []
+        for i in range(3):
+            path = os.path.join(self.folder, "sphere_%d.txt" % i)
+            with open(find("100nmSpheresNodQ.txt")) as source, open(path, 'w') as target:
+                target.write(source.read() + "0.5 %d 0.1\n" % i)
+            paths.append(path)
+        self.cache.load(paths[0], self.loader)
+        entry_size = self.cache.size()
+        self.cache.max_size = int(2.5 * entry_size)
+        self.cache.load(paths[1], self.loader)
+        # The second file is the least recently used, whatever the
+        # resolution of the file times
+        os.utime(self.cache._entry_path(self.cache.key(paths[1])), ns=(0, 0))
+        self.cache.load(paths[2], self.loader)
+        self.assertLessEqual(self.cache.size(), self.cache.max_size)
+
+        self.loader.load.reset_mock()
+        self.cache.load(paths[0], self.loader)
+        self.cache.load(paths[2], self.loader)
+        self.assertEqual(self.loader.load.call_count, 0)
+        self.cache.load(paths[1], self.loader)
+        self.assertEqual(self.loader.load.call_count, 1)
+
+    def test_errors(self):
+        """
+            Files which can't be parsed are not stored
+        """
+        missing = os.path.join(self.folder, "missing.txt")
+        with self.assertRaises(Exception):
+            self.cache.load(missing, self.loader)
+        self.assertEqual(self.cache.size(), 0)
+
+        # A damaged entry is parsed again
+        self.loader.load.reset_mock()
+        self.cache.load(self.path, self.loader)
+        with open(self.cache._entry_path(self.cache.key(self.path)), 'wb') as entry:
+            entry.write(b"damaged")
+        data = self.cache.load(self.path, self.loader)
+        self.assertEqual(self.loader.load.call_count, 2)
+        self.assertEqual(len(data), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
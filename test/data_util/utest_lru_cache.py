@@ -0,0 +1,79 @@
+"""
+Unit tests for the least recently used cache
+"""
+
+import unittest
+
+import numpy as np
+
+from sas.sascalc.data_util.lru_cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+        Test the least recently used cache
+    """
+    def test_maxsize(self):
+        """
+            The least recently used values are dropped beyond maxsize
+        """
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_create(self):
+        """
+            Values are only created when missing
+        """
+        cache = LRUCache()
+        calls = []
+        def create():
+            calls.append(1)
+            return len(calls)
+        self.assertEqual(cache.get("a", create), 1)
+        self.assertEqual(cache.get("a", create), 1)
+        self.assertEqual(len(calls), 1)
+
+    def test_memory_budget(self):
+        """
+            Values are dropped beyond the memory budget, but the last one is kept
+        """
+        evicted = []
+        cache = LRUCache(memory_budget=1600, evicted=lambda key, value: evicted.append(key))
+        cache.put("a", np.zeros(100))
+        cache.put("b", np.zeros(100))
+        self.assertEqual(cache.memory_used, 1600)
+        cache.put("c", np.zeros(100))
+        self.assertEqual(evicted, ["a"])
+        self.assertEqual(cache.memory_used, 1600)
+
+        cache.put("d", np.zeros(1000))
+        self.assertEqual(evicted, ["a", "b", "c"])
+        self.assertIn("d", cache)
+        self.assertEqual(cache.memory_used, 8000)
+
+    def test_discard(self):
+        """
+            Values can be dropped by key, without calling evicted
+        """
+        evicted = []
+        cache = LRUCache(memory_budget=1000, evicted=lambda key, value: evicted.append(key))
+        for key in [(1, "a"), (1, "b"), (2, "a")]:
+            cache.put(key, np.zeros(10))
+        cache.discard(lambda key: key[0] == 1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.memory_used, 80)
+        self.assertIs(cache.pop((1, "a")), None)
+        self.assertEqual(cache.pop((2, "a")).shape, (10,))
+        self.assertEqual(cache.memory_used, 0)
+        self.assertEqual(evicted, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Unit tests for the parallel data loader
+"""
+
+import os.path
+import shutil
+import tempfile
+import unittest
+
+from sas.sascalc.data_util import parallel_loader
+
+
+def find(filename):
+    return os.path.join(os.path.dirname(__file__), '..', 'sasinvariant', 'data', filename)
+
+
+class TestParallelLoader(unittest.TestCase):
+    """
+        Test the loading of files in worker processes
+    """
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(10):
+            path = os.path.join(self.folder, "sphere_%d.txt" % i)
+            shutil.copy(find("100nmSpheresNodQ.txt"), path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_parallel(self):
+        """
+            Files parsed by the workers match files parsed in the process
+        """
+        expected = parallel_loader.load_file(self.paths[0])[1][0]
+        batches = list(parallel_loader.load_files(self.paths, n_workers=2, chunk_size=3))
+        self.assertEqual(len(batches), 4)
+
+        results = [result for batch in batches for result in batch]
+        # Results are in the order of the files
+        self.assertEqual([result[0] for result in results], self.paths)
+        for path, data, error in results:
+            self.assertIsNone(error)
+            self.assertEqual(len(data), 1)
+            self.assertEqual(data[0].x.tolist(), expected.x.tolist())
+            self.assertEqual(data[0].y.tolist(), expected.y.tolist())
+
+    def test_errors(self):
+        """
+            Files which can't be parsed are reported with their error
+        """
+        missing = os.path.join(self.folder, "missing.txt")
+        paths = self.paths + [missing]
+        for n_workers in [1, 2]:
+            results = {path: (data, error) for batch in parallel_loader.load_files(paths, n_workers=n_workers)
+                       for path, data, error in batch}
+            self.assertEqual(len(results), len(paths))
+            data, error = results[missing]
+            self.assertEqual(data, [])
+            self.assertIsInstance(error, Exception)
+            self.assertIsNone(results[self.paths[0]][1])
+
+    def test_few_files(self):
+        """
+            Few files are parsed in the calling process, one at a time
+        """
+        batches = list(parallel_loader.load_files(self.paths[:2], n_workers=4))
+        self.assertEqual([len(batch) for batch in batches], [1, 1])
+
+    def test_loader(self):
+        """
+            Files parsed with a given loader are parsed in the calling process
+        """
+        class CountingLoader(object):
+            def __init__(self):
+                self.paths = []
+            def load(self, path):
+                self.paths.append(path)
+                return []
+
+        loader = CountingLoader()
+        batches = list(parallel_loader.load_files(self.paths, n_workers=2, loader=loader))
+        self.assertEqual([len(batch) for batch in batches], [1] * len(self.paths))
+        self.assertEqual(loader.paths, self.paths)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Startup time of the model manager.
+
+Each case runs in a new interpreter, so that the imports are counted:
+
+    python test/fit/models_benchmark.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+# Title, whether the model index is kept from the previous case, and code
+CASES = [
+    ("Load all standard models", True, """
+from sasmodels.sasview_model import load_standard_models
+load_standard_models()
+"""),
+    ("Model manager, no index", False, """
+from sas.sascalc.fit.models import ModelManager
+ModelManager()
+"""),
+    ("Model manager, index", True, """
+from sas.sascalc.fit.models import ModelManager
+ModelManager()
+"""),
+    ("Model manager, index, select a model", True, """
+from sas.sascalc.fit.models import ModelManager
+ModelManager().get_model_dictionary()['cylinder']()
+"""),
+]
+
+TIMER = """
+import time
+start = time.perf_counter()
+%s
+print(time.perf_counter() - start)
+"""
+
+
+def run(code, home):
+    """
+    Run the code in a new interpreter using home as user directory and
+    return the time taken
+    """
+    env = dict(os.environ, HOME=home, USERPROFILE=home)
+    output = subprocess.run([sys.executable, "-c", TIMER % code], env=env,
+                            check=True, capture_output=True, text=True).stdout
+    return float(output.split()[-1])
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as home:
+        os.makedirs(os.path.join(home, '.sasview'))
+        index_path = os.path.join(home, '.sasview', 'model_index.json')
+        for title, keep_index, code in CASES:
+            if not keep_index and os.path.exists(index_path):
+                os.remove(index_path)
+            print("%-40s %.3f s" % (title, run(code, home)))
@@ -0,0 +1,75 @@
+"""
+Unit tests for the index of the standard models
+"""
+
+import json
+import os.path
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from sasmodels.sasview_model import load_standard_models
+
+from sas.sascalc.fit import models
+
+
+class TestModelIndex(unittest.TestCase):
+    """
+        Test the index of the standard models
+    """
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.index_path = os.path.join(self.folder, models.MODEL_INDEX)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_index(self):
+        """
+            The index lists the standard models like the model classes
+        """
+        index = models.read_model_index(self.index_path)
+        standard_models = {model.name: model for model in load_standard_models()}
+        for name, metadata in index.items():
+            model = standard_models[name]
+            self.assertEqual(metadata['category'], model.category)
+            self.assertEqual(metadata['is_structure_factor'], bool(model.is_structure_factor))
+            self.assertEqual(metadata['is_multiplicity_model'], bool(model.is_multiplicity_model))
+        self.assertEqual(index['cylinder']['filename'], standard_models['cylinder'].filename)
+
+    def test_saved_index(self):
+        """
+            The saved index is used until the models change
+        """
+        models.read_model_index(self.index_path)
+        with mock.patch.object(models, 'build_model_index') as build:
+            models.read_model_index(self.index_path)
+            self.assertEqual(build.call_count, 0)
+
+        with open(self.index_path) as index_file:
+            index = json.load(index_file)
+        index['signature'] = 'old models'
+        with open(self.index_path, 'w') as index_file:
+            json.dump(index, index_file)
+        with mock.patch.object(models, 'build_model_index', return_value={}) as build:
+            self.assertEqual(models.read_model_index(self.index_path), {})
+            self.assertEqual(build.call_count, 1)
+
+    def test_lazy_model(self):
+        """
+            Standard models are loaded when instantiated
+        """
+        metadata = models.read_model_index(self.index_path)['sphere']
+        model = models.LazyStandardModel(metadata)
+        self.assertIsNone(model._model)
+        self.assertEqual(model.category, 'shape:sphere')
+        self.assertTrue(model.is_form_factor)
+        instance = model()
+        self.assertEqual(instance.name, 'sphere')
+        self.assertIn('radius', instance.params)
+        self.assertIsNotNone(model._model)
+
+
+if __name__ == '__main__':
+    unittest.main()
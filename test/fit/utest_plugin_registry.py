@@ -0,0 +1,147 @@
+"""
+Unit tests for the incremental discovery of plugin models
+"""
+
+import os
+import os.path
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from sasmodels.core import load_model_info
+from sasmodels.sasview_model import make_model_from_info
+
+from sas.sascalc.fit import models
+
+PLUGIN = '''
+from numpy import inf
+name = "%(name)s"
+title = "Test plugin"
+description = "I(q) = slope * q + intercept"
+category = "plugin"
+structure_factor = %(structure_factor)s
+parameters = [["slope", "", 1.0, [-inf, inf], "", "Slope"],
+              ["intercept", "", 0.0, [-inf, inf], "", "Intercept"]]
+def Iq(x, slope, intercept):
+    return slope * x + intercept
+Iq.vectorized = True
+'''
+
+
+class TestPluginRegistry(unittest.TestCase):
+    """
+        Test the plugin registry
+    """
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        # Models are registered by name in sasmodels for the whole session
+        self.prefix = os.path.basename(self.folder) + "_"
+        for name in ["line_a", "line_b"]:
+            self.write(name)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write(self, name, structure_factor=False):
+        path = os.path.join(self.folder, name + ".py")
+        with open(path, 'w') as plugin_file:
+            plugin_file.write(PLUGIN % {'name': self.prefix + name,
+                                        'structure_factor': structure_factor})
+        # Distinct modification times, whatever the resolution of the file times
+        status = os.stat(path)
+        os.utime(path, ns=(status.st_atime_ns, status.st_mtime_ns + 10**9))
+        return path
+
+    def names(self, registry):
+        return sorted(name[len(self.prefix):] for name in registry.models())
+
+    def test_incremental(self):
+        """
+            Only new and changed plugins are loaded
+        """
+        registry = models.PluginRegistry(self.folder)
+        with mock.patch.object(models, 'load_custom_model', wraps=models.load_custom_model) as load:
+            self.assertTrue(registry.update())
+            self.assertEqual(self.names(registry), ["line_a", "line_b"])
+            self.assertEqual(load.call_count, 2)
+
+            # Nothing changed
+            self.assertFalse(registry.update())
+            self.assertEqual(load.call_count, 2)
+
+            # Touched but unchanged
+            os.utime(os.path.join(self.folder, "line_a.py"))
+            self.assertFalse(registry.update())
+            self.assertEqual(load.call_count, 2)
+
+            # Changed, added and deleted
+            self.write("line_b", structure_factor=True)
+            self.write("line_c")
+            os.remove(os.path.join(self.folder, "line_a.py"))
+            self.assertTrue(registry.update())
+            self.assertEqual(load.call_count, 4)
+            self.assertEqual(self.names(registry), ["line_b", "line_c"])
+            self.assertTrue(registry.models()[self.prefix + "line_b"].is_structure_factor)
+
+    def test_index(self):
+        """
+            Unchanged plugins are listed from the index in a new session
+        """
+        models.PluginRegistry(self.folder).update()
+        self.assertTrue(os.path.exists(os.path.join(self.folder, models.PLUGIN_INDEX)))
+
+        registry = models.PluginRegistry(self.folder)
+        with mock.patch.object(models, 'load_custom_model', wraps=models.load_custom_model) as load:
+            self.assertFalse(registry.update())
+            plugin = registry.models()[self.prefix + "line_a"]
+            self.assertIsInstance(plugin, models.LazyModel)
+            self.assertFalse(plugin.is_structure_factor)
+            self.assertEqual(plugin.category, "plugin")
+            self.assertEqual(load.call_count, 0)
+
+            # Loaded when used
+            instance = plugin()
+            self.assertEqual(instance.getParam("slope"), 1.0)
+            self.assertEqual(load.call_count, 1)
+
+    def test_broken_plugin(self):
+        """
+            Plugins which fail to load are loaded again once changed
+        """
+        path = os.path.join(self.folder, "broken.py")
+        with open(path, 'w') as plugin_file:
+            plugin_file.write("this is not python\n")
+        registry = models.PluginRegistry(self.folder)
+        with mock.patch.object(models, 'plugin_log'):
+            registry.update()
+            self.assertNotIn("broken", self.names(registry))
+            self.assertFalse(registry.update())
+
+            self.write("broken")
+            self.assertTrue(registry.update())
+            self.assertIn("broken", self.names(registry))
+
+    def test_standard_name(self):
+        """
+            Plugins named like a standard model not loaded yet are renamed
+        """
+        standard = make_model_from_info(load_model_info("sphere"))
+        metadata = models._model_metadata(standard)
+        metadata['filename'] = standard.filename
+        with open(os.path.join(self.folder, "my_sphere.py"), 'w') as plugin_file:
+            plugin_file.write(PLUGIN % {'name': "sphere", 'structure_factor': False})
+
+        with mock.patch.dict(models.MODELS), \
+                mock.patch.dict(models._standard_models, {"sphere": models.LazyStandardModel(metadata)}):
+            models.MODELS.pop("sphere", None)
+            registry = models.PluginRegistry(self.folder)
+            registry.update()
+            self.assertIn("my_sphere", registry.models())
+            self.assertNotIn("sphere", registry.models())
+            self.assertNotIsInstance(models.MODELS["sphere"], models.LazyModel)
+            self.assertEqual(models.MODELS["sphere"].filename, standard.filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
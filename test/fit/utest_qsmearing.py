@@ -0,0 +1,130 @@
+"""
+Unit tests for the resolution functions shared between smearers
+"""
+
+import copy
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from sasmodels.resolution import Pinhole1D
+from sasdata.dataloader.data_info import Data1D, Data2D
+
+from sas.sascalc.fit import qsmearing
+from sas.sascalc.fit.qsmearing import ResolutionRegistry, smear_selection, array_key
+
+
+class Model:
+    """ Model returning q for 1D data, qx+qy for 2D data """
+    def evalDistribution(self, q):
+        if isinstance(q, list):
+            return q[0] + q[1]
+        return np.asarray(q)
+
+
+class TestResolutionRegistry(unittest.TestCase):
+    """
+        Test the registry of resolution functions
+    """
+    def setUp(self):
+        qsmearing.resolution_registry.clear()
+        self.x = np.linspace(0.001, 0.2, 100)
+        self.data = Data1D(x=self.x, y=np.ones(100), dx=0.05*self.x, dy=np.ones(100))
+
+    def test_pinhole_shared(self):
+        """
+            Smearers for the same data, or copies of it, share the resolution
+        """
+        first = smear_selection(self.data, Model())
+        second = smear_selection(copy.deepcopy(self.data), Model())
+        self.assertIs(first.resolution, second.resolution)
+        self.assertIsNot(first.model, second.model)
+        self.assertEqual(len(qsmearing.resolution_registry), 1)
+
+        # Same smeared values as a resolution built for the smearer
+        direct = Pinhole1D(self.x, 0.05*self.x)
+        theory = Model().evalDistribution(self.x)
+        np.testing.assert_allclose(first(theory, 0, 99), direct.apply(direct.q_calc))
+
+    def test_pinhole_changed(self):
+        """
+            A different resolution is built for different widths
+        """
+        first = smear_selection(self.data, Model())
+        self.data.dx = 0.1*self.x
+        second = smear_selection(self.data, Model())
+        self.assertIsNot(first.resolution, second.resolution)
+        self.assertEqual(len(qsmearing.resolution_registry), 2)
+
+    def test_slit_shared(self):
+        """
+            Slit resolutions are shared too
+        """
+        self.data.dx = None
+        self.data.dxl = 0.1*np.ones(100)
+        self.data.dxw = np.zeros(100)
+        first = smear_selection(self.data, Model())
+        second = smear_selection(self.data, Model())
+        self.assertIs(first.resolution, second.resolution)
+
+    def test_pinhole2d_shared(self):
+        """
+            The 2D resolution is built once for each data and index
+        """
+        q = np.linspace(-0.1, 0.1, 20)
+        qx, qy = [a.ravel() for a in np.meshgrid(q, q)]
+        data = Data2D(data=np.ones(400), qx_data=qx, qy_data=qy,
+                      q_data=np.sqrt(qx**2 + qy**2),
+                      dqx_data=0.01*np.ones(400), dqy_data=0.01*np.ones(400),
+                      mask=np.ones(400, dtype=bool))
+        data.xmin, data.xmax, data.ymin, data.ymax = -0.1, 0.1, -0.1, 0.1
+        index = np.abs(qx) > 0.02
+
+        with mock.patch.object(qsmearing, 'Pinhole2D', wraps=qsmearing.Pinhole2D) as pinhole:
+            values = []
+            for _ in range(3):
+                smearer = smear_selection(data)
+                smearer.set_model(Model())
+                smearer.set_index(index)
+                values.append(smearer.get_value())
+            self.assertEqual(pinhole.call_count, 1)
+
+            smearer.set_index(~index)
+            smearer.get_value()
+            self.assertEqual(pinhole.call_count, 2)
+
+        np.testing.assert_array_equal(values[0], values[2])
+
+    def test_memory_budget(self):
+        """
+            The least recently used resolutions are dropped beyond the budget
+        """
+        registry = ResolutionRegistry(memory_budget=2*8*100)
+
+        def build(scale):
+            resolution = mock.Mock(spec=[])
+            resolution.q_calc = scale*np.ones(100)
+            return resolution
+
+        first = registry.get("a", lambda: build(1))
+        registry.get("b", lambda: build(2))
+        self.assertIs(registry.get("a", lambda: build(3)), first)
+        registry.get("c", lambda: build(4))
+        self.assertIn("a", registry)
+        self.assertNotIn("b", registry)
+        self.assertEqual(registry.memory_used, 2*8*100)
+
+    def test_array_key(self):
+        """
+            Keys depend on the values, types and shapes of the arrays
+        """
+        x = np.arange(4.0)
+        self.assertEqual(array_key(x, None), array_key(x.copy(), None))
+        self.assertNotEqual(array_key(x), array_key(x.astype(np.float32)))
+        self.assertNotEqual(array_key(x), array_key(x.reshape(2, 2)))
+        self.assertNotEqual(array_key(x, None), array_key(x, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
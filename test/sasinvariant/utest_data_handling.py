@@ -379,6 +379,60 @@ class TestInvariantCalculator(unittest.TestCase):
         self.assertRaises(ValueError, inv.set_extrapolation, 'high', npts=4,
                           function='guinier')
 
+    def test_extrapolation_cache(self):
+        """
+            Memoised extrapolations must give the same invariant and restore
+            the fitted model after the settings were changed in between.
+        """
+        inv = invariant.InvariantCalculator(self.data)
+        inv.set_extrapolation('low', npts=10, function='guinier')
+        qs_low, dqs_low = inv.get_qstar_low()
+        radius = inv._low_extrapolation_function.radius
+
+        inv.set_extrapolation('low', npts=20, function='power_law')
+        inv.get_qstar_low()
+        inv.set_extrapolation('low', npts=10, function='guinier')
+        self.assertEqual(inv.get_qstar_low(), (qs_low, dqs_low))
+        self.assertEqual(inv._low_extrapolation_function.radius, radius)
+
+        # New data invalidates the cache
+        inv.set_data(self.data)
+        self.assertEqual(len(inv._extrapolation_cache), 0)
+
+    def test_batch(self):
+        """
+            The batch API must agree with the individual calls
+        """
+        contrasts = [1.5e-6, 2.2e-6, 3.0e-6]
+        settings = [None,
+                    {'low': {'npts': 10, 'function': 'guinier'},
+                     'high': {'npts': 20, 'function': 'power_law'}}]
+        inv = invariant.InvariantCalculator(self.data)
+        results = inv.get_batch(contrasts, porod_const=1.825e-7,
+                                settings=settings)
+        self.assertEqual(len(results), 2)
+
+        for result, extrapolation in zip(results, [None, 'both']):
+            inv.set_extrapolation('low', npts=10, function='guinier')
+            inv.set_extrapolation('high', npts=20, function='power_law')
+            qstar, dqstar = inv.get_qstar_with_error(extrapolation)
+            self.assertAlmostEqual(result['qstar'], qstar, 8)
+            self.assertAlmostEqual(result['qstar_err'], dqstar, 8)
+            for i, contrast in enumerate(contrasts):
+                v, dv = inv.get_volume_fraction_with_error(contrast,
+                                                           extrapolation)
+                self.assertAlmostEqual(result['volume_fraction'][i], v, 8)
+                self.assertAlmostEqual(result['volume_fraction_err'][i], dv, 8)
+                s, _ = inv.get_surface_with_error(contrast, 1.825e-7)
+                self.assertAlmostEqual(result['surface'][i], s, 8)
+
+        # Many data sets in one call
+        batch = invariant.get_batch([self.data, self.data], contrasts,
+                                    settings=settings)
+        self.assertEqual(len(batch), 2)
+        self.assertAlmostEqual(batch[1][1]['qstar'], results[1]['qstar'], 8)
+        self.assertIsNone(batch[0][0]['surface'])
+
 
 class TestGuinierExtrapolation(unittest.TestCase):
     """
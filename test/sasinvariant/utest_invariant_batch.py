@@ -0,0 +1,87 @@
+"""
+Unit tests for the batch invariant engine
+"""
+
+import os.path
+import math
+import unittest
+
+from sasdata.dataloader.loader import Loader
+
+from sas.sascalc.invariant import invariant
+from sas.sascalc.invariant import invariant_batch
+
+
+def find(filename):
+    return os.path.join(os.path.dirname(__file__), 'data', filename)
+
+
+class TestInvariantBatch(unittest.TestCase):
+    """
+        Test the batch invariant computation
+    """
+    def setUp(self):
+        data = Loader().load(find("100nmSpheresNodQ.txt"))
+        self.data = data[0]
+        self.data.dxl = None
+        self.settings = {'background': 0.0,
+                         'scale': 1.0,
+                         'contrast': 2.2e-6,
+                         'porod_const': 1.825e-7,
+                         'low': {'npts': 10, 'function': 'guinier'},
+                         'high': {'npts': 20, 'function': 'power_law'}}
+
+    def test_single_data_set(self):
+        """
+            A batch result must match the InvariantCalculator result
+        """
+        result = invariant_batch.compute_invariant(self.data, self.settings)
+        inv = invariant.InvariantCalculator(self.data)
+        inv.set_extrapolation('low', npts=10, function='guinier')
+        inv.set_extrapolation('high', npts=20, function='power_law')
+        qstar, dqstar = inv.get_qstar_with_error('both')
+        v, dv = inv.get_volume_fraction_with_error(2.2e-6, 'both')
+
+        self.assertEqual(result['error'], '')
+        self.assertAlmostEqual(result['qstar'], qstar, 8)
+        self.assertAlmostEqual(result['qstar_err'], dqstar, 8)
+        self.assertAlmostEqual(result['volume_fraction'], v, 8)
+        self.assertAlmostEqual(result['volume_fraction_err'], dv, 8)
+        self.assertAlmostEqual(result['surface'],
+                               inv.get_surface(2.2e-6, 1.825e-7), 8)
+
+    def test_parallel(self):
+        """
+            Parallel and serial batches must give the same ordered results
+        """
+        datasets = [self.data] * 5
+        serial = invariant_batch.compute_invariant_batch(
+            datasets, self.settings, n_workers=1)
+        parallel = invariant_batch.compute_invariant_batch(
+            datasets, self.settings, n_workers=2, chunk_size=2)
+        self.assertEqual(len(parallel), 5)
+        for s, p in zip(serial, parallel):
+            self.assertAlmostEqual(s['qstar'], p['qstar'], 12)
+
+    def test_failure(self):
+        """
+            A data set that cannot be processed is reported, not raised
+        """
+        settings = dict(self.settings, contrast=-1.0)
+        result = invariant_batch.compute_invariant(self.data, settings)
+        self.assertTrue(math.isnan(result['volume_fraction']))
+        self.assertNotEqual(result['error'], '')
+
+    def test_table(self):
+        """
+            The table layout matches the grid panel column format
+        """
+        results = invariant_batch.compute_invariant_batch(
+            [self.data, self.data], self.settings, n_workers=1)
+        table = invariant_batch.results_to_table(results)
+        self.assertEqual(list(table.keys()), invariant_batch.TABLE_COLUMNS)
+        self.assertEqual(len(table['Data']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
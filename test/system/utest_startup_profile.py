@@ -0,0 +1,68 @@
+"""
+Unit tests for the startup import profile
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from sas.system import startup_profile
+
+
+class TestStartupProfile(unittest.TestCase):
+    """
+        Test the timing of imports
+    """
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        with open(os.path.join(self.folder, "profiled_sample.py"), 'w') as module_file:
+            module_file.write("import profiled_sample_child\nVALUE = 1\n")
+        with open(os.path.join(self.folder, "profiled_sample_child.py"), 'w') as module_file:
+            module_file.write("VALUE = 2\n")
+        sys.path.insert(0, self.folder)
+
+    def tearDown(self):
+        startup_profile.stop()
+        startup_profile._profile = None
+        sys.path.remove(self.folder)
+        for name in ("profiled_sample", "profiled_sample_child"):
+            sys.modules.pop(name, None)
+        shutil.rmtree(self.folder)
+
+    def test_profile(self):
+        """
+            Imports are timed until the profile is finished
+        """
+        startup_profile.start()
+        self.assertTrue(startup_profile.is_running())
+        import profiled_sample
+        self.assertEqual(profiled_sample.VALUE, 1)
+        # Modules keep their own loader
+        self.assertNotIsInstance(profiled_sample.__loader__, startup_profile._TimedLoader)
+        self.assertIs(profiled_sample.__spec__.loader, profiled_sample.__loader__)
+        startup_profile.stage("Sample imported")
+
+        output = io.StringIO()
+        startup_profile.finish(output)
+        self.assertFalse(startup_profile.is_running())
+        report = output.getvalue()
+        self.assertIn("Sample imported", report)
+        self.assertIn("Main window shown", report)
+        self.assertIn("profiled_sample_child", report)
+
+        profile = startup_profile._profile
+        self.assertGreaterEqual(profile.total["profiled_sample"], profile.total["profiled_sample_child"])
+        self.assertLessEqual(profile.own["profiled_sample"], profile.total["profiled_sample"])
+
+    def test_not_running(self):
+        """
+            Nothing is reported without profiling
+        """
+        output = io.StringIO()
+        startup_profile.stage("Ignored")
+        startup_profile.finish(output)
+        self.assertEqual(output.getvalue(), "")
+        self.assertFalse(startup_profile.is_running())